@@ -6,6 +6,7 @@ import numpy as np
 from pandas.core.algorithms import factorize, match, unique, value_counts
 from pandas.core.common import isnull, notnull, save, load
 from pandas.core.categorical import Categorical, Factor
+from pandas.core.stringarray import StringArray
 from pandas.core.format import (set_printoptions, reset_printoptions,
                                 set_eng_float_format)
 from pandas.core.index import Index, Int64Index, MultiIndex
@@ -15,6 +16,7 @@ from pandas.core.frame import DataFrame
 from pandas.core.panel import Panel
 from pandas.core.panel4d import Panel4D
 from pandas.core.groupby import groupby
+from pandas.core.eval import eval
 from pandas.core.reshape import (pivot_simple as pivot, get_dummies,
                                  lreshape)
 
@@ -16,9 +16,20 @@ def _cat_compare_op(op):
         else:
             if other in self.levels:
                 i = self.levels.get_loc(other)
-                return getattr(self.labels, op)(i)
-            else:
-                return np.repeat(False, len(self))
+                if op in ('__eq__', '__ne__'):
+                    return getattr(self.labels, op)(i)
+
+                # the labels are in the order of the levels if they are
+                # sorted
+                if (self.levels.is_monotonic and
+                    not com.isnull(self.levels).any()):
+                    result = getattr(self.labels, op)(i)
+                    np.putmask(result, self.labels == -1, False)
+                    return result
+            elif op in ('__eq__', '__ne__'):
+                return np.repeat(op == '__ne__', len(self))
+
+            return getattr(np.asarray(self), op)(other)
 
     f.__name__ = op
 
@@ -82,6 +93,24 @@ class Categorical(object):
     __le__ = _cat_compare_op('__le__')
     __ge__ = _cat_compare_op('__ge__')
 
+    def isin(self, values):
+        """
+        Compute boolean array of whether each value is found in the passed set
+        of values. Only the levels are looked up in the set
+
+        Parameters
+        ----------
+        values : set or sequence of values
+
+        Returns
+        -------
+        is_contained : ndarray (boolean dtype)
+        """
+        level_mask = self.levels.isin(values)
+
+        # missing values are not contained
+        return np.append(level_mask, False).take(self.labels)
+
     def __array__(self, dtype=None):
         return com.take_1d(self.levels.values, self.labels)
 
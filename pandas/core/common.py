@@ -7,6 +7,9 @@ except ImportError:  # pragma: no cover
     import pickle
 
 import itertools
+import io
+import os
+import sys
 
 from numpy.lib.format import read_array, write_array
 import numpy as np
@@ -498,6 +501,41 @@ def take_fast(arr, indexer, mask, needs_masking, axis=0, out=None,
     return result
 
 
+def take_nullable(arr, valid, indexer, axis=0, mask=None):
+    """
+    Take from an integer or boolean array without upcasting it to hold NaN:
+    where the indexer is -1 the result is flagged missing in the returned
+    validity mask instead. valid flags the values of arr that are not
+    missing, None if none are
+
+    Returns
+    -------
+    (taken, taken_valid) : tuple of ndarray
+    """
+    indexer = _ensure_int64(indexer)
+    if mask is None:
+        mask = indexer == -1
+    fill_value = False if arr.dtype == np.bool_ else 0
+
+    if arr.ndim == 2:
+        result = take_2d(arr, indexer, mask=mask, needs_masking=False,
+                         axis=axis, fill_value=fill_value)
+    else:
+        result = take_1d(arr, indexer, fill_value=fill_value)
+
+    if valid is None:
+        result_valid = np.ones(result.shape, dtype=bool)
+        mask_out_axis(result_valid, mask, axis, fill_value=False)
+    elif arr.ndim == 2:
+        result_valid = take_2d(valid, indexer, mask=mask,
+                               needs_masking=False, axis=axis,
+                               fill_value=False)
+    else:
+        result_valid = take_1d(valid, indexer, fill_value=False)
+
+    return result, result_valid
+
+
 def _maybe_mask(result, mask, needs_masking, axis=0, out_passed=False,
                 fill_value=np.nan):
     if needs_masking:
@@ -537,6 +575,8 @@ _backfill_1d_datetime = _interp_wrapper(algos.backfill_inplace_int64,
                                         np.int64)
 _backfill_2d_datetime = _interp_wrapper(algos.backfill_2d_inplace_int64,
                                         np.int64)
+_pad_2d_bool = _interp_wrapper(algos.pad_2d_inplace_bool, np.uint8)
+_backfill_2d_bool = _interp_wrapper(algos.backfill_2d_inplace_bool, np.uint8)
 
 
 def pad_1d(values, limit=None, mask=None):
@@ -579,6 +619,10 @@ def pad_2d(values, limit=None, mask=None):
         _method = _pad_2d_datetime
     elif values.dtype == np.object_:
         _method = algos.pad_2d_inplace_object
+    elif values.dtype == np.int64:
+        _method = algos.pad_2d_inplace_int64
+    elif values.dtype == np.bool_:
+        _method = _pad_2d_bool
     else:  # pragma: no cover
         raise ValueError('Invalid dtype for padding')
 
@@ -600,6 +644,10 @@ def backfill_2d(values, limit=None, mask=None):
         _method = _backfill_2d_datetime
     elif values.dtype == np.object_:
         _method = algos.backfill_2d_inplace_object
+    elif values.dtype == np.int64:
+        _method = algos.backfill_2d_inplace_int64
+    elif values.dtype == np.bool_:
+        _method = _backfill_2d_bool
     else:  # pragma: no cover
         raise ValueError('Invalid dtype for padding')
 
@@ -1080,7 +1128,107 @@ class UTF8Recoder:
         return self.reader.next().encode("utf-8")
 
 
-def _get_handle(path, mode, encoding=None):
+_compression_extensions = {'.gz': 'gzip', '.bz2': 'bz2'}
+
+
+def _infer_compression(filepath_or_buffer, compression):
+    """
+    Resolve compression='infer' from the extension of a file path (file
+    handles are taken to be uncompressed) and check the compression type
+    """
+    if compression == 'infer':
+        compression = None
+        if isinstance(filepath_or_buffer, basestring):
+            ext = os.path.splitext(filepath_or_buffer)[1].lower()
+            compression = _compression_extensions.get(ext)
+
+    if compression not in (None, 'gzip', 'bz2'):
+        raise ValueError('Unrecognized compression type: %s' % compression)
+
+    return compression
+
+
+def _get_compressed_handle(path_or_buf, mode, compression):
+    """
+    Open a file path, or wrap an open handle, so that reads decompress and
+    writes compress the data a block at a time
+    """
+    if compression == 'gzip':
+        import gzip
+        if isinstance(path_or_buf, basestring):
+            return gzip.GzipFile(path_or_buf, mode)
+        return gzip.GzipFile(fileobj=path_or_buf, mode=mode)
+    elif compression == 'bz2':
+        import bz2
+        if 'r' not in mode and 'U' not in mode:
+            if isinstance(path_or_buf, basestring):
+                return bz2.BZ2File(path_or_buf, mode)
+            raise ValueError('bz2 compression of file handles is only '
+                             'supported for reading')
+        if isinstance(path_or_buf, basestring):
+            return io.BufferedReader(_BZ2Reader(open(path_or_buf, 'rb'),
+                                                owns_handle=True))
+        return io.BufferedReader(_BZ2Reader(path_or_buf))
+    raise ValueError('Unrecognized compression type: %s' % compression)
+
+
+class _BZ2Reader(io.RawIOBase):
+    """
+    Raw stream decompressing the bz2 data read from a file handle.
+    bz2.BZ2File can only open paths, and on Python 2 stops at the end of the
+    first of several concatenated streams
+    """
+    _chunksize = 256 * 1024
+
+    def __init__(self, f, owns_handle=False):
+        import bz2
+        self._f = f
+        self._owns_handle = owns_handle
+        self._decompressor = bz2.BZ2Decompressor()
+        self._buffer = b''
+
+    def readable(self):
+        return True
+
+    def close(self):
+        if self._owns_handle and not self.closed:
+            self._f.close()
+        io.RawIOBase.close(self)
+
+    def readinto(self, b):
+        while not self._buffer:
+            data = self._f.read(self._chunksize)
+            if not data:
+                return 0
+            self._decompress(data)
+
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def _decompress(self, data):
+        import bz2
+        while data:
+            try:
+                self._buffer += self._decompressor.decompress(data)
+            except EOFError:
+                # the previous data ended a stream
+                self._decompressor = bz2.BZ2Decompressor()
+                continue
+
+            # the file can hold several concatenated streams, as written by
+            # pbzip2 or by appending to it
+            data = self._decompressor.unused_data
+            if data:
+                self._decompressor = bz2.BZ2Decompressor()
+
+
+def _get_handle(path, mode, encoding=None, compression=None):
+    compression = _infer_compression(path, compression)
+    if compression is not None:
+        return _get_compressed_handle(path, mode, compression)
+
     if py3compat.PY3:  # pragma: no cover
         if encoding:
             f = open(path, mode, encoding=encoding)
@@ -1141,6 +1289,20 @@ else:
                    else pprint_thing(x).encode('utf-8') for x in row]
 
             self.writer.writerow([s for s in row])
+            self._flush_queue()
+
+        def writerows(self, rows):
+            def _check_as_is(x):
+                return (self.quoting == csv.QUOTE_NONNUMERIC and
+                        is_number(x)) or isinstance(x, str)
+
+            for row in rows:
+                row = [x if _check_as_is(x)
+                       else pprint_thing(x).encode('utf-8') for x in row]
+                self.writer.writerow(row)
+            self._flush_queue()
+
+        def _flush_queue(self):
             # Fetch UTF-8 output from the queue ...
             data = self.queue.getvalue()
             data = data.decode("utf-8")
@@ -1167,6 +1329,42 @@ def _concat_compat(to_concat, axis=0):
     else:
         return np.concatenate(to_concat, axis=axis)
 
+
+def _map_threaded(func, arglist, nthreads):
+    """
+    Call func with each of the argument tuples in arglist on up to nthreads
+    threads and return the results in order. Only worth it if func spends its
+    time in code that releases the GIL
+    """
+    import threading
+
+    nthreads = min(nthreads, len(arglist))
+    if nthreads <= 1:
+        return [func(*args) for args in arglist]
+
+    results = [None] * len(arglist)
+    errors = []
+
+    def _worker(start):
+        try:
+            for i in xrange(start, len(arglist), nthreads):
+                results[i] = func(*arglist[i])
+        except Exception:
+            errors.append(sys.exc_info())
+
+    threads = [threading.Thread(target=_worker, args=(i,))
+               for i in range(nthreads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        exc_type, exc_value, tb = errors[0]
+        raise exc_type, exc_value, tb
+
+    return results
+
 def in_interactive_session():
     """ check if we're running in an interactive shell
 
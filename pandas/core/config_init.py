@@ -123,3 +123,57 @@ with cf.config_prefix('print'):
                        validator=is_bool)
     cf.register_option('encoding', detect_console_encoding(), pc_encoding_doc,
                     validator=is_text)
+
+###########################################
+# options from the "compute" namespace
+
+compute_threads_doc="""
+: int
+    Number of threads used by operations that can run in parallel, such as
+    cythonized groupby aggregations, which aggregate the columns of the
+    frame in pieces on a thread pool, the NumPy engine of pandas.eval, and
+    arithmetic and comparisons of Series and DataFrame with more than 100000
+    elements, which run in cache-sized chunks. Defaults to 1 (no threading)
+"""
+
+compute_use_numexpr_doc="""
+: boolean
+    If True and numexpr is installed, arithmetic and comparisons of float64
+    and int64 Series and DataFrame with more than 100000 elements are
+    evaluated by numexpr, which runs them multi-threaded in cache-sized
+    chunks. numexpr does not report floating point errors, so it is only
+    used while np.seterr ignores all of them. Defaults to False
+"""
+
+with cf.config_prefix('compute'):
+    cf.register_option('threads', 1, compute_threads_doc, validator=is_int)
+    cf.register_option('use_numexpr', False, compute_use_numexpr_doc,
+                       validator=is_bool)
+
+###########################################
+# options from the "mode" namespace
+
+mode_copy_on_write_doc="""
+: boolean
+    If True, copies, slices and column selections of DataFrame and Panel
+    objects share the values of the original object, and a copy is only
+    made when either object is first written to through pandas (setting
+    items or values, .ix, in-place fillna and replace, writes to its
+    columns, ...) or hands out its values as an ndarray (.values).
+    Standalone Series are not affected
+"""
+
+mode_nullable_int_bool_doc="""
+: boolean
+    If True, integer and boolean columns of a DataFrame that get missing
+    values from reindexing, alignment, joins, concatenation or shift keep
+    their int64 and bool values plus a mask of the missing ones, instead of
+    being upcast to float64 and object. Columns retrieved from the frame are
+    still upcast, with NaN for the missing values
+"""
+
+with cf.config_prefix('mode'):
+    cf.register_option('copy_on_write', False, mode_copy_on_write_doc,
+                       validator=is_bool)
+    cf.register_option('nullable_int_bool', False,
+                       mode_nullable_int_bool_doc, validator=is_bool)
@@ -0,0 +1,402 @@
+"""
+Evaluation of string expressions over arrays, Series and DataFrame columns
+in one pass, without a full-length temporary for every operation
+"""
+# pylint: disable=W0622
+
+import ast
+import operator
+import sys
+import tokenize
+from StringIO import StringIO
+
+import numpy as np
+
+from pandas.core.config import get_option
+from pandas.core.expressions import _evaluate_chunked
+from pandas.core.series import Series
+import pandas.core.common as com
+
+try:
+    import numexpr as ne
+    _USE_NUMEXPR = True
+except ImportError:  # pragma: no cover
+    _USE_NUMEXPR = False
+
+
+# rows per chunk of the NumPy engine, so the temporaries stay in cache
+_CHUNKSIZE = 1 << 14
+
+# below this many rows a plain NumPy pass is cheaper than numexpr
+_MIN_NUMEXPR_ELEMENTS = 10000
+
+_binary_ops = {
+    ast.Add: (operator.add, '+'),
+    ast.Sub: (operator.sub, '-'),
+    ast.Mult: (operator.mul, '*'),
+    ast.Div: (operator.div, '/'),
+    ast.Mod: (operator.mod, '%'),
+    ast.Pow: (operator.pow, '**'),
+    ast.FloorDiv: (operator.floordiv, None),
+    ast.BitAnd: (operator.and_, '&'),
+    ast.BitOr: (operator.or_, '|'),
+    ast.BitXor: (operator.xor, None),
+}
+
+_unary_ops = {
+    ast.USub: (operator.neg, '-'),
+    ast.UAdd: (operator.pos, ''),
+    ast.Invert: (operator.invert, '~'),
+    ast.Not: (operator.invert, '~'),
+}
+
+_cmp_ops = {
+    ast.Eq: (operator.eq, '=='),
+    ast.NotEq: (operator.ne, '!='),
+    ast.Lt: (operator.lt, '<'),
+    ast.LtE: (operator.le, '<='),
+    ast.Gt: (operator.gt, '>'),
+    ast.GtE: (operator.ge, '>='),
+}
+
+_bool_ops = {
+    ast.And: (operator.and_, '&'),
+    ast.Or: (operator.or_, '|'),
+}
+
+_funcs = {
+    'abs': np.abs, 'sqrt': np.sqrt, 'exp': np.exp, 'log': np.log,
+    'log10': np.log10, 'sin': np.sin, 'cos': np.cos, 'tan': np.tan,
+    'arcsin': np.arcsin, 'arccos': np.arccos, 'arctan': np.arctan,
+    'sinh': np.sinh, 'cosh': np.cosh, 'tanh': np.tanh,
+}
+
+_constants = {'True': True, 'False': False}
+
+_numexpr_dtypes = set(np.dtype(dt) for dt in
+                      [np.bool_, np.int32, np.int64, np.float32,
+                       np.float64])
+
+
+def eval(expr, local_dict=None, global_dict=None, engine=None,
+         chunksize=None, level=0):
+    """
+    Evaluate a string expression over arrays, Series and scalars, fusing the
+    operations into one pass over the data. With numexpr installed the
+    expression is compiled by numexpr, otherwise it is evaluated with NumPy
+    in cache-sized chunks, on the compute.threads thread pool
+
+    The expression may use the arithmetic operators + - * / % ** //,
+    the comparisons == != < <= > >=, the boolean operators & | ~ (and, or,
+    not), parentheses and the functions abs, sqrt, exp, log, log10 and the
+    trigonometric functions. Unlike in Python, & and | bind less tightly than
+    the comparisons, so 'a > 1 & b < 2' means '(a > 1) & (b < 2)'
+
+    Parameters
+    ----------
+    expr : string
+    local_dict : dict-like, optional
+        Where to look up the names in the expression, defaults to the
+        local variables of the caller
+    global_dict : dict-like, optional
+        Where to look up names not in local_dict, defaults to the global
+        variables of the caller
+    engine : {None, 'numexpr', 'numpy'}, default None
+        None uses numexpr when it is installed and the expression and the
+        data are large enough and of types numexpr handles
+    chunksize : int, optional
+        Number of rows evaluated at a time by the NumPy engine
+
+    Returns
+    -------
+    result : Series if any operand is a Series, otherwise ndarray or scalar
+
+    Examples
+    --------
+    >>> pd.eval('a * b + c')
+    >>> s[pd.eval('(s > 0) & (s < 10) | (s == -1)')]
+    """
+    frame = sys._getframe(level + 1)
+    try:
+        if local_dict is None:
+            local_dict = frame.f_locals
+        if global_dict is None:
+            global_dict = frame.f_globals
+    finally:
+        del frame
+    return _evaluate(expr, [local_dict, global_dict], engine=engine,
+                     chunksize=chunksize)
+
+
+def _evaluate(expr, resolvers, engine=None, chunksize=None, index=None):
+    if engine not in (None, 'numexpr', 'numpy'):
+        raise ValueError('engine must be one of None, numexpr or numpy, '
+                         'got %s' % engine)
+
+    tree = _parse(expr)
+    env = dict((name, _resolve(name, resolvers))
+               for name in _names(tree))
+
+    indexes = [v.index for v in env.itervalues() if isinstance(v, Series)]
+    if index is not None:
+        indexes.insert(0, index)
+    if any(not idx.equals(indexes[0]) for idx in indexes[1:]):
+        # Series on different indexes, their operators align them
+        return _eval_node(tree, env)
+
+    for name, value in env.iteritems():
+        if isinstance(value, Series):
+            env[name] = value.values
+        elif isinstance(value, (list, tuple)):
+            env[name] = np.asarray(value)
+
+    arrays = [v for v in env.itervalues() if isinstance(v, np.ndarray)]
+    if len(set(len(arr) for arr in arrays)) > 1:
+        raise ValueError('Operands in the expression have different lengths')
+
+    if len(arrays) == 0:
+        result = _eval_node(tree, env)
+    else:
+        if engine is None:
+            engine = 'numpy'
+            if (_USE_NUMEXPR and len(arrays[0]) >= _MIN_NUMEXPR_ELEMENTS and
+                    _numexpr_ok(tree, env)):
+                engine = 'numexpr'
+        elif engine == 'numexpr':
+            if not _USE_NUMEXPR:
+                raise ImportError('numexpr is not installed')
+            if not _numexpr_ok(tree, env):
+                raise ValueError('numexpr cannot evaluate %r on these '
+                                 'operands' % expr)
+
+        if engine == 'numexpr':
+            result = ne.evaluate(_numexpr_source(tree), local_dict=env,
+                                 global_dict={})
+        else:
+            result = _eval_chunked(tree, env, chunksize or _CHUNKSIZE,
+                                   get_option('compute.threads'))
+
+    if indexes and isinstance(result, np.ndarray):
+        result = Series(result, index=indexes[0])
+    return result
+
+
+def _parse(expr):
+    # & and | as and / or, so they bind less tightly than the comparisons
+    tokens = []
+    for toknum, tokval, _, _, _ in tokenize.generate_tokens(
+            StringIO(expr.strip()).readline):
+        if toknum == tokenize.OP and tokval == '&':
+            toknum, tokval = tokenize.NAME, 'and'
+        elif toknum == tokenize.OP and tokval == '|':
+            toknum, tokval = tokenize.NAME, 'or'
+        tokens.append((toknum, tokval))
+    source = tokenize.untokenize(tokens)
+    tree = ast.parse(source.strip(), mode='eval').body
+    _validate(tree)
+    return tree
+
+
+def _validate(node):
+    if isinstance(node, ast.Call):
+        if (not isinstance(node.func, ast.Name) or
+                node.func.id not in _funcs or node.keywords or
+                node.starargs or node.kwargs):
+            raise ValueError('Only the functions %s can be called in '
+                             'expressions' % ', '.join(sorted(_funcs)))
+        args = node.args
+    elif isinstance(node, ast.BinOp):
+        if type(node.op) not in _binary_ops:
+            raise ValueError('Unsupported operator in expression')
+        args = [node.left, node.right]
+    elif isinstance(node, ast.UnaryOp):
+        args = [node.operand]
+    elif isinstance(node, ast.BoolOp):
+        args = node.values
+    elif isinstance(node, ast.Compare):
+        if any(type(op) not in _cmp_ops for op in node.ops):
+            raise ValueError('Unsupported comparison in expression')
+        args = [node.left] + node.comparators
+    elif isinstance(node, (ast.Name, ast.Num, ast.Str)):
+        args = []
+    else:
+        raise ValueError('%s is not supported in expressions'
+                         % type(node).__name__)
+    for arg in args:
+        _validate(arg)
+
+
+def _names(node):
+    if isinstance(node, ast.Name):
+        return set() if node.id in _constants else set([node.id])
+    names = set()
+    for child in ast.iter_child_nodes(node):
+        if isinstance(node, ast.Call) and child is node.func:
+            continue
+        names |= _names(child)
+    return names
+
+
+def _resolve(name, resolvers):
+    for resolver in resolvers:
+        if name in resolver:
+            return resolver[name]
+    raise NameError('name %r is not defined' % name)
+
+
+def _eval_node(node, env):
+    if isinstance(node, ast.Name):
+        if node.id in _constants:
+            return _constants[node.id]
+        return env[node.id]
+    elif isinstance(node, ast.Num):
+        return node.n
+    elif isinstance(node, ast.Str):
+        return node.s
+    elif isinstance(node, ast.BinOp):
+        op = _binary_ops[type(node.op)][0]
+        return op(_eval_node(node.left, env), _eval_node(node.right, env))
+    elif isinstance(node, ast.UnaryOp):
+        op = _unary_ops[type(node.op)][0]
+        return op(_eval_node(node.operand, env))
+    elif isinstance(node, ast.BoolOp):
+        op = _bool_ops[type(node.op)][0]
+        return reduce(op, [_eval_node(v, env) for v in node.values])
+    elif isinstance(node, ast.Compare):
+        left = _eval_node(node.left, env)
+        result = None
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _eval_node(comparator, env)
+            cmp = _cmp_ops[type(op)][0](left, right)
+            result = cmp if result is None else result & cmp
+            left = right
+        return result
+    elif isinstance(node, ast.Call):
+        args = [_eval_node(arg, env) for arg in node.args]
+        return _funcs[node.func.id](*args)
+    raise AssertionError('unreachable')  # pragma: no cover
+
+
+def _eval_chunked(tree, env, chunksize, nthreads):
+    n = len(iter(v for v in env.itervalues()
+                 if isinstance(v, np.ndarray)).next())
+
+    def _chunk(start, stop):
+        local = {}
+        for name, value in env.iteritems():
+            if isinstance(value, np.ndarray):
+                value = value[start:stop]
+            local[name] = value
+        return _eval_node(tree, local)
+
+    return _evaluate_chunked(_chunk, n, chunksize, nthreads)
+
+
+def _numexpr_ok(node, env):
+    for value in env.itervalues():
+        if isinstance(value, np.ndarray):
+            if value.ndim != 1 or value.dtype not in _numexpr_dtypes:
+                return False
+        elif not isinstance(value, (int, long, float, bool, np.number,
+                                    np.bool_)):
+            return False
+
+    for child in ast.walk(node):
+        if isinstance(child, ast.Str):
+            return False
+        if isinstance(child, ast.BinOp):
+            symbol = _binary_ops[type(child.op)][1]
+            if symbol is None:
+                return False
+            # integer division and powers round differently in numexpr
+            if (symbol in ('/', '%', '**') and
+                    _is_integer(child.left, env) and
+                    _is_integer(child.right, env)):
+                return False
+            # numexpr has no bitwise operators on integers
+            if (symbol in ('&', '|') and
+                    not (_is_boolean(child.left, env) and
+                         _is_boolean(child.right, env))):
+                return False
+        elif isinstance(child, ast.UnaryOp):
+            if (isinstance(child.op, (ast.Invert, ast.Not)) and
+                    not _is_boolean(child.operand, env)):
+                return False
+        elif isinstance(child, ast.BoolOp):
+            if not all(_is_boolean(v, env) for v in child.values):
+                return False
+        elif isinstance(child, ast.Call):
+            # numexpr computes abs of integers in floating point
+            if child.func.id == 'abs' and _is_integer(child.args[0], env):
+                return False
+    return True
+
+
+def _is_integer(node, env):
+    # whether the expression evaluates to integers (or booleans)
+    if isinstance(node, ast.Name):
+        value = _constants.get(node.id, env.get(node.id))
+        if isinstance(value, np.ndarray):
+            return value.dtype.kind in 'iub'
+        return com.is_integer(value) or isinstance(value, (bool, np.bool_))
+    elif isinstance(node, ast.Num):
+        return com.is_integer(node.n)
+    elif isinstance(node, ast.BinOp):
+        return _is_integer(node.left, env) and _is_integer(node.right, env)
+    elif isinstance(node, ast.UnaryOp):
+        return _is_integer(node.operand, env)
+    elif isinstance(node, ast.Call):
+        return node.func.id == 'abs' and _is_integer(node.args[0], env)
+    return True
+
+
+def _is_boolean(node, env):
+    # whether the expression evaluates to booleans
+    if isinstance(node, ast.Name):
+        value = _constants.get(node.id, env.get(node.id))
+        if isinstance(value, np.ndarray):
+            return value.dtype == np.bool_
+        return isinstance(value, (bool, np.bool_))
+    elif isinstance(node, ast.Compare):
+        return True
+    elif isinstance(node, ast.BoolOp):
+        return all(_is_boolean(v, env) for v in node.values)
+    elif isinstance(node, ast.UnaryOp):
+        return (isinstance(node.op, (ast.Invert, ast.Not)) and
+                _is_boolean(node.operand, env))
+    elif isinstance(node, ast.BinOp):
+        return (isinstance(node.op, (ast.BitAnd, ast.BitOr, ast.BitXor)) and
+                _is_boolean(node.left, env) and
+                _is_boolean(node.right, env))
+    return False
+
+
+def _numexpr_source(node):
+    if isinstance(node, ast.Name):
+        return node.id
+    elif isinstance(node, ast.Num):
+        if isinstance(node.n, float):
+            return repr(node.n)
+        return str(node.n)
+    elif isinstance(node, ast.BinOp):
+        symbol = _binary_ops[type(node.op)][1]
+        return '(%s %s %s)' % (_numexpr_source(node.left), symbol,
+                               _numexpr_source(node.right))
+    elif isinstance(node, ast.UnaryOp):
+        symbol = _unary_ops[type(node.op)][1]
+        return '(%s%s)' % (symbol, _numexpr_source(node.operand))
+    elif isinstance(node, ast.BoolOp):
+        symbol = ' %s ' % _bool_ops[type(node.op)][1]
+        return '(%s)' % symbol.join(_numexpr_source(v) for v in node.values)
+    elif isinstance(node, ast.Compare):
+        terms = []
+        left = _numexpr_source(node.left)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _numexpr_source(comparator)
+            terms.append('(%s %s %s)' % (left, _cmp_ops[type(op)][1], right))
+            left = right
+        return '(%s)' % ' & '.join(terms)
+    elif isinstance(node, ast.Call):
+        return '%s(%s)' % (node.func.id, ', '.join(_numexpr_source(arg)
+                                                   for arg in node.args))
+    raise AssertionError('unreachable')  # pragma: no cover
@@ -0,0 +1,143 @@
+"""
+Elementwise arithmetic and comparisons on large arrays, evaluated by numexpr
+or in cache-sized chunks on a thread pool. Small operations go straight to
+NumPy
+"""
+
+import operator
+
+import numpy as np
+
+from pandas.core.config import get_option
+import pandas.core.common as com
+
+try:
+    import numexpr as ne
+    _USE_NUMEXPR = True
+except ImportError:  # pragma: no cover
+    _USE_NUMEXPR = False
+
+
+# operations on fewer elements than this are not worth splitting up
+_MIN_ELEMENTS = 100000
+
+# elements per chunk on the thread pool, so the pieces stay in cache
+_CHUNKSIZE = 1 << 16
+
+_numexpr_ops = {
+    operator.add: '+',
+    operator.sub: '-',
+    operator.mul: '*',
+    operator.div: '/',
+    operator.truediv: '/',
+    operator.eq: '==',
+    operator.ne: '!=',
+    operator.lt: '<',
+    operator.le: '<=',
+    operator.gt: '>',
+    operator.ge: '>=',
+}
+
+# integer division rounds differently in numexpr
+_float_only_ops = set([operator.div, operator.truediv])
+
+
+def evaluate(op, a, b):
+    """
+    Elementwise op(a, b). When a is a large numeric array this is evaluated
+    by numexpr (if installed, the compute.use_numexpr option is set and
+    np.seterr ignores all floating point errors, which numexpr does not
+    report) or in chunks on compute.threads threads, otherwise by op itself
+
+    Parameters
+    ----------
+    op : elementwise binary function, e.g. operator.add
+    a : ndarray
+    b : ndarray or scalar
+
+    Returns
+    -------
+    result : ndarray
+    """
+    if not _can_split(a, b):
+        return op(a, b)
+
+    if _USE_NUMEXPR and _numexpr_ok(op, a, b):
+        if (get_option('compute.use_numexpr') and
+                all(v == 'ignore' for v in np.geterr().itervalues())):
+            return ne.evaluate('a %s b' % _numexpr_ops[op],
+                               local_dict={'a': a, 'b': b}, global_dict={})
+
+    nthreads = get_option('compute.threads')
+    if nthreads > 1:
+        return _evaluate_threaded(op, a, b, nthreads)
+    return op(a, b)
+
+
+def _can_split(a, b):
+    if not isinstance(a, np.ndarray) or a.size < _MIN_ELEMENTS:
+        return False
+    if a.ndim == 0 or a.dtype.kind not in 'iuf':
+        return False
+    if isinstance(b, np.ndarray):
+        # b is either split alongside a or broadcast whole to each piece
+        return (b.dtype.kind in 'iuf' and
+                (b.shape == a.shape or b.ndim < a.ndim))
+    return com.is_number(b) and not isinstance(b, (bool, np.bool_))
+
+
+def _numexpr_ok(op, a, b):
+    if op not in _numexpr_ops:
+        return False
+    if isinstance(b, np.ndarray):
+        if b.shape != a.shape or b.dtype != a.dtype:
+            return False
+    if a.dtype == np.float64:
+        return True
+    elif a.dtype == np.int64:
+        return (op not in _float_only_ops and
+                (isinstance(b, np.ndarray) or com.is_integer(b)))
+    return False
+
+
+def _evaluate_threaded(op, a, b, nthreads):
+    row_size = a.size // len(a) if len(a) else 1
+    rows = max(1, _CHUNKSIZE // max(row_size, 1))
+    split_b = isinstance(b, np.ndarray) and b.shape == a.shape
+
+    def _chunk(start, stop):
+        return op(a[start:stop], b[start:stop] if split_b else b)
+
+    return _evaluate_chunked(_chunk, len(a), rows, nthreads)
+
+
+def _evaluate_chunked(func, n, chunksize, nthreads):
+    """
+    Assemble the n rows of a result from func(start, stop), which computes
+    the rows start:stop, called for chunksize rows at a time on up to
+    nthreads threads
+    """
+    # the floating point error state is per thread
+    errstate = np.geterr()
+
+    def _chunk(start, stop):
+        old = np.seterr(**errstate)
+        try:
+            return np.asarray(func(start, stop))
+        finally:
+            np.seterr(**old)
+
+    first = _chunk(0, chunksize)
+    if n <= chunksize:
+        return first
+
+    out = np.empty((n,) + first.shape[1:], dtype=first.dtype)
+    out[:chunksize] = first
+
+    def _fill(start, stop):
+        out[start:stop] = _chunk(start, stop)
+
+    com._map_threaded(_fill, [(start, min(start + chunksize, n))
+                              for start in xrange(chunksize, n, chunksize)],
+                      nthreads)
+    return out
@@ -24,10 +24,13 @@ import numpy.ma as ma
 
 from pandas.core.common import (isnull, notnull, PandasError, _try_sort,
                                 _default_index, _is_sequence)
+from pandas.core.categorical import Categorical
+from pandas.core.stringarray import StringArray
 from pandas.core.generic import NDFrame
 from pandas.core.index import Index, MultiIndex, _ensure_index
 from pandas.core.indexing import _NDFrameIndexer, _maybe_droplevels
-from pandas.core.internals import BlockManager, make_block, form_blocks
+from pandas.core.internals import (BlockManager, MaskedIntBlock, make_block,
+                                   form_blocks)
 from pandas.core.series import Series, _radd_compat, _dtype_from_scalar
 from pandas.compat.scipy import scoreatpercentile as _quantile
 from pandas.util import py3compat
@@ -38,6 +41,7 @@ from pandas.tseries.period import PeriodIndex
 
 import pandas.core.algorithms as algos
 import pandas.core.datetools as datetools
+import pandas.core.expressions as expressions
 import pandas.core.common as com
 import pandas.core.format as fmt
 import pandas.core.generic as generic
@@ -49,6 +53,9 @@ import pandas.algos as _algos
 
 from pandas.core.config import get_option
 
+# to_csv formats about this many values at a time
+_CSV_CHUNK_CELLS = 100000
+
 #----------------------------------------------------------------------
 # Docstring templates
 
@@ -182,7 +189,7 @@ class DataConflictError(Exception):
 def _arith_method(op, name, default_axis='columns'):
     def na_op(x, y):
         try:
-            result = op(x, y)
+            result = expressions.evaluate(op, x, y)
         except TypeError:
             xrav = x.ravel()
             result = np.empty(x.size, dtype=x.dtype)
@@ -301,14 +308,19 @@ def _flex_comp_method(op, name, default_axis='columns'):
 
 
 def _comp_method(func, name):
+    def na_op(x, y):
+        return expressions.evaluate(func, x, y)
+
     @Appender('Wrapper for comparison method %s' % name)
     def f(self, other):
         if isinstance(other, DataFrame):    # Another DataFrame
             return self._compare_frame(other, func)
         elif isinstance(other, Series):
-            return self._combine_series_infer(other, func)
+            return self._combine_series_infer(other, na_op)
+        elif self._data.is_categorical and np.isscalar(other):
+            return self._compare_const(other, func, name)
         else:
-            return self._combine_const(other, func)
+            return self._combine_const(other, na_op)
 
     f.__name__ = name
 
@@ -1215,7 +1227,7 @@ class DataFrame(NDFrame):
         shape = len(major_axis), len(minor_axis)
 
         new_blocks = []
-        for block in selfsorted._data.blocks:
+        for block in selfsorted._data.decode().blocks:
             newb = block2d_to_block3d(block.values.T, block.items, shape,
                                       major_labels, minor_labels,
                                       ref_items=selfsorted.columns)
@@ -1237,13 +1249,15 @@ class DataFrame(NDFrame):
 
     def _helper_csv(self, writer, na_rep=None, cols=None,
                          header=True, index=True,
-                         index_label=None, float_format=None):
+                         index_label=None, float_format=None,
+                         chunksize=None):
         if cols is None:
             cols = self.columns
-
-        series = {}
-        for k, v in self._series.iteritems():
-            series[k] = v.values
+        else:
+            missing = [col for col in cols if col not in self.columns]
+            if missing:
+                raise KeyError("No column(s) named: %s" %
+                               com.pprint_thing(missing))
 
         has_aliases = isinstance(header, (tuple, list, np.ndarray))
         if has_aliases or header:
@@ -1290,32 +1304,38 @@ class DataFrame(NDFrame):
         if isinstance(self.index, PeriodIndex):
             data_index = self.index.to_timestamp()
 
-        nlevels = getattr(data_index, 'nlevels', 1)
-        for j, idx in enumerate(data_index):
-            row_fields = []
-            if index:
-                if nlevels == 1:
-                    row_fields = [idx]
-                else:  # handle MultiIndex
-                    row_fields = list(idx)
-            for i, col in enumerate(cols):
-                val = series[col][j]
-                if lib.checknull(val):
-                    val = na_rep
+        if cols is self.columns:
+            data = self._data
+        else:
+            data = self._data.reindex_items(_ensure_index(cols), copy=False)
 
-                if float_format is not None and com.is_float(val):
-                    val = float_format % val
-                elif isinstance(val, np.datetime64):
-                    val = lib.Timestamp(val)._repr_base
+        # format and write the values a chunk of rows at a time, block by
+        # block, rather than cell by cell
+        nrows = len(data_index)
+        if chunksize is None:
+            chunksize = max(_CSV_CHUNK_CELLS // max(len(cols), 1), 1)
 
-                row_fields.append(val)
+        for start in xrange(0, nrows, chunksize):
+            slicer = slice(start, min(start + chunksize, nrows))
 
-            writer.writerow(row_fields)
+            columns = [None] * len(cols)
+            for block in data.blocks:
+                values = block.to_native_types(slicer=slicer, na_rep=na_rep,
+                                               float_format=float_format)
+                for loc, col_values in zip(block.ref_locs, values):
+                    columns[loc] = col_values
+
+            if index:
+                index_values = _native_index_values(data_index[slicer])
+            else:
+                index_values = []
+
+            lib.write_csv_rows(columns, index_values, writer)
 
     def to_csv(self, path_or_buf, sep=",", na_rep='', float_format=None,
                cols=None, header=True, index=True, index_label=None,
                mode='w', nanRep=None, encoding=None, quoting=None,
-               line_terminator='\n'):
+               line_terminator='\n', chunksize=None, compression=None):
         """
         Write DataFrame to a comma-separated values (csv) file
 
@@ -1352,6 +1372,13 @@ class DataFrame(NDFrame):
             file
         quoting : optional constant from csv module
             defaults to csv.QUOTE_MINIMAL
+        chunksize : int, optional
+            Number of rows to format and write at a time. By default chosen
+            from the number of columns
+        compression : {'gzip', 'bz2', 'infer', None}, default None
+            Compress the output file, only used when writing to a file path.
+            If 'infer', the compression is taken from the extension of the
+            path ('.gz' or '.bz2')
         """
         if nanRep is not None:  # pragma: no cover
             import warnings
@@ -1363,7 +1390,8 @@ class DataFrame(NDFrame):
             f = path_or_buf
             close = False
         else:
-            f = com._get_handle(path_or_buf, mode, encoding=encoding)
+            f = com._get_handle(path_or_buf, mode, encoding=encoding,
+                                compression=compression)
             close = True
 
         if quoting is None:
@@ -1380,7 +1408,8 @@ class DataFrame(NDFrame):
             self._helper_csv(csvout, na_rep=na_rep,
                                   float_format=float_format, cols=cols,
                                   header=header, index=index,
-                                  index_label=index_label)
+                                  index_label=index_label,
+                                  chunksize=chunksize)
 
         finally:
             if close:
@@ -1446,6 +1475,20 @@ class DataFrame(NDFrame):
         if need_save:
             excel_writer.save()
 
+    def to_binary(self, path):
+        """
+        Write DataFrame to a column-oriented binary file which can be read
+        back with pandas.read_binary. The values are stored block by block so
+        that they can be memory-mapped on read
+
+        Parameters
+        ----------
+        path : string
+            File path
+        """
+        from pandas.io.binary import to_binary
+        to_binary(self, path)
+
     @Appender(fmt.docstring_to_string, indents=1)
     def to_string(self, buf=None, columns=None, col_space=None, colSpace=None,
                   header=True, index=True, na_rep='NaN', formatters=None,
@@ -1780,6 +1823,11 @@ class DataFrame(NDFrame):
         """
         try:
             series = self._get_item_cache(col)
+            if self._data._has_shared:
+                # the item may not be a view on the values, or be a view on
+                # values shared copy-on-write
+                self._materialize()
+                series = self._get_item_cache(col)
             engine = self.index._engine
             engine.set_value(series, index, value)
             return self
@@ -1857,10 +1905,50 @@ class DataFrame(NDFrame):
                 else:
                     return self.ix[:, i]
 
+            if self.columns.is_unique:
+                return self._get_item(label)
             values = self._data.iget(i)
             return self._col_klass.from_array(values, index=self.index,
                                               name=label)
 
+    def get_categorical(self, column):
+        """
+        Retrieve a categorical column as a Categorical of its integer codes
+        and levels, without decoding the values. Columns are stored that way
+        when a Categorical is assigned to them, e.g.
+
+        >>> df['exchange'] = Categorical.from_array(df['exchange'])
+
+        Parameters
+        ----------
+        column : column label
+
+        Returns
+        -------
+        categorical : Categorical, or None if the column is not categorical
+        """
+        return self._data.get_categorical(column)
+
+    def get_string_array(self, column):
+        """
+        Retrieve a compactly stored string column as a StringArray, without
+        creating the string objects. Columns are stored that way when a
+        StringArray is assigned to them, e.g.
+
+        >>> df['ticker'] = StringArray.from_array(df['ticker'])
+
+        or when read with read_csv(..., compact_strings=True)
+
+        Parameters
+        ----------
+        column : column label
+
+        Returns
+        -------
+        strings : StringArray, or None if the column is not stored compactly
+        """
+        return self._data.get_string_array(column)
+
     def _ixs(self, i, axis=0):
         if axis == 0:
             return self.irow(i)
@@ -2071,7 +2159,14 @@ class DataFrame(NDFrame):
     def _sanitize_column(self, key, value):
         # Need to make sure new columns (which go into the BlockManager as new
         # blocks) are always copied
-        if _is_sequence(value):
+        if isinstance(value, (Categorical, StringArray)):
+            # stored as codes into the levels, see get_categorical and
+            # get_string_array
+            if len(value) != len(self.index):
+                raise AssertionError('Length of values does not match '
+                                     'length of index')
+            return value
+        elif _is_sequence(value):
             is_frame = isinstance(value, DataFrame)
             if isinstance(value, Series) or is_frame:
                 if value.index.equals(self.index):
@@ -2311,6 +2406,41 @@ class DataFrame(NDFrame):
 
         return result
 
+    def eval(self, expr, engine=None, chunksize=None):
+        """
+        Evaluate a string expression over the columns of the frame in one
+        pass, without a temporary for every operation. Names are looked up in
+        the columns, then in the local and global variables of the caller.
+        See pandas.eval for the syntax
+
+        Parameters
+        ----------
+        expr : string
+        engine : {None, 'numexpr', 'numpy'}, default None
+            None uses numexpr when it is installed and can evaluate the
+            expression
+        chunksize : int, optional
+            Number of rows evaluated at a time by the NumPy engine
+
+        Returns
+        -------
+        result : Series
+
+        Examples
+        --------
+        >>> df.eval('a * b + c')
+        >>> df[df.eval('a > 1 & b < 2 | c == 3')]
+        """
+        from pandas.core.eval import _evaluate
+
+        frame = sys._getframe(1)
+        try:
+            resolvers = [self, frame.f_locals, frame.f_globals]
+        finally:
+            del frame
+        return _evaluate(expr, resolvers, engine=engine, chunksize=chunksize,
+                         index=self.index)
+
     #----------------------------------------------------------------------
     # Reindexing and alignment
 
@@ -2815,7 +2945,7 @@ class DataFrame(NDFrame):
         """
         if isinstance(indices, list):
             indices = np.array(indices)
-        if self._data.is_mixed_dtype():
+        if self._data.is_mixed_dtype() or self._data.is_encoded:
             if axis == 0:
                 new_data = self._data.take(indices, axis=1)
                 return DataFrame(new_data)
@@ -3074,11 +3204,11 @@ class DataFrame(NDFrame):
             if axis != 0:
                 raise AssertionError('Axis must be 0')
             if isinstance(by, (tuple, list)):
-                keys = [self[x].values for x in by]
+                keys = [self._get_sort_key(x) for x in by]
                 indexer = _lexsort_indexer(keys, orders=ascending)
                 indexer = com._ensure_platform_int(indexer)
             else:
-                indexer = self[by].values.argsort()
+                indexer = self._get_sort_key(by).argsort()
                 if not ascending:
                     indexer = indexer[::-1]
         elif isinstance(labels, MultiIndex):
@@ -3101,6 +3231,15 @@ class DataFrame(NDFrame):
         else:
             return self.take(indexer, axis=axis)
 
+    def _get_sort_key(self, column):
+        # categorical columns with sorted levels and no missing values sort
+        # as their codes, missing values are placed as in the decoded column
+        cat = self._data.get_categorical(column)
+        if (cat is not None and cat.levels.is_monotonic and
+                not (cat.labels == -1).any()):
+            return cat.labels
+        return self[column].values
+
     def sortlevel(self, level=0, axis=0, ascending=True, inplace=False):
         """
         Sort multilevel index by chosen axis and primary level. Data will be
@@ -3224,6 +3363,8 @@ class DataFrame(NDFrame):
         filled : DataFrame
         """
         self._consolidate_inplace()
+        if inplace:
+            self._materialize()
 
         if value is None:
             if method is None:
@@ -3257,6 +3398,8 @@ class DataFrame(NDFrame):
                                               'by column')
 
                 result = self if inplace else self.copy()
+                # the columns are filled in place
+                result._materialize()
                 for k, v in value.iteritems():
                     if k not in result:
                         continue
@@ -3314,6 +3457,8 @@ class DataFrame(NDFrame):
         filled : DataFrame
         """
         self._consolidate_inplace()
+        if inplace:
+            self._materialize()
 
         if value is None:
             return self._interpolate(to_replace, method, axis, inplace, limit)
@@ -3377,6 +3522,7 @@ class DataFrame(NDFrame):
                                       limit=limit).T
 
             rs = self if inplace else self.copy()
+            rs._materialize()
             for k, v in to_replace.iteritems():
                 if k in rs:
                     rs[k].replace(v, method=method, limit=limit,
@@ -3400,6 +3546,7 @@ class DataFrame(NDFrame):
 
     def _replace_dest_dict(self, to_replace, value, inplace):
         rs = self if inplace else self.copy()
+        rs._materialize()
         for k, v in value.iteritems():
             if k in rs:
                 rs[k].replace(to_replace, v, inplace=True)
@@ -3407,6 +3554,7 @@ class DataFrame(NDFrame):
 
     def _replace_src_dict(self, to_replace, value, inplace):
         rs = self if inplace else self.copy()
+        rs._materialize()
         for k, src in to_replace.iteritems():
             if k in rs:
                 rs[k].replace(src, value, inplace=True)
@@ -3414,6 +3562,7 @@ class DataFrame(NDFrame):
 
     def _replace_both_dict(self, to_replace, value, inplace):
         rs = self if inplace else self.copy()
+        rs._materialize()
         for c, src in to_replace.iteritems():
             if c in value and c in rs:
                 rs[c].replace(src, value[c], inplace=True)
@@ -3575,6 +3724,26 @@ class DataFrame(NDFrame):
         return self._constructor(result_values, index=self.index,
                                  columns=self.columns, copy=False)
 
+    def _compare_const(self, other, func, name):
+        # categorical columns are compared by their codes, see Categorical
+        new_data = {}
+        for i, col in enumerate(self.columns):
+            cat = self._data.get_categorical(col)
+            if cat is not None:
+                new_data[i] = getattr(cat, name)(other)
+            else:
+                values = self.icol(i).values
+                res = func(values, other)
+                if not isinstance(res, np.ndarray):
+                    # element-wise, as in an object matrix
+                    res = func(values.astype(object), other)
+                new_data[i] = res
+
+        result = self._constructor(data=new_data, index=self.index,
+                                   copy=False)
+        result.columns = self.columns
+        return result
+
     def _compare_frame(self, other, func):
         if not self._indexed_same(other):
             raise Exception('Can only compare identically-labeled '
@@ -3937,6 +4106,18 @@ class DataFrame(NDFrame):
             offset = datetools.to_offset(offset)
 
         def _shift_block(blk, indexer):
+            if blk._nullable and (blk.valid is not None or nullable):
+                # mask the shifted in values rather than upcasting
+                indexer = indexer.copy()
+                if periods > 0:
+                    indexer[:periods] = -1
+                else:
+                    indexer[periods:] = -1
+                new_values, valid = com.take_nullable(blk.values, blk.valid,
+                                                      indexer, axis=1)
+                return make_block(new_values, blk.items, blk.ref_items,
+                                  valid=valid)
+
             new_values = blk.values.take(indexer, axis=1)
             # convert integer to float if necessary. need to do a lot more than
             # that, handle boolean etc also
@@ -3948,6 +4129,7 @@ class DataFrame(NDFrame):
             return make_block(new_values, blk.items, blk.ref_items)
 
         if offset is None:
+            nullable = get_option('mode.nullable_int_bool')
             indexer = com._shift_indexer(len(self), periods)
             new_blocks = [_shift_block(b, indexer) for b in self._data.blocks]
             new_data = BlockManager(new_blocks, [self.columns, self.index])
@@ -4762,6 +4944,11 @@ class DataFrame(NDFrame):
 
     def _reduce(self, op, axis=0, skipna=True, numeric_only=None,
                 filter_type=None, **kwds):
+        if axis == 0 and filter_type is None and numeric_only is not False:
+            result = self._reduce_masked(op, skipna, numeric_only, **kwds)
+            if result is not None:
+                return result
+
         f = lambda x: op(x, axis=axis, skipna=skipna, **kwds)
         labels = self._get_agg_axis(axis)
         if numeric_only is None:
@@ -4803,6 +4990,35 @@ class DataFrame(NDFrame):
 
         return Series(result, index=labels)
 
+    def _reduce_masked(self, op, skipna, numeric_only, **kwds):
+        """
+        Reduce the columns block by block if there are masked integer blocks,
+        so that they are not upcast to float64 first. Returns None otherwise
+        """
+        data = self._data
+        if not any(isinstance(b, MaskedIntBlock) for b in data.blocks):
+            return None
+
+        num_data = data.get_numeric_data()
+        if not numeric_only and len(num_data.items) < len(data.items):
+            # reduce all of the columns as usual
+            return None
+
+        results = []
+        for blk in num_data.blocks:
+            if blk.valid is not None:
+                result = nanops.nanmasked(op, blk.values, -blk.valid, axis=1,
+                                          skipna=skipna, **kwds)
+            else:
+                result = op(blk.values, axis=1, skipna=skipna, **kwds)
+            results.append(result)
+
+        dtype = np.result_type(*results)
+        values = np.empty(len(num_data.items), dtype=dtype)
+        for blk, result in zip(num_data.blocks, results):
+            values[blk.ref_locs] = result
+        return Series(values, index=num_data.items)
+
     def idxmin(self, axis=0, skipna=True):
         """
         Return index of first occurrence of minimum over requested axis.
@@ -5126,6 +5342,7 @@ class DataFrame(NDFrame):
             _, other = self.align(other, join='left', fill_value=NA)
 
         if inplace:
+            self._materialize()
             np.putmask(self.values, cond, other)
             return self
 
@@ -5492,6 +5709,22 @@ def _put_str(s, space):
     return ('%s' % s)[:space].ljust(space)
 
 
+def _native_index_values(index):
+    # values of each level of the index, in a form a csv writer can write
+    if isinstance(index, MultiIndex):
+        return [com.take_1d(_native_index_level(lev), com._ensure_int64(lab))
+                for lev, lab in zip(index.levels, index.labels)]
+    return [_native_index_level(index)]
+
+
+def _native_index_level(index):
+    if index.dtype == com._NS_DTYPE and getattr(index, 'tz', None) is None:
+        return tslib.format_datetime64(index.asi8)
+    elif index.dtype == com._NS_DTYPE:
+        return index.asobject.values
+    return index.values
+
+
 def install_ipython_completers():  # pragma: no cover
     """Register the DataFrame type with IPython's tab completion machinery, so
     that it knows about accessing column names as attributes."""
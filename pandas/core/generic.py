@@ -530,20 +530,46 @@ class NDFrame(PandasObject):
 
     def _get_item_cache(self, item):
         cache = self._item_cache
+        if self._data._has_shared:
+            # items of masked and categorical blocks are upcast or decoded
+            # copies, which would go stale, and the blocks of values shared
+            # copy-on-write are copied when written to
+            cache.clear()
+            return self._get_item(item)
         try:
             return cache[item]
         except Exception:
-            values = self._data.get(item)
-            res = self._box_item_values(item, values)
+            res = self._get_item(item)
             cache[item] = res
             return res
 
+    def _get_item(self, item):
+        block = self._data.get_block(item)
+        res = self._box_item_values(item, block.get(item))
+        if isinstance(res, np.ndarray):
+            # a Series, which makes the block copy the values it shares
+            # copy-on-write before writing to them
+            res._block = block
+        else:
+            # no such hook, the values are written to directly
+            block.materialize()
+        return res
+
     def _box_item_values(self, key, values):
         raise NotImplementedError
 
     def _clear_item_cache(self):
         self._item_cache.clear()
 
+    def _materialize(self):
+        """
+        Copy values shared copy-on-write with other objects (see the
+        mode.copy_on_write option) before writing to them in place
+        """
+        if self._data.materialize():
+            # cached items are views on the shared values
+            self._clear_item_cache()
+
     def _set_item(self, key, value):
         self._data.set(key, value)
         self._clear_item_cache()
@@ -605,8 +631,10 @@ class NDFrame(PandasObject):
     # Consolidation of internals
 
     def _consolidate_inplace(self):
-        self._clear_item_cache()
-        self._data = self._data.consolidate()
+        if not self._data.is_consolidated():
+            # cached items are views on the blocks being merged
+            self._clear_item_cache()
+            self._data = self._data.consolidate()
 
     def consolidate(self, inplace=False):
         """
@@ -634,8 +662,14 @@ class NDFrame(PandasObject):
 
     @property
     def _is_mixed_type(self):
+        # telling the dtypes apart doesn't need the blocks to be merged
+        if self._data.is_mixed_dtype():
+            return True
+
+        # homogeneous data is worked on through .values, which is only a
+        # view on the data once it's in a single block
         self._consolidate_inplace()
-        return len(self._data.blocks) > 1
+        return False
 
     def _reindex_axis(self, new_index, fill_method, axis, copy):
         new_data = self._data.reindex_axis(new_index, axis=axis,
@@ -3,6 +3,7 @@ import types
 import numpy as np
 
 from pandas.core.categorical import Categorical
+from pandas.core.config import get_option
 from pandas.core.frame import DataFrame
 from pandas.core.generic import NDFrame
 from pandas.core.index import Index, MultiIndex, _ensure_index
@@ -594,6 +595,9 @@ class Grouper(object):
         else:
             label_list = [ping.labels for ping in self.groupings]
             keys = [ping.group_index for ping in self.groupings]
+            if self._hash_groups:
+                comp_ids, _, ngroups = self.group_info
+                return _get_indices_dict(label_list, keys, comp_ids, ngroups)
             return _get_indices_dict(label_list, keys)
 
     @property
@@ -639,7 +643,15 @@ class Grouper(object):
 
     def _get_compressed_labels(self):
         all_labels = [ping.labels for ping in self.groupings]
-        if self._overflow_possible:
+        if self._hash_groups:
+            # obs_group_ids are the positions of the first row of each group
+            all_labels = [com._ensure_int64(labs) for labs in all_labels]
+            comp_ids, first = _hash.group_labels_multi(all_labels,
+                                                       list(self.shape))
+            # every group is observed
+            self._filter_empty_groups = False
+            return comp_ids, first
+        elif self._overflow_possible:
             tups = lib.fast_zip(all_labels)
             labs, uniques = algos.factorize(tups)
 
@@ -660,6 +672,12 @@ class Grouper(object):
 
             return comp_ids, obs_group_ids
 
+    @cache_readonly
+    def _hash_groups(self):
+        # with no need to sort the groups, multiple keys are combined in a
+        # hash table rather than through the product of their labels
+        return not self.sort and len(self.groupings) > 1
+
     @cache_readonly
     def _overflow_possible(self):
         return _int64_overflow_possible(self.shape)
@@ -679,6 +697,11 @@ class Grouper(object):
         if not self.compressed and len(self.groupings) == 1:
             return [self.groupings[0].group_index]
 
+        if self._hash_groups:
+            first = com._ensure_platform_int(obs_ids)
+            return [ping.group_index.take(ping.labels.take(first))
+                    for ping in self.groupings]
+
         if self._overflow_possible:
             recons_labels = [np.array(x) for x in izip(*obs_ids)]
         else:
@@ -716,6 +739,10 @@ class Grouper(object):
         'std': np.sqrt
     }
 
+    # numeric kernels that release the GIL
+    _threaded_functions = frozenset(['add', 'prod', 'min', 'max', 'mean',
+                                     'var', 'std', 'first', 'last'])
+
     _cython_arity = {
         'ohlc': 4,  # OHLC
     }
@@ -1201,7 +1228,10 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True):
         if _is_label_like(gpr) or in_axis:
             exclusions.append(gpr)
             name = gpr
-            gpr = obj[gpr]
+            cat = None
+            if in_axis and axis == 0 and sort:
+                cat = _get_categorical_grouper(obj, gpr)
+            gpr = obj[gpr] if cat is None else cat
         ping = Grouping(group_axis, gpr, name=name, level=level, sort=sort)
         groupings.append(ping)
 
@@ -1213,6 +1243,27 @@ def _get_grouper(obj, key=None, axis=0, level=None, sort=True):
     return grouper, exclusions
 
 
+def _get_categorical_grouper(obj, key):
+    """
+    Categorical of the codes of a categorical column to group by, without the
+    levels that are not observed, None if the column is not categorical. The
+    codes are the group labels if the levels are sorted
+    """
+    cat = obj._data.get_categorical(key)
+    if cat is None or not cat.levels.is_monotonic:
+        return None
+
+    labels = com._ensure_int64(cat.labels)
+    observed = np.bincount(labels + 1, minlength=len(cat.levels) + 1)[1:] > 0
+    levels = cat.levels
+    if not observed.all():
+        # -1 stays -1
+        relabel = np.append(observed.cumsum() - 1, -1)
+        labels = relabel.take(labels)
+        levels = levels[observed]
+    return Categorical(labels, levels, name=key)
+
+
 def _is_label_like(val):
     return isinstance(val, basestring) or np.isscalar(val)
 
@@ -1472,9 +1523,14 @@ class NDFrameGroupBy(GroupBy):
     def _cython_agg_blocks(self, how, numeric_only=True):
         data, agg_axis = self._get_data_to_aggregate()
 
+        nthreads = get_option('compute.threads')
+        threaded = (nthreads > 1 and agg_axis != 0 and
+                    how in self.grouper._threaded_functions)
+
         new_blocks = []
 
-        for block in data.blocks:
+        # the kernels skip the NaN in the upcast values of masked blocks
+        for block in data.decode().blocks:
             values = block.values
 
             is_numeric = _is_numeric_dtype(values.dtype)
@@ -1485,7 +1541,11 @@ class NDFrameGroupBy(GroupBy):
             if is_numeric:
                 values = com.ensure_float(values)
 
-            result, _ = self.grouper.aggregate(values, how, axis=agg_axis)
+            if threaded and is_numeric and len(values) > 1:
+                result = self._aggregate_threaded(values, how, agg_axis,
+                                                  nthreads)
+            else:
+                result, _ = self.grouper.aggregate(values, how, axis=agg_axis)
             newb = make_block(result, block.items, block.ref_items)
             new_blocks.append(newb)
 
@@ -1494,6 +1554,16 @@ class NDFrameGroupBy(GroupBy):
 
         return new_blocks
 
+    def _aggregate_threaded(self, values, how, agg_axis, nthreads):
+        # compute the group info up front, the workers only read it
+        self.grouper.ngroups
+
+        pieces = np.array_split(values, min(nthreads, len(values)))
+        results = com._map_threaded(self.grouper.aggregate,
+                                    [(piece, how, agg_axis)
+                                     for piece in pieces], nthreads)
+        return np.concatenate([result for result, _ in results])
+
     def _get_data_to_aggregate(self):
         obj = self._obj_with_exclusions
         if self.axis == 0:
@@ -1772,6 +1842,8 @@ class NDFrameGroupBy(GroupBy):
 
             # broadcasting
             if isinstance(res, Series):
+                # the group's values are overwritten
+                group._materialize()
                 if res.index is obj.index:
                     group.T.values[:] = res
                 else:
@@ -1996,6 +2068,283 @@ class NDArrayGroupBy(GroupBy):
     pass
 
 
+#----------------------------------------------------------------------
+# Grouping data that arrives in chunks
+
+class ChunkedGroupBy(object):
+    """
+    Group the rows of a sequence of DataFrame chunks, such as a TextFileReader
+    created with a chunksize, without holding all of the data in memory.
+    Aggregations that can be computed from partial results (sum, count, mean,
+    var, std, min, max, first and last) are merged chunk by chunk, so memory
+    use depends on the number of groups rather than on the size of the data
+
+    Parameters
+    ----------
+    chunks : iterable of DataFrame
+        Consumed by the first aggregation, after which the object (and the
+        column selections made from it) can't be aggregated again. Pass a
+        list to aggregate to compute several aggregations in one pass
+    by : column name, function, dict, or list of those
+        Group keys, evaluated on each chunk as by DataFrame.groupby
+    sort : boolean, default True
+        Sort the result by the group keys. If False, the groups are in the
+        order in which they first appear in the chunks
+    """
+    # partial results needed by each aggregation
+    _states = {
+        'count': ('count',),
+        'sum': ('count', 'sum'),
+        'mean': ('count', 'sum'),
+        'var': ('count', 'sum', 'm2'),
+        'std': ('count', 'sum', 'm2'),
+        'min': ('min',),
+        'max': ('max',),
+        'first': ('first',),
+        'last': ('last',)
+    }
+
+    def __init__(self, chunks, by, sort=True, selection=None):
+        self.chunks = chunks
+        self.by = by
+        self.sort = sort
+        self._selection = selection
+
+        # shared with the column selections, which read the same chunks
+        self._consumed = [False]
+
+    def __getitem__(self, key):
+        result = ChunkedGroupBy(self.chunks, self.by, sort=self.sort,
+                                selection=key)
+        result._consumed = self._consumed
+        return result
+
+    def count(self):
+        return self.aggregate('count')
+
+    def sum(self):
+        return self.aggregate('sum')
+
+    def mean(self):
+        return self.aggregate('mean')
+
+    def var(self):
+        return self.aggregate('var')
+
+    def std(self):
+        return self.aggregate('std')
+
+    def min(self):
+        return self.aggregate('min')
+
+    def max(self):
+        return self.aggregate('max')
+
+    def first(self):
+        return self.aggregate('first')
+
+    def last(self):
+        return self.aggregate('last')
+
+    def aggregate(self, how):
+        """
+        Compute one or several aggregations in a single pass over the chunks
+
+        Parameters
+        ----------
+        how : string or list of strings
+            Any of 'count', 'sum', 'mean', 'var', 'std', 'min', 'max',
+            'first' and 'last'
+
+        Returns
+        -------
+        aggregated : DataFrame, or Series if a single column was selected.
+            Passing a list gives a column per aggregation, hierarchical if
+            there are several data columns
+        """
+        if isinstance(how, basestring):
+            hows = [how]
+        else:
+            hows = list(how)
+
+        needed = set()
+        for name in hows:
+            if name not in self._states:
+                raise ValueError('Can not aggregate chunks with %s, only '
+                                 'with %s' % (name, sorted(self._states)))
+            needed.update(self._states[name])
+
+        if self._consumed[0]:
+            raise Exception('The chunks were consumed by a previous '
+                            'aggregation. Pass a list to aggregate, e.g. '
+                            "aggregate(['sum', 'mean']), to compute several "
+                            'aggregations in one pass')
+        self._consumed[0] = True
+
+        states = None
+        columns = []
+        group_order = None
+        for chunk in self.chunks:
+            if len(chunk) == 0:
+                continue
+
+            data, keys = self._split_chunk(chunk)
+            columns.extend(c for c in data.columns if c not in columns)
+
+            partial = _chunk_states(data, keys, needed)
+            if states is None:
+                states = partial
+            else:
+                states = _merge_chunk_states(states, partial)
+
+            if not self.sort:
+                # merging the states sorts the groups, keep track of the
+                # order in which they are first seen
+                seen = partial.values()[0].index
+                if group_order is None:
+                    group_order = seen
+                else:
+                    new = group_order.get_indexer(seen) == -1
+                    if new.any():
+                        group_order = group_order.append(seen[new])
+
+        if states is None:
+            results = [DataFrame() for _ in hows]
+        else:
+            results = [_finalize_chunk_states(states, name) for name in hows]
+
+        results = [self._wrap_result(result, columns, group_order)
+                   for result in results]
+
+        if isinstance(how, basestring):
+            return results[0]
+
+        from pandas.tools.merge import concat
+        if self._is_series_selection:
+            result = concat(results, axis=1)
+            result.columns = hows
+            return result
+
+        result = concat(results, axis=1, keys=hows)
+        result = result.swaplevel(0, 1, axis=1)
+        order = [(col, name) for col in columns for name in hows
+                 if (col, name) in result.columns]
+        return result.reindex(columns=MultiIndex.from_tuples(order))
+
+    agg = aggregate
+
+    @property
+    def _is_series_selection(self):
+        return (self._selection is not None and
+                not isinstance(self._selection, (list, tuple, Index,
+                                                 np.ndarray)))
+
+    def _split_chunk(self, chunk):
+        by = self.by
+        if not isinstance(by, list):
+            by = [by]
+
+        keys = []
+        exclusions = []
+        for key in by:
+            if _is_label_like(key) and key in chunk:
+                exclusions.append(key)
+                key = chunk[key]
+            keys.append(key)
+
+        if self._selection is None:
+            data = chunk.drop(exclusions, axis=1) if exclusions else chunk
+        elif self._is_series_selection:
+            data = chunk[[self._selection]]
+        else:
+            data = chunk[list(self._selection)]
+
+        return data, keys
+
+    def _wrap_result(self, result, columns, group_order=None):
+        result = result.reindex(columns=[c for c in columns
+                                         if c in result.columns])
+        if self.sort:
+            result = result.sort_index()
+        elif group_order is not None:
+            result = result.reindex(group_order)
+
+        if self._is_series_selection:
+            result = result[self._selection]
+        return result
+
+
+def _chunk_states(data, keys, needed):
+    grouped = data.groupby(keys, sort=False)
+
+    states = {}
+    if 'count' in needed:
+        states['count'] = com.notnull(data).groupby(keys, sort=False).sum()
+    if 'sum' in needed:
+        states['sum'] = grouped.sum()
+    if 'm2' in needed:
+        var = grouped.var()
+        count = states['count'].reindex(columns=var.columns)
+        states['m2'] = (var * (count - 1)).fillna(0)
+    for name in ('min', 'max', 'first', 'last'):
+        if name in needed:
+            states[name] = getattr(grouped, name)()
+    return states
+
+
+def _merge_chunk_states(left, right):
+    states = {}
+    if 'm2' in left:
+        # Chan et al's update of the sums of squared deviations
+        lm2, rm2 = left['m2'].align(right['m2'], fill_value=0)
+        index, columns = lm2.index, lm2.columns
+
+        def _get(states, name):
+            return states[name].reindex(index=index,
+                                        columns=columns).fillna(0)
+
+        lcount, rcount = _get(left, 'count'), _get(right, 'count')
+        delta = (_get(right, 'sum') / rcount -
+                 _get(left, 'sum') / lcount)
+        total = lcount + rcount
+        states['m2'] = (lm2 + rm2 +
+                        (delta ** 2 * lcount * rcount / total).fillna(0))
+
+    for name in ('count', 'sum'):
+        if name in left:
+            states[name] = left[name].combine(right[name], np.add,
+                                              fill_value=0)
+    if 'min' in left:
+        states['min'] = left['min'].combine(right['min'], np.fmin)
+    if 'max' in left:
+        states['max'] = left['max'].combine(right['max'], np.fmax)
+    if 'first' in left:
+        states['first'] = left['first'].combine_first(right['first'])
+    if 'last' in left:
+        states['last'] = right['last'].combine_first(left['last'])
+    return states
+
+
+def _finalize_chunk_states(states, how):
+    if how == 'count':
+        return states['count'].fillna(0).astype(np.int64)
+    elif how in ('sum', 'mean', 'var', 'std'):
+        total = states['sum']
+        count = states['count'].reindex(columns=total.columns).fillna(0)
+        if how == 'sum':
+            return total.where(count > 0)
+        elif how == 'mean':
+            return (total / count).where(count > 0)
+
+        m2 = states['m2'].reindex(index=total.index, columns=total.columns)
+        result = (m2 / (count - 1)).where(count > 1)
+        if how == 'std':
+            result = np.sqrt(result)
+        return result
+    else:
+        return states[how]
+
+
 #----------------------------------------------------------------------
 # Splitting / application
 
@@ -2212,12 +2561,14 @@ class _KeyMapper(object):
 
 
 
-def _get_indices_dict(label_list, keys):
-    shape = [len(x) for x in keys]
-    group_index = get_group_index(label_list, shape)
+def _get_indices_dict(label_list, keys, group_index=None, ngroups=None):
+    if group_index is None:
+        shape = [len(x) for x in keys]
+        group_index = get_group_index(label_list, shape)
+        ngroups = np.prod(shape)
 
     sorter, _ = _algos.groupsort_indexer(com._ensure_int64(group_index),
-                                         np.prod(shape))
+                                         ngroups)
 
     sorter_int = com._ensure_platform_int(sorter)
 
@@ -82,6 +82,9 @@ class _NDFrameIndexer(object):
     def _setitem_with_indexer(self, indexer, value):
         from pandas.core.frame import DataFrame, Series
 
+        # write to own copies of values shared copy-on-write
+        self.obj._materialize()
+
         # also has the side effect of consolidating in-place
 
         # mmm, spaghetti
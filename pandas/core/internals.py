@@ -1,10 +1,14 @@
 import itertools
+import weakref
 from datetime import datetime
 
 from numpy import nan
 import numpy as np
 
 from pandas.core.index import Index, _ensure_index, _handle_legacy_indexes
+from pandas.core.categorical import Categorical
+from pandas.core.stringarray import StringArray
+from pandas.core.config import get_option
 import pandas.core.common as com
 import pandas.lib as lib
 import pandas.tslib as tslib
@@ -18,7 +22,17 @@ class Block(object):
 
     Index-ignorant; let the container take care of that
     """
-    __slots__ = ['items', 'ref_items', '_ref_locs', 'values', 'ndim']
+    __slots__ = ['items', 'ref_items', '_ref_locs', 'values', 'ndim',
+                 '_refs', '__weakref__']
+
+    # flags the values that are not missing, for masked blocks only
+    valid = None
+
+    # the levels the values are codes into, for categorical blocks only
+    levels = None
+
+    # whether missing values can be masked instead of upcasting the block
+    _nullable = False
 
     def __init__(self, values, items, ref_items, ndim=2):
         if issubclass(values.dtype.type, basestring):
@@ -31,6 +45,7 @@ class Block(object):
             raise AssertionError('Wrong number of items passed')
 
         self._ref_locs = None
+        self._refs = None
         self.values = values
         self.ndim = ndim
         self.items = _ensure_index(items)
@@ -84,6 +99,7 @@ class Block(object):
         items, ref_items, values = state
         self.items = _ensure_index(items)
         self.ref_items = _ensure_index(ref_items)
+        self._refs = None
         self.values = values
         self.ndim = values.ndim
 
@@ -99,7 +115,90 @@ class Block(object):
         values = self.values
         if deep:
             values = values.copy()
-        return make_block(values, self.items, self.ref_items)
+        newb = make_block(values, self.items, self.ref_items,
+                          levels=self.levels)
+        if not deep:
+            _view_of(newb, self)
+        return newb
+
+    def share(self, values=None, items=None, ref_items=None, valid=None):
+        """
+        Copy-on-write copy of the block, or of a view on its values (and
+        validity mask): the values are shared by both blocks until either
+        one is written to, see materialize
+
+        Returns
+        -------
+        y : Block (new object)
+        """
+        if values is None:
+            values = self.values
+            valid = self.valid
+        if items is None:
+            items = self.items
+        if ref_items is None:
+            ref_items = self.ref_items
+
+        if self._refs is None:
+            self._refs = _SharedValues()
+            self._refs.owners.add(self)
+
+        newb = make_block(values, items, ref_items, valid=valid,
+                          levels=self.levels)
+        newb._refs = self._refs
+        self._refs.others.add(newb)
+        return newb
+
+    def decode(self):
+        """
+        Equivalent plain block: a masked block upcast to hold NaN if it has
+        missing values, the levels of a categorical block in place of its codes
+        """
+        return self
+
+    def materialize(self):
+        """
+        Prepare the block to be written to if its values are shared
+        copy-on-write with other blocks: a block that shared its values
+        hands the blocks it shared them with copies of their own, any other
+        block copies its values. Returns whether the block's values were
+        copied
+        """
+        refs = self._refs
+        if refs is None:
+            return False
+        self._refs = None
+
+        if self in refs.owners:
+            # views on the block's values see the write as usual
+            for block in list(refs.owners):
+                block._refs = None
+            for block in list(refs.others):
+                block._refs = None
+                block._copy_values()
+            refs.owners.clear()
+            refs.others.clear()
+            return False
+
+        refs.others.discard(self)
+        if not (len(refs.owners) or len(refs.others)):
+            # nothing else refers to the values anymore
+            return False
+        self._copy_values()
+        return True
+
+    def prepare_views(self):
+        """
+        Copy the values of a block sharing another block's values before
+        handing out views on them, which would be written to directly.
+        Returns whether the values were copied
+        """
+        if self._refs is None or self in self._refs.owners:
+            return False
+        return self.materialize()
+
+    def _copy_values(self):
+        self.values = self.values.copy()
 
     def merge(self, other):
         if not self.ref_items.equals(other.ref_items):
@@ -115,6 +214,14 @@ class Block(object):
         """
         Reindex using pre-computed indexer information
         """
+        if (needs_masking and self._nullable and self.values.ndim == 2
+            and self.values.size > 0 and _is_nan(fill_value)
+            and _nullable_int_bool()):
+            new_values, valid = com.take_nullable(self.values, None, indexer,
+                                                  axis=axis, mask=mask)
+            return make_block(new_values, self.items, self.ref_items,
+                              valid=valid)
+
         if self.values.size > 0:
             new_values = com.take_fast(self.values, indexer, mask,
                                        needs_masking, axis=axis,
@@ -126,13 +233,16 @@ class Block(object):
             new_values.fill(fill_value)
         return make_block(new_values, self.items, self.ref_items)
 
-    def reindex_items_from(self, new_ref_items, copy=True):
+    def reindex_items_from(self, new_ref_items, copy=True, share=False):
         """
         Reindex to only those items contained in the input set of items
 
         E.g. if you have ['a', 'b'], and the input items is ['b', 'c', 'd'],
         then the resulting items will be ['b']
 
+        If share=True, copies are made copy-on-write where the new values are
+        a view on the block's values
+
         Returns
         -------
         reindexed : Block
@@ -140,11 +250,23 @@ class Block(object):
         new_ref_items, indexer = self.items.reindex(new_ref_items)
         if indexer is None:
             new_items = new_ref_items
-            new_values = self.values.copy() if copy else self.values
+            if copy and share:
+                return self.share(items=new_items, ref_items=new_ref_items)
+            if not copy:
+                return _view_of(make_block(self.values, new_items,
+                                           new_ref_items,
+                                           levels=self.levels), self)
+            new_values = self.values.copy()
         else:
             mask = indexer != -1
             masked_idx = indexer[mask]
 
+            if copy and share and _is_contiguous(masked_idx):
+                start = masked_idx[0]
+                values = self.values[start:start + len(masked_idx)]
+                return self.share(values, self.items.take(masked_idx),
+                                  new_ref_items)
+
             if self.values.ndim == 2:
                 new_values = com.take_2d(self.values, masked_idx, axis=0,
                                          needs_masking=False)
@@ -152,7 +274,8 @@ class Block(object):
                 new_values = self.values.take(masked_idx, axis=0)
 
             new_items = self.items.take(masked_idx)
-        return make_block(new_values, new_items, new_ref_items)
+        return make_block(new_values, new_items, new_ref_items,
+                          levels=self.levels)
 
     def get(self, item):
         loc = self.items.get_loc(item)
@@ -166,6 +289,7 @@ class Block(object):
         -------
         None
         """
+        self.materialize()
         loc = self.items.get_loc(item)
         self.values[loc] = value
 
@@ -178,7 +302,8 @@ class Block(object):
         loc = self.items.get_loc(item)
         new_items = self.items.delete(loc)
         new_values = np.delete(self.values, loc, 0)
-        return make_block(new_values, new_items, self.ref_items)
+        return make_block(new_values, new_items, self.ref_items,
+                          levels=self.levels)
 
     def split_block_at(self, item):
         """
@@ -190,6 +315,13 @@ class Block(object):
         -------
         generator of Block
         """
+        for s,e in self._split_ranges_at(item):
+            yield _view_of(make_block(self.values[s:e],
+                                      self.items[s:e].copy(),
+                                      self.ref_items, levels=self.levels),
+                           self)
+
+    def _split_ranges_at(self, item):
         loc = self.items.get_loc(item)
 
         if type(loc) == slice or type(loc) == int:
@@ -198,12 +330,11 @@ class Block(object):
         else: # already a mask, inverted
             mask = -loc
 
-        for s,e in com.split_ranges(mask):
-            yield make_block(self.values[s:e],
-                             self.items[s:e].copy(),
-                             self.ref_items)
+        return com.split_ranges(mask)
 
     def fillna(self, value, inplace=False):
+        if inplace:
+            self.materialize()
         new_values = self.values if inplace else self.values.copy()
 
         mask = com.isnull(new_values)
@@ -221,6 +352,8 @@ class Block(object):
         raise NotImplementedError()
 
     def replace(self, to_replace, value, inplace=False):
+        if inplace:
+            self.materialize()
         new_values = self.values if inplace else self.values.copy()
         if self._can_hold_element(value):
             value = self._try_cast(value)
@@ -249,6 +382,8 @@ class Block(object):
             return make_block(new_values, self.items, self.ref_items)
 
     def putmask(self, mask, new, inplace=False):
+        if inplace:
+            self.materialize()
         new_values = self.values if inplace else self.values.copy()
         if self._can_hold_element(new):
             new = self._try_cast(new)
@@ -260,6 +395,8 @@ class Block(object):
 
     def interpolate(self, method='pad', axis=0, inplace=False,
                     limit=None, missing=None):
+        if inplace:
+            self.materialize()
         values = self.values if inplace else self.values.copy()
 
         if values.ndim != 2:
@@ -290,6 +427,22 @@ class Block(object):
     def get_values(self, dtype):
         return self.values
 
+    def to_native_types(self, slicer=None, na_rep='', **kwargs):
+        """
+        Values of the block, or of the rows in slicer, in a form that a csv
+        writer can write out, with missing values replaced by na_rep
+        """
+        values = self.values
+        if slicer is not None:
+            values = values[:, slicer]
+
+        if self._can_hold_na:
+            mask = com.isnull(values)
+            if mask.any():
+                values = values.astype(object)
+                values[mask] = na_rep
+        return values
+
     def diff(self, n):
         new_values = com.diff(self.values, n, axis=1)
         return make_block(new_values, self.items, self.ref_items)
@@ -330,6 +483,24 @@ class FloatBlock(Block):
         # unnecessarily
         return issubclass(value.dtype.type, np.floating)
 
+    def to_native_types(self, slicer=None, na_rep='', float_format=None,
+                        **kwargs):
+        values = self.values
+        if slicer is not None:
+            values = values[:, slicer]
+
+        # only NaN, inf is written out as is
+        mask = np.isnan(values)
+        if float_format is not None:
+            formatted = [float_format % x for x in values.ravel()]
+            values = np.array(formatted, dtype=object).reshape(values.shape)
+        elif mask.any():
+            values = values.astype(object)
+
+        if mask.any():
+            values[mask] = na_rep
+        return values
+
 
 class ComplexBlock(Block):
     _can_hold_na = True
@@ -349,6 +520,7 @@ class ComplexBlock(Block):
 
 class IntBlock(Block):
     _can_hold_na = False
+    _nullable = True
 
     def _can_hold_element(self, element):
         return com.is_integer(element)
@@ -365,6 +537,7 @@ class IntBlock(Block):
 
 class BoolBlock(Block):
     _can_hold_na = False
+    _nullable = True
 
     def _can_hold_element(self, element):
         return isinstance(element, (int, bool))
@@ -393,6 +566,25 @@ class ObjectBlock(Block):
                               (np.integer, np.floating, np.complexfloating,
                                np.datetime64, np.bool_))
 
+    def to_native_types(self, slicer=None, na_rep='', float_format=None,
+                        **kwargs):
+        values = self.values
+        if slicer is not None:
+            values = values[:, slicer]
+
+        mask = com.isnull(values)
+        if float_format is None and not mask.any():
+            return values
+
+        values = values.copy()
+        if float_format is not None:
+            flat = values.ravel()
+            for i, val in enumerate(flat):
+                if com.is_float(val):
+                    flat[i] = float_format % val
+        values[mask] = na_rep
+        return values
+
 _NS_DTYPE = np.dtype('M8[ns]')
 
 class DatetimeBlock(Block):
@@ -432,6 +624,7 @@ class DatetimeBlock(Block):
         if value.dtype != _NS_DTYPE:
             value = tslib.cast_to_nanoseconds(value)
 
+        self.materialize()
         self.values[loc] = value
 
     def get_values(self, dtype):
@@ -441,11 +634,383 @@ class DatetimeBlock(Block):
             return res.reshape(self.values.shape)
         return self.values
 
+    def to_native_types(self, slicer=None, na_rep='', **kwargs):
+        values = self.values
+        if slicer is not None:
+            values = values[:, slicer]
+
+        flat_i8 = values.ravel().view(np.int64)
+        result = tslib.format_datetime64(flat_i8, na_rep)
+        return result.reshape(values.shape)
+
+
+class MaskedBlock(Block):
+    """
+    Integer or boolean block with missing values, which are flagged False in
+    the validity mask: a boolean array the shape of the values. The values
+    are taken out of the block upcast to float64 or object, with NaN for the
+    missing ones, but are not stored upcast
+    """
+    _can_hold_na = True
+
+    def __init__(self, values, items, ref_items, ndim=2, valid=None):
+        if valid is None:
+            valid = np.ones(values.shape, dtype=bool)
+        if valid.shape != values.shape:
+            raise AssertionError('Validity mask must have the shape of the '
+                                 'values')
+
+        Block.__init__(self, values, items, ref_items, ndim=ndim)
+        self.valid = valid
+
+    def _gi(self, arg):
+        if not self.valid[arg]:
+            return np.nan
+        return self.values[arg]
+
+    def __getstate__(self):
+        return (self.items, self.ref_items, self.values, self.valid)
+
+    def __setstate__(self, state):
+        Block.__setstate__(self, state[:3])
+        self.valid = state[3]
+
+    def copy(self, deep=True):
+        values, valid = self.values, self.valid
+        if deep:
+            values, valid = values.copy(), valid.copy()
+        newb = make_block(values, self.items, self.ref_items, valid=valid)
+        if not deep:
+            _view_of(newb, self)
+        return newb
+
+    def decode(self):
+        return make_block(_fill_masked(self.values, self.valid), self.items,
+                          self.ref_items)
+
+    def _copy_values(self):
+        self.values = self.values.copy()
+        self.valid = self.valid.copy()
+
+    def reindex_axis(self, indexer, mask, needs_masking, axis=0,
+                     fill_value=np.nan):
+        if self.values.size == 0 or not _is_nan(fill_value):
+            return self.decode().reindex_axis(indexer, mask, needs_masking,
+                                              axis=axis,
+                                              fill_value=fill_value)
+        new_values, valid = com.take_nullable(self.values, self.valid,
+                                              indexer, axis=axis, mask=mask)
+        return make_block(new_values, self.items, self.ref_items, valid=valid)
+
+    def reindex_items_from(self, new_ref_items, copy=True, share=False):
+        new_ref_items, indexer = self.items.reindex(new_ref_items)
+        if indexer is None:
+            if copy and share:
+                return self.share(items=new_ref_items, ref_items=new_ref_items)
+            new_items = new_ref_items
+            if not copy:
+                return _view_of(make_block(self.values, new_items,
+                                           new_ref_items, valid=self.valid),
+                                self)
+            new_values, valid = self.values.copy(), self.valid.copy()
+        else:
+            masked_idx = indexer[indexer != -1]
+
+            if copy and share and _is_contiguous(masked_idx):
+                start = masked_idx[0]
+                sl = slice(start, start + len(masked_idx))
+                return self.share(self.values[sl], self.items.take(masked_idx),
+                                  new_ref_items, valid=self.valid[sl])
+
+            new_values = com.take_2d(self.values, masked_idx, axis=0,
+                                     needs_masking=False)
+            valid = com.take_2d(self.valid, masked_idx, axis=0,
+                                needs_masking=False)
+            new_items = self.items.take(masked_idx)
+        return make_block(new_values, new_items, new_ref_items, valid=valid)
+
+    def get(self, item):
+        loc = self.items.get_loc(item)
+        valid = self.valid[loc]
+        if valid.all():
+            # only upcast items that have missing values
+            return self.values[loc]
+        return _fill_masked(self.values[loc], valid)
+
+    def set(self, item, value):
+        """
+        Modify Block in-place with new item value
+
+        Returns
+        -------
+        None
+        """
+        self.materialize()
+        loc = self.items.get_loc(item)
+        self.values[loc] = value
+        self.valid[loc] = True
+
+    def delete(self, item):
+        loc = self.items.get_loc(item)
+        new_items = self.items.delete(loc)
+        new_values = np.delete(self.values, loc, 0)
+        valid = np.delete(self.valid, loc, 0)
+        return make_block(new_values, new_items, self.ref_items, valid=valid)
+
+    def split_block_at(self, item):
+        for s,e in self._split_ranges_at(item):
+            yield _view_of(make_block(self.values[s:e],
+                                      self.items[s:e].copy(),
+                                      self.ref_items, valid=self.valid[s:e]),
+                           self)
 
-def make_block(values, items, ref_items):
+    def fillna(self, value, inplace=False):
+        if not self._can_hold_element(value):
+            return self.decode().fillna(value, inplace=True)
+
+        if inplace:
+            self.materialize()
+        new_values = self.values if inplace else self.values.copy()
+        np.putmask(new_values, -self.valid, self._try_cast(value))
+
+        if inplace:
+            self.valid = np.ones(self.shape, dtype=bool)
+            return self
+        else:
+            return make_block(new_values, self.items, self.ref_items)
+
+    def replace(self, to_replace, value, inplace=False):
+        return self.decode().replace(to_replace, value, inplace=True)
+
+    def putmask(self, mask, new, inplace=False):
+        return self.decode().putmask(mask, new, inplace=True)
+
+    def interpolate(self, method='pad', axis=0, inplace=False,
+                    limit=None, missing=None):
+        if missing is not None:
+            return self.decode().interpolate(method, axis=axis, inplace=True,
+                                             limit=limit, missing=missing)
+        if inplace:
+            self.materialize()
+        values = self.values if inplace else self.values.copy()
+        valid = self.valid if inplace else self.valid.copy()
+
+        if values.ndim != 2:
+            raise NotImplementedError
+
+        transf = (lambda x: x) if axis == 0 else (lambda x: x.T)
+        fill_f = com.pad_2d if method == 'pad' else com.backfill_2d
+
+        # the fill is tracked by filling the validity mask the same way
+        mask = -transf(valid)
+        fill_f(transf(values), limit=limit, mask=mask)
+        fill_f(transf(valid), limit=limit, mask=mask)
+
+        if inplace:
+            return self
+        return make_block(values, self.items, self.ref_items, valid=valid)
+
+    def take(self, indexer, axis=1, fill_value=np.nan):
+        if axis < 1:
+            raise AssertionError('axis must be at least 1, got %d' % axis)
+        new_values, valid = com.take_nullable(self.values, self.valid,
+                                              indexer, axis=axis)
+        return make_block(new_values, self.items, self.ref_items, valid=valid)
+
+    def get_values(self, dtype):
+        return _fill_masked(self.values, self.valid)
+
+    def to_native_types(self, slicer=None, na_rep='', **kwargs):
+        values, valid = self.values, self.valid
+        if slicer is not None:
+            values, valid = values[:, slicer], valid[:, slicer]
+
+        values = values.astype(object)
+        values[-valid] = na_rep
+        return values
+
+    def diff(self, n):
+        return self.decode().diff(n)
+
+
+class MaskedIntBlock(MaskedBlock, IntBlock):
+    pass
+
+
+class MaskedBoolBlock(MaskedBlock, BoolBlock):
+    pass
+
+
+class CategoricalBlock(Block):
+    """
+    Block of categorical items sharing the same levels, stored as integer
+    codes into the levels with -1 for missing values (see Categorical). The
+    codes are of the smallest integer dtype that holds them, and the values
+    are decoded when taken out of the block
+    """
+    _can_hold_na = True
+
+    def __init__(self, values, items, ref_items, ndim=2, levels=None):
+        if levels is None:
+            raise AssertionError('Categorical blocks must have levels')
+        if not issubclass(values.dtype.type, np.integer):
+            raise AssertionError('Categorical codes must be integers, got '
+                                 'dtype %s' % values.dtype)
+
+        Block.__init__(self, values, items, ref_items, ndim=ndim)
+        self.levels = _ensure_index(levels)
+
+    def _gi(self, arg):
+        code = self.values[arg]
+        if code == -1:
+            return np.nan
+        return self.levels[code]
+
+    def __getstate__(self):
+        return (self.items, self.ref_items, self.values, self.levels)
+
+    def __setstate__(self, state):
+        Block.__setstate__(self, state[:3])
+        self.levels = state[3]
+
+    def decode(self):
+        return make_block(_decode(self.values, self.levels), self.items,
+                          self.ref_items)
+
+    def should_store(self, value):
+        # values set are stored decoded, in a block of their own
+        return False
+
+    def reindex_axis(self, indexer, mask, needs_masking, axis=0,
+                     fill_value=np.nan):
+        if self.values.size == 0 or not _is_nan(fill_value):
+            return self.decode().reindex_axis(indexer, mask, needs_masking,
+                                              axis=axis,
+                                              fill_value=fill_value)
+        new_values = _take_codes(self.values, indexer, axis=axis)
+        return make_block(new_values, self.items, self.ref_items,
+                          levels=self.levels)
+
+    def get(self, item):
+        loc = self.items.get_loc(item)
+        return _decode(self.values[loc], self.levels)
+
+    def get_categorical(self, item):
+        loc = self.items.get_loc(item)
+        return Categorical(self.values[loc], self.levels, name=item)
+
+    def fillna(self, value, inplace=False):
+        if value not in self.levels:
+            return self.decode().fillna(value, inplace=True)
+
+        if inplace:
+            self.materialize()
+        new_values = self.values if inplace else self.values.copy()
+        np.putmask(new_values, new_values == -1, self.levels.get_loc(value))
+
+        if inplace:
+            return self
+        return make_block(new_values, self.items, self.ref_items,
+                          levels=self.levels)
+
+    def replace(self, to_replace, value, inplace=False):
+        return self.decode().replace(to_replace, value, inplace=True)
+
+    def putmask(self, mask, new, inplace=False):
+        return self.decode().putmask(mask, new, inplace=True)
+
+    def interpolate(self, method='pad', axis=0, inplace=False,
+                    limit=None, missing=None):
+        return self.decode().interpolate(method, axis=axis, inplace=True,
+                                         limit=limit, missing=missing)
+
+    def take(self, indexer, axis=1, fill_value=np.nan):
+        if axis < 1:
+            raise AssertionError('axis must be at least 1, got %d' % axis)
+        new_values = _take_codes(self.values, indexer, axis=axis)
+        return make_block(new_values, self.items, self.ref_items,
+                          levels=self.levels)
+
+    def get_values(self, dtype):
+        return _decode(self.values, self.levels)
+
+    def to_native_types(self, slicer=None, **kwargs):
+        values = self.values
+        if slicer is not None:
+            values = values[:, slicer]
+
+        decoded = make_block(_decode(values, self.levels), self.items,
+                             self.ref_items)
+        return decoded.to_native_types(**kwargs)
+
+    def diff(self, n):
+        return self.decode().diff(n)
+
+
+class StringBlock(CategoricalBlock):
+    """
+    Block of string items stored compactly (see StringArray), as integer
+    codes into a StringArray of the strings with -1 for missing values.
+    Taking or reindexing rows only moves the codes, the strings are shared
+    """
+    def __init__(self, values, items, ref_items, ndim=2, levels=None):
+        if not isinstance(levels, StringArray):
+            raise AssertionError('String blocks must have a StringArray of '
+                                 'levels')
+        if not issubclass(values.dtype.type, np.integer):
+            raise AssertionError('String codes must be integers, got '
+                                 'dtype %s' % values.dtype)
+
+        Block.__init__(self, values, items, ref_items, ndim=ndim)
+        self.levels = levels
+
+    def get_categorical(self, item):
+        return None
+
+    def get_string_array(self, item):
+        loc = self.items.get_loc(item)
+        codes = self.values[loc]
+        if (len(codes) == len(self.levels) and
+            (codes == np.arange(len(codes))).all()):
+            return self.levels
+        return self.levels.take(codes)
+
+    def fillna(self, value, inplace=False):
+        return self.decode().fillna(value, inplace=True)
+
+
+def make_block(values, items, ref_items, valid=None, levels=None):
+    """
+    Block of the type for the dtype of the values. Integer and boolean values
+    with missing ones flagged in valid make a masked block, integer codes
+    into levels a categorical block, or a string block if the levels are a
+    StringArray
+    """
     dtype = values.dtype
     vtype = dtype.type
 
+    if isinstance(levels, StringArray):
+        return StringBlock(values, items, ref_items, ndim=values.ndim,
+                           levels=levels)
+    elif levels is not None:
+        return CategoricalBlock(values, items, ref_items, ndim=values.ndim,
+                                levels=levels)
+
+    if valid is not None and valid.all():
+        valid = None
+
+    if valid is not None:
+        if issubclass(vtype, np.integer):
+            if vtype != np.int64:
+                values = values.astype('i8')
+            klass = MaskedIntBlock
+        elif dtype == np.bool_:
+            klass = MaskedBoolBlock
+        else:
+            raise AssertionError('Only integer and boolean blocks can be '
+                                 'masked, got dtype %s' % dtype)
+        return klass(values, items, ref_items, ndim=values.ndim, valid=valid)
+
     if issubclass(vtype, np.floating):
         klass = FloatBlock
     elif issubclass(vtype, np.complexfloating):
@@ -466,6 +1031,10 @@ def make_block(values, items, ref_items):
 # TODO: flexible with index=None and/or items=None
 
 
+# blocks a manager can be split into before inserting an item merges them
+_MIN_FRAGMENTED_BLOCKS = 100
+
+
 class BlockManager(object):
     """
     Core internal data structure to implement DataFrame
@@ -482,18 +1051,27 @@ class BlockManager(object):
     -----
     This is *not* a public API class
     """
-    __slots__ = ['axes', 'blocks', '_known_consolidated', '_is_consolidated']
+    __slots__ = ['axes', 'blocks', '_known_consolidated', '_is_consolidated',
+                 '_has_shared']
 
     def __init__(self, blocks, axes, do_integrity_check=True):
         self.axes = [_ensure_index(ax) for ax in axes]
         self.blocks = blocks
 
+        # set when copy-on-write copies of the blocks are made (here or by
+        # the manager they were shared from), or when there are masked or
+        # categorical blocks: either way items can't be handed out as views
+        # on the block values
+        self._has_shared = False
+
         ndim = len(axes)
         for block in blocks:
             if ndim != block.values.ndim:
                 raise AssertionError(('Number of Block dimensions (%d) must '
                                       'equal number of axes (%d)')
                                      % (block.values.ndim, ndim))
+            if _is_encoded(block) or block._refs is not None:
+                self._has_shared = True
 
 
         if do_integrity_check:
@@ -512,6 +1090,20 @@ class BlockManager(object):
     def ndim(self):
         return len(self.axes)
 
+    @property
+    def is_masked(self):
+        return any(blk.valid is not None for blk in self.blocks)
+
+    @property
+    def is_categorical(self):
+        return any(blk.levels is not None for blk in self.blocks)
+
+    @property
+    def is_encoded(self):
+        # masked or categorical blocks, whose values are taken out upcast or
+        # decoded
+        return any(_is_encoded(blk) for blk in self.blocks)
+
     def is_mixed_dtype(self):
         counts = set()
         for block in self.blocks:
@@ -542,6 +1134,13 @@ class BlockManager(object):
         block_values = [b.values for b in self.blocks]
         block_items = [b.items for b in self.blocks]
         axes_array = [ax for ax in self.axes]
+        block_valid = [b.valid for b in self.blocks]
+        block_levels = [b.levels for b in self.blocks]
+        if any(levels is not None for levels in block_levels):
+            return (axes_array, block_values, block_items, block_valid,
+                    block_levels)
+        if any(valid is not None for valid in block_valid):
+            return axes_array, block_values, block_items, block_valid
         return axes_array, block_values, block_items
 
     def __setstate__(self, state):
@@ -549,14 +1148,25 @@ class BlockManager(object):
         # while longer
         ax_arrays, bvalues, bitems = state[:3]
 
+        # validity masks of masked blocks, levels of categorical blocks
+        bvalid = [None] * len(bvalues)
+        blevels = [None] * len(bvalues)
+        if len(state) > 3 and isinstance(state[3], list):
+            bvalid = state[3]
+        if len(state) > 4 and isinstance(state[4], list):
+            blevels = state[4]
+
         self.axes = [_ensure_index(ax) for ax in ax_arrays]
         self.axes = _handle_legacy_indexes(self.axes)
 
         blocks = []
-        for values, items in zip(bvalues, bitems):
-            blk = make_block(values, items, self.axes[0])
+        for values, items, valid, levels in zip(bvalues, bitems, bvalid,
+                                                blevels):
+            blk = make_block(values, items, self.axes[0], valid=valid,
+                             levels=levels)
             blocks.append(blk)
         self.blocks = blocks
+        self._has_shared = any(_is_encoded(blk) for blk in blocks)
 
     def __len__(self):
         return len(self.items)
@@ -592,7 +1202,7 @@ class BlockManager(object):
 
     def astype(self, dtype):
         new_blocks = []
-        for block in self.blocks:
+        for block in self.decode().blocks:
             newb = make_block(com._astype_nansafe(block.values, dtype),
                               block.items, block.ref_items)
             new_blocks.append(newb)
@@ -609,7 +1219,8 @@ class BlockManager(object):
         return self._is_consolidated
 
     def _consolidate_check(self):
-        dtypes = [blk.dtype.type for blk in self.blocks]
+        # categorical blocks are not merged, see _consolidate
+        dtypes = [blk.dtype.type for blk in self.blocks if blk.levels is None]
         self._is_consolidated = len(dtypes) == len(set(dtypes))
         self._known_consolidated = True
 
@@ -630,8 +1241,9 @@ class BlockManager(object):
             type_list = self._get_clean_block_types(type_list)
             filter_blocks = lambda block: isinstance(block, type_list)
 
-        maybe_copy = lambda b: b.copy() if copy else b
-        num_blocks = [maybe_copy(b) for b in self.blocks if filter_blocks(b)]
+        num_blocks = [b for b in self.blocks if filter_blocks(b)]
+        if copy:
+            num_blocks = self._copy_blocks(num_blocks)
 
         if len(num_blocks) == 0:
             return BlockManager.make_empty()
@@ -672,21 +1284,32 @@ class BlockManager(object):
         new_axes = list(self.axes)
         new_axes[axis] = new_axes[axis][slobj]
 
+        # slices are views, or copy-on-write copies
+        share = _copy_on_write()
+        if share:
+            self._has_shared = True
+
         if axis == 0:
             new_items = new_axes[0]
             if len(self.blocks) == 1:
                 blk = self.blocks[0]
-                newb = make_block(blk.values[slobj], new_items,
-                                  new_items)
+                valid = _slice_valid(blk, slobj)
+                if share:
+                    newb = blk.share(blk.values[slobj], new_items, new_items,
+                                     valid=valid)
+                else:
+                    newb = _view_of(make_block(blk.values[slobj], new_items,
+                                               new_items, valid=valid,
+                                               levels=blk.levels), blk)
                 new_blocks = [newb]
             else:
                 return self.reindex_items(new_items)
         else:
-            new_blocks = self._slice_blocks(slobj, axis)
+            new_blocks = self._slice_blocks(slobj, axis, share=share)
 
         return BlockManager(new_blocks, new_axes, do_integrity_check=False)
 
-    def _slice_blocks(self, slobj, axis):
+    def _slice_blocks(self, slobj, axis, share=False):
         new_blocks = []
 
         slicer = [slice(None, None) for _ in range(self.ndim)]
@@ -694,8 +1317,13 @@ class BlockManager(object):
         slicer = tuple(slicer)
 
         for block in self.blocks:
-            newb = make_block(block.values[slicer], block.items,
-                              block.ref_items)
+            valid = _slice_valid(block, slicer)
+            if share:
+                newb = block.share(block.values[slicer], valid=valid)
+            else:
+                newb = _view_of(make_block(block.values[slicer], block.items,
+                                           block.ref_items, valid=valid,
+                                           levels=block.levels), block)
             new_blocks.append(newb)
         return new_blocks
 
@@ -723,11 +1351,51 @@ class BlockManager(object):
         -------
         copy : BlockManager
         """
-        copy_blocks = [block.copy(deep=deep) for block in self.blocks]
+        if deep:
+            copy_blocks = self._copy_blocks(self.blocks)
+        else:
+            copy_blocks = [block.copy(deep=False) for block in self.blocks]
         # copy_axes = [ax.copy() for ax in self.axes]
         copy_axes = list(self.axes)
         return BlockManager(copy_blocks, copy_axes, do_integrity_check=False)
 
+    def _copy_blocks(self, blocks):
+        # deep copies, or copy-on-write copies if the option is set
+        if _copy_on_write():
+            self._has_shared = True
+            return [block.share() for block in blocks]
+        return [block.copy() for block in blocks]
+
+    def materialize(self):
+        """
+        Make own copies of the values shared copy-on-write with other objects
+        before writing to them, and upcast the masked blocks and decode the
+        categorical ones: element-wise writes go through views on the values.
+        Returns whether any values were copied
+        """
+        copied = False
+        for i, block in enumerate(self.blocks):
+            if _is_encoded(block):
+                # decoded blocks may consolidate with the others
+                self.blocks[i] = block.decode()
+                self._known_consolidated = False
+                copied = True
+            elif block.materialize():
+                copied = True
+        self._has_shared = False
+        return copied
+
+    def decode(self):
+        """
+        Manager with the masked blocks upcast to float64 or object blocks
+        holding NaN and the categorical blocks decoded, for code working on
+        the block values directly. Returns self if there are none
+        """
+        if not self.is_encoded:
+            return self
+        new_blocks = [blk.decode() for blk in self.blocks]
+        return BlockManager(new_blocks, self.axes, do_integrity_check=False)
+
     def as_matrix(self, items=None):
         if len(self.blocks) == 0:
             mat = np.empty(self.shape, dtype=float)
@@ -735,7 +1403,10 @@ class BlockManager(object):
             blk = self.blocks[0]
             if items is None or blk.items.equals(items):
                 # if not, then just call interleave per below
-                mat = blk.values
+                if not _is_encoded(blk):
+                    # the values are written to directly
+                    blk.materialize()
+                mat = blk.decode().values
             else:
                 mat = self.reindex_items(items).as_matrix()
         else:
@@ -803,11 +1474,14 @@ class BlockManager(object):
             if not copy:
                 raise Exception('cannot get view of mixed-type or '
                                 'non-consolidated DataFrame')
-            for blk in self.blocks:
+            for blk in self.decode().blocks:
                 newb = make_block(blk.values[slicer], blk.items, blk.ref_items)
-                new_blocks.append(newb)
+                new_blocks.append(_view_of(newb, blk))
         elif len(self.blocks) == 1:
-            vals = self.blocks[0].values[slicer]
+            if not copy:
+                # the view is written to directly
+                self.blocks[0].materialize()
+            vals = self.blocks[0].decode().values[slicer]
             if copy:
                 vals = vals.copy()
             new_blocks = [make_block(vals, self.items, self.items)]
@@ -819,10 +1493,16 @@ class BlockManager(object):
 
         """
         if len(self.blocks) == 1:
-            result = self.blocks[0].values[:, loc]
+            blk = self.blocks[0]
+            if blk.valid is not None:
+                return _fill_masked(blk.values[:, loc], blk.valid[:, loc])
+            if blk.levels is not None:
+                return _decode(blk.values[:, loc], blk.levels)
             if copy:
-                result = result.copy()
-            return result
+                return blk.values[:, loc].copy()
+            # the view is written to directly
+            blk.materialize()
+            return blk.values[:, loc]
 
         if not copy:
             raise Exception('cannot get view of mixed-type or '
@@ -855,13 +1535,54 @@ class BlockManager(object):
         return BlockManager(new_blocks, self.axes)
 
     def _consolidate_inplace(self):
+        if self.is_consolidated():
+            return
+
         self.blocks = _consolidate(self.blocks, self.items)
-        self._is_consolidated = true
+        self._is_consolidated = True
         self._known_consolidated = True
 
+    def _is_fragmented(self):
+        """
+        Whether the blocks left behind by inserting items should be merged.
+        Merging copies all the values, so it is put off until the blocks
+        outnumber half of the items: the number of items then doubles between
+        merges and adding items one at a time copies each value O(1) times
+        """
+        return len(self.blocks) > max(_MIN_FRAGMENTED_BLOCKS,
+                                      len(self.items) // 2)
+
     def get(self, item):
+        return self.get_block(item).get(item)
+
+    def get_block(self, item):
+        """
+        Block holding the item, with values views on which may be handed out,
+        see Block.prepare_views
+        """
+        _, block = self._find_block(item)
+        block.prepare_views()
+        return block
+
+    def get_categorical(self, item):
+        """
+        Categorical of the codes and levels of a categorical item, None if the
+        item is not categorical (or is not unique)
+        """
+        _, block = self._find_block(item)
+        if block.levels is None or not self.items.is_unique:
+            return None
+        return block.get_categorical(item)
+
+    def get_string_array(self, item):
+        """
+        StringArray of the strings of a compactly stored string item, None if
+        the item is not stored that way (or is not unique)
+        """
         _, block = self._find_block(item)
-        return block.get(item)
+        if not isinstance(block, StringBlock) or not self.items.is_unique:
+            return None
+        return block.get_string_array(item)
 
     def iget(self, i):
         item = self.items[i]
@@ -883,6 +1604,12 @@ class BlockManager(object):
 
             for j, (k, b) in enumerate(zip(inds, binds)):
                 if i == k:
+                    if block.valid is not None:
+                        return _fill_masked(block.values[b], block.valid[b])
+                    if block.levels is not None:
+                        return _decode(block.values[b], block.levels)
+                    # the view is written to directly
+                    block.materialize()
                     return block.values[b]
 
             raise Exception('Cannot have duplicate column names '
@@ -899,6 +1626,8 @@ class BlockManager(object):
         item_loc = blk.items.get_loc(item),
         full_loc = item_loc + tuple(ax.get_loc(x)
                                     for ax, x in zip(self.axes[1:], tup[1:]))
+        if _is_encoded(blk):
+            return blk._gi(full_loc)
         return blk.values[full_loc]
 
     def delete(self, item):
@@ -917,8 +1646,13 @@ class BlockManager(object):
     def set(self, item, value):
         """
         Set new item in-place. Does not consolidate. Adds new Block if not
-        contained in the current set of items
+        contained in the current set of items. A Categorical value is stored
+        as a categorical block of its own, a StringArray as a string block
         """
+        if isinstance(value, (Categorical, StringArray)):
+            self._set_encoded(item, value)
+            return
+
         if value.ndim == self.ndim - 1:
             value = value.reshape((1,) + value.shape)
         if value.shape[1:] != self.shape[1:]:
@@ -950,6 +1684,21 @@ class BlockManager(object):
 
         self._known_consolidated = False
 
+    def _set_encoded(self, item, value):
+        if len(value) != self.shape[1]:
+            raise AssertionError('Length of values does not match length of '
+                                 'manager axis')
+        if item in self.items:
+            if not isinstance(self.items.get_loc(item), int):
+                raise Exception('cannot set a %s to duplicate items'
+                                % type(value).__name__)
+            i, _ = self._find_block(item)
+            self._delete_from_block(i, item)
+            self._add_new_block(item, value, loc=None)
+            self._known_consolidated = False
+        else:
+            self.insert(len(self.items), item, value)
+
     def insert(self, loc, item, value):
         if item in self.items:
             raise Exception('cannot insert %s, already exists' % item)
@@ -960,7 +1709,7 @@ class BlockManager(object):
         # new block
         self._add_new_block(item, value, loc=loc)
 
-        if len(self.blocks) > 100:
+        if self._is_fragmented():
             self._consolidate_inplace()
 
         self._known_consolidated = False
@@ -986,8 +1735,18 @@ class BlockManager(object):
         # hm, elaborate hack?
         if loc is None:
             loc = self.items.get_loc(item)
-        new_block = make_block(value, self.items[loc:loc+1].copy(),
-                               self.items)
+        if isinstance(value, Categorical):
+            new_block = _categorical_block(value, self.items[loc:loc+1].copy(),
+                                           self.items)
+            # items are decoded copies
+            self._has_shared = True
+        elif isinstance(value, StringArray):
+            new_block = _string_block(value, self.items[loc:loc+1].copy(),
+                                      self.items)
+            self._has_shared = True
+        else:
+            new_block = make_block(value, self.items[loc:loc+1].copy(),
+                                   self.items)
         self.blocks.append(new_block)
 
     def _find_block(self, item):
@@ -1057,6 +1816,8 @@ class BlockManager(object):
         # keep track of what items aren't found anywhere
         mask = np.zeros(len(item_order), dtype=bool)
 
+        share = _copy_on_write()
+
         new_blocks = []
         for blk in self.blocks:
             blk_indexer = blk.items.get_indexer(item_order)
@@ -1068,10 +1829,25 @@ class BlockManager(object):
                 continue
 
             new_block_items = new_items.take(selector.nonzero()[0])
-            new_values = com.take_fast(blk.values, blk_indexer[selector],
+            blk_indexer = blk_indexer[selector]
+            if share and _is_contiguous(blk_indexer):
+                # a run of the block's items, share a view on them
+                sl = slice(blk_indexer[0], blk_indexer[0] + len(blk_indexer))
+                new_blocks.append(blk.share(blk.values[sl], new_block_items,
+                                            new_items,
+                                            valid=_slice_valid(blk, sl)))
+                self._has_shared = True
+                continue
+
+            new_values = com.take_fast(blk.values, blk_indexer,
                                        None, False, axis=0)
+            valid = None
+            if blk.valid is not None:
+                valid = com.take_fast(blk.valid, blk_indexer,
+                                      None, False, axis=0)
             new_blocks.append(make_block(new_values, new_block_items,
-                                         new_items))
+                                         new_items, valid=valid,
+                                         levels=blk.levels))
 
         if not mask.all():
             na_items = new_items[-mask]
@@ -1090,23 +1866,32 @@ class BlockManager(object):
         data = self
         if not data.is_consolidated():
             data = data.consolidate()
-            return data.reindex_items(new_items)
+            result = data.reindex_items(new_items)
+            # blocks that needed no merging are shared with self
+            self._has_shared = self._has_shared or data._has_shared
+            return result
 
         # TODO: this part could be faster (!)
         new_items, indexer = self.items.reindex(new_items)
 
+        share = copy and _copy_on_write()
+        if share:
+            self._has_shared = True
+
         # could have some pathological (MultiIndex) issues here
         new_blocks = []
         if indexer is None:
             for blk in self.blocks:
                 if copy:
-                    new_blocks.append(blk.reindex_items_from(new_items))
+                    new_blocks.append(blk.reindex_items_from(new_items,
+                                                             share=share))
                 else:
                     blk.ref_items = new_items
                     new_blocks.append(blk)
         else:
             for block in self.blocks:
-                newb = block.reindex_items_from(new_items, copy=copy)
+                newb = block.reindex_items_from(new_items, copy=copy,
+                                                share=share)
                 if len(newb.items) > 0:
                     new_blocks.append(newb)
 
@@ -1147,9 +1932,8 @@ class BlockManager(object):
         new_axes[axis] = self.axes[axis].take(indexer)
         new_blocks = []
         for blk in self.blocks:
-            new_values = com.take_fast(blk.values, indexer,
-                                       None, False, axis=axis)
-            newb = make_block(new_values, blk.items, self.items)
+            newb = blk.take(indexer, axis=axis)
+            newb.ref_items = self.items
             new_blocks.append(newb)
 
         return BlockManager(new_blocks, new_axes)
@@ -1216,11 +2000,12 @@ class BlockManager(object):
         new_items = Index([mapper(x) for x in self.items])
         new_items.is_unique
 
-        new_blocks = []
-        for block in self.blocks:
-            newb = block.copy(deep=copydata)
+        if copydata:
+            new_blocks = self._copy_blocks(self.blocks)
+        else:
+            new_blocks = [block.copy(deep=False) for block in self.blocks]
+        for newb in new_blocks:
             newb.set_ref_items(new_items, maybe_rename=True)
-            new_blocks.append(newb)
         new_axes = list(self.axes)
         new_axes[0] = new_items
         return BlockManager(new_blocks, new_axes)
@@ -1238,6 +2023,8 @@ class BlockManager(object):
                       if b._can_hold_na else b
                       for b in self.blocks]
         if inplace:
+            # masked blocks may be replaced by upcast ones
+            self.blocks = new_blocks
             return self
         return BlockManager(new_blocks, self.axes)
 
@@ -1245,12 +2032,15 @@ class BlockManager(object):
         new_blocks = [b.replace(to_replace, value, inplace=inplace)
                       for b in self.blocks]
         if inplace:
+            self.blocks = new_blocks
             return self
         return BlockManager(new_blocks, self.axes)
 
     def _replace_list(self, src_lst, dest_lst):
         sset = set(src_lst)
         if any([k in sset for k in dest_lst]):
+            # the masks are of the values, not of upcast copies
+            self.materialize()
             masks = {}
             for s in src_lst:
                 masks[s] = [b.values == s for b in self.blocks]
@@ -1419,8 +2209,13 @@ def _blocks_to_series_dict(blocks, index=None):
     series_dict = {}
 
     for block in blocks:
-        for item, vec in zip(block.items, block.values):
-            series_dict[item] = Series(vec, index=index, name=item)
+        block.prepare_views()
+        decoded = block.decode()
+        for item, vec in zip(block.items, decoded.values):
+            s = Series(vec, index=index, name=item)
+            if decoded is block:
+                s._block = block
+            series_dict[item] = s
     return series_dict
 
 def _interleaved_dtype(blocks):
@@ -1429,10 +2224,12 @@ def _interleaved_dtype(blocks):
     for x in blocks:
         counts[type(x)] += 1
 
+    # masked blocks are taken out upcast, categorical ones decoded
     have_int = counts[IntBlock] > 0
     have_bool = counts[BoolBlock] > 0
-    have_object = counts[ObjectBlock] > 0
-    have_float = counts[FloatBlock] > 0
+    have_object = (counts[ObjectBlock] > 0 or counts[MaskedBoolBlock] > 0 or
+                   counts[CategoricalBlock] > 0 or counts[StringBlock] > 0)
+    have_float = counts[FloatBlock] > 0 or counts[MaskedIntBlock] > 0
     have_complex = counts[ComplexBlock] > 0
     have_dt64 = counts[DatetimeBlock] > 0
     have_numeric = have_float or have_complex or have_int
@@ -1452,17 +2249,143 @@ def _interleaved_dtype(blocks):
     else:
         return np.dtype('f8')
 
+def _copy_on_write():
+    return get_option('mode.copy_on_write')
+
+
+class _SharedValues(object):
+    """
+    Blocks sharing values copy-on-write: the owners are the block whose
+    values were shared and its views, the others the blocks sharing them
+    """
+
+    def __init__(self):
+        self.owners = weakref.WeakSet()
+        self.others = weakref.WeakSet()
+
+
+def _view_of(newb, block):
+    """
+    Make a block whose values are a view on the values of block share them
+    copy-on-write the same way block does
+    """
+    refs = block._refs
+    if refs is not None:
+        newb._refs = refs
+        if block in refs.owners:
+            refs.owners.add(newb)
+        else:
+            refs.others.add(newb)
+    return newb
+
+
+def _nullable_int_bool():
+    return get_option('mode.nullable_int_bool')
+
+
+def _is_nan(value):
+    return value is None or (com.is_float(value) and np.isnan(value))
+
+
+def _block_valid(block):
+    # validity mask of any block, all True if it is not masked
+    if block.valid is None:
+        return np.ones(block.shape, dtype=bool)
+    return block.valid
+
+
+def _slice_valid(block, slicer):
+    if block.valid is None:
+        return None
+    return block.valid[slicer]
+
+
+def _is_encoded(block):
+    return block.valid is not None or block.levels is not None
+
+
+def _codes_dtype(nlevels):
+    # smallest integer dtype holding the codes into nlevels levels, and -1
+    for dtype in (np.int8, np.int16, np.int32):
+        if nlevels <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def _categorical_block(cat, items, ref_items):
+    levels = _ensure_index(cat.levels)
+    codes = np.asarray(cat.labels)
+
+    null = com.isnull(levels.values)
+    if null.any():
+        # missing values are coded -1, not as a level
+        relabel = np.append((-null).cumsum() - 1, -1)
+        relabel[:-1][null] = -1
+        codes = relabel.take(com._ensure_platform_int(codes))
+        levels = levels[-null]
+
+    codes = codes.astype(_codes_dtype(len(levels)))
+    return make_block(codes.reshape((1, len(codes))), items, ref_items,
+                      levels=levels)
+
+
+def _string_block(arr, items, ref_items):
+    codes = np.arange(len(arr), dtype=_codes_dtype(len(arr)))
+    codes[arr.mask] = -1
+    return make_block(codes.reshape((1, len(codes))), items, ref_items,
+                      levels=arr)
+
+
+def _decode(codes, levels):
+    # values of the levels the codes stand for, NaN for -1
+    if isinstance(levels, StringArray):
+        result = levels.take(codes.ravel()).values
+    else:
+        result = com.take_1d(levels.values, codes.ravel())
+    return result.reshape(codes.shape)
+
+
+def _take_codes(codes, indexer, axis=0):
+    # -1 in the indexer makes a missing code, not an upcast
+    indexer = com._ensure_platform_int(indexer)
+    result = com.ndtake(codes, indexer, axis=axis)
+    mask = indexer == -1
+    if mask.any():
+        com.mask_out_axis(result, mask, axis, fill_value=-1)
+    return result
+
+
+def _fill_masked(values, valid):
+    # upcast copy of the values holding NaN where they are missing
+    result = com._maybe_upcast(values)
+    if result is values:
+        result = result.copy()
+    np.putmask(result, -valid, np.nan)
+    return result
+
+
+def _is_contiguous(indexer):
+    # indexer selects a run of consecutive positions, in order
+    if len(indexer) == 0:
+        return False
+    return (indexer[-1] - indexer[0] == len(indexer) - 1 and
+            (len(indexer) == 1 or (np.diff(indexer) == 1).all()))
+
+
 def _consolidate(blocks, items):
     """
-    Merge blocks having same dtype
+    Merge blocks having same dtype. Categorical blocks are left as they are,
+    their codes are into levels of their own
     """
     get_dtype = lambda x: x.dtype.name
 
+    new_blocks = [b for b in blocks if b.levels is not None]
+    blocks = [b for b in blocks if b.levels is None]
+
     # sort by dtype
     grouper = itertools.groupby(sorted(blocks, key=get_dtype),
                                 lambda x: x.dtype)
 
-    new_blocks = []
     for dtype, group_blocks in grouper:
         new_block = _merge_blocks(list(group_blocks), items)
         new_blocks.append(new_block)
@@ -1476,8 +2399,11 @@ def _merge_blocks(blocks, items):
     if len(blocks) == 1:
         return blocks[0]
     new_values = _vstack([b.values for b in blocks])
+    new_valid = None
+    if any(b.valid is not None for b in blocks):
+        new_valid = np.vstack([_block_valid(b) for b in blocks])
     new_items = blocks[0].items.append([b.items for b in blocks[1:]])
-    new_block = make_block(new_values, new_items, items)
+    new_block = make_block(new_values, new_items, items, valid=new_valid)
     return new_block.reindex_items_from(items)
 
 def _vstack(to_stack):
@@ -337,6 +337,60 @@ def nanprod(values, axis=None, skipna=True):
     return _maybe_null_out(result, axis, mask)
 
 
+def nanmasked(op, values, mask, axis=None, skipna=True, **kwds):
+    """
+    Reduce integer (or boolean) values whose missing entries are flagged in
+    mask. Sums, products, minima, maxima and means of integers are computed
+    without upcasting the values to float64 first, so the sums and extrema
+    are exact and stay integers unless a result is NA. Other reductions are
+    computed on the values upcast with NaN
+    """
+    if (op not in _masked_methods or
+        not issubclass(values.dtype.type, np.integer)):
+        filled = com._maybe_upcast(values)
+        if filled is values:
+            filled = filled.copy()
+        np.putmask(filled, mask, np.nan)
+        return op(filled, axis=axis, skipna=skipna, **kwds)
+
+    if op is nanmean:
+        the_sum = nanmasked(nansum, values, mask, axis=axis, skipna=skipna)
+        return the_sum / _get_counts(mask, axis)
+
+    method, fill_value = _masked_methods[op]
+    if fill_value is None:
+        info = np.iinfo(values.dtype)
+        fill_value = info.max if op is nanmin else info.min
+
+    values = values.copy()
+    np.putmask(values, mask, fill_value)
+    result = getattr(values, method)(axis)
+
+    if skipna:
+        null_mask = mask.all(axis)
+    else:
+        null_mask = mask.any(axis)
+
+    if axis is None:
+        if null_mask:
+            result = np.nan
+    elif null_mask.any():
+        result = result.astype('f8')
+        result[null_mask] = np.nan
+    return result
+
+
+# method of the values, value to fill the missing values with (None: the
+# extreme value of the dtype)
+_masked_methods = {
+    nansum: ('sum', 0),
+    nanprod: ('prod', 1),
+    nanmin: ('min', None),
+    nanmax: ('max', None),
+    nanmean: (None, None),
+}
+
+
 def _maybe_arg_null_out(result, axis, mask, skipna):
     # helper function for nanargmin/nanargmax
     if axis is None:
@@ -372,7 +372,7 @@ def _unstack_frame(obj, level):
 
         new_blocks = []
         mask_blocks = []
-        for blk in obj._data.blocks:
+        for blk in obj._data.decode().blocks:
             bunstacker = _Unstacker(blk.values.T, obj.index, level=level,
                                     value_columns=blk.items)
             new_items = bunstacker.get_new_columns()
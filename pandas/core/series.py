@@ -26,6 +26,7 @@ from pandas.util import py3compat
 from pandas.util.terminal import get_terminal_size
 import pandas.core.common as com
 import pandas.core.datetools as datetools
+import pandas.core.expressions as expressions
 import pandas.core.format as fmt
 import pandas.core.generic as generic
 import pandas.core.nanops as nanops
@@ -56,7 +57,7 @@ def _arith_method(op, name):
     """
     def na_op(x, y):
         try:
-            result = op(x, y)
+            result = expressions.evaluate(op, x, y)
         except TypeError:
             result = np.empty(len(x), dtype=x.dtype)
             if isinstance(y, np.ndarray):
@@ -121,7 +122,7 @@ def _comp_method(op, name):
             else:
                 result = lib.scalar_compare(x, y, op)
         else:
-            result = op(x, y)
+            result = expressions.evaluate(op, x, y)
 
         return result
 
@@ -433,6 +434,10 @@ copy : boolean, default False
     _index = None
     index = lib.SeriesIndex()
 
+    # the block of the frame the Series is a column of, if it is a view on
+    # the block's values
+    _block = None
+
     def __array_finalize__(self, obj):
         """
         Gets called after any ufunc or other array operations, necessary
@@ -591,6 +596,8 @@ copy : boolean, default False
         if len(cond) != len(self):
             raise ValueError('condition must have same length as series')
 
+        if inplace:
+            self._materialize()
         ser = self if inplace else self.copy()
         if not isinstance(other, (list, tuple, np.ndarray)):
             ser._set_with(~cond, other)
@@ -620,7 +627,17 @@ copy : boolean, default False
         """
         return self.where(~cond, nan)
 
+    def _materialize(self):
+        """
+        Make the frame column the Series is a view on copy the values it
+        shares copy-on-write with other frames (see the mode.copy_on_write
+        option) before writing to them in place
+        """
+        if self._block is not None:
+            self._block.materialize()
+
     def __setitem__(self, key, value):
+        self._materialize()
         try:
             try:
                 self.index._engine.set_value(self, key, value)
@@ -859,6 +876,7 @@ copy : boolean, default False
             otherwise a new object
         """
         try:
+            self._materialize()
             self.index._engine.set_value(self, label, value)
             return self
         except KeyError:
@@ -1884,6 +1902,7 @@ copy : boolean, default False
         """
         other = other.reindex_like(self)
         mask = notnull(other)
+        self._materialize()
         np.putmask(self.values, mask, other.values)
 
     #----------------------------------------------------------------------
@@ -2412,6 +2431,9 @@ copy : boolean, default False
         if not self._can_hold_na:
             return self.copy() if not inplace else self
 
+        if inplace:
+            self._materialize()
+
         if value is not None:
             if method is not None:
                 raise ValueError('Cannot specify both a fill value and method')
@@ -2478,6 +2500,8 @@ copy : boolean, default False
         -------
         replaced : Series
         """
+        if inplace:
+            self._materialize()
         result = self.copy() if not inplace else self
 
         def _rep_one(s, to_rep, v):  # replace single value
@@ -0,0 +1,183 @@
+# pylint: disable=E1101,W0232
+
+import numpy as np
+
+import pandas.core.common as com
+import pandas._strings as _strings
+
+
+class StringArray(object):
+    """
+    Array of strings stored compactly as one contiguous buffer of UTF-8
+    bytes and the offsets of the strings in it, instead of as an object array
+    of Python strings. The vectorized string functions in pandas.core.strings
+    run in compiled loops on it without creating a string object per value
+
+    Parameters
+    ----------
+    data : ndarray (uint8)
+        UTF-8 bytes of the strings, string i is data[offsets[i]:offsets[i+1]]
+    offsets : ndarray (int64), one longer than the array
+    mask : ndarray (boolean)
+        True where the value is missing
+    is_unicode : boolean, default False
+        Whether the values are unicode or byte strings
+
+    Examples
+    --------
+    >>> arr = StringArray.from_array(df['ticker'])
+    >>> arr.str.startswith('AA')
+    >>> df['ticker'] = arr
+    """
+    def __init__(self, data, offsets, mask, is_unicode=False, name=None):
+        if len(offsets) != len(mask) + 1:
+            raise ValueError('offsets must be one longer than the mask')
+        self.data = data
+        self.offsets = offsets
+        self.mask = mask
+        self.is_unicode = is_unicode
+        self.name = name
+
+    @classmethod
+    def from_array(cls, values):
+        """
+        Encode strings, NaN or None marking missing values
+
+        Parameters
+        ----------
+        values : array-like of strings
+
+        Returns
+        -------
+        encoded : StringArray
+        """
+        if isinstance(values, StringArray):
+            return values
+        name = getattr(values, 'name', None)
+        values = com._ensure_object(np.asarray(values, dtype=object))
+        data, offsets, mask, is_unicode = _strings.encode(values)
+        return StringArray(data, offsets, mask, is_unicode=is_unicode,
+                           name=name)
+
+    @classmethod
+    def concat(cls, arrays):
+        """
+        Concatenate StringArrays into one
+        """
+        arrays = list(arrays)
+        data = np.concatenate([arr.data for arr in arrays])
+        starts = np.cumsum([0] + [len(arr.data) for arr in arrays[:-1]])
+        offsets = np.concatenate([[0]] + [arr.offsets[1:] + start
+                                          for arr, start in zip(arrays,
+                                                                starts)])
+        mask = np.concatenate([arr.mask for arr in arrays])
+        is_unicode = any(arr.is_unicode for arr in arrays)
+        return StringArray(data, offsets.astype(np.int64), mask,
+                           is_unicode=is_unicode)
+
+    _ascii = None
+
+    @property
+    def is_ascii(self):
+        """
+        True if all the strings are ASCII, then bytes are characters
+        """
+        if self._ascii is None:
+            self._ascii = _strings.is_ascii(self.data)
+        return self._ascii
+
+    @property
+    def values(self):
+        """
+        Object array of the strings, NaN where missing
+        """
+        return _strings.decode(self.data, self.offsets, self.mask,
+                               self.is_unicode)
+
+    @property
+    def nbytes(self):
+        return self.data.nbytes + self.offsets.nbytes + self.mask.nbytes
+
+    @property
+    def str(self):
+        from pandas.core.strings import StringMethods
+        return StringMethods(self)
+
+    def isnull(self):
+        return self.mask.copy()
+
+    def take(self, indexer):
+        """
+        Strings at the positions in the indexer, -1 making a missing value
+
+        Returns
+        -------
+        taken : StringArray
+        """
+        indexer = com._ensure_int64(indexer)
+        data, offsets, mask = _strings.take(self.data, self.offsets,
+                                            self.mask, indexer)
+        return StringArray(data, offsets, mask, is_unicode=self.is_unicode,
+                           name=self.name)
+
+    def _substrings(self, starts, ends):
+        # StringArray of the byte ranges [starts[i], ends[i])
+        data, offsets = _strings.substrings(self.data, starts, ends)
+        return StringArray(data, offsets, self.mask.copy(),
+                           is_unicode=self.is_unicode, name=self.name)
+
+    def _with_data(self, data):
+        # same strings but for the bytes, e.g. case-converted
+        return StringArray(data, self.offsets, self.mask.copy(),
+                           is_unicode=self.is_unicode, name=self.name)
+
+    def __array__(self, dtype=None):
+        return self.values
+
+    def __len__(self):
+        return len(self.mask)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __getitem__(self, key):
+        if com.is_integer(key):
+            if key < 0:
+                key += len(self)
+            if key < 0 or key >= len(self):
+                raise IndexError('index out of bounds')
+            if self.mask[key]:
+                return np.nan
+            value = self.data[self.offsets[key]:self.offsets[key + 1]]
+            value = value.tostring()
+            if self.is_unicode:
+                value = value.decode('utf-8')
+            return value
+        indexer = np.arange(len(self))[key]
+        return self.take(indexer)
+
+    def __repr__(self):
+        temp = 'StringArray: %s\n%s\nLength: %d, %d bytes'
+        return temp % ('' if self.name is None else self.name,
+                       repr(self.values), len(self), self.nbytes)
+
+    def equals(self, other):
+        """
+        Returns True if the string arrays are equal
+
+        Parameters
+        ----------
+        other : StringArray
+
+        Returns
+        -------
+        are_equal : boolean
+        """
+        if not isinstance(other, StringArray) or len(self) != len(other):
+            return False
+        if not np.array_equal(self.mask, other.mask):
+            return False
+        if self.is_unicode != other.is_unicode:
+            return False
+        return (np.array_equal(self.offsets, other.offsets) and
+                np.array_equal(self.data, other.data))
@@ -1,11 +1,15 @@
 import numpy as np
 
-from functools import wraps
+from functools import wraps, partial
 from itertools import izip
+from operator import methodcaller, itemgetter
 from pandas.core.common import isnull
 from pandas.core.series import Series
+from pandas.core.stringarray import StringArray
+import pandas.core.common as com
 import re
 import pandas.lib as lib
+import pandas._strings as _strings
 
 
 def _get_array_list(arr, others):
@@ -86,19 +90,57 @@ def _length_check(others):
 
 
 def _na_map(f, arr, na_result=np.nan):
-    # should really _check_ for NA
-    def g(x):
-        try:
-            return f(x)
-        except (TypeError, AttributeError):
-            return na_result
-    return _map(g, arr)
+    # NA values are na_result without calling f, as are the values f raises
+    # TypeError or AttributeError for (not strings). f is best a builtin,
+    # e.g. a bound or methodcaller method, not a lambda
+    result = _strings.na_map(_to_object(arr), f, na_result)
+    return lib.maybe_convert_objects(result, try_float=0, convert_datetime=0)
 
 
-def _map(f, arr):
-    if not isinstance(arr, np.ndarray):
-        arr = np.asarray(arr, dtype=object)
-    return lib.map_infer(arr, f)
+def _to_object(arr):
+    return com._ensure_object(np.asarray(arr, dtype=object))
+
+
+# StringArray (compact) input is handled in compiled loops on the UTF-8
+# bytes, falling back to the per-value functions where bytes are not
+# characters. The typed kernels for object arrays return the results with a
+# mask of the missing values, as do the StringArray ones
+
+_regex_chars = set('.^$*+?{}[]\\|()')
+
+
+def _is_literal(pat):
+    return not any(c in _regex_chars for c in pat)
+
+
+def _encode_pat(pat):
+    if isinstance(pat, unicode):
+        return pat.encode('utf-8')
+    return pat
+
+
+def _na_fill(result, mask, na_result=np.nan):
+    # missing values of a StringArray as _na_map leaves them
+    if not mask.any():
+        return result
+    if isnull(na_result):
+        result = com._maybe_upcast(result)
+    elif not (result.dtype == np.bool_ and isinstance(na_result, bool)):
+        result = result.astype(object)
+    result[mask] = na_result
+    return result
+
+
+def _bytes_are_chars(arr):
+    return not arr.is_unicode or arr.is_ascii
+
+
+def _na_map_strings(f, arr):
+    # strings out for a StringArray in, compact either way
+    result = _na_map(f, arr)
+    if isinstance(arr, StringArray):
+        result = StringArray.from_array(result)
+    return result
 
 
 def str_count(arr, pat, flags=0):
@@ -117,8 +159,10 @@ def str_count(arr, pat, flags=0):
     counts : arrays
     """
     regex = re.compile(pat, flags=flags)
-    f = lambda x: len(regex.findall(x))
-    return _na_map(f, arr)
+    if isinstance(arr, StringArray):
+        arr = arr.values
+    result, mask = _strings.obj_count(_to_object(arr), regex.findall)
+    return _na_fill(result, mask)
 
 
 def str_contains(arr, pat, case=True, flags=0, na=np.nan):
@@ -142,10 +186,22 @@ def str_contains(arr, pat, case=True, flags=0, na=np.nan):
     if not case:
         flags |= re.IGNORECASE
 
+    literal = not flags and _is_literal(pat)
+    if isinstance(arr, StringArray):
+        if literal:
+            result = _strings.str_contains(arr.data, arr.offsets,
+                                           _encode_pat(pat))
+            return _na_fill(result, arr.mask, na)
+        arr = arr.values
+
     regex = re.compile(pat, flags=flags)
 
-    f = lambda x: bool(regex.search(x))
-    return _na_map(f, arr, na)
+    if literal:
+        result, mask = _strings.obj_contains(_to_object(arr), pat,
+                                             regex.search)
+    else:
+        result, mask = _strings.obj_search(_to_object(arr), regex.search)
+    return _na_fill(result, mask, na)
 
 
 def str_startswith(arr, pat, na=np.nan):
@@ -163,8 +219,13 @@ def str_startswith(arr, pat, na=np.nan):
     -------
     startswith : array (boolean)
     """
-    f = lambda x: x.startswith(pat)
-    return _na_map(f, arr, na)
+    if isinstance(arr, StringArray):
+        result = _strings.str_startswith(arr.data, arr.offsets,
+                                         _encode_pat(pat))
+        return _na_fill(result, arr.mask, na)
+
+    result, mask = _strings.obj_startswith(_to_object(arr), pat)
+    return _na_fill(result, mask, na)
 
 
 def str_endswith(arr, pat, na=np.nan):
@@ -182,8 +243,13 @@ def str_endswith(arr, pat, na=np.nan):
     -------
     endswith : array (boolean)
     """
-    f = lambda x: x.endswith(pat)
-    return _na_map(f, arr, na)
+    if isinstance(arr, StringArray):
+        result = _strings.str_endswith(arr.data, arr.offsets,
+                                       _encode_pat(pat))
+        return _na_fill(result, arr.mask, na)
+
+    result, mask = _strings.obj_endswith(_to_object(arr), pat)
+    return _na_fill(result, mask, na)
 
 
 def str_lower(arr):
@@ -194,7 +260,9 @@ def str_lower(arr):
     -------
     lowercase : array
     """
-    return _na_map(lambda x: x.lower(), arr)
+    if isinstance(arr, StringArray) and _bytes_are_chars(arr):
+        return arr._with_data(_strings.str_lower(arr.data))
+    return _na_map_strings(methodcaller('lower'), arr)
 
 
 def str_upper(arr):
@@ -205,7 +273,9 @@ def str_upper(arr):
     -------
     uppercase : array
     """
-    return _na_map(lambda x: x.upper(), arr)
+    if isinstance(arr, StringArray) and _bytes_are_chars(arr):
+        return arr._with_data(_strings.str_upper(arr.data))
+    return _na_map_strings(methodcaller('upper'), arr)
 
 
 def str_replace(arr, pat, repl, n=-1, case=True, flags=0):
@@ -236,10 +306,9 @@ def str_replace(arr, pat, repl, n=-1, case=True, flags=0):
             flags |= re.IGNORECASE
         regex = re.compile(pat, flags=flags)
         n = n if n >= 0 else 0
-        def f(x):
-            return regex.sub(repl, x, count=n)
+        f = partial(regex.sub, repl, count=n)
     else:
-        f = lambda x: x.replace(pat, repl, n)
+        f = methodcaller('replace', pat, repl, n)
 
     return _na_map(f, arr)
 
@@ -326,7 +395,12 @@ def str_len(arr):
     -------
     lengths : array
     """
-    return _na_map(len, arr)
+    if isinstance(arr, StringArray):
+        result = _strings.str_len(arr.data, arr.offsets, arr.is_unicode)
+        return _na_fill(result, arr.mask)
+
+    result, mask = _strings.obj_len(_to_object(arr))
+    return _na_fill(result, mask)
 
 
 def str_findall(arr, pat, flags=0):
@@ -365,11 +439,11 @@ def str_pad(arr, width, side='left'):
     padded : array
     """
     if side == 'left':
-        f = lambda x: x.rjust(width)
+        f = methodcaller('rjust', width)
     elif side == 'right':
-        f = lambda x: x.ljust(width)
+        f = methodcaller('ljust', width)
     elif side == 'both':
-        f = lambda x: x.center(width)
+        f = methodcaller('center', width)
     else:  # pragma: no cover
         raise ValueError('Invalid side')
 
@@ -409,13 +483,13 @@ def str_split(arr, pat=None, n=-1):
     split : array
     """
     if pat is None:
-        f = lambda x: x.split()
+        f = methodcaller('split')
     else:
         if len(pat) == 1:
-            f = lambda x: x.split(pat, n)
+            f = methodcaller('split', pat, n)
         else:
             regex = re.compile(pat)
-            f = lambda x: regex.split(x, maxsplit=n)
+            f = partial(regex.split, maxsplit=n)
 
     return _na_map(f, arr)
 
@@ -433,9 +507,13 @@ def str_slice(arr, start=None, stop=None, step=1):
     -------
     sliced : array
     """
-    obj = slice(start, stop, step)
-    f = lambda x: x[obj]
-    return _na_map(f, arr)
+    if (isinstance(arr, StringArray) and _bytes_are_chars(arr) and
+        step in (None, 1)):
+        starts, ends = _strings.str_slice(arr.offsets, start, stop)
+        return arr._substrings(starts, ends)
+
+    f = itemgetter(slice(start, stop, step))
+    return _na_map_strings(f, arr)
 
 
 def str_slice_replace(arr, start=None, stop=None, repl=None):
@@ -459,7 +537,9 @@ def str_strip(arr):
     -------
     stripped : array
     """
-    return _na_map(lambda x: x.strip(), arr)
+    if isinstance(arr, StringArray) and _bytes_are_chars(arr):
+        return _strip_compact(arr, left=True, right=True)
+    return _na_map_strings(methodcaller('strip'), arr)
 
 
 def str_lstrip(arr):
@@ -471,7 +551,9 @@ def str_lstrip(arr):
     -------
     stripped : array
     """
-    return _na_map(lambda x: x.lstrip(), arr)
+    if isinstance(arr, StringArray) and _bytes_are_chars(arr):
+        return _strip_compact(arr, left=True, right=False)
+    return _na_map_strings(methodcaller('lstrip'), arr)
 
 
 def str_rstrip(arr):
@@ -483,7 +565,15 @@ def str_rstrip(arr):
     -------
     stripped : array
     """
-    return _na_map(lambda x: x.rstrip(), arr)
+    if isinstance(arr, StringArray) and _bytes_are_chars(arr):
+        return _strip_compact(arr, left=False, right=True)
+    return _na_map_strings(methodcaller('rstrip'), arr)
+
+
+def _strip_compact(arr, left=True, right=True):
+    starts, ends = _strings.str_strip(arr.data, arr.offsets, left, right,
+                                      arr.is_unicode)
+    return arr._substrings(starts, ends)
 
 
 def str_wrap(arr, width=80):
@@ -515,8 +605,7 @@ def str_get(arr, i):
     -------
     items : array
     """
-    f = lambda x: x[i]
-    return _na_map(f, arr)
+    return _na_map(itemgetter(i), arr)
 
 
 def str_decode(arr, encoding, errors="strict"):
@@ -532,8 +621,7 @@ def str_decode(arr, encoding, errors="strict"):
     -------
     decoded : array
     """
-    f = lambda x: x.decode(encoding, errors)
-    return _na_map(f, arr)
+    return _na_map(methodcaller('decode', encoding, errors), arr)
 
 
 def str_encode(arr, encoding, errors="strict"):
@@ -549,8 +637,7 @@ def str_encode(arr, encoding, errors="strict"):
     -------
     encoded : array
     """
-    f = lambda x: x.encode(encoding, errors)
-    return _na_map(f, arr)
+    return _na_map(methodcaller('encode', encoding, errors), arr)
 
 
 def _noarg_wrapper(f):
@@ -618,6 +705,8 @@ class StringMethods(object):
             return self.get(key)
 
     def _wrap_result(self, result):
+        if isinstance(self.series, StringArray):
+            return result
         return Series(result, index=self.series.index,
                       name=self.series.name)
 
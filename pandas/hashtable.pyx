@@ -1,6 +1,7 @@
 from cpython cimport PyObject, Py_INCREF, PyList_Check, PyTuple_Check
 
 from khash cimport *
+from libc.stdlib cimport malloc, free
 from numpy cimport *
 
 from util cimport _checknan
@@ -881,6 +882,85 @@ cdef class Int64Factorizer:
 
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def group_labels_multi(list label_list, list shape):
+    """
+    Hash the rows of several arrays of group labels, with label_list[i] taking
+    values in range(shape[i]), into compressed group ids in a single pass.
+    Groups are numbered in order of first appearance, so neither the cartesian
+    product of the labels nor any sorting is needed. Rows with a negative
+    label in any of the arrays get -1
+
+    Returns
+    -------
+    comp_ids : ndarray[int64]
+    first : ndarray[int64]
+        Position of the first row of each group
+    """
+    cdef:
+        Py_ssize_t i, j, n, nlevels = len(label_list)
+        int64_t gid, lab
+        int64_t *strides
+        int64_t *counts
+        int64_t **vecs
+        kh_int64_t **tables
+        khiter_t k
+        int ret = 0
+        ndarray arr
+        ndarray[int64_t] comp_ids
+        Int64Vector first = Int64Vector()
+
+    n = len(label_list[0])
+    comp_ids = np.empty(n, dtype=np.int64)
+
+    vecs = <int64_t**> malloc(nlevels * sizeof(int64_t*))
+    tables = <kh_int64_t**> malloc(nlevels * sizeof(kh_int64_t*))
+    strides = <int64_t*> malloc(nlevels * sizeof(int64_t))
+    counts = <int64_t*> malloc(nlevels * sizeof(int64_t))
+
+    for j in range(nlevels):
+        arr = label_list[j]
+        vecs[j] = <int64_t*> arr.data
+        strides[j] = shape[j]
+        counts[j] = 0
+        tables[j] = kh_init_int64()
+
+    # the id of the prefix of keys seen so far stays below n, so combining
+    # it with the next label fits in an int64 for any realistic n
+    for i in range(n):
+        gid = 0
+        for j in range(nlevels):
+            lab = vecs[j][i]
+            if lab < 0:
+                gid = -1
+                break
+
+            lab = gid * strides[j] + lab
+            k = kh_get_int64(tables[j], lab)
+            if k != tables[j].n_buckets:
+                gid = tables[j].vals[k]
+            else:
+                k = kh_put_int64(tables[j], lab, &ret)
+                gid = counts[j]
+                tables[j].vals[k] = gid
+                counts[j] += 1
+
+                if j == nlevels - 1:
+                    first.append(i)
+
+        comp_ids[i] = gid
+
+    for j in range(nlevels):
+        kh_destroy_int64(tables[j])
+    free(vecs)
+    free(tables)
+    free(strides)
+    free(counts)
+
+    return comp_ids, first.to_array()
+
+
 def value_count_int64(ndarray[int64_t] values):
     cdef:
         Py_ssize_t i, n = len(values)
@@ -0,0 +1,197 @@
+"""
+Column-oriented binary file format for DataFrame, laid out so that the data
+can be memory-mapped on read.
+
+The file holds the values of each block of the BlockManager contiguously, in
+the block's own (items x rows) layout, followed by a pickled footer with the
+axes, the block metadata and the offsets of the blocks in the file:
+
+    MAGIC | block 0 | block 1 | ... | footer | footer offset (<i8) | MAGIC
+
+Blocks start on 64-byte boundaries. Object blocks can't be mapped and are
+pickled instead, so they are loaded eagerly.
+"""
+
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from pandas.core.frame import DataFrame
+from pandas.core.internals import BlockManager, make_block
+
+try:
+    import cPickle as pickle
+except ImportError:  # pragma: no cover
+    import pickle
+
+MAGIC = b'PDBINARY'
+VERSION = 1
+
+_ALIGNMENT = 64
+_OFFSET_FORMAT = '<q'
+_TRAILER_SIZE = struct.calcsize(_OFFSET_FORMAT) + len(MAGIC)
+
+
+def to_binary(obj, path):
+    """
+    Write DataFrame to the pandas binary format, see read_binary
+
+    The file is written next to path and then renamed over it, so frames
+    read from a file at path (which may memory-map it) keep their data
+
+    Parameters
+    ----------
+    obj : DataFrame
+    path : string
+        File path
+    """
+    if not isinstance(obj, DataFrame):
+        raise TypeError('Can only write DataFrame, got %s' % type(obj))
+
+    mgr = obj._data.consolidate().decode()
+
+    dirname, basename = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix='.%s.' % basename, dir=dirname)
+    try:
+        f = os.fdopen(fd, 'wb')
+        try:
+            _write_blocks(f, mgr)
+        finally:
+            f.close()
+
+        # mkstemp creates the file readable by the owner only
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+
+        if os.name == 'nt' and os.path.exists(path):  # pragma: no cover
+            # rename doesn't replace files there
+            os.remove(path)
+        os.rename(tmp_path, path)
+    except:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _write_blocks(f, mgr):
+    f.write(MAGIC)
+
+    blocks = []
+    for block in mgr.blocks:
+        _pad(f)
+        offset = f.tell()
+        values = block.values
+
+        if values.dtype == np.object_:
+            pickle.dump(values, f, protocol=pickle.HIGHEST_PROTOCOL)
+            blocks.append(dict(items=block.items, offset=offset,
+                               dtype=None, shape=values.shape))
+        else:
+            values = np.ascontiguousarray(values)
+            f.write(values.data)
+            blocks.append(dict(items=block.items, offset=offset,
+                               dtype=values.dtype.str,
+                               shape=values.shape))
+
+    footer = dict(version=VERSION, axes=mgr.axes, blocks=blocks)
+    footer_offset = f.tell()
+    pickle.dump(footer, f, protocol=pickle.HIGHEST_PROTOCOL)
+    f.write(struct.pack(_OFFSET_FORMAT, footer_offset))
+    f.write(MAGIC)
+
+
+def read_binary(path, mmap_mode='c'):
+    """
+    Read DataFrame written with DataFrame.to_binary. Only the axes and block
+    metadata are read up front: the values of the non-object columns are
+    memory-mapped, so pages of the file are only loaded as they are used
+
+    Parameters
+    ----------
+    path : string
+        File path
+    mmap_mode : {'c', 'r', 'r+', None}, default 'c'
+        Mode of the memory maps, as for numpy.memmap. With 'c' (copy on
+        write) the frame can be modified without changing the file, 'r' makes
+        the values read-only and 'r+' writes modifications back to the file.
+        If None, the values are read into memory
+
+    Returns
+    -------
+    y : DataFrame
+    """
+    if mmap_mode not in ('c', 'r', 'r+', None):
+        raise ValueError('Invalid mmap_mode: %s' % mmap_mode)
+
+    f = open(path, 'rb')
+    try:
+        footer = _read_footer(f)
+
+        if footer['version'] > VERSION:
+            raise ValueError('File was written by a newer pandas, format '
+                             'version %d' % footer['version'])
+
+        axes = footer['axes']
+        blocks = []
+        for meta in footer['blocks']:
+            if meta['dtype'] is None:
+                f.seek(meta['offset'])
+                values = pickle.load(f)
+            else:
+                values = _read_values(f, path, meta, mmap_mode)
+            blocks.append(make_block(values, meta['items'], axes[0]))
+    finally:
+        f.close()
+
+    return DataFrame(BlockManager(blocks, axes))
+
+
+def _read_footer(f):
+    f.seek(0, 2)
+    size = f.tell()
+
+    if size >= len(MAGIC) + _TRAILER_SIZE:
+        f.seek(0)
+        head = f.read(len(MAGIC))
+        f.seek(size - _TRAILER_SIZE)
+        trailer = f.read(_TRAILER_SIZE)
+    else:
+        head = trailer = b''
+
+    if head != MAGIC or not trailer.endswith(MAGIC):
+        raise ValueError('%s is not a pandas binary file' % f.name)
+
+    footer_offset, = struct.unpack(_OFFSET_FORMAT,
+                                   trailer[:-len(MAGIC)])
+    f.seek(footer_offset)
+    return pickle.load(f)
+
+
+def _read_values(f, path, meta, mmap_mode):
+    dtype = np.dtype(meta['dtype'])
+    shape = tuple(meta['shape'])
+    count = int(np.prod(shape))
+
+    if count == 0:
+        # can't map an empty range
+        return np.empty(shape, dtype=dtype)
+
+    if mmap_mode is None:
+        f.seek(meta['offset'])
+        values = np.fromfile(f, dtype=dtype, count=count)
+        return values.reshape(shape)
+
+    values = np.memmap(path, dtype=dtype, mode=mmap_mode,
+                       offset=meta['offset'], shape=shape)
+    # plain ndarray that keeps the map alive, so that results of operations
+    # on the values aren't memmaps
+    return values.view(np.ndarray)
+
+
+def _pad(f):
+    pos = f.tell()
+    if pos % _ALIGNMENT:
+        f.write(b'\x00' * (_ALIGNMENT - pos % _ALIGNMENT))
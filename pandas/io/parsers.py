@@ -6,11 +6,14 @@ import re
 from itertools import izip
 from urlparse import urlparse
 import csv
+import mmap
 
 import numpy as np
 
 from pandas.core.index import Index, MultiIndex
 from pandas.core.frame import DataFrame
+from pandas.core.stringarray import StringArray
+from pandas.core.groupby import ChunkedGroupBy
 import datetime
 import pandas.core.common as com
 from pandas.util import py3compat
@@ -19,6 +22,7 @@ from pandas.io.date_converters import generic_parser
 from pandas.util.decorators import Appender
 
 import pandas.lib as lib
+import pandas.tslib as tslib
 import pandas._parser as _parser
 from pandas.tseries.period import Period
 
@@ -35,8 +39,13 @@ filepath_or_buffer : string or file handle / StringIO. The string could be
     is expected. For instance, a local file could be
     file ://localhost/path/to/table.csv
 %s
-compression : {'gzip', 'bz2', None}, default None
-    For on-the-fly decompression of on-disk data
+compression : {'gzip', 'bz2', 'infer', None}, default None
+    For on-the-fly decompression of on-disk data. The data is decompressed
+    a buffer at a time as it is parsed. If 'infer', the compression is taken
+    from the extension of a file path ('.gz' or '.bz2')
+memory_map : boolean, default False
+    If a file path or handle on a regular file is given, map the file into
+    memory and parse it from there instead of reading it through a buffer
 dialect : string or csv.Dialect instance, default None
     If None defaults to Excel dialect. Ignored if sep longer than 1 char
     See csv.Dialect documentation for more details
@@ -75,6 +84,12 @@ date_parser : function
     dateutil.parser
 dayfirst : boolean, default False
     DD/MM format dates, international and European format
+date_format : string, default None
+    strptime-style format of the dates in parse_dates columns, e.g.
+    '%%d/%%m/%%Y %%H:%%M', parsed by a fast C parser. Supports %%Y, %%y, %%m,
+    %%b, %%d, %%H, %%M, %%S, %%f and %%%%. Without it, ISO 8601 dates like
+    '2012-01-31 10:30:00' are also parsed fast; anything else falls back
+    to dateutil.parser
 thousands : str, default None
     Thousands separator
 comment : str, default None
@@ -99,6 +114,15 @@ encoding : string, default None
     Encoding to use for UTF when reading/writing (ex. 'utf-8')
 squeeze : boolean, default False
     If the parsed data only contains one column then return a Series
+num_threads : int, default 1
+    Number of threads used to tokenize and convert a file read in one go
+    with the C parser. A file on disk is split into this many pieces at
+    record boundaries; other sources, and files too small to split, are
+    read by a single thread
+compact_strings : boolean, default False
+    Store the string columns compactly as StringArrays (one buffer of UTF-8
+    bytes and offsets) instead of as Python string objects, C parser only.
+    See DataFrame.get_string_array
 
 Returns
 -------
@@ -219,13 +243,16 @@ _parser_defaults = {
     'keep_date_col': False,
     'dayfirst': False,
     'date_parser': None,
+    'date_format': None,
 
     # 'nrows': None,
     # 'iterator': False,
     'chunksize': None,
     'verbose': False,
     'encoding': None,
-    'squeeze': False
+    'squeeze': False,
+    'compression': None,
+    'memory_map': False
 }
 
 
@@ -236,14 +263,14 @@ _c_parser_defaults = {
     'compact_ints': False,
     'use_unsigned': False,
     'low_memory': True,
-    'memory_map': False,
     'buffer_lines': None,
     'error_bad_lines': True,
     'warn_bad_lines': True,
     'factorize': True,
     'dtype': None,
     'usecols': None,
-    'compression': None
+    'num_threads': 1,
+    'compact_strings': False
 }
 
 _fwf_defaults = {
@@ -290,6 +317,8 @@ def _make_parser_function(name, sep=','):
                  use_unsigned=False,
                  low_memory=_c_parser_defaults['low_memory'],
                  buffer_lines=None,
+                 num_threads=1,
+                 compact_strings=False,
                  warn_bad_lines=True,
                  error_bad_lines=True,
 
@@ -301,6 +330,7 @@ def _make_parser_function(name, sep=','):
                  keep_date_col=False,
                  dayfirst=False,
                  date_parser=None,
+                 date_format=None,
 
                  memory_map=False,
                  nrows=None,
@@ -341,6 +371,7 @@ def _make_parser_function(name, sep=','):
                     keep_date_col=keep_date_col,
                     dayfirst=dayfirst,
                     date_parser=date_parser,
+                    date_format=date_format,
 
                     nrows=nrows,
                     iterator=iterator,
@@ -362,7 +393,9 @@ def _make_parser_function(name, sep=','):
                     warn_bad_lines=warn_bad_lines,
                     error_bad_lines=error_bad_lines,
                     low_memory=low_memory,
-                    buffer_lines=buffer_lines)
+                    buffer_lines=buffer_lines,
+                    num_threads=num_threads,
+                    compact_strings=compact_strings)
 
         return _read(filepath_or_buffer, kwds)
 
@@ -490,6 +523,8 @@ class TextFileReader(object):
                 if engine != 'c' and value != default:
                     raise ValueError('%s is not supported with %s parser' %
                                      (argname, engine))
+            else:
+                value = default
             options[argname] = value
 
         if engine == 'python-fwf':
@@ -604,7 +639,20 @@ class TextFileReader(object):
         # May alter columns / col_dict
         # index, columns, col_dict = self._create_index(col_dict, columns)
 
+        # compact string columns are set as they are, see compact_strings
+        compact = dict((k, v) for k, v in col_dict.iteritems()
+                       if isinstance(v, StringArray))
+        for k in compact.keys():
+            del col_dict[k]
+            if columns is not None and k not in columns:
+                # e.g. the index
+                del compact[k]
+        if compact and index is None and not col_dict:
+            index = com._default_index(len(compact.values()[0]))
+
         df = DataFrame(col_dict, columns=columns, index=index)
+        for k, v in compact.iteritems():
+            df[k] = v
 
         if self.squeeze and len(df.columns) == 1:
             return df[df.columns[0]]
@@ -616,6 +664,32 @@ class TextFileReader(object):
     # backwards compatibility
     get_chunk = read
 
+    def groupby(self, by, sort=True):
+        """
+        Group the rows of the file chunk by chunk, see ChunkedGroupBy. Only
+        the partial aggregates of each group are kept in memory, so files
+        larger than memory can be aggregated. Requires a chunksize
+
+        Parameters
+        ----------
+        by : column name, function, dict, or list of those
+            Group keys, evaluated on each chunk
+        sort : boolean, default True
+            Sort the result by the group keys
+
+        Examples
+        --------
+        >>> reader = read_csv('log.csv', chunksize=100000)
+        >>> reader.groupby(['host', 'status'])['bytes'].agg(['sum', 'mean'])
+
+        Returns
+        -------
+        grouped : ChunkedGroupBy
+        """
+        if self.chunksize is None:
+            raise ValueError('Can only group a file read with a chunksize')
+        return ChunkedGroupBy(self, by, sort=sort)
+
 
 
 class ParserBase(object):
@@ -630,6 +704,7 @@ class ParserBase(object):
         self.parse_dates = kwds.pop('parse_dates', False)
         self.date_parser = kwds.pop('date_parser', None)
         self.dayfirst = kwds.pop('dayfirst', False)
+        self.date_format = kwds.get('date_format')
         self.keep_date_col = kwds.pop('keep_date_col', False)
 
         self.na_values = kwds.get('na_values')
@@ -637,7 +712,8 @@ class ParserBase(object):
         self.false_values = kwds.get('false_values')
 
         self._date_conv = _make_date_converter(date_parser=self.date_parser,
-                                               dayfirst=self.dayfirst)
+                                               dayfirst=self.dayfirst,
+                                               date_format=self.date_format)
 
         self._name_processed = False
 
@@ -693,7 +769,7 @@ class ParserBase(object):
         for idx in self.index_col:
             i = ix(idx)
             to_remove.append(i)
-            index.append(data[i])
+            index.append(_decode_strings(data[i]))
 
         # remove index items from content and columns, don't pop in
         # loop
@@ -724,7 +800,7 @@ class ParserBase(object):
         for idx in self.index_col:
             name = _get_name(idx)
             to_remove.append(name)
-            index.append(data[name])
+            index.append(_decode_strings(data[name]))
 
         # remove index items from content and columns, don't pop in
         # loop
@@ -758,12 +834,12 @@ class ParserBase(object):
 
 
     def _convert_to_ndarrays(self, dct, na_values, verbose=False,
-                             converters=None):
+                             converters=None, noconvert=None):
         result = {}
         for c, values in dct.iteritems():
             conv_f = None if converters is None else converters.get(c, None)
             col_na_values = _get_na_values(c, na_values)
-            coerce_type = True
+            coerce_type = noconvert is None or c not in noconvert
             if conv_f is not None:
                 values = lib.map_infer(values, conv_f)
                 coerce_type = False
@@ -776,6 +852,10 @@ class ParserBase(object):
 
     def _convert_types(self, values, na_values, try_num_bool=True):
         na_count = 0
+        if com.is_datetime64_dtype(values):
+            # parsed dates, NA already NaT
+            return values, na_count
+
         if issubclass(values.dtype.type, (np.number, np.bool_)):
             mask = lib.ismember(values, na_values)
             na_count = mask.sum()
@@ -872,11 +952,19 @@ class CParserWrapper(ParserBase):
     def _set_noconvert_columns(self):
         names = self.names
 
-        def _set(x):
+        def _get_index(x):
             if com.is_integer(x):
-                self._reader.set_noconvert(x)
+                return x
             else:
-                self._reader.set_noconvert(names.index(x))
+                return names.index(x)
+
+        def _set(x):
+            self._reader.set_noconvert(_get_index(x))
+
+        # single date columns can go straight to datetime64 in the C parser,
+        # unless dateutil has to resolve dayfirst
+        fast_dates = (self.date_parser is None and
+                      (not self.dayfirst or self.date_format is not None))
 
         if isinstance(self.parse_dates, list):
             for val in self.parse_dates:
@@ -885,6 +973,17 @@ class CParserWrapper(ParserBase):
                         _set(k)
                 else:
                     _set(val)
+                    if fast_dates:
+                        self._reader.set_parse_dates(_get_index(val))
+        elif self.parse_dates is True and fast_dates:
+            index_col = self.index_col
+            if index_col is None:
+                index_col = range(self._reader.leading_cols)
+            elif not isinstance(index_col, (list, tuple)):
+                index_col = [index_col]
+
+            for x in index_col:
+                self._reader.set_parse_dates(_get_index(x))
 
     def set_error_bad_lines(self, status):
         self._reader.set_error_bad_lines(int(status))
@@ -916,6 +1015,7 @@ class CParserWrapper(ParserBase):
                     values = data.pop(i)
                 else:
                     values = data.pop(self.index_col[i])
+                values = _decode_strings(values)
 
                 values = self._maybe_parse_dates(values, i,
                                                  try_parse_dates=True)
@@ -976,6 +1076,13 @@ class CParserWrapper(ParserBase):
 
 
 
+def _decode_strings(values):
+    # index values of compact string columns, see compact_strings
+    if isinstance(values, StringArray):
+        return values.values
+    return values
+
+
 def TextParser(*args, **kwds):
     """
     Converts lists of lists/tuples into DataFrames with proper type inference
@@ -1007,6 +1114,7 @@ def TextParser(*args, **kwds):
     parse_dates : boolean, default False
     keep_date_col : boolean, default False
     date_parser : function, default None
+    date_format : string, default None
     skiprows : list of integers
         Row numbers to skip
     skip_footer : int
@@ -1077,12 +1185,25 @@ class PythonParser(ParserBase):
         self._comment_lines = []
 
 
+        compression = com._infer_compression(f, kwds['compression'])
         if isinstance(f, basestring):
             try:
                 # universal newline mode
-                f = com._get_handle(f, 'U', encoding=self.encoding)
+                f = com._get_handle(f, 'U', encoding=self.encoding,
+                                    compression=compression)
             except Exception: # pragma: no cover
-                f = com._get_handle(f, 'r', encoding=self.encoding)
+                f = com._get_handle(f, 'r', encoding=self.encoding,
+                                    compression=compression)
+        elif compression is not None:
+            f = com._get_compressed_handle(f, 'rb', compression)
+
+        if (kwds['memory_map'] and compression is None and
+            hasattr(f, 'fileno')):
+            try:
+                f = _MMapWrapper(f, encoding=self.encoding)
+            except Exception:
+                # not a regular file, or empty
+                pass
 
         if hasattr(f, 'readline'):
             self._make_reader(f)
@@ -1184,9 +1305,11 @@ class PythonParser(ParserBase):
         alldata = self._rows_to_cols(content)
         data = self._exclude_implicit_index(alldata)
 
+        # missing values are converted before the dates are parsed, as in
+        # the C parser
+        data = self._convert_data(data)
         columns, data = self._do_date_conversions(self.columns, data)
 
-        data = self._convert_data(data)
         index = self._make_index(data, alldata, columns)
         if indexnamerow:
             coffset = len(indexnamerow) - len(columns)
@@ -1206,8 +1329,18 @@ class PythonParser(ParserBase):
                 col = self.orig_names[col]
             clean_conv[col] = f
 
+        # as in the C parser, the columns of parse_dates keep their strings
+        # for the date parser, only their missing values are converted
+        noconvert = set()
+        if isinstance(self.parse_dates, list):
+            for val in self.parse_dates:
+                for col in (val if isinstance(val, list) else [val]):
+                    if isinstance(col, int) and col not in self.orig_names:
+                        col = self.orig_names[col]
+                    noconvert.add(col)
+
         return self._convert_to_ndarrays(data, self.na_values, self.verbose,
-                                         clean_conv)
+                                         clean_conv, noconvert=noconvert)
 
     def _infer_columns(self):
         names = self.names
@@ -1447,9 +1580,25 @@ class PythonParser(ParserBase):
         return self._check_thousands(lines)
 
 
-def _make_date_converter(date_parser=None, dayfirst=False):
+def _make_date_converter(date_parser=None, dayfirst=False,
+                         date_format=None):
     def converter(*date_cols):
         if date_parser is None:
+            if len(date_cols) == 1:
+                values = date_cols[0]
+                if com.is_datetime64_dtype(values):
+                    # already parsed by the C parser
+                    return values
+                strs = com._ensure_object(values)
+            else:
+                strs = _concat_date_cols(date_cols)
+
+            if date_format is not None or not dayfirst:
+                try:
+                    return tslib.array_strptime(strs, date_format)
+                except ValueError:
+                    pass
+
             return lib.try_parse_dates(_concat_date_cols(date_cols),
                                        dayfirst=dayfirst)
         else:
@@ -1646,6 +1795,37 @@ def _concat_date_cols(date_cols):
     return rs
 
 
+class _MMapWrapper(object):
+    """
+    Line iterator over a memory-mapped file, starting at the current position
+    of the file handle f. '\\r\\n' line endings are translated to '\\n'.
+    """
+    def __init__(self, f, encoding=None):
+        self.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.mmap.seek(f.tell())
+        self.encoding = encoding
+
+    def __iter__(self):
+        return self
+
+    def readline(self):
+        line = self.mmap.readline()
+        if line.endswith(b'\r\n'):
+            line = line[:-2] + b'\n'
+        if py3compat.PY3:
+            line = line.decode(self.encoding or 'utf-8', 'replace')
+        return line
+
+    def next(self):
+        line = self.readline()
+        if not line:
+            raise StopIteration
+        return line
+
+    # Iterator protocol in Python 3 uses __next__()
+    __next__ = next
+
+
 class FixedWidthReader(object):
     """
     A reader of fixed-width lines.
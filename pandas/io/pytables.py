@@ -326,7 +326,8 @@ class HDFStore(object):
             raise KeyError('No object named %s in the file' % key)
         return self._read_group(group)
 
-    def select(self, key, where=None):
+    def select(self, key, where=None, start=None, stop=None, columns=None,
+               iterator=False, chunksize=None):
         """
         Retrieve pandas object stored in file, optionally based on where
         criteria
@@ -335,14 +336,143 @@ class HDFStore(object):
         ----------
         key : object
         where : list of Term (or convertable) objects, optional
+        start : integer (defaults to None), row number to start selection
+        stop  : integer (defaults to None), row number to stop selection
+        columns : list of columns (the items of a Panel) to read, optional
+            only the parts of the table holding these columns are read
+        iterator : boolean, default False
+            Return an iterator over the selection in chunks of chunksize rows
+        chunksize : integer, optional
+            Number of selected rows per chunk, implies iterator=True
 
+        Returns
+        -------
+        obj : type of object stored in file, or a TableIterator yielding
+              objects of that type if iterator or chunksize is given
+
+        Examples
+        --------
+        >>> for df in store.select('ticks', 'index>20121114', chunksize=50000):
+        ...     totals = totals.add(df.sum(), fill_value=0)
         """
         group = self.get_node(key)
         if group is None:
             raise KeyError('No object named %s in the file' % key)
-        if where is not None and not _is_table_type(group):
-            raise Exception('can only select with where on objects written as tables')
-        return self._read_group(group, where)
+
+        if not _is_table_type(group):
+            if (where is not None or start is not None or stop is not None
+                    or columns is not None or iterator or
+                    chunksize is not None):
+                raise Exception('can only select with where, start, stop, '
+                                'columns or chunksize on objects written as '
+                                'tables')
+            return self._read_group(group, where)
+
+        if iterator or chunksize is not None:
+            return TableIterator(create_table(self, group), where=where,
+                                 start=start, stop=stop, columns=columns,
+                                 chunksize=chunksize)
+
+        return self._read_group(group, where, start=start, stop=stop,
+                                columns=columns)
+
+    def select_multiple(self, keys, where=None, selector=None, columns=None,
+                        start=None, stop=None, iterator=False, chunksize=None):
+        """
+        Retrieve rows from several tables that share the same index (e.g.
+        written with append_to_multiple) and return them joined as a single
+        DataFrame. The where condition is evaluated once, on the selector
+        table, and the matching rows are read from every table by their
+        coordinates
+
+        Parameters
+        ----------
+        keys : list of table keys
+        where : list of Term (or convertable) objects, optional
+            only fields of the selector table can be used
+        selector : the table to evaluate where on (defaults to keys[0])
+        columns : list of columns to return, optional
+            a table holding none of these columns is not read at all
+        start : integer (defaults to None), row number to start selection
+        stop  : integer (defaults to None), row number to stop selection
+        iterator : boolean, default False
+            Return an iterator over the selection in chunks of chunksize rows
+        chunksize : integer, optional
+            Number of selected rows per chunk, implies iterator=True
+
+        Returns
+        -------
+        DataFrame, or an iterator of DataFrames if iterator or chunksize is
+        given
+
+        Examples
+        --------
+        >>> store.select_multiple(['df1', 'df2'], where=[Term('A>0')],
+        ...                       selector='df1')
+        """
+        if isinstance(keys, basestring):
+            keys = [keys]
+        if not isinstance(keys, (list, tuple)) or not len(keys):
+            raise ValueError('keys must be a non-empty list of table keys')
+        if selector is None:
+            selector = keys[0]
+
+        tables = []
+        for k in list(keys) + [selector]:
+            group = self.get_node(k)
+            if group is None:
+                raise KeyError('No object named %s in the file' % k)
+            if not _is_table_type(group):
+                raise Exception('cannot select_multiple on [%s], it is not '
+                                'a table' % k)
+            t = create_table(self, group)
+            t.infer_axes()
+            if t.ndim != 2:
+                raise NotImplementedError('select_multiple is only '
+                                          'implemented for DataFrame tables')
+            tables.append(t)
+        s = tables.pop()
+
+        nrows = s.nrows
+        for k, t in zip(keys, tables):
+            if t.nrows != nrows:
+                raise ValueError('all tables must have the same number of '
+                                 'rows, [%s] has %s, the selector [%s] has %s'
+                                 % (k, t.nrows, selector, nrows))
+
+        # the columns each table contributes; skip tables not needed
+        reads = []
+        for t in tables:
+            labels = list(t.non_index_axes[0][1])
+            if columns is not None:
+                labels = [c for c in labels if c in columns]
+                if not len(labels):
+                    continue
+            reads.append((t, labels))
+        if columns is not None:
+            found = set(c for t, labels in reads for c in labels)
+            missing = [c for c in columns if c not in found]
+            if len(missing):
+                raise KeyError('columns %s are not in any of the tables'
+                               % missing)
+
+        # evaluate the condition once, on the selector
+        coords = Selection(s, where, start=start, stop=stop).select_coords()
+
+        def _read(coordinates):
+            frames = [t.read(coordinates=coordinates, columns=labels)
+                      for t, labels in reads]
+            df = concat(frames, axis=1, verify_integrity=True)
+            if columns is not None:
+                df = df.reindex(columns=columns, copy=False)
+            return df
+
+        if iterator or chunksize is not None:
+            chunksize = chunksize or TableIterator._default_chunksize
+            return (_read(coords[i:i + chunksize])
+                    for i in xrange(0, len(coords), chunksize))
+
+        return _read(coords)
 
     def put(self, key, value, table=False, append=False,
             compression=None, **kwargs):
@@ -419,6 +549,60 @@ class HDFStore(object):
         """
         self._write_to_group(key, value, table=True, append=True, **kwargs)
 
+    def append_to_multiple(self, d, value, selector, data_columns=None,
+                           **kwargs):
+        """
+        Append the columns of a DataFrame to several tables, split as given
+        by d. The tables share the index of value and keep the same rows
+        (all-NaN rows are not dropped), so they can be queried together with
+        select_multiple
+
+        Parameters
+        ----------
+        d : dict of table key -> list of columns; a single key may map to
+            None, that table gets all of the remaining columns
+        value : DataFrame
+        selector : the key of the table that where conditions are evaluated
+            on; make it small and give it the data_columns
+        data_columns : list of columns of the selector table to create as
+            data columns (optional)
+
+        Examples
+        --------
+        >>> store.append_to_multiple({'df1': ['A', 'B'], 'df2': None}, df,
+        ...                          selector='df1', data_columns=['A'])
+        """
+        if not isinstance(value, DataFrame):
+            raise NotImplementedError('append_to_multiple is only '
+                                      'implemented for DataFrames')
+        if not isinstance(d, dict):
+            raise ValueError('append_to_multiple requires a dict of '
+                             'table key -> list of columns')
+        if selector not in d:
+            raise ValueError('append_to_multiple requires the selector [%s] '
+                             'to be one of the keys of d' % selector)
+
+        remain_key = None
+        assigned = []
+        for k, v in d.items():
+            if v is None:
+                if remain_key is not None:
+                    raise ValueError('append_to_multiple can only have one '
+                                     'value in d that is None')
+                remain_key = k
+            else:
+                assigned.extend(v)
+
+        d = dict(d)
+        if remain_key is not None:
+            assigned = set(assigned)
+            d[remain_key] = [c for c in value.columns if c not in assigned]
+
+        for k, v in d.items():
+            dc = data_columns if k == selector else None
+            self.append(k, value.reindex(columns=v, copy=False),
+                        data_columns=dc, dropna=False, **kwargs)
+
     def create_table_index(self, key, **kwargs):
         """ Create a pytables index on the table
         Paramaters
@@ -584,6 +768,7 @@ class HDFStore(object):
     def _write_block_manager(self, group, data):
         if not data.is_consolidated():
             data = data.consolidate()
+        data = data.decode()
 
         group._v_attrs.ndim = data.ndim
         for i, ax in enumerate(data.axes):
@@ -632,9 +817,9 @@ class HDFStore(object):
         t.write(axes_to_index=[1,2], obj=panel,
                 append=append, compression=comp, **kwargs)
 
-    def _read_wide_table(self, group, where=None):
+    def _read_wide_table(self, group, where=None, **kwargs):
         t = create_table(self, group)
-        return t.read(where)
+        return t.read(where, **kwargs)
 
     def _write_index(self, group, key, index):
         if isinstance(index, MultiIndex):
@@ -817,11 +1002,11 @@ class HDFStore(object):
 
         getattr(group, key)._v_attrs.transposed = transposed
 
-    def _read_group(self, group, where=None):
+    def _read_group(self, group, where=None, **kwargs):
         kind = group._v_attrs.pandas_type
         kind = _LEGACY_MAP.get(kind, kind)
         handler = self._get_handler(op='read', kind=kind)
-        return handler(group, where)
+        return handler(group, where, **kwargs)
 
     def _read_series(self, group, where=None):
         index = self._read_index(group, 'index')
@@ -850,9 +1035,9 @@ class HDFStore(object):
         kind = node._v_attrs.kind
         return _unconvert_index_legacy(data, kind)
 
-    def _read_frame_table(self, group, where=None):
+    def _read_frame_table(self, group, where=None, **kwargs):
         t = create_table(self, group)
-        return t.read(where)
+        return t.read(where, **kwargs)
 
 
 class Col(object):
@@ -867,6 +1052,7 @@ class Col(object):
 
         """
     is_indexable = True
+    is_data_indexable = False
 
     def __init__(self, values = None, kind = None, typ = None, cname = None, itemsize = None, name = None, kind_attr = None, **kwargs):
         self.values = values
@@ -1061,6 +1247,29 @@ class DataCol(Col):
         if self.dtype is not None:
             setattr(self.attrs,self.dtype_attr,self.dtype)
 
+class DataIndexableCol(DataCol):
+    """ a data column of a single frame column, stored as its own column in
+        the table so it can be queried (and indexed) like the indexables
+
+        the data is kept 2-dim (1 x nrows) like a block, but stored 1-dim
+        """
+    is_data_indexable = True
+
+    @classmethod
+    def create_for_column(cls, name, **kwargs):
+        """ return a new data indexable column for the frame column name """
+        return cls(name = name, cname = name, **kwargs)
+
+    def convert(self, sel):
+        """ set the data from this selection, as a single column block """
+        super(DataIndexableCol, self).convert(sel)
+        self.data = self.data.reshape(-1, 1)
+
+    def get_attr(self):
+        """ get the data for this colummn, and its kind from the dtype """
+        super(DataIndexableCol, self).get_attr()
+        self.kind = 'string' if self.dtype == 'object' else self.dtype
+
 class Table(object):
     """ represent a table:
           facilitate read/write of various types of tables
@@ -1157,11 +1366,16 @@ class Table(object):
         """ return a list of my values cols """
         return [ i.cname for i in self.values_axes ]
 
+    def data_columns(self):
+        """ return a list of my data columns (the values cols stored individually) """
+        return [ i.cname for i in self.values_axes if i.is_data_indexable ]
+
     def set_attrs(self):
         """ set our table type & indexables """
         self.attrs.table_type  = self.table_type
         self.attrs.index_cols  = self.index_cols()
-        self.attrs.values_cols = self.values_cols()
+        self.attrs.values_cols = [ i.cname for i in self.values_axes if not i.is_data_indexable ]
+        self.attrs.data_columns = self.data_columns()
         self.attrs.non_index_axes = self.non_index_axes
 
     def validate(self):
@@ -1186,9 +1400,12 @@ class Table(object):
             # index columns
             self._indexables.extend([ Col(name = i) for i in self.attrs.index_cols ])
 
-            # data columns
+            # values columns
             self._indexables.extend([ DataCol.create_for_block(i = i) for i, c in enumerate(self.attrs.values_cols) ])
 
+            # data columns
+            self._indexables.extend([ DataIndexableCol.create_for_column(c) for c in getattr(self.attrs,'data_columns',None) or [] ])
+
         return self._indexables
 
     def create_index(self, columns = None, optlevel = None, kind = None):
@@ -1199,7 +1416,8 @@ class Table(object):
 
         Paramaters
         ----------
-        columns : None or list_like (the columns to index - currently supports index/column)
+        columns : None or list_like (the columns to index - the index/column and the data columns,
+                  defaults to the index and the data columns)
         optlevel: optimization level (defaults to 6)
         kind    : kind of index (defaults to 'medium')
 
@@ -1213,7 +1431,7 @@ class Table(object):
         if table is None: return
 
         if columns is None:
-            columns = ['index']
+            columns = ['index'] + (getattr(self.attrs,'data_columns',None) or [])
         if not isinstance(columns, (tuple,list)):
             columns = [ columns ]
 
@@ -1228,29 +1446,55 @@ class Table(object):
             if v is not None and not v.is_indexed:
                 v.createIndex(**kw)
 
-    def read_axes(self, where):
-        """ create and return the axes sniffed from the table """
+    def read_axes(self, where, columns=None, **kwargs):
+        """ create and return the axes sniffed from the table
+              columns : only read the data columns holding these columns (optional) """
 
         # infer the data kind
         self.infer_axes()
 
         # create the selection
-        self.selection = Selection(self, where)
-        self.selection.select()
+        self.selection = Selection(self, where, **kwargs)
+
+        if columns is None:
+            self.selection.select()
+        else:
+            self.project_axes(columns)
+            self.selection.select(fields = self.index_cols() + self.values_cols())
 
         # convert the data
         for a in self.axes:
             a.convert(self.selection)
 
+    def project_axes(self, columns):
+        """ keep only the values axes (and non-index labels) holding the columns """
+        if not isinstance(columns, (list, tuple, np.ndarray, Index)):
+            columns = [ columns ]
+        columns = list(columns)
+
+        existing = set()
+        for a in self.values_axes:
+            existing |= set(a.values)
+        missing = [ c for c in columns if c not in existing ]
+        if missing:
+            raise KeyError("columns %s are not in the table" % missing)
+
+        wanted = set(columns)
+        self.values_axes = [ a for a in self.values_axes if wanted & set(a.values) ]
+        self.non_index_axes = [ (axis, columns) for axis, labels in self.non_index_axes ]
+
     def infer_axes(self):
         """ infer the axes from the indexables """
         self.index_axes, self.values_axes = [ a.infer(self.table) for a in self.indexables if a.is_indexable ], [ a.infer(self.table) for a in self.indexables if not a.is_indexable ]
         self.non_index_axes = getattr(self.attrs,'non_index_axes',None) or []
 
-    def create_axes(self, axes_to_index, obj, validate = True, min_itemsize = None):
+    def create_axes(self, axes_to_index, obj, validate = True, min_itemsize = None, data_columns = None):
         """ create and return the axes
               leagcy tables create an indexable column, indexable index, non-indexable fields
 
+              data_columns : list of columns of a frame to store individually, so they can be
+                             queried (optional)
+
         """
 
         self.index_axes = []
@@ -1265,14 +1509,17 @@ class Table(object):
             else:
                 self.non_index_axes.append((i,list(a)))
 
-        # check for column conflicts
-        if validate:
-            for a in self.axes:
-                a.maybe_set_size(min_itemsize = min_itemsize)
+        # the columns stored individually are not part of the blocks
+        data_columns = self.validate_data_columns(data_columns)
+        if data_columns:
+            axis, labels = self.non_index_axes[0]
+            blocks_obj = obj.reindex_axis([ l for l in labels if l not in data_columns ], axis = axis, copy = False)
+        else:
+            blocks_obj = obj
 
         # add my values
         self.values_axes = []
-        for i, b in enumerate(obj._data.blocks):
+        for i, b in enumerate(blocks_obj._data.decode().blocks):
             values = b.values
 
             # a string column
@@ -1292,6 +1539,63 @@ class Table(object):
             dc = DataCol.create_for_block(i = i, values = list(b.items), kind = b.dtype.name, typ = atom, data = values)
             self.values_axes.append(dc)
 
+        # add the data columns
+        for c in data_columns:
+            values = obj[c].values
+            dtype  = values.dtype.name
+
+            # a string column
+            if dtype == 'object':
+                values   = values.astype(str)
+                itemsize = values.dtype.itemsize
+                kind     = 'string'
+                atom     = _tables().StringCol(itemsize = itemsize)
+            else:
+                itemsize = None
+                kind     = dtype
+                atom     = getattr(_tables(),"%sCol" % dtype.capitalize())()
+                try:
+                    values = values.astype(atom._deftype)
+                except (Exception), detail:
+                    raise Exception("cannot coerce data type -> [dtype->%s]" % dtype)
+
+            dc = DataIndexableCol.create_for_column(c, values = [ c ], kind = kind, typ = atom, itemsize = itemsize,
+                                                    data = values.reshape(1, -1))
+            dc.dtype = dtype
+            self.values_axes.append(dc)
+
+        # check for column conflicts
+        if validate:
+            for a in self.axes:
+                a.maybe_set_size(min_itemsize = min_itemsize)
+
+    def validate_data_columns(self, data_columns):
+        """ return the list of data columns to create: the existing ones when appending,
+              otherwise the frame columns passed (that must be valid names to query) """
+        existing = getattr(self.attrs,'data_columns',None) if self.table is not None else None
+        if data_columns is None:
+            return existing or []
+        if not isinstance(data_columns, (list, tuple)):
+            data_columns = [ data_columns ]
+        data_columns = list(data_columns)
+
+        if existing is not None and existing != data_columns:
+            raise Exception("data_columns %s do not match the existing data_columns %s of the table"
+                            % (data_columns, existing))
+        if data_columns and self.ndim != 2:
+            raise NotImplementedError("data_columns are only supported for DataFrame tables")
+
+        labels = self.non_index_axes[0][1] if self.non_index_axes else []
+        for c in data_columns:
+            if c not in labels:
+                raise KeyError("data column [%s] is not a column of the frame" % c)
+            if (not isinstance(c, basestring) or not self._valid_name.match(c) or
+                    c in self.axis_names or c.startswith('values_')):
+                raise ValueError("data column [%s] must be a name usable in a query" % c)
+        return data_columns
+
+    _valid_name = re.compile("^[a-zA-Z_]\w*$")
+
     def create_description(self, compression = None, complevel = None):
         """ create the description of the table from the axes & values """
 
@@ -1358,10 +1662,10 @@ class LegacyTable(Table):
     def write(self, **kwargs):
         raise Exception("write operations are not allowed on legacy tables!")
 
-    def read(self, where=None):
+    def read(self, where=None, columns=None, **kwargs):
         """ we have 2 indexable columns, with an arbitrary number of data axes """
 
-        self.read_axes(where)
+        self.read_axes(where, columns=columns, **kwargs)
 
         index  = self.index_axes[0].values
         column = self.index_axes[1].values
@@ -1448,7 +1752,8 @@ class AppendableTable(LegacyTable):
     table_type = 'appendable'
 
     def write(self, axes_to_index, obj, append=False, compression=None,
-              complevel=None, min_itemsize = None, **kwargs):
+              complevel=None, min_itemsize = None, data_columns = None, dropna = True,
+              **kwargs):
 
         # create the table if it doesn't exist (or get it if it does)
         if not append:
@@ -1456,7 +1761,8 @@ class AppendableTable(LegacyTable):
                 self.handle.removeNode(self.group, 'table')
 
         # create the axes
-        self.create_axes(axes_to_index = axes_to_index, obj = obj, validate = append, min_itemsize = min_itemsize)
+        self.create_axes(axes_to_index = axes_to_index, obj = obj, validate = append, min_itemsize = min_itemsize,
+                         data_columns = data_columns)
 
         if 'table' not in self.group:
 
@@ -1482,11 +1788,12 @@ class AppendableTable(LegacyTable):
             a.validate_and_set(table, append)
 
         # add the rows
-        self._write_data()
+        self._write_data(dropna = dropna)
         self.handle.flush()
 
-    def _write_data(self):
-        """ fast writing of data: requires specific cython routines each axis shape """
+    def _write_data(self, dropna = True):
+        """ fast writing of data: requires specific cython routines each axis shape
+              if dropna, rows whose values are all nan are not written """
 
         masks  = []
 
@@ -1505,7 +1812,14 @@ class AppendableTable(LegacyTable):
         # consolidate masks
         mask = masks[0]
         for m in masks[1:]:
-            m = mask & m
+            mask = mask & m
+        if not dropna:
+            mask = np.zeros_like(mask)
+
+        # data columns are stored 1-dim, fill the record array by column
+        if len(self.data_columns()):
+            self._write_data_columns(mask.astype(bool))
+            return
 
         # the arguments & values
         args   = [ a.cvalues for a in self.index_axes ]
@@ -1522,6 +1836,23 @@ class AppendableTable(LegacyTable):
         except (Exception), detail:
             raise Exception("tables cannot write this data -> %s" % str(detail))
 
+    def _write_data_columns(self, mask):
+        """ write the rows not masked out as a record array, filled column by column """
+        keep = -mask
+        rows = np.empty(keep.sum(), dtype = self.table.description._v_dtype)
+        try:
+            for a in self.index_axes:
+                rows[a.cname] = a.cvalues[keep]
+            for a in self.values_axes:
+                if a.is_data_indexable:
+                    rows[a.cname] = a.data[0][keep]
+                else:
+                    rows[a.cname] = a.data.T[keep]
+            if len(rows):
+                self.table.append(rows)
+        except (Exception), detail:
+            raise Exception("tables cannot write this data -> %s" % str(detail))
+
     def delete(self, where = None):
         if where is None:
             return super(LegacyTable, self).delete()
@@ -1532,6 +1863,8 @@ class AppendableTable(LegacyTable):
 
         # create the selection
         self.selection = Selection(self, where)
+        if self.selection.condition is None:
+            raise Exception("cannot delete rows without a condition on the table columns")
         self.selection.select_coords()
 
         # delete the rows in reverse order
@@ -1560,9 +1893,9 @@ class AppendableFrameTable(AppendableTable):
     table_type = 'appendable_frame'
     ndim       = 2
 
-    def read(self, where=None):
+    def read(self, where=None, columns=None, **kwargs):
 
-        self.read_axes(where)
+        self.read_axes(where, columns=columns, **kwargs)
 
         index   = Index(self.index_axes[0].values)
         frames  = []
@@ -1787,7 +2120,8 @@ class Term(object):
 
         Parameters
         ----------
-        field : dict, string term expression, or the field to operate (must be a valid index/column type of DataFrame/Panel)
+        field : dict, string term expression, or the field to operate (must be a valid index/column type of DataFrame/Panel,
+                or a data column of the table)
         op    : a valid op (defaults to '=') (optional)
                 >, >=, <, <=, =, != (not equal) are allowed
         value : a value or list of values (required)
@@ -1806,6 +2140,7 @@ class Term(object):
         Term('index', datetime(2012,11,14))
         Term('major>20121114')
         Term('minor', ['A','B'])
+        Term('price>100')     (price is a data column)
 
     """
 
@@ -1871,12 +2206,12 @@ class Term(object):
         if self.field is None or self.op is None or self.value is None:
             raise Exception("Could not create this term [%s]" % str(self))
 
-        # valid field name
+        # valid field name (a data column can only be checked against the kinds of the table)
         if self.field in self._index:
             self.field = 'index'
         elif self.field in self._column:
             self.field = 'column'
-        else:
+        elif self.kinds and not self.is_in_table:
             raise Exception("field is not a valid index/column for this term [%s]" % str(self))
 
         # we have valid conditions
@@ -1899,6 +2234,11 @@ class Term(object):
         """ return True if this is a valid column name for generation (e.g. an actual column in the table) """
         return self.field in self.kinds
 
+    @property
+    def is_data_column(self):
+        """ return True if the field is a data column, rather than the index/column """
+        return self.field not in ('index', 'column')
+
     @property
     def kind(self):
         """ the kind of my field """
@@ -1920,9 +2260,14 @@ class Term(object):
                     self.condition = "(%s)" % ' | '.join([ "(%s == %s)" % (self.field,v[0]) for v in values])
 
                 # use a filter after reading
+                elif self.is_data_column:
+                    raise Exception("too many values to select on the data column [%s]" % str(self))
                 else:
                     self.filter = set([ v[1] for v in values ])
 
+                if self.op == '!=' and self.condition is not None:
+                    self.condition = "(~%s)" % self.condition
+
             else:
 
                 self.filter = set([ v[1] for v in values ])
@@ -1935,17 +2280,62 @@ class Term(object):
 
     def convert_value(self, v):
 
-        if self.field == 'index':
-            if self.kind == 'datetime64' :
-                return [lib.Timestamp(v).value, None]
-            elif isinstance(v, datetime):
+        if self.kind == 'datetime64':
+            return [lib.Timestamp(v).value, None]
+        elif self.field == 'index':
+            if isinstance(v, datetime):
                 return [time.mktime(v.timetuple()), None]
         elif not isinstance(v, basestring):
             return [str(v), None]
+        elif self.is_data_column and self.kind != 'string':
+            # a number passed in a string term, e.g. 'price>100'
+            return [v, None]
 
         # string quoting
         return ["'" + v + "'", v]
 
+class TableIterator(object):
+    """ iterate over the rows of a table selection in chunks; each chunk is
+          read and converted to a DataFrame/Panel only when it is reached
+
+        Parameters
+        ----------
+        table     : a Table object
+        where     : list of Terms (or convertable to)
+        start     : integer, row number to start the selection (optional)
+        stop      : integer, row number to stop the selection (optional)
+        columns   : list of columns to read (optional)
+        chunksize : number of selected rows per chunk (defaults to 100000)
+
+        """
+    _default_chunksize = 100000
+
+    def __init__(self, table, where=None, start=None, stop=None, columns=None, chunksize=None):
+        self.table     = table
+        self.where     = where
+        self.start     = start
+        self.stop      = stop
+        self.columns   = columns
+        self.chunksize = chunksize or self._default_chunksize
+
+    def __iter__(self):
+        self.table.infer_axes()
+        selection = Selection(self.table, self.where, start=self.start, stop=self.stop)
+
+        # no condition: read consecutive ranges of rows
+        if selection.condition is None:
+            start, stop, _ = slice(self.start, self.stop).indices(self.table.nrows)
+            for i in xrange(start, stop, self.chunksize):
+                yield self.table.read(self.where, start=i, stop=min(i + self.chunksize, stop),
+                                      columns=self.columns)
+            return
+
+        # the coordinates of the selected rows, read a chunk of them at a time
+        coords = selection.select_coords()
+        for i in xrange(0, len(coords), self.chunksize):
+            yield self.table.read(self.where, coordinates=coords[i:i + self.chunksize],
+                                  columns=self.columns)
+
 class Selection(object):
     """
     Carries out a selection operation on a tables.Table object.
@@ -1954,11 +2344,18 @@ class Selection(object):
     ----------
     table : a Table object
     where : list of Terms (or convertable to)
+    start : integer, row number to start the selection (optional)
+    stop  : integer, row number to stop the selection (optional)
+    coordinates : the row numbers to read, instead of evaluating the
+                  where condition (optional)
 
     """
-    def __init__(self, table, where=None):
+    def __init__(self, table, where=None, start=None, stop=None, coordinates=None):
         self.table      = table
         self.where      = where
+        self.start      = start
+        self.stop       = stop
+        self.coordinates = coordinates
         self.values     = None
         self.condition  = None
         self.filter     = None
@@ -1981,26 +2378,50 @@ class Selection(object):
         if not isinstance(where, (list,tuple)):
             where = [ where ]
         else:
-            # do we have all list/tuple
-            if not any([ isinstance(w, (list,tuple,Term)) for w in where ]):
+            # do we have all list/tuple (or all string expressions, e.g. ['A>0','B<1'])
+            if (not any([ isinstance(w, (list,tuple,Term)) for w in where ]) and
+                    not all([ isinstance(w, basestring) and Term._search.match(w) for w in where ])):
                 where = [ where ]
 
         return [ Term(c, kinds = self.table.kinds_map()) for c in where ]
 
-    def select(self):
+    def select(self, fields=None):
         """
         generate the selection
+          fields : only read these columns of the table (optional)
         """
-        if self.condition is not None:
-            self.values = self.table.table.readWhere(self.condition)
+        table = self.table.table
+
+        if fields is None:
+            if self.coordinates is not None:
+                self.values = table.readCoordinates(self.coordinates)
+            elif self.condition is not None:
+                self.values = table.readWhere(self.condition, start=self.start, stop=self.stop)
+            else:
+                self.values = table.read(start=self.start, stop=self.stop)
+            return
+
+        # evaluate the condition once, then read each field for those rows
+        coords = self.coordinates
+        if coords is None and self.condition is not None:
+            coords = table.getWhereList(self.condition, start=self.start, stop=self.stop, sort=True)
+
+        if coords is not None:
+            self.values = dict([ (f, table.readCoordinates(coords, field=f)) for f in fields ])
         else:
-            self.values = self.table.table.read()
+            self.values = dict([ (f, table.read(start=self.start, stop=self.stop, field=f)) for f in fields ])
 
     def select_coords(self):
         """
-        generate the selection
+        generate the selection: the sorted row numbers that match
         """
-        self.values = self.table.table.getWhereList(self.condition)
+        if self.condition is None:
+            start, stop, _ = slice(self.start, self.stop).indices(self.table.nrows)
+            self.values = np.arange(start, stop, dtype=np.int64)
+        else:
+            self.values = self.table.table.getWhereList(self.condition, start=self.start,
+                                                        stop=self.stop, sort=True)
+        return self.values
 
 
 def _get_index_factory(klass):
@@ -8,7 +8,10 @@ import numpy as np
 import traceback
 
 from pandas.core.datetools import format as date_format
-from pandas.core.api import DataFrame, isnull
+from pandas.core.api import DataFrame, Index, isnull
+import pandas.core.common as com
+import pandas.lib as lib
+import pandas.tslib as tslib
 
 #------------------------------------------------------------------------------
 # Helper execution function
@@ -124,7 +127,7 @@ def uquery(sql, con=None, cur=None, retry=True, params=()):
     return result
 
 
-def read_frame(sql, con, index_col=None, coerce_float=True):
+def read_frame(sql, con, index_col=None, coerce_float=True, chunksize=None):
     """
     Returns a DataFrame corresponding to the result set of the query
     string.
@@ -139,29 +142,123 @@ def read_frame(sql, con, index_col=None, coerce_float=True):
     con: DB connection object, optional
     index_col: string, optional
         column name to use for the returned DataFrame object.
+    coerce_float : boolean, default True
+        Attempt to convert values of non-string, non-numeric objects (like
+        decimal.Decimal) to floating point
+    chunksize : int, default None
+        If given, return an iterator over DataFrames of (at most) chunksize
+        rows, fetched from the cursor as they are needed
     """
     cur = execute(sql, con)
-    rows = _safe_fetch(cur)
     columns = [col_desc[0] for col_desc in cur.description]
 
-    cur.close()
-    con.commit()
+    if chunksize is not None:
+        return _iter_frames(cur, con, columns, index_col, coerce_float,
+                            chunksize)
 
-    result = DataFrame.from_records(rows, columns=columns,
-                                    coerce_float=coerce_float)
+    # fetch in batches, converting each to typed columns as it comes in, so
+    # that all the rows are never held as tuples at once
+    pieces = [[] for _ in columns]
+    try:
+        while True:
+            rows = cur.fetchmany(_FETCH_SIZE)
+            if not rows:
+                break
+            arrays = _rows_to_arrays(rows, len(columns), coerce_float)
+            for piece, arr in zip(pieces, arrays):
+                piece.append(arr)
+    finally:
+        cur.close()
+        con.commit()
+
+    arrays = [_concat_columns(piece, coerce_float) for piece in pieces]
+    return _arrays_to_frame(arrays, columns, index_col)
+
+frame_query = read_frame
+
+
+_FETCH_SIZE = 10000
+
+
+def _iter_frames(cur, con, columns, index_col, coerce_float, chunksize):
+    offset = 0
+    try:
+        while True:
+            rows = cur.fetchmany(chunksize)
+            if not rows:
+                break
+            arrays = _rows_to_arrays(rows, len(columns), coerce_float)
+            yield _arrays_to_frame(arrays, columns, index_col, offset)
+            offset += len(rows)
+    finally:
+        cur.close()
+        con.commit()
+
+
+def _rows_to_arrays(rows, ncols, coerce_float):
+    if not isinstance(rows, list):
+        rows = list(rows)
+
+    values = lib.to_object_array_tuples(rows)
+    return [_convert_column(values[:, i], coerce_float)
+            for i in range(ncols)]
+
+
+def _convert_column(values, coerce_float):
+    if coerce_float:
+        return lib.convert_sql_column(values)
+    return lib.maybe_convert_objects(values)
+
+
+def _concat_columns(pieces, coerce_float):
+    """
+    Combine the conversions of the batches of a column into what converting
+    the whole column at once would have given
+    """
+    if len(pieces) == 0:
+        return np.empty(0, dtype=object)
+    elif len(pieces) == 1:
+        return pieces[0]
+
+    dtypes = set([piece.dtype for piece in pieces])
+    if len(dtypes) == 1 or dtypes <= _NUMERIC_DTYPES:
+        return np.concatenate(pieces)
+
+    values = np.concatenate([piece.astype(object) for piece in pieces])
+    return _convert_column(values, coerce_float)
+
+_NUMERIC_DTYPES = set([np.dtype(np.int64), np.dtype(np.float64)])
+
+
+def _arrays_to_frame(arrays, columns, index_col, offset=0):
+    nrows = len(arrays[0]) if len(arrays) > 0 else 0
+    index = Index(np.arange(offset, offset + nrows))
+    result = DataFrame._from_arrays(arrays, columns, index)
 
     if index_col is not None:
         result = result.set_index(index_col)
 
     return result
 
-frame_query = read_frame
-
 
-def write_frame(frame, name=None, con=None, flavor='sqlite', append=False):
+def write_frame(frame, name=None, con=None, flavor='sqlite', append=False,
+                chunksize=None):
     """
     Write records stored in a DataFrame to SQLite. The index will currently be
     dropped
+
+    Parameters
+    ----------
+    frame : DataFrame
+    name : string
+        Name of the table
+    con : DB connection object
+    flavor : {'sqlite'}, default 'sqlite'
+    append : boolean, default False
+        If the table exists, add the rows to it instead of creating it
+    chunksize : int, default None
+        Number of rows to insert at a time, each batch being committed in its
+        own transaction. By default all the rows go in one batch
     """
     if flavor == 'sqlite':
         schema = get_sqlite_schema(frame, name)
@@ -173,8 +270,48 @@ def write_frame(frame, name=None, con=None, flavor='sqlite', append=False):
 
     wildcards = ','.join(['?'] * len(frame.columns))
     insert_sql = 'INSERT INTO %s VALUES (%s)' % (name, wildcards)
-    data = [tuple(x) for x in frame.values]
-    con.executemany(insert_sql, data)
+
+    # column by column, so that frame.values doesn't upcast everything to
+    # object at once
+    arrays = [frame.icol(i).values for i in range(len(frame.columns))]
+
+    nrows = len(frame)
+    if chunksize is None:
+        chunksize = max(nrows, 1)
+    elif chunksize < 1:
+        raise ValueError('chunksize must be at least 1')
+
+    for start in xrange(0, nrows, chunksize):
+        end = min(start + chunksize, nrows)
+        data = zip(*[_to_sql_values(arr[start:end]) for arr in arrays])
+
+        cur = con.cursor()
+        try:
+            cur.executemany(insert_sql, data)
+            con.commit()
+        except Exception:
+            con.rollback()
+            raise
+        finally:
+            cur.close()
+
+
+def _to_sql_values(values):
+    """
+    List of Python objects that the DB API modules can bind
+    """
+    if com.is_datetime64_dtype(values):
+        ivalues = values.view('i8')
+        mask = ivalues == tslib.iNaT
+        result = np.empty(len(values), dtype=object)
+        result[~mask] = tslib.ints_to_pydatetime(ivalues[~mask])
+        result[mask] = None
+        return list(result)
+    elif values.dtype == np.object_:
+        return list(values)
+    else:
+        # native ints and floats rather than numpy scalars
+        return values.tolist()
 
 
 def has_table(name, con):
@@ -0,0 +1,114 @@
+import unittest
+import os
+
+from datetime import datetime
+import numpy as np
+
+from pandas import DataFrame, MultiIndex, read_binary
+from pandas.io.binary import to_binary
+import pandas.util.testing as tm
+from pandas.util.testing import assert_frame_equal
+
+
+class TestBinary(unittest.TestCase):
+    path = '__test__.pdbin'
+
+    def setUp(self):
+        df = tm.makeTimeDataFrame()
+        df['int'] = np.arange(len(df))
+        df['bool'] = df['A'] > 0
+        df['obj'] = 'foo'
+        df['date'] = datetime(2012, 1, 1)
+        self.frame = df
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _check_roundtrip(self, df, **kwargs):
+        df.to_binary(self.path)
+        result = read_binary(self.path, **kwargs)
+        assert_frame_equal(result, df)
+        self.assertEqual([b.dtype for b in result._data.blocks],
+                         [b.dtype for b in df._data.consolidate().blocks])
+        return result
+
+    def test_roundtrip(self):
+        self._check_roundtrip(self.frame)
+        self._check_roundtrip(self.frame, mmap_mode=None)
+        self._check_roundtrip(self.frame, mmap_mode='r')
+
+        self._check_roundtrip(DataFrame())
+        self._check_roundtrip(DataFrame(index=range(5)))
+        self._check_roundtrip(self.frame[:0])
+
+        df = tm.makeDataFrame()
+        index = MultiIndex.from_tuples([(i % 3, i) for i in range(len(df))],
+                                       names=['a', 'b'])
+        df.index = index
+        df.columns = MultiIndex.from_tuples([('x', 1), ('x', 2),
+                                             ('y', 1), ('y', 2)])
+        self._check_roundtrip(df)
+
+    def test_unconsolidated(self):
+        df = tm.makeDataFrame()
+        df['E'] = 1.
+        self.assert_(not df._data.is_consolidated())
+        result = self._check_roundtrip(df)
+        self.assert_(result._data.is_consolidated())
+
+    def test_mmap_mode(self):
+        self.frame.to_binary(self.path)
+
+        result = read_binary(self.path)
+        float_block = result._data.blocks[0]
+        self.assert_(isinstance(float_block.values.base, np.memmap))
+
+        # copy on write leaves the file alone
+        result['A'] = 0.
+        assert_frame_equal(read_binary(self.path), self.frame)
+
+        result = read_binary(self.path, mmap_mode='r')
+        self.assertRaises(Exception, result.__setitem__, 'A', 0.)
+
+        result = read_binary(self.path, mmap_mode='r+')
+        result['A'] = 0.
+        del result
+        self.assert_((read_binary(self.path)['A'] == 0).all())
+
+        result = read_binary(self.path, mmap_mode=None)
+        self.assert_(not isinstance(result._data.blocks[0].values.base,
+                                    np.memmap))
+
+        self.assertRaises(ValueError, read_binary, self.path, mmap_mode='w')
+
+    def test_overwrite_mapped_file(self):
+        self.frame.to_binary(self.path)
+
+        # the file is replaced, not truncated under the memory maps
+        result = read_binary(self.path)
+        result.to_binary(self.path)
+        assert_frame_equal(result, self.frame)
+        assert_frame_equal(read_binary(self.path), self.frame)
+
+        other = self.frame[::-1]
+        other.to_binary(self.path)
+        assert_frame_equal(result, self.frame)
+        assert_frame_equal(read_binary(self.path), other)
+
+        files = [x for x in os.listdir('.') if self.path in x]
+        self.assertEqual(files, [self.path])
+
+    def test_invalid_file(self):
+        f = open(self.path, 'wb')
+        f.write('a,b,c\n1,2,3\n')
+        f.close()
+        self.assertRaises(ValueError, read_binary, self.path)
+
+        self.assertRaises(TypeError, to_binary, self.frame['A'], self.path)
+
+
+if __name__ == '__main__':
+    import nose
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -63,6 +63,14 @@ class TestCParser(unittest.TestCase):
         finally:
             f.close()
 
+        expected = TextReader(self.csv1, header=None).read()
+        assert_array_dicts_equal(result, expected)
+
+    def test_missing_file(self):
+        self.assertRaises(IOError, TextReader, '__missing__.csv')
+        self.assertRaises(IOError, TextReader, '__missing__.csv',
+                          memory_map=True)
+
     def test_StringIO(self):
         text = open(self.csv1, 'rb').read()
         src = BytesIO(text)
@@ -290,6 +298,27 @@ a,b,c
         self.assertTrue((result[1] == exp[1]).all())
         self.assertTrue((result[2] == exp[2]).all())
 
+    def test_usecols_chunks(self):
+        # unused fields aren't stored by the tokenizer
+        rows = ['%d,x%d,%d.5,y,%d' % (i, i, i, i) for i in range(100)]
+        rows[50] = '1,2'
+        data = '\n'.join(['a,b,c,d,e'] + rows)
+
+        def _make_reader(**kwds):
+            return TextReader(StringIO(data), delimiter=',',
+                              error_bad_lines=False, warn_bad_lines=False,
+                              **kwds)
+
+        exp = _make_reader().read()
+        for kwds in [dict(usecols=[1, 2]),
+                     dict(usecols=['b', 'e']),
+                     dict(usecols=[0, 'e'], low_memory=True, buffer_lines=7),
+                     dict(usecols=[3], header=None, skiprows=[0])]:
+            result = _make_reader(**kwds).read()
+            self.assertEquals(len(result), len(kwds['usecols']))
+            for i, v in result.iteritems():
+                assert_almost_equal(v, exp[i])
+
     def test_cr_delimited(self):
         def _test(text, **kwargs):
             nice_text = text.replace('\r', '\r\n')
@@ -324,6 +353,142 @@ a,b,c
                     2: np.array(['3', ''], dtype=object)}
         assert_array_dicts_equal(result, expected)
 
+    def test_num_threads(self):
+        def _test(text, **kwargs):
+            path = '__%s__.csv' % tm.rands(10)
+            with open(path, 'wb') as f:
+                f.write(text)
+
+            try:
+                expected = TextReader(path, tokenize_chunksize=64,
+                                      **kwargs).read()
+                reader = TextReader(path, tokenize_chunksize=64,
+                                    num_threads=4, **kwargs)
+                result = reader.read()
+                self.assertRaises(StopIteration, reader.read)
+            finally:
+                os.remove(path)
+
+            self.assertEqual(sorted(result), sorted(expected))
+            for k, v in expected.iteritems():
+                self.assertEqual(result[k].dtype, v.dtype)
+                assert_almost_equal(result[k], v)
+
+        rows = ['%d,%s,"a\nb%d",True' % (i, i * 0.5, i) for i in range(200)]
+        _test('\n'.join(['a,b,c,d'] + rows))
+        _test('\n'.join(rows), header=None)
+        _test('\n'.join(['a,b,c,d'] + rows), usecols=[0, 2])
+        _test('\n'.join(['a,b,c,d'] + rows), memory_map=True)
+
+        rows = ['%d,%d,True,%d' % (i, i, i) for i in range(200)]
+
+        # dtypes inferred over the whole column
+        _test('\n'.join(['a,b,c,d'] + rows + ['1.5,foo,NA,']))
+        _test('\n'.join(['a,b,c,d'] + rows +
+                         ['99999999999999999999,1e400,False,x']))
+        _test('\n'.join(['a,b,c,d'] + rows), quoting=csv.QUOTE_NONE)
+        _test('\n'.join(['a,b,c,d'] + rows),
+              converters={'a': lambda x: x * 2}, dtype={'d': 'f8'})
+        _test('\n'.join(['a,b,c,d'] + rows), skiprows=[1, 2])
+
+        # bad lines are reported as in a serial read
+        rows[150] = '1,2,3'
+        self.assertRaises(parser.CParserError, _test,
+                          '\n'.join(['a,b,c,d'] + rows))
+
+        # quoted fields opening \r-terminated records
+        rows = ['"a\nb%d",%d' % (i, i) for i in range(200)]
+        _test('\r'.join(['a,b'] + rows))
+
+        self.assertRaises(ValueError, TextReader, StringIO('a,b'),
+                          num_threads=0)
+
+    def test_num_threads_low_memory(self):
+        # a string header row read as data makes only the first buffer_lines
+        # chunk object in a serial low_memory read
+        rows = ['%d,%s' % (i, i * 0.5) for i in range(300000)]
+        text = '\n'.join(['a,b'] + rows)
+
+        expected = read_csv(StringIO(text), header=None)
+        result = read_csv(StringIO(text), header=None, num_threads=4)
+
+        for k in expected:
+            self.assertEqual(result[k].dtype, expected[k].dtype)
+            self.assertEqual([type(x) for x in result[k]],
+                             [type(x) for x in expected[k]])
+        assert_frame_equal(result, expected)
+
+    def test_na_values_error(self):
+        # errors building the NA set of a column are raised, not ignored
+        self.assertRaises(TypeError, read_csv, StringIO('a,b\n1,5\n2,6'),
+                          na_values={'b': [5]})
+
+    def test_parse_dates(self):
+        data = ('a,b\n2012-01-01,1\n2012-02-29 10:30,2\n'
+                'NA,3\n2012-03-01T08:00:01.5,4')
+
+        reader = TextReader(StringIO(data), na_values=['NA'])
+        reader.set_parse_dates(0)
+        reader.set_parse_dates(1)
+        result = reader.read()
+
+        expected = np.array([datetime(2012, 1, 1),
+                             datetime(2012, 2, 29, 10, 30), None,
+                             datetime(2012, 3, 1, 8, 0, 1, 500000)],
+                            dtype='M8[ns]')
+        self.assert_(np.array_equal(result[0], expected))
+        self.assertEqual(result[1].dtype, np.int64)
+
+        reader = TextReader(StringIO('a\n31/01/2012 10h\n01/02/2012 11h'),
+                            date_format='%d/%m/%Y %Hh')
+        reader.set_parse_dates(0)
+        result = reader.read()
+        expected = np.array([datetime(2012, 1, 31, 10),
+                             datetime(2012, 2, 1, 11)], dtype='M8[ns]')
+        self.assert_(np.array_equal(result[0], expected))
+
+        # not dates
+        reader = TextReader(StringIO('a\n2012-02-30\n2012-03-01'),
+                            date_format='%Y-%m-%d')
+        reader.set_parse_dates(0)
+        result = reader.read()
+        self.assertEqual(result[0].dtype, np.object_)
+
+        self.assertRaises(ValueError, TextReader, StringIO(data),
+                          date_format='%Y-%j')
+
+    def test_parse_dates_num_threads(self):
+        rows = ['2012-01-%.2d %.2d:00,%d' % (i % 28 + 1, i % 24, i)
+                for i in range(200)]
+
+        def _test(text):
+            path = '__%s__.csv' % tm.rands(10)
+            with open(path, 'wb') as f:
+                f.write(text)
+
+            try:
+                expected = TextReader(path, tokenize_chunksize=64)
+                expected.set_parse_dates(0)
+                expected = expected.read()
+                reader = TextReader(path, tokenize_chunksize=64,
+                                    num_threads=4)
+                reader.set_parse_dates(0)
+                result = reader.read()
+            finally:
+                os.remove(path)
+
+            for k, v in expected.iteritems():
+                self.assertEqual(result[k].dtype, v.dtype)
+                self.assert_(np.array_equal(result[k], v))
+            return result
+
+        result = _test('\n'.join(['a,b'] + rows))
+        self.assertEqual(result[0].dtype, 'M8[ns]')
+
+        # only the last piece doesn't parse
+        result = _test('\n'.join(['a,b'] + rows + ['2012/01/01,1']))
+        self.assertEqual(result[0].dtype, np.object_)
+
 
 def assert_array_dicts_equal(left, right):
     for k, v in left.iteritems():
@@ -14,7 +14,8 @@ import nose
 from numpy import nan
 import numpy as np
 
-from pandas import DataFrame, Series, Index, MultiIndex, DatetimeIndex
+from pandas import (DataFrame, Series, Index, MultiIndex, DatetimeIndex, concat,
+                    StringArray)
 import pandas.io.parsers as parsers
 from pandas.io.parsers import (read_csv, read_table, read_fwf,
                                TextFileReader, TextParser)
@@ -660,6 +661,68 @@ c,4,5
                            parse_dates=['date', 'aux_date'], dayfirst=True)
         tm.assert_frame_equal(df, expected)
 
+    def test_parse_dates_iso8601(self):
+        data = """date,A,B
+2009-01-01 00:00:00,a,1
+2009-01-02 12:30:00,b,2
+2009-01-03,c,3
+2009-01-04T06:00:00.25,d,4
+"""
+        expected = DatetimeIndex([datetime(2009, 1, 1),
+                                  datetime(2009, 1, 2, 12, 30),
+                                  datetime(2009, 1, 3),
+                                  datetime(2009, 1, 4, 6, 0, 0, 250000)])
+
+        df = self.read_csv(StringIO(data), parse_dates=['date'])
+        self.assertEqual(df['date'].dtype, 'M8[ns]')
+        self.assert_(np.array_equal(df['date'], expected.values))
+
+        df = self.read_csv(StringIO(data), index_col=0, parse_dates=True)
+        self.assert_(isinstance(df.index, DatetimeIndex))
+        self.assert_(df.index.equals(expected))
+
+    def test_date_format(self):
+        data = """date,A
+31/01/2009 10:15,1
+01/02/2009 08:00,2
+"""
+        expected = DatetimeIndex([datetime(2009, 1, 31, 10, 15),
+                                  datetime(2009, 2, 1, 8, 0)]).values
+
+        df = self.read_csv(StringIO(data), parse_dates=['date'],
+                           date_format='%d/%m/%Y %H:%M')
+        self.assert_(np.array_equal(df['date'], expected))
+
+        # combined columns
+        data = """date,time,A
+31Jan2009,10:15,1
+01Feb2009,08:00,2
+"""
+        df = self.read_csv(StringIO(data), parse_dates=[['date', 'time']],
+                           date_format='%d%b%Y %H:%M')
+        self.assert_(np.array_equal(df['date_time'], expected))
+
+        # falls back to dateutil
+        data = 'date,A\nJan 31 2009,1\nFeb 1 2009,2'
+        df = self.read_csv(StringIO(data), parse_dates=['date'],
+                           date_format='%Y-%m-%d')
+        self.assertEqual(df['date'][0], datetime(2009, 1, 31))
+
+    def test_parse_dates_na(self):
+        # NA values become NaT, the same in every engine
+        data = 'A,date\n1,NA\n2,2009-01-03\n3,\n'
+        df = self.read_csv(StringIO(data), parse_dates=['date'])
+        expected = np.array(['NaT', datetime(2009, 1, 3), 'NaT'],
+                            dtype='M8[ns]')
+        self.assertEqual(df['date'].dtype, 'M8[ns]')
+        self.assert_(np.array_equal(df['date'].values.view('i8'),
+                                    expected.view('i8')))
+
+        data = 'A,date\n1,NA\n2,\n'
+        df = self.read_csv(StringIO(data), parse_dates=['date'])
+        self.assertEqual(df['date'].dtype, 'M8[ns]')
+        self.assert_(df['date'].isnull().all())
+
     def test_no_header(self):
         data = """1,2,3,4,5
 6,7,8,9,10
@@ -836,6 +899,27 @@ baz,7,8,9
         tm.assert_frame_equal(chunks[1], df[2:4])
         tm.assert_frame_equal(chunks[2], df[4:])
 
+    def test_read_chunksize_groupby(self):
+        df = DataFrame({'key1': np.random.randint(0, 5, 100),
+                        'key2': np.random.randint(0, 2, 100),
+                        'value': np.random.randn(100)})
+        df['value'][::7] = nan
+        data = df.to_string(index=False)
+        df = self.read_table(StringIO(data), sep='\\s+')
+
+        reader = self.read_table(StringIO(data), sep='\\s+', chunksize=15)
+        result = reader.groupby(['key1', 'key2']).mean()
+        expected = df.groupby(['key1', 'key2']).mean()
+        tm.assert_frame_equal(result, expected)
+
+        reader = self.read_table(StringIO(data), sep='\\s+', chunksize=15)
+        result = reader.groupby('key1')['value'].agg(['max', 'std'])
+        expected = df.groupby('key1')['value'].agg(['max', 'std'])
+        tm.assert_frame_equal(result, expected)
+
+        reader = self.read_table(StringIO(data), sep='\\s+', iterator=True)
+        self.assertRaises(ValueError, reader.groupby, 'key1')
+
     def test_read_text_list(self):
         data = """A,B,C\nfoo,1,2,3\nbar,4,5,6"""
         as_list = [['A','B','C'],['foo','1','2','3'],['bar','4','5','6']]
@@ -1297,6 +1381,89 @@ False,NA,True"""
 
         tm.assert_frame_equal(result, expected)
 
+    def test_decompression(self):
+        data = open(self.csv1, 'rb').read()
+
+        expected = self.read_csv(self.csv1)
+
+        import gzip, bz2
+
+        for compression, klass, ext in [('gzip', gzip.GzipFile, '.gz'),
+                                        ('bz2', bz2.BZ2File, '.bz2')]:
+            path = '__tmp__' + ext
+            try:
+                tmp = klass(path, mode='wb')
+                tmp.write(data)
+                tmp.close()
+
+                result = self.read_csv(path, compression=compression)
+                tm.assert_frame_equal(result, expected)
+
+                result = self.read_csv(path, compression='infer')
+                tm.assert_frame_equal(result, expected)
+
+                # open handle on the compressed file
+                f = open(path, 'rb')
+                try:
+                    result = self.read_csv(f, compression=compression)
+                finally:
+                    f.close()
+                tm.assert_frame_equal(result, expected)
+
+                result = self.read_csv(StringIO(open(path, 'rb').read()),
+                                       compression=compression)
+                tm.assert_frame_equal(result, expected)
+            finally:
+                if os.path.exists(path):
+                    os.remove(path)
+
+        # concatenated streams, as written by pbzip2
+        path = '__tmp__.bz2'
+        try:
+            half = data.index(b'\n', len(data) // 2) + 1
+            tmp = open(path, 'wb')
+            tmp.write(bz2.compress(data[:half]) + bz2.compress(data[half:]))
+            tmp.close()
+
+            result = self.read_csv(path, compression='bz2')
+            tm.assert_frame_equal(result, expected)
+
+            f = open(path, 'rb')
+            try:
+                result = self.read_csv(f, compression='bz2')
+            finally:
+                f.close()
+            tm.assert_frame_equal(result, expected)
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
+        # infer leaves other files alone
+        result = self.read_csv(self.csv1, compression='infer')
+        tm.assert_frame_equal(result, expected)
+
+        self.assertRaises(ValueError, self.read_csv, self.csv1,
+                          compression='zip')
+
+    def test_decompression_chunksize(self):
+        data = open(self.csv1, 'rb').read()
+        expected = self.read_csv(self.csv1, index_col=0)
+
+        path = '__tmp__.gz'
+        import gzip
+        try:
+            tmp = gzip.GzipFile(path, mode='wb')
+            tmp.write(data)
+            tmp.close()
+
+            reader = self.read_csv(path, index_col=0, compression='infer',
+                                   chunksize=2)
+            result = concat(list(reader))
+            tm.assert_frame_equal(result, expected)
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+
 
 class TestPythonParser(ParserTests, unittest.TestCase):
 
@@ -1434,6 +1601,36 @@ c   1   2   3   4
         self.assertRaises(ValueError, read_fwf, StringIO(data3),
                           colspecs=colspecs, widths=[6, 10, 10, 7])
 
+        path = '__%s__.txt' % tm.rands(10)
+        with open(path, 'wb') as f:
+            f.write(data1.replace('\n', '\r\n'))
+
+        try:
+            df = read_fwf(path, colspecs=colspecs, header=None,
+                          memory_map=True)
+            tm.assert_frame_equal(df, expected)
+        finally:
+            os.remove(path)
+
+    def test_memory_map_handle(self):
+        expected = self.read_csv(self.csv1, index_col=0)
+
+        with open(self.csv1, 'rb') as f:
+            result = self.read_csv(f, index_col=0, memory_map=True)
+        tm.assert_frame_equal(result, expected)
+
+        # start where the handle is
+        with open(self.csv1, 'rb') as f:
+            f.readline()
+            result = self.read_csv(f, index_col=0, header=None,
+                                   memory_map=True)
+        self.assert_(np.array_equal(result.values, expected.values))
+
+        # not a regular file
+        result = self.read_csv(StringIO(open(self.csv1).read()), index_col=0,
+                               memory_map=True)
+        tm.assert_frame_equal(result, expected)
+
 
     def test_verbose_import(self):
         text = """a,b,c,d
@@ -1753,51 +1950,50 @@ a,b,c
                           names=['a', 'b'], usecols=[1], header=None)
 
 
-    def test_pure_python_failover(self):
-        data = "a,b,c\n1,2,3#ignore this!\n4,5,6#ignorethistoo"
+    def test_compact_strings(self):
+        data = """\
+a,b,c,d
+1,foo,x,1
+2,,yy,2
+3,bar,zzz,3
+4,baz,,q"""
 
-        result = self.read_csv(StringIO(data), comment='#')
-        expected = DataFrame({'a': [1, 4], 'b': [2, 5], 'c': [3, 6]})
+        result = self.read_csv(StringIO(data), compact_strings=True)
+        expected = self.read_csv(StringIO(data))
         tm.assert_frame_equal(result, expected)
 
-    def test_decompression(self):
-        data = open(self.csv1, 'rb').read()
-
-        expected = self.read_csv(self.csv1)
-
-        import gzip, bz2
-
-        try:
-            tmp = gzip.GzipFile('__tmp__', mode='wb')
-            tmp.write(data)
-            tmp.close()
+        self.assert_(result.get_string_array('a') is None)
+        arr = result.get_string_array('b')
+        self.assert_(isinstance(arr, StringArray))
+        self.assert_(np.array_equal(arr.isnull(), [False, True, False, False]))
 
-            result = self.read_csv('__tmp__', compression='gzip')
-            tm.assert_frame_equal(result, expected)
-        finally:
-            # try:
-            #     os.remove('__tmp__')
-            # except:
-            #     pass
-            pass
+        result = self.read_csv(StringIO(data), compact_strings=True,
+                               index_col='c')
+        expected = self.read_csv(StringIO(data), index_col='c')
+        tm.assert_frame_equal(result, expected)
+        self.assert_(result.get_string_array('b') is not None)
 
-        try:
-            tmp = bz2.BZ2File('__tmp__', mode='wb')
-            tmp.write(data)
-            tmp.close()
+    def test_pure_python_failover(self):
+        data = "a,b,c\n1,2,3#ignore this!\n4,5,6#ignorethistoo"
 
-            result = self.read_csv('__tmp__', compression='bz2')
-            tm.assert_frame_equal(result, expected)
-        finally:
-            try:
-                os.remove('__tmp__')
-            except:
-                pass
+        result = self.read_csv(StringIO(data), comment='#')
+        expected = DataFrame({'a': [1, 4], 'b': [2, 5], 'c': [3, 6]})
+        tm.assert_frame_equal(result, expected)
 
     def test_memory_map(self):
         # it works!
         result = self.read_csv(self.csv1, memory_map=True)
 
+    def test_num_threads(self):
+        # files this small are read by one thread, see test_cparser for the
+        # split reads
+        result = self.read_csv(self.csv1, num_threads=4)
+        expected = self.read_csv(self.csv1)
+        tm.assert_frame_equal(result, expected)
+
+        self.assertRaises(ValueError, read_csv, self.csv1, num_threads=4,
+                          engine='python')
+
     def test_disable_bool_parsing(self):
         # #2090
 
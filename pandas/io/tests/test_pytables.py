@@ -8,7 +8,7 @@ import numpy as np
 
 from pandas import (Series, DataFrame, Panel, MultiIndex, bdate_range,
                     date_range, Index)
-from pandas.io.pytables import HDFStore, get_store, Term
+from pandas.io.pytables import HDFStore, get_store, Term, create_table
 import pandas.util.testing as tm
 from pandas.tests.test_series import assert_series_equal
 from pandas.tests.test_frame import assert_frame_equal
@@ -221,6 +221,54 @@ class TestHDFStore(unittest.TestCase):
         self.store.append('s4', wp)
         self.assertRaises(Exception, self.store.append, 's4', wp2)
 
+    def test_append_with_data_columns(self):
+        df = tm.makeTimeDataFrame()
+        df['sym'] = ['AAPL', 'GOOG', 'IBM'] * 10
+        df['size'] = np.arange(30)
+        self.store.append('df', df[:20], data_columns=['B', 'sym', 'size'])
+        self.store.append('df', df[20:])
+        tm.assert_frame_equal(self.store['df'], df)
+
+        # stored as individual columns of the table
+        table = self.store.handle.root.df.table
+        for c in ['B', 'sym', 'size']:
+            self.assert_(c in table.colnames)
+
+        # queries on the data columns run in the table
+        result = self.store.select('df', 'B>0')
+        tm.assert_frame_equal(result, df[df.B > 0])
+
+        result = self.store.select('df', [Term('sym', '=', 'IBM'), 'size>5'])
+        tm.assert_frame_equal(result, df[(df.sym == 'IBM') & (df['size'] > 5)])
+
+        result = self.store.select('df', [('sym', ['IBM', 'AAPL'])])
+        tm.assert_frame_equal(result, df[df.sym.isin(['IBM', 'AAPL'])])
+
+        date = df.index[3]
+        result = self.store.select('df', [('sym', '!=', 'IBM'),
+                                          ('index', '>', date)],
+                                   columns=['A', 'sym'])
+        expected = df[(df.sym != 'IBM') & (df.index > date)]
+        tm.assert_frame_equal(result, expected[['A', 'sym']])
+
+        chunks = self.store.select('df', 'size<25', chunksize=7)
+        tm.assert_frame_equal(concat(list(chunks)), df[:25])
+
+        # the data columns are indexed along with the index
+        self.store.create_table_index('df')
+        self.assert_(table.cols.index.is_indexed)
+        self.assert_(table.cols.sym.is_indexed)
+        self.assert_(table.cols.size.is_indexed)
+
+        # appends keep the data columns of the table
+        self.assertRaises(Exception, self.store.append, 'df', df,
+                          data_columns=['A'])
+
+        self.assertRaises(KeyError, self.store.append, 'df2', df,
+                          data_columns=['E'])
+        self.assertRaises(NotImplementedError, self.store.append, 'wp',
+                          tm.makePanel(), data_columns=['A'])
+
     def test_create_table_index(self):
         wp = tm.makePanel()
         self.store.append('p5', wp)
@@ -823,6 +871,177 @@ class TestHDFStore(unittest.TestCase):
         self.assertRaises(Exception, self.store.select,
                           'frame', [crit1, crit2])
 
+    def test_select_start_stop(self):
+        df = tm.makeTimeDataFrame()
+        self.store.append('df', df)
+
+        result = self.store.select('df', start=5, stop=15)
+        tm.assert_frame_equal(result, df[5:15])
+
+        result = self.store.select('df', start=-10)
+        tm.assert_frame_equal(result, df[-10:])
+
+        # the where applies within the rows start:stop
+        date = df.index[10]
+        result = self.store.select('df', [('index', '>', date)],
+                                   start=5, stop=20)
+        tm.assert_frame_equal(result, df[11:20])
+
+        # only on tables
+        self.store.put('frame', df)
+        self.assertRaises(Exception, self.store.select, 'frame', start=5)
+
+    def test_select_iterator(self):
+        df = tm.makeTimeDataFrame()
+        df = concat([df] * 5)
+        df.index = date_range('2000-01-01', periods=len(df))
+        self.store.append('df', df)
+
+        chunks = list(self.store.select('df', chunksize=70))
+        self.assertEqual([len(c) for c in chunks], [70, 70, 10])
+        tm.assert_frame_equal(concat(chunks), df)
+
+        chunks = list(self.store.select('df', iterator=True))
+        self.assertEqual(len(chunks), 1)
+        tm.assert_frame_equal(chunks[0], df)
+
+        # chunks of the selected rows
+        date = df.index[50]
+        where = [('index', '>', date), ('column', ['A', 'C'])]
+        chunks = list(self.store.select('df', where, chunksize=25))
+        self.assertEqual([len(c) for c in chunks], [25, 25, 25, 24])
+        tm.assert_frame_equal(concat(chunks), df.ix[51:, ['A', 'C']])
+
+        chunks = list(self.store.select('df', where, start=40, stop=120,
+                                        chunksize=25))
+        tm.assert_frame_equal(concat(chunks), df.ix[51:120, ['A', 'C']])
+
+        # nothing selected
+        where = [('index', '>', df.index[-1])]
+        self.assertEqual(len(list(self.store.select('df', where,
+                                                    chunksize=10))), 0)
+
+        # panel rows are (major, minor) pairs
+        wp = tm.makePanel()
+        self.store.append('wp', wp)
+        chunks = list(self.store.select('wp', chunksize=40))
+        self.assertEqual(len(chunks), 3)
+        tm.assert_panel_equal(concat(chunks, axis=1),
+                              self.store.select('wp'))
+
+        # only on tables
+        self.store.put('frame', df)
+        self.assertRaises(Exception, self.store.select, 'frame',
+                          chunksize=10)
+
+    def test_append_to_multiple(self):
+        df1 = tm.makeTimeDataFrame()
+        df2 = tm.makeTimeDataFrame().rename(columns=lambda x: '%s_2' % x)
+        df2['foo'] = 'bar'
+        df = concat([df1, df2], axis=1)
+
+        # a row that is all nan in one of the tables is still written
+        df.ix[3, ['A', 'B']] = np.nan
+
+        self.assertRaises(ValueError, self.store.append_to_multiple,
+                          {'df1': ['A', 'B'], 'df2': None}, df,
+                          selector='df3')
+        self.assertRaises(ValueError, self.store.append_to_multiple,
+                          {'df1': None, 'df2': None}, df, selector='df1')
+        self.assertRaises(NotImplementedError, self.store.append_to_multiple,
+                          {'p1': None}, tm.makePanel(), selector='p1')
+
+        self.store.append_to_multiple({'df1': ['A', 'B'], 'df2': None}, df,
+                                      selector='df1', data_columns=['B'])
+        tm.assert_frame_equal(self.store.select('df1'), df[['A', 'B']])
+        tm.assert_frame_equal(self.store.select('df2'),
+                              df[[c for c in df.columns
+                                  if c not in ['A', 'B']]])
+
+        result = self.store.select_multiple(['df1', 'df2'])
+        tm.assert_frame_equal(result, df)
+
+        # the condition is evaluated on the selector only
+        result = self.store.select_multiple(['df1', 'df2'],
+                                            where=[Term('B>0')],
+                                            selector='df1')
+        tm.assert_frame_equal(result, df[df.B > 0])
+
+        result = self.store.select_multiple(['df1', 'df2'],
+                                            where=['B>0', 'B<1'],
+                                            selector='df1')
+        tm.assert_frame_equal(result, df[(df.B > 0) & (df.B < 1)])
+
+        result = self.store.select_multiple(['df1', 'df2'],
+                                            where=[Term('B>0')],
+                                            columns=['C_2', 'A'])
+        tm.assert_frame_equal(result, df[df.B > 0][['C_2', 'A']])
+
+        result = self.store.select_multiple(['df1', 'df2'], start=5, stop=10)
+        tm.assert_frame_equal(result, df[5:10])
+
+        chunks = list(self.store.select_multiple(['df1', 'df2'],
+                                                 where=[Term('B>0')],
+                                                 chunksize=4))
+        self.assertTrue(all(len(c) <= 4 for c in chunks))
+        tm.assert_frame_equal(concat(chunks), df[df.B > 0])
+
+        # errors
+        self.assertRaises(KeyError, self.store.select_multiple,
+                          ['df1', 'missing'])
+        self.assertRaises(KeyError, self.store.select_multiple,
+                          ['df1', 'df2'], columns=['E'])
+        self.store.append('df3', df[:5])
+        self.assertRaises(ValueError, self.store.select_multiple,
+                          ['df1', 'df3'])
+        self.store.put('frame', df)
+        self.assertRaises(Exception, self.store.select_multiple,
+                          ['df1', 'frame'])
+
+    def test_select_columns(self):
+        df = tm.makeTimeDataFrame()
+        df['string'] = 'foo'
+        df['int'] = 1
+        self.store.append('df', df)
+
+        result = self.store.select('df', columns=['C', 'string'])
+        tm.assert_frame_equal(result, df[['C', 'string']])
+
+        result = self.store.select('df', columns=['int', 'A'])
+        tm.assert_frame_equal(result, df[['int', 'A']])
+
+        date = df.index[10]
+        result = self.store.select('df', [('index', '>', date)],
+                                   columns=['B'])
+        tm.assert_frame_equal(result, df[11:][['B']])
+
+        result = self.store.select('df', start=3, stop=6, columns=['string'])
+        tm.assert_frame_equal(result, df[3:6][['string']])
+
+        chunks = self.store.select('df', columns=['D'], chunksize=7)
+        tm.assert_frame_equal(concat(list(chunks)), df[['D']])
+
+        # only the index and the block holding the column are read
+        t = create_table(self.store, self.store.get_node('df'))
+        t.read(columns=['A'])
+        fields = sorted(t.selection.values.keys())
+        self.assertEqual(len(fields), 2)
+        self.assertEqual(fields[0], 'index')
+
+        self.assertRaises(KeyError, self.store.select, 'df', columns=['E'])
+
+        # items of a panel
+        wp = tm.makePanel()
+        self.store.append('wp', wp)
+        result = self.store.select('wp', columns=['ItemB'])
+        tm.assert_panel_equal(result,
+                              self.store.select('wp').reindex(items=['ItemB']))
+
+        # only on tables
+        self.store.put('frame', df)
+        self.assertRaises(Exception, self.store.select, 'frame',
+                          columns=['A'])
+
     def test_select_filter_corner(self):
         df = DataFrame(np.random.randn(50, 100))
         df.index = ['%.3d' % c for c in df.index]
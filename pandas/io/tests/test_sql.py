@@ -2,12 +2,14 @@ from pandas.util.py3compat import StringIO
 import unittest
 import sqlite3
 import sys
+import os
+from datetime import datetime
 
 import numpy as np
 
 import pandas.io.sql as sql
 import pandas.util.testing as tm
-from pandas import Series, Index, DataFrame
+from pandas import Series, Index, DataFrame, DatetimeIndex, concat
 
 class TestSQLite(unittest.TestCase):
     _multiprocess_can_split_ = True
@@ -171,6 +173,99 @@ class TestSQLite(unittest.TestCase):
         finally:
             sys.stdout = sys.__stdout__
 
+    def test_read_frame_chunksize(self):
+        self.db.execute('CREATE TABLE test (a INTEGER, b REAL, c TEXT)')
+        rows = [(i, i * 0.5, 'foo%d' % i) for i in range(25)]
+        rows[20] = (None, None, None)
+        self.db.executemany('INSERT INTO test VALUES (?, ?, ?)', rows)
+
+        expected = sql.read_frame('select * from test', self.db)
+        self.assertEqual(expected['a'].dtype, np.float64)
+        self.assertEqual(expected['c'].dtype, np.object_)
+        self.assert_(np.isnan(expected['a'][20]))
+
+        chunks = list(sql.read_frame('select * from test', self.db,
+                                     chunksize=10))
+        self.assertEqual([len(x) for x in chunks], [10, 10, 5])
+        self.assertEqual(chunks[0]['a'].dtype, np.int64)
+        tm.assert_frame_equal(concat(chunks), expected)
+
+        chunks = sql.read_frame('select * from test', self.db,
+                                index_col='c', chunksize=10)
+        tm.assert_frame_equal(concat(list(chunks)), expected.set_index('c'))
+
+    def test_read_frame_batches(self):
+        # columns typed batch by batch match a conversion of the whole column
+        self.db.execute('CREATE TABLE test (a INTEGER, b INTEGER, c TEXT)')
+        rows = [(i, i % 2, 'foo') for i in range(25)]
+        rows[24] = (None, 'bar', None)
+        self.db.executemany('INSERT INTO test VALUES (?, ?, ?)', rows)
+
+        _fetch_size = sql._FETCH_SIZE
+        try:
+            sql._FETCH_SIZE = 10
+            result = sql.read_frame('select * from test', self.db)
+        finally:
+            sql._FETCH_SIZE = _fetch_size
+        expected = sql.read_frame('select * from test', self.db)
+        tm.assert_frame_equal(result, expected)
+        self.assertEqual(result['a'].dtype, np.float64)
+        self.assertEqual(result['b'].dtype, np.object_)
+
+        result = sql.read_frame('select * from test where a > 100', self.db)
+        self.assertEqual(len(result), 0)
+        self.assert_(np.array_equal(result.columns, ['a', 'b', 'c']))
+
+    def test_write_frame_chunksize(self):
+        frame = DataFrame({'a': np.arange(30),
+                           'b': np.random.randn(30),
+                           'c': ['foo%d' % i for i in range(30)]},
+                          columns=['a', 'b', 'c'])
+        frame['b'][5] = np.nan
+
+        sql.write_frame(frame, name='test', con=self.db, chunksize=7)
+        result = sql.read_frame('select * from test', self.db)
+        tm.assert_frame_equal(result, frame)
+
+        self.assertRaises(ValueError, sql.write_frame, frame, name='test',
+                          con=self.db, chunksize=0)
+
+
+    def test_write_frame_commits(self):
+        path = '__%s__.db' % tm.rands(10)
+        frame = tm.makeTimeDataFrame()
+        frame['A'][25] = 1000
+        con = sqlite3.connect(path)
+        try:
+            con.execute('CREATE TABLE test (A REAL CHECK (A < 100), B REAL, '
+                        'C REAL, D REAL)')
+
+            # the batch with the bad value is rolled back, the ones before it
+            # were committed
+            self.assertRaises(sqlite3.IntegrityError, sql.write_frame, frame,
+                              name='test', con=con, append=True, chunksize=10)
+
+            con2 = sqlite3.connect(path)
+            result = sql.read_frame('select * from test', con2)
+            con2.close()
+            self.assertEqual(len(result), 20)
+        finally:
+            con.close()
+            os.remove(path)
+
+    def test_write_frame_datetime(self):
+        frame = DataFrame({'a': [1, 2, 3],
+                           'b': DatetimeIndex([datetime(2012, 1, 1),
+                                               datetime(2012, 1, 2),
+                                               datetime(2012, 1, 3, 12)])})
+        frame['b'][1] = np.nan
+        self.assertEqual(frame['b'].dtype, 'M8[ns]')
+
+        sql.write_frame(frame, name='test', con=self.db)
+        result = sql.read_frame('select * from test', self.db)
+        self.assertEqual(list(result['b']), ['2012-01-01 00:00:00', None,
+                                             '2012-01-03 12:00:00'])
+
     def test_keyword_as_column_names(self):
         '''
         '''
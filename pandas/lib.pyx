@@ -825,6 +825,38 @@ def create_hdf_rows_3d(ndarray index, ndarray columns,
 
     return l
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def write_csv_rows(list data, list data_index, object writer):
+    """
+    Write a chunk of the rows of a frame with a csv writer, given the
+    formatted values of each index level (data_index) and of each column
+    (data). The rows are assembled here and written with one writerows call
+    """
+    cdef:
+        Py_ssize_t i, j, nrows, ncols
+        list columns, rows
+        object row, val
+
+    columns = [arr.tolist() for arr in data_index]
+    columns.extend([arr.tolist() for arr in data])
+
+    ncols = len(columns)
+    if ncols == 0:
+        return
+
+    nrows = len(columns[0])
+    rows = [None] * nrows
+    for i from 0 <= i < nrows:
+        row = PyTuple_New(ncols)
+        for j from 0 <= j < ncols:
+            val = (<list> columns[j])[i]
+            PyTuple_SET_ITEM(row, j, val)
+            Py_INCREF(val)
+        rows[i] = row
+
+    writer.writerows(rows)
+
 #-------------------------------------------------------------------------------
 # Groupby-related functions
 
@@ -114,6 +114,10 @@ class SparseDataFrame(DataFrame):
         # do nothing when DataFrame calls this method
         pass
 
+    def _materialize(self):
+        # sparse values are never shared copy-on-write
+        pass
+
     def convert_objects(self):
         # XXX
         return self
@@ -114,6 +114,11 @@ cdef extern from "datetime/np_datetime_strings.h":
 
     int get_datetime_iso_8601_strlen(int local, PANDAS_DATETIMEUNIT base)
 
+    int parse_datetime_format(char *str, char *format,
+                              pandas_datetimestruct *out) nogil
+    int is_supported_datetime_format(char *format)
+    char *infer_iso_datetime_format(char *str)
+
     # int parse_python_string(object obj, pandas_datetimestruct *out) except -1
 
 
@@ -13,6 +13,7 @@
 #include <Python.h>
 
 #include <time.h>
+#include <ctype.h>
 
 #include <numpy/arrayobject.h>
 #include "numpy/arrayscalars.h"
@@ -1461,3 +1462,197 @@ string_too_short:
                 outlen);
     return -1;
 }
+
+
+/*
+ * Parses up to 'maxlen' decimal digits (at least one) from *str,
+ * advancing the pointer. Returns -1 if there is no digit.
+ */
+static int
+parse_digits(char **str, int maxlen, int *out, int *ndigits)
+{
+    char *s = *str;
+    int value = 0, i = 0;
+
+    while (i < maxlen && s[i] >= '0' && s[i] <= '9') {
+        value = 10 * value + (s[i] - '0');
+        ++i;
+    }
+    if (i == 0) {
+        return -1;
+    }
+
+    *str = s + i;
+    *out = value;
+    if (ndigits != NULL) {
+        *ndigits = i;
+    }
+    return 0;
+}
+
+static const char *_month_abbrevs[12] = {
+    "jan", "feb", "mar", "apr", "may", "jun",
+    "jul", "aug", "sep", "oct", "nov", "dec"
+};
+
+int
+parse_datetime_format(char *str, char *format, pandas_datetimestruct *out)
+{
+    char *s = str, *f = format;
+    int value, ndigits, i, month_found;
+
+    memset(out, 0, sizeof(pandas_datetimestruct));
+    out->year = 1970;
+    out->month = 1;
+    out->day = 1;
+
+    while (*f != '\0') {
+        if (*f != '%') {
+            if (*s != *f) {
+                return -1;
+            }
+            ++s;
+            ++f;
+            continue;
+        }
+
+        ++f;
+        switch (*f) {
+            case 'Y':
+                if (parse_digits(&s, 4, &value, &ndigits) < 0 ||
+                        ndigits != 4) {
+                    return -1;
+                }
+                out->year = value;
+                break;
+            case 'y':
+                if (parse_digits(&s, 2, &value, &ndigits) < 0 ||
+                        ndigits != 2) {
+                    return -1;
+                }
+                /* same pivot as time.strptime */
+                out->year = value + (value < 69 ? 2000 : 1900);
+                break;
+            case 'm':
+                if (parse_digits(&s, 2, &value, NULL) < 0 ||
+                        value < 1 || value > 12) {
+                    return -1;
+                }
+                out->month = value;
+                break;
+            case 'b':
+                month_found = 0;
+                for (i = 0; i < 12; ++i) {
+                    if (tolower(s[0]) == _month_abbrevs[i][0] &&
+                            tolower(s[1]) == _month_abbrevs[i][1] &&
+                            tolower(s[2]) == _month_abbrevs[i][2]) {
+                        out->month = i + 1;
+                        month_found = 1;
+                        s += 3;
+                        break;
+                    }
+                }
+                if (!month_found) {
+                    return -1;
+                }
+                break;
+            case 'd':
+                if (parse_digits(&s, 2, &value, NULL) < 0 || value < 1) {
+                    return -1;
+                }
+                out->day = value;
+                break;
+            case 'H':
+                if (parse_digits(&s, 2, &value, NULL) < 0 || value > 23) {
+                    return -1;
+                }
+                out->hour = value;
+                break;
+            case 'M':
+                if (parse_digits(&s, 2, &value, NULL) < 0 || value > 59) {
+                    return -1;
+                }
+                out->min = value;
+                break;
+            case 'S':
+                if (parse_digits(&s, 2, &value, NULL) < 0 || value > 59) {
+                    return -1;
+                }
+                out->sec = value;
+                break;
+            case 'f':
+                /* fractional seconds, down to nanoseconds */
+                if (parse_digits(&s, 9, &value, &ndigits) < 0) {
+                    return -1;
+                }
+                for (i = ndigits; i < 9; ++i) {
+                    value *= 10;
+                }
+                out->us = value / 1000;
+                out->ps = (value % 1000) * 1000;
+                break;
+            case '%':
+                if (*s != '%') {
+                    return -1;
+                }
+                ++s;
+                break;
+            default:
+                /* unsupported directive */
+                return -1;
+        }
+        ++f;
+    }
+
+    if (*s != '\0') {
+        return -1;
+    }
+
+    if (out->day > days_per_month_table[is_leapyear(out->year)]
+                                       [out->month - 1]) {
+        return -1;
+    }
+
+    return 0;
+}
+
+int
+is_supported_datetime_format(char *format)
+{
+    char *f = format;
+
+    while (*f != '\0') {
+        if (*f++ == '%') {
+            if (*f == '\0' || strchr("YymbdHMSf%", *f) == NULL) {
+                return 0;
+            }
+            ++f;
+        }
+    }
+    return 1;
+}
+
+static char *_iso_formats[] = {
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    NULL
+};
+
+char *
+infer_iso_datetime_format(char *str)
+{
+    pandas_datetimestruct dts;
+    int i;
+
+    for (i = 0; _iso_formats[i] != NULL; ++i) {
+        if (parse_datetime_format(str, _iso_formats[i], &dts) == 0) {
+            return _iso_formats[i];
+        }
+    }
+    return NULL;
+}
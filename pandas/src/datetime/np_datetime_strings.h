@@ -83,4 +83,35 @@ make_iso_8601_datetime(pandas_datetimestruct *dts, char *outstr, int outlen,
                     int local, PANDAS_DATETIMEUNIT base, int tzoffset,
                     NPY_CASTING casting);
 
+/*
+ * Parses a NULL-terminated string according to a strptime-style format.
+ * The supported directives are %Y (4 digits), %y (2 digits), %m, %b
+ * (English month abbreviation), %d, %H, %M, %S, %f (up to nanoseconds)
+ * and %%. All other characters must match literally, and the whole
+ * string must be consumed. Fields not given in the format default to
+ * 1970-01-01 00:00:00.
+ *
+ * Does not set a Python exception, so it can be called without the GIL.
+ *
+ * Returns 0 on success, -1 on failure.
+ */
+int
+parse_datetime_format(char *str, char *format, pandas_datetimestruct *out);
+
+/*
+ * Returns 1 if all the directives in 'format' are understood by
+ * parse_datetime_format, 0 otherwise.
+ */
+int
+is_supported_datetime_format(char *format);
+
+/*
+ * Returns the first of the common ISO 8601 layouts ("YYYY-MM-DD",
+ * optionally followed by " HH:MM", ":SS" and ".ffffff", with a ' ' or
+ * 'T' separator) that parses 'str', as a format string suitable for
+ * parse_datetime_format, or NULL if none matches.
+ */
+char *
+infer_iso_datetime_format(char *str);
+
 #endif
@@ -28,8 +28,12 @@ import numpy as np
 cimport util
 
 import pandas.lib as lib
+import pandas.core.common as com
+from pandas.core.stringarray import StringArray
 
+import os
 import time
+import threading
 
 cnp.import_array()
 
@@ -76,6 +80,12 @@ cdef extern from "parser/tokenizer.h":
         EAT_COMMENT
         FINISHED
 
+    ctypedef enum QuoteStyle:
+        QUOTE_MINIMAL
+        QUOTE_ALL
+        QUOTE_NONNUMERIC
+        QUOTE_NONE
+
     enum: ERROR_OVERFLOW
 
     ctypedef void* (*io_callback)(void *src, size_t nbytes, size_t *bytes_read,
@@ -153,14 +163,16 @@ cdef extern from "parser/tokenizer.h":
         int *line_start
         int col
 
-    void coliter_setup(coliter_t *it, parser_t *parser, int i, int start)
-    char* COLITER_NEXT(coliter_t it)
+    void coliter_setup(coliter_t *it, parser_t *parser,
+                       int i, int start) nogil
+    char* COLITER_NEXT(coliter_t it) nogil
 
     parser_t* parser_new()
 
     int parser_init(parser_t *self) nogil
     void parser_free(parser_t *self) nogil
     int parser_add_skiprow(parser_t *self, int64_t row)
+    int parser_set_usecols(parser_t *self, char *mask, int n)
 
     void parser_set_default_options(parser_t *self)
 
@@ -173,12 +185,16 @@ cdef extern from "parser/tokenizer.h":
     int tokenize_all_rows(parser_t *self) nogil
     int tokenize_nrows(parser_t *self, size_t nrows) nogil
 
+    int parser_find_record_starts(parser_t *self, void *source,
+                                  int64_t start, int64_t *offsets,
+                                  int n) nogil
+
     int64_t str_to_int64(char *p_item, int64_t int_min,
-                         int64_t int_max, int *error, char tsep)
+                         int64_t int_max, int *error, char tsep) nogil
     uint64_t str_to_uint64(char *p_item, uint64_t uint_max, int *error)
 
     inline int to_double(char *item, double *p_value,
-                         char sci, char decimal)
+                         char sci, char decimal) nogil
     inline int to_complex(char *item, double *p_real,
                           double *p_imag, char sci, char decimal)
     inline int to_longlong(char *item, long long *p_value)
@@ -206,6 +222,30 @@ cdef extern from "parser/io.h":
     void* buffer_rd_bytes(void *source, size_t nbytes,
                           size_t *bytes_read, int *status)
 
+    int file_source_set_range(void *source, int64_t start, int64_t stop)
+    int64_t file_source_tell(void *source)
+
+    int mmap_set_range(void *source, int64_t start, int64_t stop)
+    int64_t mmap_tell(void *source)
+
+
+cdef extern from "datetime/np_datetime.h":
+    ctypedef enum PANDAS_DATETIMEUNIT:
+        PANDAS_FR_ns
+
+    ctypedef struct pandas_datetimestruct:
+        int64_t year
+        int32_t month, day, hour, min, sec, us, ps, as
+
+    int64_t pandas_datetimestruct_to_datetime(PANDAS_DATETIMEUNIT fr,
+                                              pandas_datetimestruct *d) nogil
+
+cdef extern from "datetime/np_datetime_strings.h":
+    int parse_datetime_format(char *str, char *format,
+                              pandas_datetimestruct *out) nogil
+    int is_supported_datetime_format(char *format)
+    char *infer_iso_datetime_format(char *str) nogil
+
 
 DEFAULT_CHUNKSIZE = 256 * 1024
 
@@ -231,9 +271,12 @@ cdef class TextReader:
         int parser_start
         list clocks
         char *c_encoding
+        object source_path, chunk_kwds
+        object date_format
 
     cdef public:
         int leading_cols, table_width, skip_footer, buffer_lines
+        int num_threads
         object delimiter, converters, delim_whitespace
         object na_values, true_values, false_values
         object memory_map
@@ -242,10 +285,11 @@ cdef class TextReader:
         object low_memory
         object skiprows
         object compact_ints, use_unsigned
+        object compact_strings
         object dtype
         object encoding
         object compression
-        set noconvert, usecols
+        set noconvert, usecols, parse_dates
 
     def __cinit__(self, source,
                   delimiter=b',',
@@ -287,11 +331,15 @@ cdef class TextReader:
 
                   compact_ints=False,
                   use_unsigned=False,
+                  compact_strings=False,
                   low_memory=False,
                   buffer_lines=None,
                   skiprows=None,
                   skip_footer=0,
-                  verbose=False):
+                  verbose=False,
+                  date_format=None,
+                  num_threads=1,
+                  byte_range=None):
 
         self.parser = parser_new()
         self.parser.chunksize = tokenize_chunksize
@@ -299,10 +347,10 @@ cdef class TextReader:
         # For timekeeping
         self.clocks = []
 
-        self.compression = compression
+        self.compression = com._infer_compression(source, compression)
         self.memory_map = memory_map
 
-        self._setup_parser_source(source)
+        self._setup_parser_source(source, byte_range)
         parser_set_default_options(self.parser)
 
         parser_init(self.parser)
@@ -379,10 +427,51 @@ cdef class TextReader:
 
         self.compact_ints = compact_ints
         self.use_unsigned = use_unsigned
+        self.compact_strings = compact_strings and not as_recarray
+
+        if date_format is not None:
+            if not isinstance(date_format, bytes):
+                date_format = date_format.encode('utf-8')
+            if not is_supported_datetime_format(date_format):
+                raise ValueError('Unsupported date format: %s' % date_format)
+        self.date_format = date_format
 
         self.verbose = verbose
         self.low_memory = low_memory
 
+        if num_threads < 1:
+            raise ValueError('num_threads must be at least 1')
+        self.num_threads = num_threads
+
+        # options shared by the readers of the pieces of a split file, see
+        # _read_parallel
+        self.chunk_kwds = None
+        if num_threads > 1:
+            self.chunk_kwds = dict(delimiter=delimiter,
+                                   memory_map=memory_map,
+                                   tokenize_chunksize=tokenize_chunksize,
+                                   delim_whitespace=delim_whitespace,
+                                   converters=converters,
+                                   factorize=factorize,
+                                   skipinitialspace=skipinitialspace,
+                                   escapechar=escapechar,
+                                   doublequote=doublequote,
+                                   quotechar=quotechar,
+                                   quoting=quoting,
+                                   encoding=encoding,
+                                   comment=comment,
+                                   decimal=decimal,
+                                   thousands=thousands,
+                                   dtype=dtype,
+                                   error_bad_lines=error_bad_lines,
+                                   warn_bad_lines=warn_bad_lines,
+                                   na_filter=na_filter,
+                                   na_values=na_values,
+                                   true_values=true_values,
+                                   false_values=false_values,
+                                   compact_strings=compact_strings,
+                                   date_format=date_format)
+
         # encoding
         if encoding is not None:
             if not isinstance(encoding, bytes):
@@ -409,6 +498,7 @@ cdef class TextReader:
 
         # XXX
         self.noconvert = set()
+        self.parse_dates = set()
 
         #----------------------------------------
         # header stuff
@@ -427,6 +517,9 @@ cdef class TextReader:
         self.names = names
         self.header, self.table_width = self._get_header()
 
+        if self.has_usecols:
+            self._prune_columns()
+
         # compute buffer_lines as function of table width
         heuristic = 2**20 // self.table_width
         self.buffer_lines = 1
@@ -449,21 +542,25 @@ cdef class TextReader:
         for i in self.skiprows:
             parser_add_skiprow(self.parser, i)
 
-    cdef _setup_parser_source(self, source):
+    cdef _setup_parser_source(self, source, byte_range=None):
         cdef:
             int status
             void *ptr
 
-        if isinstance(source, basestring) and self.compression:
-            if self.compression == 'gzip':
-                import gzip
-                source = gzip.GzipFile(source, 'rb')
-            elif self.compression == 'bz2':
-                import bz2
-                source = bz2.BZ2File(source, 'rb')
-            else:
-                raise ValueError('Unrecognized compression type: %s' %
-                                 self.compression)
+        self.source_path = None
+
+        if (self.memory_map and not self.compression and
+            _is_disk_file(source)):
+            # map the file behind the handle, starting where it is now
+            if byte_range is None:
+                byte_range = (source.tell(), -1)
+            source = source.name
+
+        if self.compression:
+            # the decompressed data is pulled through the read callback one
+            # buffer at a time, the file is never inflated as a whole
+            source = com._get_compressed_handle(source, 'rb',
+                                                self.compression)
 
         if isinstance(source, basestring):
             if not isinstance(source, bytes):
@@ -485,9 +582,18 @@ cdef class TextReader:
                 self.parser.cb_cleanup = &del_file_source
 
             if ptr == NULL:
-                raise Exception('Initializing from file failed')
+                if not os.path.exists(source):
+                    raise IOError('File %s does not exist' % source)
+                raise IOError('Initializing from file failed')
 
             self.parser.source = ptr
+            self.source_path = source
+
+            if byte_range is not None:
+                if self._set_source_range(ptr, byte_range[0],
+                                          byte_range[1]) < 0:
+                    raise Exception('Seeking to byte %d failed'
+                                    % byte_range[0])
 
         elif hasattr(source, 'read'):
             # e.g., StringIO
@@ -603,6 +709,39 @@ cdef class TextReader:
     cdef _implicit_index_count(self):
         pass
 
+    cdef _prune_columns(self):
+        # have the tokenizer drop the fields of the columns not in usecols
+        cdef ndarray mask = np.zeros(self.table_width, dtype=np.uint8)
+
+        for i, name in self._used_columns():
+            mask[i] = 1
+
+        if parser_set_usecols(self.parser, <char*> mask.data,
+                              self.table_width) != 0:
+            raise CParserError('Unable to select columns')
+
+    cdef list _used_columns(self):
+        # (number, name) of the columns to return
+        cdef:
+            Py_ssize_t i, nused = 0
+            object name
+            list result = []
+
+        for i in range(self.table_width):
+            name = self._get_column_name(i, nused)
+
+            if self.has_usecols and not (i in self.usecols or
+                                         name in self.usecols):
+                continue
+
+            result.append((i, name))
+
+            # number of used columns, not counting those with converters
+            if not self._get_converter(i, name):
+                nused += 1
+
+        return result
+
     def read(self, rows=None):
         """
         rows=None --> read all rows
@@ -610,7 +749,13 @@ cdef class TextReader:
         cdef:
             int status
 
-        if self.low_memory:
+        columns = None
+        if rows is None and self.num_threads > 1:
+            columns = self._read_parallel()
+
+        if columns is not None:
+            pass
+        elif self.low_memory:
             # Conserve intermediate space
             columns = self._read_low_memory(rows)
         else:
@@ -664,6 +809,242 @@ cdef class TextReader:
         # destructive to chunks
         return _concatenate_chunks(chunks)
 
+    cdef _read_parallel(self):
+        """
+        Split the rest of the file into pieces starting on record boundaries,
+        tokenize and convert them on num_threads threads and merge the
+        results. The column dtypes are the ones a serial read would infer.
+
+        Returns None without consuming any data if the source can't be split
+        or if a piece doesn't parse cleanly (bad lines, warnings), leaving the
+        serial reader to handle (and report) it.
+        """
+        cdef:
+            int64_t data_start, size, *offsets
+            int npieces, k
+            void *ptr
+            TextReader reader
+
+        if (self.source_path is None or self.skip_footer > 0 or
+            self.parser.state != START_RECORD or self.parser.lines == 0):
+            return None
+
+        # rows to skip must already be behind us
+        if self.skiprows is not None:
+            for k in self.skiprows:
+                if k >= self.parser.file_lines:
+                    return None
+
+        data_start = (self._source_tell(self.parser.source) -
+                      (self.parser.datalen - self.parser.datapos))
+        size = os.path.getsize(self.source_path)
+
+        npieces = min(self.num_threads,
+                      (size - data_start) // self.parser.chunksize)
+        if npieces < 2:
+            return None
+
+        self._start_clock()
+
+        # find where the records containing the even split points start
+        offsets = <int64_t*> malloc((npieces - 1) * sizeof(int64_t))
+        for k in range(1, npieces):
+            offsets[k - 1] = data_start + k * (size - data_start) // npieces
+
+        if self.parser.cb_io == &buffer_mmap_bytes:
+            ptr = new_mmap(self.source_path)
+        else:
+            ptr = new_file_source(self.source_path, self.parser.chunksize)
+
+        try:
+            if ptr == NULL:
+                return None
+
+            if (self.parser.quoting == QUOTE_NONE and
+                self.parser.escapechar == 0):
+                # any newline ends a record, so scan from each split point
+                for k in range(npieces - 1):
+                    if self._set_source_range(ptr, offsets[k], -1) < 0:
+                        return None
+                    with nogil:
+                        parser_find_record_starts(self.parser, ptr,
+                                                  offsets[k], offsets + k, 1)
+            else:
+                if self._set_source_range(ptr, data_start, -1) < 0:
+                    return None
+                with nogil:
+                    parser_find_record_starts(self.parser, ptr, data_start,
+                                              offsets, npieces - 1)
+
+            bounds = [data_start]
+            for k in range(npieces - 1):
+                if bounds[-1] < offsets[k] < size:
+                    bounds.append(offsets[k])
+            bounds.append(size)
+        finally:
+            free(offsets)
+            if ptr != NULL:
+                self.parser.cb_cleanup(ptr)
+
+        readers = []
+        try:
+            for k in range(len(bounds) - 1):
+                reader = TextReader(self.source_path, header=None,
+                                    byte_range=(bounds[k], bounds[k + 1]),
+                                    **self.chunk_kwds)
+                reader.header = self.header
+                reader.names = self.names
+                reader.leading_cols = self.leading_cols
+                reader.table_width = self.table_width
+                reader.noconvert = set(self.noconvert)
+                reader.parse_dates = set(self.parse_dates)
+                if self.has_usecols:
+                    reader.has_usecols = 1
+                    reader.usecols = self.usecols
+                    reader._prune_columns()
+                readers.append(reader)
+        except Exception:
+            return None
+
+        results = [None] * len(readers)
+        threads = [threading.Thread(target=_chunk_worker,
+                                    args=(readers[k], results, k))
+                   for k in range(1, len(readers))]
+        for thread in threads:
+            thread.start()
+        _chunk_worker(readers[0], results, 0)
+        for thread in threads:
+            thread.join()
+
+        # each piece's first line must have been checked against the line
+        # before it, as in the serial reader
+        ex_fields = self.parser.line_fields[self.parser.lines - 1]
+        for k in range(len(readers)):
+            reader = readers[k]
+            if results[k] is None or reader.parser.warn_msg != NULL:
+                return None
+            if reader.parser.lines > 0:
+                if reader.parser.line_fields[0] != ex_fields:
+                    return None
+                ex_fields = reader.parser.line_fields[reader.parser.lines - 1]
+
+        # rows already tokenized by this reader come first
+        pieces = []
+        if self.parser_start < self.parser.lines:
+            pieces.append((self, self.parser_start, self.parser.lines,
+                           self._convert_raw_columns(self.parser_start,
+                                                     self.parser.lines)))
+        for k in range(len(readers)):
+            reader = readers[k]
+            if reader.parser.lines > 0:
+                pieces.append((reader, 0, reader.parser.lines, results[k]))
+
+        if len(pieces) == 0:
+            return None
+
+        columns = {}
+        for i in pieces[0][3]:
+            name = pieces[0][3][i][3]
+            col_res, na_count = _merge_column_pieces(i, name, pieces)
+            if col_res is None:
+                return None
+            col_res = self._finish_column(i, name, col_res, na_count,
+                                          not self.as_recarray)
+
+            if self.low_memory and not self._chunk_invariant(i, name,
+                                                             col_res):
+                col_res = self._convert_by_chunks(i, name, pieces)
+                if col_res is None:
+                    return None
+            columns[i] = col_res
+
+        # everything has been read
+        parser_consume_rows(self.parser, self.parser.lines - self.parser_start)
+        parser_trim_buffers(self.parser)
+        self.parser.datapos = self.parser.datalen
+        self._set_source_range(self.parser.source, size, size)
+
+        self._end_clock('Parallel tokenization and type conversion')
+
+        return columns
+
+    cdef bint _chunk_invariant(self, Py_ssize_t i, object name,
+                               object values):
+        # whether converting the column a chunk of rows at a time, as a
+        # low_memory read does, gives the same values and dtype. Integer
+        # columns stay integers and float columns floats in every chunk,
+        # unless a chunk is all integers and one of them overflows int64
+        if self._get_converter(i, name) or isinstance(values, StringArray):
+            return False
+
+        kind = values.dtype.kind
+        if kind == 'i' or kind == 'u':
+            return not self.compact_ints
+        elif kind == 'f':
+            return not (np.abs(values) >= 2 ** 63).any()
+        return kind == 'M'
+
+    cdef _convert_by_chunks(self, Py_ssize_t i, object name, list pieces):
+        """
+        Convert column i of the pieces as the serial low_memory read does,
+        inferring the dtype of each buffer_lines rows on their own. None if
+        the rows of a chunk split over pieces don't merge, see
+        _merge_column_pieces
+        """
+        cdef:
+            TextReader reader
+            int start, end, stop, nrows = 0
+
+        chunks = []
+        parts = []
+        for reader, start, end, _ in pieces:
+            while start < end:
+                stop = min(end, start + self.buffer_lines - nrows)
+                parts.append((reader, start, stop,
+                              {i: reader._convert_raw_column(i, name, start,
+                                                             stop)}))
+                nrows += stop - start
+                start = stop
+
+                if nrows == self.buffer_lines or (start == end and
+                                                  reader is pieces[-1][0]):
+                    col_res, na_count = _merge_column_pieces(i, name, parts)
+                    if col_res is None:
+                        return None
+                    chunks.append(self._finish_column(i, name, col_res,
+                                                      na_count,
+                                                      not self.as_recarray))
+                    parts = []
+                    nrows = 0
+
+        return _concatenate_values(chunks)
+
+    def _read_chunk(self):
+        # tokenize everything and convert without the final NA handling, see
+        # _read_parallel
+        cdef int status
+
+        with nogil:
+            status = tokenize_all_rows(self.parser)
+
+        if status < 0:
+            raise_parser_error('Error tokenizing data', self.parser)
+
+        return self._convert_raw_columns(self.parser_start, self.parser.lines)
+
+    cdef int _set_source_range(self, void *source, int64_t start,
+                               int64_t stop):
+        if self.parser.cb_io == &buffer_mmap_bytes:
+            return mmap_set_range(source, start, stop)
+        else:
+            return file_source_set_range(source, start, stop)
+
+    cdef int64_t _source_tell(self, void *source):
+        if self.parser.cb_io == &buffer_mmap_bytes:
+            return mmap_tell(source)
+        else:
+            return file_source_tell(source)
+
     cdef _tokenize_rows(self, size_t nrows):
         cdef int status
         with nogil:
@@ -747,13 +1128,17 @@ cdef class TextReader:
     def remove_noconvert(self, i):
         self.noconvert.remove(i)
 
+    def set_parse_dates(self, i):
+        """
+        Try to parse column i straight to datetime64[ns], with date_format
+        or else the common ISO 8601 layouts. If that fails the column is
+        converted as it would have been otherwise.
+        """
+        self.parse_dates.add(i)
+
     def _convert_column_data(self, rows=None, upcast_na=False, footer=0):
         cdef:
-            Py_ssize_t i, nused, ncols
-            kh_str_t *na_hashset = NULL
             int start, end
-            object name
-            bint na_filter = 0
 
         start = self.parser_start
 
@@ -766,61 +1151,74 @@ cdef class TextReader:
         # if footer > 0:
         #     end -= footer
 
-        results = {}
-        nused = 0
-        for i in range(self.table_width):
-            name = self._get_column_name(i, nused)
+        results = self._convert_raw_columns(start, end)
+        for i in results:
+            col_res, na_count, kind, name = results[i]
+            results[i] = self._finish_column(i, name, col_res, na_count,
+                                             upcast_na)
 
-            if self.has_usecols and not (i in self.usecols or
-                                         name in self.usecols):
-                continue
+        self.parser_start += end - start
 
-            conv = self._get_converter(i, name)
+        return results
 
-            # XXX
-            if self.na_filter:
-                na_list = self._get_na_list(i, name)
-                if na_list is None:
-                    na_filter = 0
-                else:
-                    na_filter = 1
-                    na_hashset = kset_from_list(na_list)
-            else:
-                na_filter = 0
+    cdef _convert_raw_columns(self, int start, int end):
+        """
+        Convert lines [start, end) of each used column, returning a dict
+        mapping column number to (values, na_count, kind, name) where kind is
+        the position of the inferred dtype in dtype_cast_order (-1 if the
+        integer conversion overflowed, None if the dtype was not inferred).
+        NA upcasting and int compaction are left to _finish_column.
+        """
+        cdef:
+            Py_ssize_t i
+            object name
 
-            if conv:
-                results[i] = _apply_converter(conv, self.parser, i, start, end,
-                                              self.c_encoding)
-                continue
+        results = {}
+        for i, name in self._used_columns():
+            results[i] = self._convert_raw_column(i, name, start, end)
 
-            # Should return as the desired dtype (inferred or specified)
-            col_res, na_count = self._convert_tokens(i, start, end, name,
-                                                     na_filter, na_hashset)
+        return results
 
-            if na_filter:
-                self._free_na_set(na_hashset)
+    cdef _convert_raw_column(self, Py_ssize_t i, object name, int start,
+                             int end):
+        conv = self._get_converter(i, name)
+        if conv:
+            col_res = _apply_converter(conv, self.parser, i, start, end,
+                                       self.c_encoding)
+            return col_res, 0, None, name
 
-            if upcast_na and na_count > 0:
-                col_res = _maybe_upcast(col_res)
+        col_res, na_count, kind = self._convert_tokens(i, start, end, name)
+        if col_res is None:
+            raise Exception('Unable to parse column %d' % i)
 
-            if issubclass(col_res.dtype.type, np.integer) and self.compact_ints:
-                col_res = downcast_int64(col_res, self.use_unsigned)
+        return col_res, na_count, kind, name
 
-            if col_res is None:
-                raise Exception('Unable to parse column %d' % i)
+    cdef _finish_column(self, Py_ssize_t i, object name, object col_res,
+                        int na_count, bint upcast_na):
+        if self._get_converter(i, name):
+            return lib.maybe_convert_objects(col_res)
 
-            results[i] = col_res
+        if isinstance(col_res, StringArray):
+            return col_res
 
-            # number of used columns
-            nused += 1
+        if upcast_na and na_count > 0:
+            col_res = _maybe_upcast(col_res)
 
-        self.parser_start += end - start
+        if issubclass(col_res.dtype.type, np.integer) and self.compact_ints:
+            col_res = downcast_int64(col_res, self.use_unsigned)
 
-        return results
+        return col_res
 
-    cdef inline _convert_tokens(self, Py_ssize_t i, int start, int end,
-                                object name, bint na_filter,
-                                kh_str_t *na_hashset):
+    cdef kh_str_t *_get_na_hashset(self, Py_ssize_t i,
+                                   object name) except? NULL:
+        # NULL if NA values are not filtered in this column
+        if self.na_filter:
+            na_list = self._get_na_list(i, name)
+            if na_list is not None:
+                return kset_from_list(na_list)
+        return NULL
+
+    cdef _get_col_dtype(self, Py_ssize_t i, object name):
         cdef:
             object col_dtype = None
 
@@ -843,25 +1241,67 @@ cdef class TextReader:
                     else:
                         col_dtype = np.dtype(col_dtype).str
 
-                return self._convert_with_dtype(col_dtype, i, start, end,
-                                                na_filter, na_hashset)
+        return col_dtype
 
-        if i in self.noconvert:
-            return self._string_convert(i, start, end, na_filter, na_hashset)
-        else:
-            col_res = None
-            for dt in dtype_cast_order:
+    cdef _convert_tokens(self, Py_ssize_t i, int start, int end,
+                         object name):
+        cdef:
+            kh_str_t *na_hashset = self._get_na_hashset(i, name)
+            bint na_filter = na_hashset != NULL
+            object col_dtype = self._get_col_dtype(i, name)
+
+        try:
+            if col_dtype is not None:
+                col_res, na_count = self._convert_with_dtype(
+                    col_dtype, i, start, end, na_filter, na_hashset)
+                return col_res, na_count, None
+
+            if i in self.parse_dates:
+                col_res, na_count = self._convert_datetime(
+                    i, start, end, na_filter, na_hashset)
+                if col_res is not None:
+                    return col_res, na_count, None
+
+            if i in self.noconvert:
+                col_res, na_count = self._string_convert(
+                    i, start, end, na_filter, na_hashset)
+                return col_res, na_count, None
+
+            for kind, dt in enumerate(dtype_cast_order):
                 try:
                     col_res, na_count = self._convert_with_dtype(
                         dt, i, start, end, na_filter, na_hashset)
                 except OverflowError:
                     col_res, na_count = self._convert_with_dtype(
                         '|O8', i, start, end, na_filter, na_hashset)
+                    return col_res, na_count, -1
 
                 if col_res is not None:
-                    break
+                    return col_res, na_count, kind
+
+            return None, 0, None
+        finally:
+            if na_filter:
+                self._free_na_set(na_hashset)
 
-        return col_res, na_count
+    def _convert_column_as(self, object dtype, Py_ssize_t i, object name,
+                           int start, int end):
+        """
+        Convert lines [start, end) of column i to the given dtype, returning
+        (None, None) if not all of the values can be converted
+        """
+        cdef:
+            kh_str_t *na_hashset = self._get_na_hashset(i, name)
+            bint na_filter = na_hashset != NULL
+
+        try:
+            return self._convert_with_dtype(dtype, i, start, end,
+                                            na_filter, na_hashset)
+        except OverflowError:
+            return None, None
+        finally:
+            if na_filter:
+                self._free_na_set(na_hashset)
 
     cdef _convert_with_dtype(self, object dtype, Py_ssize_t i,
                              int start, int end,
@@ -914,9 +1354,25 @@ cdef class TextReader:
             raise NotImplementedError
 
         elif dtype[1] == 'O':
+            if self.compact_strings and (self.c_encoding == NULL or
+                                         self.c_encoding == b"utf-8"):
+                # columns not to be converted further, e.g. dates, are
+                # left boxed
+                return _string_box_compact(self.parser, i, start, end,
+                                           na_filter, na_hashset,
+                                           PY3 or self.c_encoding != NULL)
             return self._string_convert(i, start, end, na_filter,
                                         na_hashset)
 
+    cdef _convert_datetime(self, Py_ssize_t i, int start, int end,
+                           bint na_filter, kh_str_t *na_hashset):
+        cdef char *fmt = NULL
+
+        if self.date_format is not None:
+            fmt = self.date_format
+        return _try_datetime(self.parser, i, start, end, na_filter,
+                             na_hashset, fmt)
+
     cdef _string_convert(self, Py_ssize_t i, int start, int end,
                          bint na_filter, kh_str_t *na_hashset):
         if PY3:
@@ -1023,6 +1479,19 @@ def _is_file_like(obj):
     return isinstance(obj, (basestring, file))
 
 
+def _is_disk_file(obj):
+    # a handle on a regular file, which can be read again by name
+    if PY3:
+        import io
+        file = (io.BufferedReader, io.FileIO)
+    else:
+        import __builtin__
+        file = __builtin__.file
+
+    return (isinstance(obj, file) and isinstance(obj.name, basestring) and
+            os.path.isfile(obj.name))
+
+
 def _maybe_upcast(arr):
     """
 
@@ -1210,6 +1679,54 @@ cdef _string_box_decode(parser_t *parser, int col,
     return result, na_count
 
 
+cdef _string_box_compact(parser_t *parser, int col,
+                         int line_start, int line_end,
+                         bint na_filter, kh_str_t *na_hashset,
+                         bint is_unicode):
+    # the words copied into one buffer, see StringArray
+    cdef:
+        int na_count = 0
+        Py_ssize_t i, size = 0, length
+        size_t lines
+        coliter_t it
+        char *word
+        ndarray[int64_t] offsets
+        ndarray[uint8_t] mask, data
+        khiter_t k
+
+    lines = line_end - line_start
+    offsets = np.empty(lines + 1, dtype=np.int64)
+    mask = np.zeros(lines, dtype=np.uint8)
+
+    coliter_setup(&it, parser, col, line_start)
+    offsets[0] = 0
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+
+        if na_filter:
+            k = kh_get_str(na_hashset, word)
+            # in the hash table
+            if k != na_hashset.n_buckets:
+                na_count += 1
+                mask[i] = 1
+                offsets[i + 1] = size
+                continue
+
+        size += strlen(word)
+        offsets[i + 1] = size
+
+    data = np.empty(size, dtype=np.uint8)
+    coliter_setup(&it, parser, col, line_start)
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+        length = offsets[i + 1] - offsets[i]
+        if length > 0:
+            memcpy(<char*> data.data + offsets[i], word, length)
+
+    return (StringArray(data, offsets, mask.view(np.bool_),
+                        is_unicode=is_unicode), na_count)
+
+
 cdef _to_fw_string(parser_t *parser, int col, int line_start,
                    int line_end, size_t width):
     cdef:
@@ -1238,17 +1755,34 @@ cdef _try_double(parser_t *parser, int col, int line_start, int line_end,
                  bint na_filter, kh_str_t *na_hashset):
     cdef:
         int error, na_count = 0
-        size_t i, lines
-        coliter_t it
-        char *word
+        size_t lines
         double *data
         double NA = na_values[np.float64]
         ndarray result
-        khiter_t k
 
     lines = line_end - line_start
     result = np.empty(lines, dtype=np.float64)
     data = <double *> result.data
+
+    with nogil:
+        error = _try_double_nogil(parser, col, line_start, line_end,
+                                  na_filter, na_hashset, NA, data, &na_count)
+    if error != 0:
+        return None, None
+    return result, na_count
+
+cdef inline int _try_double_nogil(parser_t *parser, int col, int line_start,
+                                  int line_end, bint na_filter,
+                                  kh_str_t *na_hashset, double NA,
+                                  double *data, int *na_count) nogil:
+    cdef:
+        int error
+        size_t i, lines = line_end - line_start
+        coliter_t it
+        char *word
+        khiter_t k
+
+    na_count[0] = 0
     coliter_setup(&it, parser, col, line_start)
 
     if na_filter:
@@ -1258,7 +1792,7 @@ cdef _try_double(parser_t *parser, int col, int line_start, int line_end,
             k = kh_get_str(na_hashset, word)
             # in the hash table
             if k != na_hashset.n_buckets:
-                na_count += 1
+                na_count[0] += 1
                 data[0] = NA
             else:
                 error = to_double(word, data, parser.sci, parser.decimal)
@@ -1268,7 +1802,7 @@ cdef _try_double(parser_t *parser, int col, int line_start, int line_end,
                     elif strcmp(word, cneginf) == 0:
                         data[0] = NEGINF
                     else:
-                        return None, None
+                        return 1
             data += 1
     else:
         for i in range(lines):
@@ -1280,28 +1814,53 @@ cdef _try_double(parser_t *parser, int col, int line_start, int line_end,
                 elif strcmp(word, cneginf) == 0:
                     data[0] = NEGINF
                 else:
-                    return None, None
+                    return 1
             data += 1
 
-    return result, na_count
+    return 0
 
 
 cdef _try_int64(parser_t *parser, int col, int line_start, int line_end,
                 bint na_filter, kh_str_t *na_hashset):
     cdef:
         int error, na_count = 0
-        size_t i, lines
-        coliter_t it
-        char *word
+        size_t lines
+        char *word = NULL
         int64_t *data
         ndarray result
 
         int64_t NA = na_values[np.int64]
-        khiter_t k
 
     lines = line_end - line_start
     result = np.empty(lines, dtype=np.int64)
     data = <int64_t *> result.data
+
+    with nogil:
+        error = _try_int64_nogil(parser, col, line_start, line_end,
+                                 na_filter, na_hashset, NA, data, &na_count,
+                                 &word)
+    if error != 0:
+        if error == ERROR_OVERFLOW:
+            raise OverflowError(word)
+        return None, None
+
+    return result, na_count
+
+cdef inline int _try_int64_nogil(parser_t *parser, int col, int line_start,
+                                 int line_end, bint na_filter,
+                                 kh_str_t *na_hashset, int64_t NA,
+                                 int64_t *data, int *na_count,
+                                 char **bad_word) nogil:
+    # on failure returns the error code from str_to_int64 and points
+    # bad_word at the offending token
+    cdef:
+        int error
+        size_t i, lines = line_end - line_start
+        coliter_t it
+        char *word
+        khiter_t k
+
+    na_count[0] = 0
     coliter_setup(&it, parser, col, line_start)
 
     if na_filter:
@@ -1311,29 +1870,89 @@ cdef _try_int64(parser_t *parser, int col, int line_start, int line_end,
             k = kh_get_str(na_hashset, word)
             # in the hash table
             if k != na_hashset.n_buckets:
-                na_count += 1
+                na_count[0] += 1
                 data[i] = NA
                 continue
 
             data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
                                    &error, parser.thousands)
             if error != 0:
-                if error == ERROR_OVERFLOW:
-                    raise OverflowError(word)
-
-                return None, None
+                bad_word[0] = word
+                return error
     else:
         for i in range(lines):
             word = COLITER_NEXT(it)
             data[i] = str_to_int64(word, INT64_MIN, INT64_MAX,
                                    &error, parser.thousands)
             if error != 0:
-                if error == ERROR_OVERFLOW:
-                    raise OverflowError(word)
-                return None, None
+                bad_word[0] = word
+                return error
+
+    return 0
+
+
+cdef _try_datetime(parser_t *parser, int col, int line_start, int line_end,
+                   bint na_filter, kh_str_t *na_hashset, char *fmt):
+    # with no format, any of the ISO 8601 layouts is accepted
+    cdef:
+        int error, na_count = 0
+        size_t lines
+        int64_t *data
+        ndarray result
+
+    lines = line_end - line_start
+    result = np.empty(lines, dtype='M8[ns]')
+    data = <int64_t *> result.data
+
+    with nogil:
+        error = _try_datetime_nogil(parser, col, line_start, line_end,
+                                    na_filter, na_hashset, fmt, data,
+                                    &na_count)
+    if error != 0:
+        return None, None
 
     return result, na_count
 
+cdef inline int _try_datetime_nogil(parser_t *parser, int col,
+                                    int line_start, int line_end,
+                                    bint na_filter, kh_str_t *na_hashset,
+                                    char *fmt, int64_t *data,
+                                    int *na_count) nogil:
+    cdef:
+        size_t i, lines = line_end - line_start
+        coliter_t it
+        char *word
+        bint infer = fmt == NULL
+        pandas_datetimestruct dts
+
+    na_count[0] = 0
+    coliter_setup(&it, parser, col, line_start)
+
+    for i in range(lines):
+        word = COLITER_NEXT(it)
+
+        if na_filter and (kh_get_str(na_hashset, word) !=
+                          na_hashset.n_buckets):
+            na_count[0] += 1
+            data[i] = INT64_MIN
+            continue
+
+        if fmt == NULL or parse_datetime_format(word, fmt, &dts) < 0:
+            # the layout of the previous value, if any, usually matches
+            if not infer:
+                return 1
+            fmt = infer_iso_datetime_format(word)
+            if fmt == NULL or parse_datetime_format(word, fmt, &dts) < 0:
+                return 1
+
+        # leave timestamps out of the nanosecond range to the slow path
+        if dts.year < 1678 or dts.year > 2261:
+            return 1
+
+        data[i] = pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts)
+
+    return 0
+
 
 cdef _try_bool(parser_t *parser, int col, int line_start, int line_end,
                bint na_filter, kh_str_t *na_hashset):
@@ -1591,6 +2210,73 @@ def downcast_int64(ndarray[int64_t] arr, bint use_unsigned=0):
     return arr
 
 
+def _chunk_worker(TextReader reader, list results, int k):
+    try:
+        results[k] = reader._read_chunk()
+    except Exception:
+        # the serial reader reports the error
+        results[k] = None
+
+
+def _merge_column_pieces(Py_ssize_t i, object name, list pieces):
+    """
+    Combine the raw conversions of column i from the pieces of a split file,
+    redoing the dtype inference of a read of the whole column: the pieces
+    are converted again where their own inference doesn't settle whether
+    the column as a whole can take a dtype.
+    """
+    cdef:
+        int target, kind
+
+    kinds = [piece[3][i][2] for piece in pieces]
+
+    if None in kinds:
+        # dtype given or parsed dates, not inferred
+        values = [piece[3][i][0] for piece in pieces]
+        if (kinds.count(None) < len(kinds) or
+                len(set([v.dtype for v in values])) > 1):
+            # dates parsed in only some of the pieces
+            return None, None
+        na_count = sum([piece[3][i][1] for piece in pieces])
+        return _concatenate_values(values), na_count
+
+    # integer parsing stops at the first bad value in the column
+    target = 0
+    for kind in kinds:
+        if kind == -1:
+            target = len(dtype_cast_order) - 1
+            break
+        elif kind != 0:
+            target = 1
+            break
+
+    while True:
+        dt = dtype_cast_order[target]
+        values = []
+        na_count = 0
+        for reader, start, end, raw in pieces:
+            col_res, col_na, kind, _ = raw[i]
+
+            if kind == target or (kind == -1 and
+                                  target == len(dtype_cast_order) - 1):
+                pass
+            elif kind > target:
+                # this piece already failed to convert to dt
+                col_res = None
+            else:
+                col_res, col_na = reader._convert_column_as(dt, i, name,
+                                                            start, end)
+
+            if col_res is None:
+                break
+            values.append(col_res)
+            na_count += col_na
+        else:
+            return _concatenate_values(values), na_count
+
+        target += 1
+
+
 def _concatenate_chunks(list chunks):
     cdef:
         list names = list(chunks[0].keys())
@@ -1599,9 +2285,19 @@ def _concatenate_chunks(list chunks):
     result = {}
     for name in names:
         arrs = [chunk.pop(name) for chunk in chunks]
-        result[name] = np.concatenate(arrs)
+        result[name] = _concatenate_values(arrs)
     return result
 
+
+def _concatenate_values(list arrs):
+    # compact string columns stay compact if they are in all the chunks
+    compact = [isinstance(arr, StringArray) for arr in arrs]
+    if all(compact):
+        return StringArray.concat(arrs)
+    elif any(compact):
+        arrs = [np.asarray(arr) for arr in arrs]
+    return np.concatenate(arrs)
+
 #----------------------------------------------------------------------
 
 # NA values
@@ -1659,7 +2355,7 @@ cdef _apply_converter(object f, parser_t *parser, int col,
                                    c_encoding, errors)
             result[i] = f(val)
 
-    return lib.maybe_convert_objects(result)
+    return result
 
     # if issubclass(values.dtype.type, (np.number, np.bool_)):
     #     return values
@@ -7,15 +7,30 @@
 
 void *new_file_source(char *fname, size_t buffer_size) {
     file_source *fs = (file_source *) malloc(sizeof(file_source));
+    if (fs == NULL) {
+        return NULL;
+    }
+
     fs->fp = fopen(fname, "rb");
+    if (fs->fp == NULL) {
+        free(fs);
+        return NULL;
+    }
     setbuf(fs->fp, NULL);
 
     fs->initial_file_pos = ftell(fs->fp);
+    fs->buffer_file_pos = fs->initial_file_pos;
+
+    // read to the end of the file unless restricted with
+    // file_source_set_range
+    fs->last_pos = -1;
 
     // Only allocate this heap memory if we are not memory-mapping the file
     fs->buffer = (char*) malloc((buffer_size + 1) * sizeof(char));
 
     if (fs->buffer == NULL) {
+        fclose(fs->fp);
+        free(fs);
         return NULL;
     }
 
@@ -87,8 +102,22 @@ void* buffer_file_bytes(void *source, size_t nbytes,
                         size_t *bytes_read, int *status) {
     file_source *src = FS(source);
 
-    *bytes_read = fread((void*) src->buffer, sizeof(char), nbytes,
-                        src->fp);
+    if (src->last_pos >= 0) {
+        if (src->buffer_file_pos >= src->last_pos) {
+            nbytes = 0;
+        } else if (src->buffer_file_pos + nbytes > src->last_pos) {
+            // fewer than nbytes remaining in the range
+            nbytes = src->last_pos - src->buffer_file_pos;
+        }
+    }
+
+    if (nbytes > 0) {
+        *bytes_read = fread((void*) src->buffer, sizeof(char), nbytes,
+                            src->fp);
+    } else {
+        *bytes_read = 0;
+    }
+    src->buffer_file_pos += *bytes_read;
 
     if (*bytes_read == 0) {
         *status = REACHED_EOF;
@@ -157,6 +186,30 @@ void* buffer_rd_bytes(void *source, size_t nbytes,
     return retval;
 }
 
+/*
+
+  Byte ranges, used to hand pieces of one file to separate parsers
+
+ */
+
+int file_source_set_range(void *source, off_t start, off_t stop) {
+    file_source *src = FS(source);
+
+    if (fseek(src->fp, start, SEEK_SET) != 0) {
+        return -1;
+    }
+
+    src->buffer_file_pos = start;
+    src->last_pos = stop;
+
+    return 0;
+}
+
+off_t file_source_tell(void *source) {
+    /* file offset of the next byte to be handed to the parser */
+    return FS(source)->buffer_file_pos;
+}
+
 
 #ifdef HAVE_MMAP
 
@@ -172,21 +225,27 @@ void *new_mmap(char *fname)
     off_t filesize;
 
     mm = (memory_map *) malloc(sizeof(memory_map));
+    if (mm == NULL) {
+        /* XXX Eventually remove this print statement. */
+        fprintf(stderr, "new_file_buffer: malloc() failed.\n");
+        return NULL;
+    }
+
     mm->fp = fopen(fname, "rb");
+    if (mm->fp == NULL) {
+        free(mm);
+        return NULL;
+    }
 
     fd = fileno(mm->fp);
     if (fstat(fd, &buf) == -1) {
         fprintf(stderr, "new_file_buffer: fstat() failed. errno =%d\n", errno);
+        fclose(mm->fp);
+        free(mm);
         return NULL;
     }
     filesize = buf.st_size;  /* XXX This might be 32 bits. */
 
-
-    if (mm == NULL) {
-        /* XXX Eventually remove this print statement. */
-        fprintf(stderr, "new_file_buffer: malloc() failed.\n");
-        return NULL;
-    }
     mm->size = (off_t) filesize;
     mm->line_number = 0;
 
@@ -194,10 +253,11 @@ void *new_mmap(char *fname)
     mm->position = ftell(mm->fp);
     mm->last_pos = (off_t) filesize;
 
+    // mmap fails on empty files, among others; the caller falls back to
+    // reading the file
     mm->memmap = mmap(NULL, filesize, PROT_READ, MAP_SHARED, fd, 0);
-    if (mm->memmap == NULL) {
-        /* XXX Eventually remove this print statement. */
-        fprintf(stderr, "new_file_buffer: mmap() failed.\n");
+    if (mm->memmap == MAP_FAILED) {
+        fclose(mm->fp);
         free(mm);
         mm = NULL;
     }
@@ -252,6 +312,27 @@ void* buffer_mmap_bytes(void *source, size_t nbytes,
     return retval;
 }
 
+int mmap_set_range(void *source, off_t start, off_t stop) {
+    memory_map *src = MM(source);
+
+    if (start > src->size) {
+        return -1;
+    }
+
+    if (stop < 0 || stop > src->size) {
+        stop = src->size;
+    }
+
+    src->position = start;
+    src->last_pos = stop;
+
+    return 0;
+}
+
+off_t mmap_tell(void *source) {
+    return MM(source)->position;
+}
+
 #else
 
 /* kludgy */
@@ -271,4 +352,12 @@ void* buffer_mmap_bytes(void *source, size_t nbytes,
   return NULL;
 }
 
+int mmap_set_range(void *source, off_t start, off_t stop) {
+  return -1;
+}
+
+off_t mmap_tell(void *source) {
+  return -1;
+}
+
 #endif
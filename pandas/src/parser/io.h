@@ -13,10 +13,10 @@ typedef struct _file_source {
     /* file position when the file_buffer was created. */
     off_t initial_file_pos;
 
-    /* Offset in the file of the data currently in the buffer. */
+    /* Offset in the file of the next byte to be read into the buffer. */
     off_t buffer_file_pos;
 
-    /* Actual number of bytes in the current buffer. (Can be less than buffer_size.) */
+    /* Offset at which to stop reading, or -1 to read to the end of file. */
     off_t last_pos;
 
     /* Size (in bytes) of the buffer. */
@@ -61,6 +61,10 @@ int del_mmap(void *src);
 void* buffer_mmap_bytes(void *source, size_t nbytes,
                         size_t *bytes_read, int *status);
 
+int mmap_set_range(void *source, off_t start, off_t stop);
+
+off_t mmap_tell(void *source);
+
 
 typedef struct _rd_source {
     PyObject* obj;
@@ -83,3 +87,7 @@ void* buffer_file_bytes(void *source, size_t nbytes,
 void* buffer_rd_bytes(void *source, size_t nbytes,
                       size_t *bytes_read, int *status);
 
+int file_source_set_range(void *source, off_t start, off_t stop);
+
+off_t file_source_tell(void *source);
+
@@ -66,7 +66,12 @@ static void *safe_realloc(void *buffer, size_t size) {
 void coliter_setup(coliter_t *self, parser_t *parser, int i, int start) {
     // column i, starting at 0
     self->words = parser->words;
-    self->col = i;
+    if (parser->usecols_pos != NULL) {
+        // position among the stored fields
+        self->col = parser->usecols_pos[i];
+    } else {
+        self->col = i;
+    }
     self->line_start = parser->line_start + start;
 }
 
@@ -173,7 +178,8 @@ int parser_clear_data_buffers(parser_t *self) {
 }
 
 int parser_cleanup(parser_t *self) {
-    if (self->cb_cleanup(self->source) < 0) {
+    // the source is not set up if opening it failed
+    if (self->source != NULL && self->cb_cleanup(self->source) < 0) {
         return -1;
     }
 
@@ -188,6 +194,8 @@ int parser_cleanup(parser_t *self) {
     if (self->skipset != NULL)
         kh_destroy_int64((kh_int64_t*) self->skipset);
 
+    free_if_not_null(self->usecols_pos);
+
     return 0;
 }
 
@@ -372,9 +380,19 @@ static int push_char(parser_t *self, char c) {
 }
 
 static int P_INLINE end_field(parser_t *self) {
+    int i = self->line_fields[self->lines];
+
     // XXX cruft
     self->numeric_field = 0;
 
+    if (self->usecols_pos != NULL &&
+        (i >= self->usecols_len || self->usecols_pos[i] < 0)) {
+        // drop the field: count it but give its space in the stream back
+        self->stream_len = self->word_start;
+        self->line_fields[self->lines]++;
+        return 0;
+    }
+
     // null terminate token
     push_char(self, '\0');
 
@@ -439,7 +457,7 @@ static int end_line(parser_t *self) {
             self->file_lines++;
 
             // skip the tokens from this bad line
-            self->line_start[self->lines] += fields;
+            self->line_start[self->lines] = self->words_len;
 
             // reset field count
             self->line_fields[self->lines] = 0;
@@ -452,7 +470,7 @@ static int end_line(parser_t *self) {
         self->file_lines++;
 
         // skip the tokens from this bad line
-        self->line_start[self->lines] += fields;
+        self->line_start[self->lines] = self->words_len;
 
         // reset field count
         self->line_fields[self->lines] = 0;
@@ -485,8 +503,7 @@ static int end_line(parser_t *self) {
         self->lines++;
 
         // good line, set new start point
-        self->line_start[self->lines] = (self->line_start[self->lines - 1] +
-                                         fields);
+        self->line_start[self->lines] = self->words_len;
 
         TRACE(("new line start: %d\n", self->line_start[self->lines]));
 
@@ -518,6 +535,50 @@ int parser_add_skiprow(parser_t *self, int64_t row) {
     return 0;
 }
 
+/*
+  Store only the fields i < n with mask[i] != 0 from now on, compacting the
+  lines tokenized so far the same way.
+ */
+
+int parser_set_usecols(parser_t *self, char *mask, int n) {
+    int i, j, line, start, nwords = 0;
+
+    if (self->usecols_pos != NULL) {
+        // lines already stored with another selection
+        return -1;
+    }
+
+    self->usecols_pos = (int*) malloc((n + 1) * sizeof(int));
+    if (self->usecols_pos == NULL) {
+        return PARSER_OUT_OF_MEMORY;
+    }
+
+    // position of each field among the stored fields of a line
+    for (i = 0, j = 0; i < n; ++i) {
+        self->usecols_pos[i] = mask[i] ? j++ : -1;
+    }
+    self->usecols_len = n;
+
+    // includes the fields so far of the line being tokenized
+    for (line = 0; line <= self->lines; ++line) {
+        start = self->line_start[line];
+        self->line_start[line] = nwords;
+
+        for (j = 0; j < self->line_fields[line] && j < n; ++j) {
+            if (!mask[j]) {
+                continue;
+            }
+            i = start + j;
+            self->words[nwords] = self->words[i];
+            self->word_starts[nwords] = self->word_starts[i];
+            nwords++;
+        }
+    }
+    self->words_len = nwords;
+
+    return 0;
+}
+
 static int parser_buffer_bytes(parser_t *self, size_t nbytes) {
     int status;
     size_t bytes_read;
@@ -815,6 +876,10 @@ int tokenize_delimited(parser_t *self, size_t line_limit)
             } else if (c == self->delimiter){
                 // Handle \r-delimited files
                 END_LINE_AND_FIELD_STATE(START_FIELD);
+            } else if (c == self->quotechar &&
+                       self->quoting != QUOTE_NONE) {
+                /* quoted field opening a \r-delimited record */
+                END_LINE_STATE(IN_QUOTED_FIELD);
             } else {
                 PUSH_CHAR(c);
                 END_LINE_STATE(IN_FIELD);
@@ -1062,6 +1127,10 @@ int tokenize_whitespace(parser_t *self, size_t line_limit)
             } else if (IS_WHITESPACE(c)){
                 // Handle \r-delimited files
                 END_LINE_AND_FIELD_STATE(EAT_WHITESPACE);
+            } else if (c == self->quotechar &&
+                       self->quoting != QUOTE_NONE) {
+                /* quoted field opening a \r-delimited record */
+                END_LINE_STATE(IN_QUOTED_FIELD);
             } else {
                 PUSH_CHAR(c);
                 END_LINE_STATE(IN_FIELD);
@@ -1147,10 +1216,15 @@ int parser_consume_rows(parser_t *self, size_t nrows) {
     if (nrows == 0)
         return 0;
 
-    /* cannot guarantee that nrows + 1 has been observed */
-    word_deletions = self->line_start[nrows - 1] + self->line_fields[nrows - 1];
-    char_count = (self->word_starts[word_deletions - 1] +
-                  strlen(self->words[word_deletions - 1]) + 1);
+    /* the start of the next line is kept up to date by end_line */
+    word_deletions = self->line_start[nrows];
+    if (word_deletions > 0) {
+        char_count = (self->word_starts[word_deletions - 1] +
+                      strlen(self->words[word_deletions - 1]) + 1);
+    } else {
+        // no fields stored in these lines
+        char_count = 0;
+    }
 
     TRACE(("Deleting %d words, %d chars\n", word_deletions, char_count));
 
@@ -1333,6 +1407,145 @@ int tokenize_all_rows(parser_t *self) {
     return status;
 }
 
+
+/*
+  Find record boundaries for splitting a file between several parsers.
+
+  Runs the record-level part of the tokenizer state machine over the bytes
+  delivered by `self->cb_io` from `source` without storing any tokens. The
+  first byte delivered by `source` is at file offset `start`, which must be
+  the start of a record. Each entry of `offsets` (ascending file offsets) is
+  replaced by the offset of the first record starting at or after it, or -1
+  if the end of the data is reached first.
+ */
+
+#define IS_SEP(c) ((self->delim_whitespace) ? IS_WHITESPACE(c) :   \
+                   (c) == self->delimiter)
+
+int parser_find_record_starts(parser_t *self, void *source, int64_t start,
+                              int64_t *offsets, int n) {
+    ParserState state = START_RECORD;
+    int64_t pos = start;
+    int status, k = 0;
+    size_t i, bytes_read;
+    char c, *buf;
+    int quoting = self->quoting != QUOTE_NONE;
+
+    while (k < n) {
+        buf = (char*) self->cb_io(source, self->chunksize, &bytes_read,
+                                  &status);
+        if (status != 0 || buf == NULL || bytes_read == 0) {
+            break;
+        }
+
+        for (i = 0; i < bytes_read; ++i, ++pos) {
+            c = buf[i];
+
+            switch(state) {
+            case START_RECORD:
+            case START_FIELD:
+                if (c == '\n') {
+                    state = START_RECORD;
+                } else if (c == '\r') {
+                    state = EAT_CRNL;
+                } else if (quoting && c == self->quotechar) {
+                    state = IN_QUOTED_FIELD;
+                } else if (c == self->escapechar) {
+                    state = ESCAPED_CHAR;
+                } else if (IS_SEP(c) ||
+                           (c == ' ' && self->skipinitialspace)) {
+                    state = START_FIELD;
+                } else if (c == self->commentchar) {
+                    state = EAT_COMMENT;
+                } else {
+                    state = IN_FIELD;
+                }
+                break;
+
+            case ESCAPED_CHAR:
+                state = IN_FIELD;
+                break;
+
+            case IN_FIELD:
+            case EAT_COMMENT:
+                if (c == '\n') {
+                    state = START_RECORD;
+                } else if (c == '\r') {
+                    state = EAT_CRNL;
+                } else if (state == EAT_COMMENT) {
+                    ;
+                } else if (c == self->escapechar) {
+                    state = ESCAPED_CHAR;
+                } else if (IS_SEP(c)) {
+                    state = START_FIELD;
+                } else if (c == self->commentchar) {
+                    state = EAT_COMMENT;
+                }
+                break;
+
+            case IN_QUOTED_FIELD:
+                if (c == self->escapechar) {
+                    state = ESCAPE_IN_QUOTED_FIELD;
+                } else if (quoting && c == self->quotechar) {
+                    state = self->doublequote ? QUOTE_IN_QUOTED_FIELD :
+                        IN_FIELD;
+                }
+                break;
+
+            case ESCAPE_IN_QUOTED_FIELD:
+                state = IN_QUOTED_FIELD;
+                break;
+
+            case QUOTE_IN_QUOTED_FIELD:
+                if (quoting && c == self->quotechar) {
+                    state = IN_QUOTED_FIELD;
+                } else if (IS_SEP(c)) {
+                    state = START_FIELD;
+                } else if (c == '\n') {
+                    state = START_RECORD;
+                } else if (c == '\r') {
+                    state = EAT_CRNL;
+                } else {
+                    state = IN_FIELD;
+                }
+                break;
+
+            case EAT_CRNL:
+                if (c == '\n') {
+                    state = START_RECORD;
+                } else if (IS_SEP(c)) {
+                    state = START_FIELD;
+                } else if (quoting && c == self->quotechar) {
+                    state = IN_QUOTED_FIELD;
+                } else {
+                    state = IN_FIELD;
+                }
+                break;
+
+            default:
+                break;
+            }
+
+            // only a record ended by '\n' is a safe split point; a lone '\r'
+            // is resolved by the character that follows it
+            if (state == START_RECORD && c == '\n') {
+                while (k < n && offsets[k] <= pos + 1) {
+                    offsets[k++] = pos + 1;
+                }
+                if (k == n) {
+                    break;
+                }
+            }
+        }
+    }
+
+    for (; k < n; ++k) {
+        offsets[k] = -1;
+    }
+
+    return 0;
+}
+
 void test_count_lines(char *fname) {
     clock_t start = clock();
 
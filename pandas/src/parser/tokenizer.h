@@ -194,6 +194,11 @@ typedef struct parser_t {
     void *skipset;
     int skip_footer;
 
+    // Position of field i among the stored fields of a line, -1 (or
+    // i >= usecols_len) if it is dropped; NULL stores all fields
+    int *usecols_pos;
+    int usecols_len;
+
     // error handling
     char *warn_msg;
     char *error_msg;
@@ -226,6 +231,8 @@ int parser_trim_buffers(parser_t *self);
 
 int parser_add_skiprow(parser_t *self, int64_t row);
 
+int parser_set_usecols(parser_t *self, char *mask, int n);
+
 void parser_free(parser_t *self);
 
 void parser_set_default_options(parser_t *self);
@@ -236,6 +243,9 @@ int tokenize_nrows(parser_t *self, size_t nrows);
 
 int tokenize_all_rows(parser_t *self);
 
+int parser_find_record_starts(parser_t *self, void *source, int64_t start,
+                              int64_t *offsets, int n);
+
 /*
 
   Have parsed / type-converted a chunk of data and want to free memory from the
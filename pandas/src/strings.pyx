@@ -0,0 +1,518 @@
+"""
+Kernels of the vectorized string functions in pandas.core.strings, on object
+arrays of strings and on the compact string storage, see
+pandas.core.stringarray. There strings are stored as one contiguous buffer of
+UTF-8 bytes, string i spanning data[offsets[i]:offsets[i + 1]], with a mask
+flagging the missing ones
+"""
+
+from cpython cimport (PyBytes_Check, PyUnicode_Check, PyUnicode_AsUTF8String,
+                      PyBytes_AS_STRING, PyBytes_GET_SIZE,
+                      PyUnicode_GET_SIZE)
+
+cdef extern from "Python.h":
+    object PyBytes_FromStringAndSize(char *v, Py_ssize_t size)
+    object PyUnicode_DecodeUTF8(char *v, Py_ssize_t size, char *errors)
+    Py_ssize_t PyUnicode_Tailmatch(object s, object substr, Py_ssize_t start,
+                                   Py_ssize_t end, int direction) except -1
+    Py_ssize_t PY_SSIZE_T_MAX
+
+cdef extern from "string.h":
+    void *memcpy(void *dst, void *src, size_t n)
+    int memcmp(void *s1, void *s2, size_t n)
+
+cimport numpy as cnp
+from numpy cimport ndarray, uint8_t, int64_t
+
+import numpy as np
+cimport util
+
+cnp.import_array()
+
+
+#----------------------------------------------------------------------
+# Object arrays
+#
+# Values that are not strings are missing in the result, as the functions
+# applied to them raise TypeError or AttributeError. The typed kernels return
+# the results and a mask of the missing ones
+
+def na_map(ndarray[object] arr, object f, object na_result):
+    """
+    Object array of f applied to each value, na_result where the value is
+    missing or f raises TypeError or AttributeError
+    """
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        ndarray[object] result = np.empty(n, dtype=object)
+        object val
+
+    for i in range(n):
+        val = arr[i]
+        if util._checknull(val):
+            result[i] = na_result
+            continue
+        try:
+            result[i] = f(val)
+        except (TypeError, AttributeError):
+            result[i] = na_result
+    return result
+
+
+def obj_len(ndarray[object] arr):
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        ndarray[int64_t] result = np.zeros(n, dtype=np.int64)
+        ndarray[uint8_t] mask = np.zeros(n, dtype=np.uint8)
+        object val
+
+    for i in range(n):
+        val = arr[i]
+        if PyBytes_Check(val):
+            result[i] = PyBytes_GET_SIZE(val)
+        elif PyUnicode_Check(val):
+            result[i] = PyUnicode_GET_SIZE(val)
+        elif util._checknull(val):
+            mask[i] = 1
+        else:
+            # lists too
+            try:
+                result[i] = len(val)
+            except (TypeError, AttributeError):
+                mask[i] = 1
+    return result, mask.view(np.bool_)
+
+
+cdef _obj_tailmatch(ndarray[object] arr, object pat, int direction):
+    # direction -1 matches at the start, 1 at the end
+    cdef:
+        Py_ssize_t i, n = len(arr), plen, vlen
+        ndarray[uint8_t] result = np.zeros(n, dtype=np.uint8)
+        ndarray[uint8_t] mask = np.zeros(n, dtype=np.uint8)
+        object val
+        bint bytes_pat = PyBytes_Check(pat)
+        bint unicode_pat = PyUnicode_Check(pat)
+        char *p = NULL
+
+    if bytes_pat:
+        p = PyBytes_AS_STRING(pat)
+        plen = PyBytes_GET_SIZE(pat)
+
+    for i in range(n):
+        val = arr[i]
+        if bytes_pat and PyBytes_Check(val):
+            vlen = PyBytes_GET_SIZE(val)
+            if vlen >= plen:
+                if direction < 0:
+                    result[i] = memcmp(PyBytes_AS_STRING(val), p, plen) == 0
+                else:
+                    result[i] = memcmp(PyBytes_AS_STRING(val) + vlen - plen,
+                                       p, plen) == 0
+        elif unicode_pat and PyUnicode_Check(val):
+            result[i] = PyUnicode_Tailmatch(val, pat, 0, PY_SSIZE_T_MAX,
+                                            direction)
+        elif util._checknull(val):
+            mask[i] = 1
+        else:
+            try:
+                if direction < 0:
+                    result[i] = bool(val.startswith(pat))
+                else:
+                    result[i] = bool(val.endswith(pat))
+            except (TypeError, AttributeError):
+                mask[i] = 1
+    return result.view(np.bool_), mask.view(np.bool_)
+
+
+def obj_startswith(ndarray[object] arr, object pat):
+    return _obj_tailmatch(arr, pat, -1)
+
+
+def obj_endswith(ndarray[object] arr, object pat):
+    return _obj_tailmatch(arr, pat, 1)
+
+
+def obj_contains(ndarray[object] arr, object pat, object search):
+    """
+    Whether each string contains the literal pattern, search is the search
+    method of the pattern compiled, for strings of the other type
+    """
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        ndarray[uint8_t] result = np.zeros(n, dtype=np.uint8)
+        ndarray[uint8_t] mask = np.zeros(n, dtype=np.uint8)
+        object val
+        bint bytes_pat = PyBytes_Check(pat)
+
+    for i in range(n):
+        val = arr[i]
+        if (PyBytes_Check(val) and bytes_pat or
+            PyUnicode_Check(val) and not bytes_pat):
+            result[i] = pat in val
+        elif util._checknull(val):
+            mask[i] = 1
+        else:
+            try:
+                result[i] = search(val) is not None
+            except (TypeError, AttributeError):
+                mask[i] = 1
+    return result.view(np.bool_), mask.view(np.bool_)
+
+
+def obj_search(ndarray[object] arr, object search):
+    """
+    Whether search (the method of a compiled regex) matches each string
+    """
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        ndarray[uint8_t] result = np.zeros(n, dtype=np.uint8)
+        ndarray[uint8_t] mask = np.zeros(n, dtype=np.uint8)
+        object val
+
+    for i in range(n):
+        val = arr[i]
+        if util._checknull(val):
+            mask[i] = 1
+            continue
+        try:
+            result[i] = search(val) is not None
+        except (TypeError, AttributeError):
+            mask[i] = 1
+    return result.view(np.bool_), mask.view(np.bool_)
+
+
+def obj_count(ndarray[object] arr, object findall):
+    """
+    Number of matches of findall (the method of a compiled regex) in each
+    string
+    """
+    cdef:
+        Py_ssize_t i, n = len(arr)
+        ndarray[int64_t] result = np.zeros(n, dtype=np.int64)
+        ndarray[uint8_t] mask = np.zeros(n, dtype=np.uint8)
+        object val
+
+    for i in range(n):
+        val = arr[i]
+        if util._checknull(val):
+            mask[i] = 1
+            continue
+        try:
+            result[i] = len(findall(val))
+        except (TypeError, AttributeError):
+            mask[i] = 1
+    return result, mask.view(np.bool_)
+
+#----------------------------------------------------------------------
+# Compact strings
+
+def encode(ndarray[object] values):
+    """
+    Encode an array of strings to (data, offsets, mask, is_unicode). Missing
+    values are None or NaN, unicode strings are stored UTF-8 encoded
+    """
+    cdef:
+        Py_ssize_t i, n = len(values), pos = 0
+        ndarray[int64_t] offsets = np.empty(n + 1, dtype=np.int64)
+        ndarray[uint8_t] mask = np.zeros(n, dtype=np.uint8)
+        ndarray[uint8_t] data
+        list pieces = []
+        object val
+        bint is_unicode = False
+
+    offsets[0] = 0
+    for i in range(n):
+        val = values[i]
+        if PyUnicode_Check(val):
+            is_unicode = True
+            val = PyUnicode_AsUTF8String(val)
+        elif not PyBytes_Check(val):
+            if util._checknull(val):
+                mask[i] = 1
+                offsets[i + 1] = pos
+                continue
+            raise TypeError('expected string or missing value, got %s'
+                            % type(val).__name__)
+        pieces.append(val)
+        pos += PyBytes_GET_SIZE(val)
+        offsets[i + 1] = pos
+
+    data = np.empty(pos, dtype=np.uint8)
+    pos = 0
+    for val in pieces:
+        memcpy(<char*> data.data + pos, PyBytes_AS_STRING(val),
+               PyBytes_GET_SIZE(val))
+        pos += PyBytes_GET_SIZE(val)
+
+    return data, offsets, mask.view(np.bool_), is_unicode
+
+
+def decode(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+           ndarray[uint8_t, cast=True] mask, bint is_unicode):
+    """
+    Object array of the strings, NaN for the missing ones
+    """
+    cdef:
+        Py_ssize_t i, n = len(mask)
+        ndarray[object] result = np.empty(n, dtype=object)
+        char *buf = <char*> data.data
+
+    for i in range(n):
+        if mask[i]:
+            result[i] = np.nan
+        elif is_unicode:
+            result[i] = PyUnicode_DecodeUTF8(buf + offsets[i],
+                                             offsets[i + 1] - offsets[i],
+                                             'strict')
+        else:
+            result[i] = PyBytes_FromStringAndSize(buf + offsets[i],
+                                                  offsets[i + 1] - offsets[i])
+    return result
+
+
+def take(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+         ndarray[uint8_t, cast=True] mask, ndarray[int64_t] indexer):
+    """
+    (data, offsets, mask) of the strings at the indexer, -1 for missing
+    """
+    cdef:
+        Py_ssize_t i, j, n = len(indexer), size = 0, pos = 0, length
+        ndarray[int64_t] new_offsets = np.empty(n + 1, dtype=np.int64)
+        ndarray[uint8_t] new_mask = np.zeros(n, dtype=np.uint8)
+        ndarray[uint8_t] new_data
+        Py_ssize_t nvalues = len(mask)
+
+    for i in range(n):
+        j = indexer[i]
+        if j < -1 or j >= nvalues:
+            raise IndexError('index %d out of bounds' % j)
+        if j != -1 and not mask[j]:
+            size += offsets[j + 1] - offsets[j]
+
+    new_data = np.empty(size, dtype=np.uint8)
+    new_offsets[0] = 0
+    for i in range(n):
+        j = indexer[i]
+        if j == -1 or mask[j]:
+            new_mask[i] = 1
+        else:
+            length = offsets[j + 1] - offsets[j]
+            memcpy(<char*> new_data.data + pos,
+                   <char*> data.data + offsets[j], length)
+            pos += length
+        new_offsets[i + 1] = pos
+
+    return new_data, new_offsets, new_mask.view(np.bool_)
+
+
+def is_ascii(ndarray[uint8_t] data):
+    cdef:
+        Py_ssize_t i, n = len(data)
+
+    for i in range(n):
+        if data[i] >= 128:
+            return False
+    return True
+
+
+def str_len(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+            bint count_chars):
+    """
+    Length of each string, in bytes or in (UTF-8 encoded) characters
+    """
+    cdef:
+        Py_ssize_t i, k, n = len(offsets) - 1
+        ndarray[int64_t] result = np.empty(n, dtype=np.int64)
+        int64_t count
+
+    for i in range(n):
+        if count_chars:
+            count = 0
+            for k in range(offsets[i], offsets[i + 1]):
+                # continuation bytes are 10xxxxxx
+                if (data[k] & 0xC0) != 0x80:
+                    count += 1
+            result[i] = count
+        else:
+            result[i] = offsets[i + 1] - offsets[i]
+    return result
+
+
+cdef inline bint _match_at(char *buf, Py_ssize_t start, char *pat,
+                           Py_ssize_t plen):
+    return memcmp(buf + start, pat, plen) == 0
+
+
+def str_startswith(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                   bytes pat):
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1, plen = len(pat)
+        ndarray[uint8_t] result = np.zeros(n, dtype=np.uint8)
+        char *buf = <char*> data.data
+        char *p = pat
+
+    for i in range(n):
+        if (offsets[i + 1] - offsets[i] >= plen and
+            _match_at(buf, offsets[i], p, plen)):
+            result[i] = 1
+    return result.view(np.bool_)
+
+
+def str_endswith(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                 bytes pat):
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1, plen = len(pat)
+        ndarray[uint8_t] result = np.zeros(n, dtype=np.uint8)
+        char *buf = <char*> data.data
+        char *p = pat
+
+    for i in range(n):
+        if (offsets[i + 1] - offsets[i] >= plen and
+            _match_at(buf, offsets[i + 1] - plen, p, plen)):
+            result[i] = 1
+    return result.view(np.bool_)
+
+
+def str_contains(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+                 bytes pat):
+    """
+    Whether each string contains the literal (not regex) pattern
+    """
+    cdef:
+        Py_ssize_t i, k, n = len(offsets) - 1, plen = len(pat)
+        ndarray[uint8_t] result = np.zeros(n, dtype=np.uint8)
+        char *buf = <char*> data.data
+        char *p = pat
+
+    for i in range(n):
+        for k in range(offsets[i], offsets[i + 1] - plen + 1):
+            if _match_at(buf, k, p, plen):
+                result[i] = 1
+                break
+    return result.view(np.bool_)
+
+
+def str_lower(ndarray[uint8_t] data):
+    """
+    Lowercase the ASCII letters, offsets are unchanged
+    """
+    cdef:
+        Py_ssize_t i, n = len(data)
+        ndarray[uint8_t] result = np.empty(n, dtype=np.uint8)
+        uint8_t c
+
+    for i in range(n):
+        c = data[i]
+        if c >= 65 and c <= 90:
+            c += 32
+        result[i] = c
+    return result
+
+
+def str_upper(ndarray[uint8_t] data):
+    """
+    Uppercase the ASCII letters, offsets are unchanged
+    """
+    cdef:
+        Py_ssize_t i, n = len(data)
+        ndarray[uint8_t] result = np.empty(n, dtype=np.uint8)
+        uint8_t c
+
+    for i in range(n):
+        c = data[i]
+        if c >= 97 and c <= 122:
+            c -= 32
+        result[i] = c
+    return result
+
+
+cdef inline bint _is_space(uint8_t c, bint is_unicode):
+    # as str.isspace, unicode also counts the separators \x1c-\x1f
+    if c == 32 or (c >= 9 and c <= 13):
+        return True
+    return is_unicode and c >= 28 and c <= 31
+
+
+def str_strip(ndarray[uint8_t] data, ndarray[int64_t] offsets,
+              bint left, bint right, bint is_unicode):
+    """
+    (starts, ends) of each string stripped of ASCII whitespace
+    """
+    cdef:
+        Py_ssize_t i, start, end, n = len(offsets) - 1
+        ndarray[int64_t] starts = np.empty(n, dtype=np.int64)
+        ndarray[int64_t] ends = np.empty(n, dtype=np.int64)
+
+    for i in range(n):
+        start = offsets[i]
+        end = offsets[i + 1]
+        if left:
+            while start < end and _is_space(data[start], is_unicode):
+                start += 1
+        if right:
+            while end > start and _is_space(data[end - 1], is_unicode):
+                end -= 1
+        starts[i] = start
+        ends[i] = end
+    return starts, ends
+
+
+def str_slice(ndarray[int64_t] offsets, object start, object stop):
+    """
+    (starts, ends) of each string sliced bytewise as s[start:stop]
+    """
+    cdef:
+        Py_ssize_t i, n = len(offsets) - 1, length, lo, hi
+        Py_ssize_t c_start = 0, c_stop = 0
+        bint has_start = start is not None, has_stop = stop is not None
+        ndarray[int64_t] starts = np.empty(n, dtype=np.int64)
+        ndarray[int64_t] ends = np.empty(n, dtype=np.int64)
+
+    if has_start:
+        c_start = start
+    if has_stop:
+        c_stop = stop
+
+    for i in range(n):
+        length = offsets[i + 1] - offsets[i]
+
+        # as slice(start, stop).indices(length)
+        lo = 0
+        if has_start:
+            lo = c_start
+            if lo < 0:
+                lo = max(lo + length, 0)
+            lo = min(lo, length)
+        hi = length
+        if has_stop:
+            hi = c_stop
+            if hi < 0:
+                hi = max(hi + length, 0)
+            hi = min(hi, length)
+        if hi < lo:
+            hi = lo
+
+        starts[i] = offsets[i] + lo
+        ends[i] = offsets[i] + hi
+    return starts, ends
+
+
+def substrings(ndarray[uint8_t] data, ndarray[int64_t] starts,
+               ndarray[int64_t] ends):
+    """
+    (data, offsets) of the substrings data[starts[i]:ends[i]]
+    """
+    cdef:
+        Py_ssize_t i, n = len(starts), pos = 0, length
+        ndarray[int64_t] new_offsets = np.empty(n + 1, dtype=np.int64)
+        ndarray[uint8_t] new_data
+
+    new_data = np.empty((ends - starts).sum(), dtype=np.uint8)
+    new_offsets[0] = 0
+    for i in range(n):
+        length = ends[i] - starts[i]
+        memcpy(<char*> new_data.data + pos, <char*> data.data + starts[i],
+               length)
+        pos += length
+        new_offsets[i + 1] = pos
+    return new_data, new_offsets
@@ -233,6 +233,21 @@ def test_ensure_int32():
 #         expected = u"\u05d0".encode('utf-8')
 #         assert (result == expected)
 
+def test_map_threaded():
+    arglist = [(i, i * 2) for i in range(10)]
+    expected = [a + b for a, b in arglist]
+
+    for nthreads in [1, 3, 20]:
+        result = com._map_threaded(lambda a, b: a + b, arglist, nthreads)
+        assert(result == expected)
+
+    def f(a, b):
+        if a == 5:
+            raise KeyError(a)
+        return a + b
+
+    nose.tools.assert_raises(KeyError, com._map_threaded, f, arglist, 3)
+
 def test_pprint_thing():
     if py3compat.PY3:
         raise nose.SkipTest
@@ -365,6 +380,35 @@ class TestTake(unittest.TestCase):
         result = com.take_2d(arr, [0, 2, -1])
         self.assert_(result.dtype == np.object_)
 
+    def test_take_nullable(self):
+        arr = np.array([[1, 2, 3],
+                        [4, 5, 6]], dtype=np.int64)
+        valid = np.array([[True, False, True],
+                          [True, True, True]])
+
+        result, result_valid = com.take_nullable(arr, None, [2, -1, 0],
+                                                 axis=1)
+        self.assert_(result.dtype == np.int64)
+        self.assert_(np.array_equal(result[:, [0, 2]], arr[:, [2, 0]]))
+        self.assert_(np.array_equal(result_valid, [[True, False, True],
+                                                   [True, False, True]]))
+
+        result, result_valid = com.take_nullable(arr, valid, [1, -1, 2],
+                                                 axis=1)
+        self.assert_(np.array_equal(result_valid, [[False, False, True],
+                                                   [True, False, True]]))
+
+        result, result_valid = com.take_nullable(arr, valid, [-1, 0])
+        self.assert_(np.array_equal(result[1], arr[0]))
+        self.assert_(np.array_equal(result_valid, [[False, False, False],
+                                                   [True, False, True]]))
+
+        arr = np.array([True, False, True])
+        result, result_valid = com.take_nullable(arr, None, [2, -1, 1])
+        self.assert_(result.dtype == np.bool_)
+        self.assert_(np.array_equal(result[[0, 2]], [True, False]))
+        self.assert_(np.array_equal(result_valid, [True, False, True]))
+
     def test_2d_float32(self):
         arr = np.random.randn(4, 3).astype(np.float32)
         indexer = [0, 2, -1, 1, -1]
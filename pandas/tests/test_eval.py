@@ -0,0 +1,132 @@
+# pylint: disable=E1101,E1103,W0232
+
+import unittest
+import nose
+
+import numpy as np
+
+from pandas import DataFrame, Series, eval as pd_eval
+from pandas.core.config import set_option, reset_option
+from pandas.util.testing import assert_series_equal, assert_almost_equal
+import pandas.core.eval as ev
+
+import pandas.util.testing as tm
+
+
+class TestEval(unittest.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        n = 50000
+        self.frame = DataFrame({'a': np.random.randn(n),
+                                'b': np.random.randn(n),
+                                'c': np.random.randint(0, 5, n)})
+
+    def _check_engines(self, expr, expected, frame=None):
+        if frame is None:
+            frame = self.frame
+        engines = [None, 'numpy']
+        if ev._USE_NUMEXPR:
+            engines.append('numexpr')
+        for engine in engines:
+            result = frame.eval(expr, engine=engine)
+            assert_series_equal(result, expected)
+
+    def test_arithmetic(self):
+        df = self.frame
+        self._check_engines('a * b + c / 2.', df.a * df.b + df.c / 2.)
+        self._check_engines('-a ** 2 - (b - 1)', -df.a ** 2 - (df.b - 1))
+        self._check_engines('sqrt(abs(a)) * 3', np.sqrt(np.abs(df.a)) * 3)
+
+    def test_boolean(self):
+        df = self.frame
+        expected = ((df.a > 1) & (df.b < 2)) | (df.c == 3)
+        self._check_engines('a > 1 & b < 2 | c == 3', expected)
+        self._check_engines('(a > 1) and (b < 2) or (c == 3)', expected)
+        self._check_engines('~(a > 0) & (c != 1)', (df.a <= 0) & (df.c != 1))
+        self._check_engines('-1 < a <= 1', (df.a > -1) & (df.a <= 1))
+
+        filtered = df[df.eval('a > 1 & c == 3')]
+        tm.assert_frame_equal(filtered, df[(df.a > 1) & (df.c == 3)])
+
+    def test_integer_division(self):
+        # numexpr truncates integer division, NumPy floors it
+        df = DataFrame({'c': np.arange(-20000, 20000)})
+        result = df.eval('c / 3')
+        assert_series_equal(result, df.c / 3)
+        assert_series_equal(df.eval('c % 7'), df.c % 7)
+        if not ev._USE_NUMEXPR:
+            raise nose.SkipTest('no numexpr')
+        self.assertRaises(ValueError, df.eval, 'c / 3', engine='numexpr')
+
+    def test_integer_bitwise(self):
+        # numexpr has no bitwise operators on integers and computes abs of
+        # integers in floating point, these are left to NumPy
+        n = ev._MIN_NUMEXPR_ELEMENTS * 2
+        df = DataFrame({'i': np.arange(n), 'j': np.arange(n)[::-1],
+                        'a': np.random.randn(n)})
+        assert_series_equal(df.eval('i & j'), df.i & df.j)
+        assert_series_equal(df.eval('i | j'), df.i | df.j)
+        assert_series_equal(df.eval('~i'), ~df.i)
+        assert_series_equal(df.eval('(a > 0) & j'), (df.a > 0) & df.j)
+
+        result = df.eval('abs(i - j)')
+        self.assertEqual(result.dtype, np.int64)
+        assert_series_equal(result, np.abs(df.i - df.j))
+
+        if not ev._USE_NUMEXPR:
+            raise nose.SkipTest('no numexpr')
+        self.assertRaises(ValueError, df.eval, 'i & j', engine='numexpr')
+        self.assertRaises(ValueError, df.eval, '~i', engine='numexpr')
+        self.assertRaises(ValueError, df.eval, 'abs(i)', engine='numexpr')
+        assert_series_equal(df.eval('(i > 5) & (j < 9)', engine='numexpr'),
+                            (df.i > 5) & (df.j < 9))
+
+    def test_chunked_threaded(self):
+        df = self.frame
+        expected = df.a * 2 - df.b
+        for threads in [1, 4]:
+            try:
+                set_option('compute.threads', threads)
+                result = df.eval('a * 2 - b', engine='numpy', chunksize=999)
+                assert_series_equal(result, expected)
+            finally:
+                reset_option('compute.threads')
+
+    def test_local_variables(self):
+        df = self.frame
+        x = 3
+        assert_series_equal(df.eval('c > x'), df.c > 3)
+
+        s = Series(np.arange(5.))
+        assert_series_equal(pd_eval('s * 2 + 1'), s * 2 + 1)
+        assert_almost_equal(pd_eval('arr > 2', local_dict={'arr': s.values}),
+                            s.values > 2)
+        self.assertEqual(pd_eval('2 * 3'), 6)
+
+    def test_object_columns(self):
+        df = DataFrame({'s': ['a', 'b', 'a'], 'x': [1, 2, 3]})
+        assert_series_equal(df.eval('s == "a" & x > 1'),
+                            Series([False, False, True]))
+
+    def test_align(self):
+        s = Series([1., 2., 3.])
+        t = Series([1., 2., 3.], index=[1, 2, 3])
+        assert_series_equal(pd_eval('s + t'), s + t)
+
+    def test_errors(self):
+        df = self.frame
+        self.assertRaises(NameError, df.eval, 'a + missing')
+        self.assertRaises(ValueError, df.eval, 'a.sum()')
+        self.assertRaises(ValueError, df.eval, 'max(a)')
+        self.assertRaises(ValueError, df.eval, 'a + 1', engine='foo')
+        self.assertRaises(SyntaxError, df.eval, 'a +')
+
+        local_dict = {'s': Series(np.arange(5.)), 'arr': np.arange(4.)}
+        self.assertRaises(ValueError, pd_eval, 's + arr',
+                          local_dict=local_dict)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -0,0 +1,117 @@
+# pylint: disable=E1101,E1103,W0232
+
+import operator
+import unittest
+import nose
+
+import numpy as np
+
+from pandas import DataFrame, Series
+from pandas.core.config import get_option, set_option, reset_option
+from pandas.util.testing import assert_almost_equal
+import pandas.core.expressions as expr
+
+
+class TestExpressions(unittest.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.frame = DataFrame(np.random.randn(60000, 4),
+                               columns=list('ABCD'))
+        self.intframe = DataFrame(np.random.randint(-50, 50, (60000, 4)),
+                                  columns=list('ABCD'))
+        self.small = self.frame[:100]
+
+    def tearDown(self):
+        reset_option('compute.threads')
+        reset_option('compute.use_numexpr')
+
+    def _check_settings(self, func):
+        # numexpr is only used while floating point errors are ignored
+        old = np.seterr(all='ignore')
+        try:
+            set_option('compute.use_numexpr', False)
+            expected = func()
+            for use_numexpr, threads in [(True, 1), (False, 3), (True, 3)]:
+                set_option('compute.use_numexpr', use_numexpr)
+                set_option('compute.threads', threads)
+                result = func()
+                self.assertEqual(result.values.dtype, expected.values.dtype)
+                assert_almost_equal(result.values, expected.values)
+        finally:
+            np.seterr(**old)
+
+    def test_frame_arithmetic(self):
+        for frame in [self.frame, self.intframe]:
+            self._check_settings(lambda: frame + frame)
+            self._check_settings(lambda: frame * 2)
+            self._check_settings(lambda: 1 - frame)
+            self._check_settings(lambda: frame / 3)
+            self._check_settings(lambda: frame // 7)
+            self._check_settings(lambda: frame ** 2)
+            self._check_settings(lambda: frame - frame.ix[0])
+            self._check_settings(lambda: frame.sub(frame['A'], axis=0))
+
+    def test_frame_comparison(self):
+        for frame in [self.frame, self.intframe]:
+            self._check_settings(lambda: frame > 0)
+            self._check_settings(lambda: frame == frame)
+
+    def test_series(self):
+        s = self.frame['A'].append(self.frame['B'])
+        self._check_settings(lambda: s + s)
+        self._check_settings(lambda: s / 0)
+        self._check_settings(lambda: s <= 0.5)
+        self._check_settings(lambda: s.astype(int) % 3)
+
+    def test_mixed_and_object(self):
+        frame = self.frame.copy()
+        frame['E'] = 'foo'
+        self._check_settings(lambda: frame[['A', 'B']] * 2)
+        self._check_settings(lambda: frame + frame)
+
+    def test_numexpr_errstate(self):
+        s = self.frame['A'].append(self.frame['B'])
+        s[5] = 0
+        self.assertFalse(get_option('compute.use_numexpr'))
+
+        set_option('compute.use_numexpr', True)
+        old = np.seterr(divide='raise', invalid='ignore')
+        try:
+            self.assertRaises(FloatingPointError, lambda: s / 0)
+            self.assertRaises(FloatingPointError, lambda: 1 / s)
+        finally:
+            np.seterr(**old)
+
+    def test_small_not_split(self):
+        a = self.small.values
+        self.assertFalse(expr._can_split(a, a))
+        self.assertTrue(expr._can_split(self.frame.values, 2))
+        self.assertFalse(expr._can_split(self.frame.values, True))
+        self.assertFalse(expr._can_split(self.frame.values.astype(object),
+                                         2))
+
+    def test_numexpr_ok(self):
+        values = self.frame.values
+        ivalues = self.intframe.values
+        self.assertTrue(expr._numexpr_ok(operator.add, values, values))
+        self.assertTrue(expr._numexpr_ok(operator.truediv, values, 3))
+        self.assertTrue(expr._numexpr_ok(operator.gt, ivalues, 0))
+        self.assertFalse(expr._numexpr_ok(operator.div, ivalues, 3))
+        self.assertFalse(expr._numexpr_ok(operator.pow, values, 2))
+        self.assertFalse(expr._numexpr_ok(operator.add, ivalues, 0.5))
+        self.assertFalse(expr._numexpr_ok(operator.add, values, ivalues))
+        self.assertFalse(expr._numexpr_ok(lambda x, y: y - x, values, 1))
+
+    def test_evaluate_threaded(self):
+        values = self.frame.values
+        result = expr._evaluate_threaded(operator.sub, values, values[0], 4)
+        assert_almost_equal(result, values - values[0])
+
+        result = expr._evaluate_threaded(operator.gt, values.T, 0, 4)
+        assert_almost_equal(result, values.T > 0)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
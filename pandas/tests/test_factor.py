@@ -86,6 +86,26 @@ class TestCategorical(unittest.TestCase):
         expected = np.repeat(False, len(self.factor))
         self.assert_(np.array_equal(result, expected))
 
+        result = self.factor != 'd'
+        expected = np.repeat(True, len(self.factor))
+        self.assert_(np.array_equal(result, expected))
+
+    def test_comparisons_missing(self):
+        factor = Categorical.from_array(np.array(['a', np.nan, 'b', 'a'],
+                                                 dtype=object))
+        values = np.asarray(factor)
+
+        self.assert_(np.array_equal(factor == 'a', values == 'a'))
+        self.assert_(np.array_equal(factor != 'a', values != 'a'))
+        self.assert_(np.array_equal(factor > 'a', [False, False, True, False]))
+
+    def test_isin(self):
+        factor = Categorical.from_array(np.array(['a', np.nan, 'b', 'c', 'a'],
+                                                 dtype=object))
+        result = factor.isin(['a', 'c', 'd'])
+        expected = [True, False, False, True, True]
+        self.assert_(np.array_equal(result, expected))
+
     def test_value_counts(self):
         from pandas.tools.tile import cut
 
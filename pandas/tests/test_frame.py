@@ -31,6 +31,7 @@ from pandas.util import py3compat
 
 import pandas.util.testing as tm
 import pandas.lib as lib
+import pandas.tslib as tslib
 
 from numpy.testing.decorators import slow
 
@@ -3859,6 +3860,12 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         assert_frame_equal(rs, xp)
         os.remove(filename)
 
+        # floats in object columns are formatted too
+        df = DataFrame({'A': [0.123456, 'foo', np.nan, 1]})
+        buf = StringIO()
+        df.to_csv(buf, float_format='%.2f', na_rep='NA')
+        self.assertEqual(buf.getvalue(), ',A\n0,0.12\n1,foo\n2,NA\n3,1\n')
+
     def test_to_csv_quoting(self):
         import csv
 
@@ -3924,7 +3931,75 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
                     'three,3,6\n')
         self.assertEqual(buf.getvalue(), expected)
 
+    def test_to_csv_chunksize(self):
+        df = tm.makeTimeDataFrame()
+        df['int'] = np.arange(len(df))
+        df['bool'] = df['A'] > 0
+        df['obj'] = 'foo'
+        df['date'] = datetime(2012, 1, 1)
+        df.ix[3:6, 'A'] = np.nan
+        df.ix[2, 'date'] = np.nan
+
+        expected = StringIO()
+        df.to_csv(expected)
+
+        for chunksize in [1, 7, len(df), 1000]:
+            buf = StringIO()
+            df.to_csv(buf, chunksize=chunksize)
+            self.assertEqual(buf.getvalue(), expected.getvalue())
+
+        expected = StringIO()
+        df[['obj', 'A', 'date']].to_csv(expected)
+        buf = StringIO()
+        df.to_csv(buf, cols=['obj', 'A', 'date'], chunksize=4)
+        self.assertEqual(buf.getvalue(), expected.getvalue())
 
+        self.assertRaises(KeyError, df.to_csv, StringIO(),
+                          cols=['obj', 'missing'])
+
+    def test_to_csv_datetime64(self):
+        df = DataFrame({'A': [datetime(2012, 1, 1), np.nan,
+                              datetime(2012, 1, 2, 3, 4, 5, 6)]},
+                       index=[datetime(2012, 1, 1, 1), datetime(2012, 1, 2),
+                              datetime(2012, 1, 3)])
+        buf = StringIO()
+        df.to_csv(buf, na_rep='NA')
+        expected = (',A\n'
+                    '2012-01-01 01:00:00,2012-01-01 00:00:00\n'
+                    '2012-01-02 00:00:00,NA\n'
+                    '2012-01-03 00:00:00,2012-01-02 03:04:05.000006\n')
+        self.assertEqual(buf.getvalue(), expected)
+
+        values = np.array([datetime(2012, 1, 1), 'NaT',
+                           datetime(2012, 1, 2, 3, 4, 5, 6)], dtype='M8[ns]')
+        result = tslib.format_datetime64(values.view('i8'))
+        self.assertEqual(list(result), ['2012-01-01 00:00:00', 'NaT',
+                                        '2012-01-02 03:04:05.000006'])
+        self.assert_(all(isinstance(x, str) for x in result))
+
+    def test_to_csv_compression(self):
+        filename = '__tmp_to_csv_compression__'
+        df = DataFrame({'A': np.random.randn(10), 'B': ['foo'] * 10})
+
+        try:
+            for compression in ['gzip', 'bz2']:
+                df.to_csv(filename, compression=compression)
+                recons = pan.read_csv(filename, index_col=0,
+                                      compression=compression)
+                assert_frame_equal(recons, df)
+
+            self.assertRaises(ValueError, df.to_csv, filename,
+                              compression='zip')
+
+            for ext in ['.gz', '.bz2']:
+                df.to_csv(filename + ext, compression='infer')
+                recons = pan.read_csv(filename + ext, index_col=0,
+                                      compression='infer')
+                assert_frame_equal(recons, df)
+                os.remove(filename + ext)
+        finally:
+            if os.path.exists(filename):
+                os.remove(filename)
 
     def test_info(self):
         io = StringIO()
@@ -4098,6 +4173,171 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         copy = self.mixed_frame.copy()
         self.assert_(copy._data is not self.mixed_frame._data)
 
+    def test_copy_on_write(self):
+        from pandas.core.config import set_option, reset_option
+
+        set_option('mode.copy_on_write', True)
+        try:
+            df = self.frame.copy()
+            expected = self.frame.copy()
+            values = df.values.copy()
+
+            cop = df.copy()
+            self.assert_(np.may_share_memory(cop._data.blocks[0].values,
+                                             df._data.blocks[0].values))
+
+            # writes through pandas copy the values first, both ways
+            cop['A'] = 0.
+            cop.ix[0, 'B'] = 5.
+            cop.set_value(cop.index[1], 'C', 6.)
+            self.assert_((cop['A'] == 0).all())
+            self.assertEqual(cop['B'][0], 5.)
+            self.assertEqual(cop['C'][1], 6.)
+            assert_almost_equal(df.values, values)
+
+            df.ix[2, 'D'] = 7.
+            self.assertEqual(df['D'][2], 7.)
+            self.assertNotEqual(cop['D'][2], 7.)
+
+            # slices, column subsets and identical reindexing
+            df = expected.copy()
+            derived = [df[:10], df[['B', 'C']], df.reindex(df.index),
+                       df.rename(columns={'A': 'a'})]
+            for obj in derived:
+                self.assert_(np.may_share_memory(obj._data.blocks[0].values,
+                                                 df._data.blocks[0].values))
+                obj.fillna(0., inplace=True)
+                obj.ix[0] = -1.
+                self.assert_((obj.ix[0] == -1).all())
+            assert_frame_equal(df, expected)
+
+            # mixed-type data
+            df = self.mixed_frame.copy()
+            cop = df.copy()
+            cop['foo'] = 'baz'
+            cop.ix[0, 'A'] = 100.
+            self.assert_((df['foo'] == 'bar').all())
+            self.assertNotEqual(df['A'][0], 100.)
+        finally:
+            reset_option('mode.copy_on_write')
+
+        cop = self.frame.copy()
+        self.assert_(not np.may_share_memory(cop.values, self.frame.values))
+
+    def test_copy_on_write_chained_assignment(self):
+        from pandas.core.config import set_option, reset_option
+
+        set_option('mode.copy_on_write', True)
+        try:
+            df = DataFrame({'a': np.arange(5.), 'b': np.arange(5.),
+                            'c': np.arange(5.)})
+            expected = df.copy()
+
+            # writes to columns of the copies
+            cop = df.copy()
+            cop['a'][0] = 99.
+            self.assertEqual(cop['a'][0], 99.)
+
+            reindexed = df.reindex(df.index)
+            reindexed['a'][1] = 99.
+            self.assertEqual(reindexed['a'][1], 99.)
+
+            subset = df[['a', 'b']]
+            subset.set_value(0, 'a', 42.)
+            self.assertEqual(subset['a'][0], 42.)
+            assert_frame_equal(df, expected)
+
+            # writes to columns of the parent
+            cop = df.copy()
+            df['a'][0] = 5.
+            self.assertEqual(df['a'][0], 5.)
+            assert_frame_equal(cop, expected)
+
+            # columns taken before the copy was made
+            df = expected.copy()
+            col = df['a']
+            cop = df.copy()
+            col[0] = 5.
+            self.assertEqual(df['a'][0], 5.)
+            assert_frame_equal(cop, expected)
+
+            df = expected.copy()
+            cop = df.copy()
+            df.icol(0)[0] = 5.
+            self.assertEqual(df['a'][0], 5.)
+            assert_frame_equal(cop, expected)
+        finally:
+            reset_option('mode.copy_on_write')
+
+    def test_copy_on_write_values(self):
+        from pandas.core.config import set_option, reset_option
+
+        set_option('mode.copy_on_write', True)
+        try:
+            df = DataFrame({'a': np.arange(5.), 'b': np.arange(5.)})
+            expected = df.copy()
+
+            cop = df.copy()
+            df.values[0, 0] = 5.
+            self.assertEqual(df['a'][0], 5.)
+            assert_frame_equal(cop, expected)
+
+            df = expected.copy()
+            cop = df.copy()
+            cop.values[0, 0] = 5.
+            self.assertEqual(cop['a'][0], 5.)
+            assert_frame_equal(df, expected)
+
+            df = expected.copy()
+            cop = df.copy()
+            df.xs(0, copy=False)[:] = 5.
+            self.assert_((df.xs(0) == 5).all())
+            assert_frame_equal(cop, expected)
+        finally:
+            reset_option('mode.copy_on_write')
+
+    def test_copy_on_write_column_fillna(self):
+        from pandas.core.config import set_option, reset_option
+
+        set_option('mode.copy_on_write', True)
+        try:
+            df = DataFrame({'a': np.arange(5.),
+                            'b': [np.nan, 1., np.nan, 3., np.nan]})
+            expected = df.copy()
+
+            # the copy is unchanged after an inplace fillna on the parent's
+            # column, and the other way around
+            for method in ['pad', None]:
+                df = expected.copy()
+                cop = df.copy()
+                if method is None:
+                    df['b'].fillna(0., inplace=True)
+                else:
+                    df['b'].fillna(method=method, inplace=True)
+                self.assertEqual(df['b'].count(), 5 if method is None else 4)
+                assert_frame_equal(cop, expected)
+
+                df = expected.copy()
+                cop = df.copy()
+                if method is None:
+                    cop['b'].fillna(0., inplace=True)
+                else:
+                    cop['b'].fillna(method=method, inplace=True)
+                self.assertEqual(cop['b'].count(), 5 if method is None else 4)
+                assert_frame_equal(df, expected)
+
+            df = expected.copy()
+            cop = df.copy()
+            df['b'].replace(1., 2., inplace=True)
+            df['a'].where(df['a'] > 2, inplace=True)
+            df['a'].update(Series([10.], index=[4]))
+            self.assertEqual(df['b'][1], 2.)
+            self.assertEqual(df['a'].count(), 2)
+            self.assertEqual(df['a'][4], 10.)
+            assert_frame_equal(cop, expected)
+        finally:
+            reset_option('mode.copy_on_write')
+
     # def test_copy_index_name_checking(self):
     #     # don't want to be able to modify the index stored elsewhere after
     #     # making a copy
@@ -5491,6 +5731,177 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         edf = DataFrame({'a': expected, 'b':expected})
         assert_frame_equal(chg, edf)
 
+    def test_nullable_int_bool(self):
+        from pandas.core.config import set_option, reset_option
+        from pandas.core.internals import MaskedIntBlock, MaskedBoolBlock
+
+        big = 2 ** 60
+        df = DataFrame({'a': np.arange(5) + big, 'b': np.arange(5),
+                        'c': [True, False, True, True, False]},
+                       index=list('abcde'))
+
+        set_option('mode.nullable_int_bool', True)
+        try:
+            reindexed = df.reindex(list('abxc'))
+            shifted = df.shift(1)
+            for result in [reindexed, shifted]:
+                types = set(type(b) for b in result._data.blocks)
+                self.assertEqual(types, set([MaskedIntBlock,
+                                             MaskedBoolBlock]))
+
+            # columns are upcast as before
+            expected = df.astype(object).reindex(list('abxc'))
+            self.assert_(reindexed['b'].dtype == np.float64)
+            self.assert_(reindexed['c'].dtype == np.object_)
+            assert_series_equal(reindexed['b'], expected['b'].astype(float))
+            assert_series_equal(shifted['b'],
+                                df['b'].astype(float).shift(1))
+
+            # exact integer reductions
+            ints = reindexed[['a', 'b']]
+            result = ints.sum()
+            self.assert_(result.dtype == np.int64)
+            self.assertEqual(result['a'], 3 * big + 3)
+            self.assertEqual(ints.max()['a'], big + 2)
+            self.assert_(np.isnan(ints.sum(skipna=False)['a']))
+            assert_series_equal(ints.mean(), ints.astype(float).mean())
+
+            # dropping and filling the missing values gives plain ints
+            self.assert_(reindexed.dropna()['a'].dtype == np.int64)
+            filled = reindexed.fillna(method='ffill')
+            self.assertEqual(filled['a']['x'], big + 1)
+            self.assert_(filled['c']['x'] is not np.nan)
+            self.assertEqual(ints.fillna(0)['a'].dtype, np.int64)
+
+            # writes through .ix upcast the masked blocks first
+            reindexed.ix['x', 'b'] = 7
+            self.assertEqual(reindexed['b']['x'], 7)
+            self.assert_(not reindexed._data.is_masked)
+        finally:
+            reset_option('mode.nullable_int_bool')
+
+        result = df.reindex(list('abxc'))
+        self.assert_(not result._data.is_masked)
+        self.assert_(result['a'].dtype == np.float64)
+
+    def test_set_value_copy_on_write(self):
+        from pandas.core.config import set_option, reset_option
+
+        set_option('mode.copy_on_write', True)
+        set_option('mode.nullable_int_bool', True)
+        try:
+            df = DataFrame({'a': np.arange(5.), 'b': np.arange(5),
+                            'c': np.arange(5.)})
+            expected = df.copy()
+
+            subset = df[['a', 'b']]
+            subset.set_value(0, 'a', 42.)
+            self.assertEqual(subset['a'][0], 42.)
+            assert_frame_equal(df, expected)
+
+            # masked blocks are upcast before the write
+            reindexed = df.reindex(range(6))
+            reindexed.set_value(5, 'b', 7)
+            self.assertEqual(reindexed['b'][5], 7)
+            assert_frame_equal(df, expected)
+        finally:
+            reset_option('mode.copy_on_write')
+            reset_option('mode.nullable_int_bool')
+
+    def test_categorical_column(self):
+        from pandas.core.categorical import Categorical
+
+        values = np.array(['NYSE', 'LSE', 'NYSE', np.nan, 'TSE', 'LSE'],
+                          dtype=object)
+        expected = DataFrame({'a': values, 'b': np.arange(6.)})
+        df = expected.copy()
+        df['a'] = Categorical.from_array(values)
+
+        cat = df.get_categorical('a')
+        self.assert_(cat.labels.dtype == np.int8)
+        self.assert_(cat.levels.equals(Index(['LSE', 'NYSE', 'TSE'])))
+        self.assert_(df.get_categorical('b') is None)
+        assert_frame_equal(df, expected)
+
+        # decoded as the values were
+        assert_frame_equal(df[2:5], expected[2:5])
+        assert_frame_equal(df.reindex([5, 0, 7]), expected.reindex([5, 0, 7]))
+        self.assert_(df.reindex([5, 0, 7]).get_categorical('a') is not None)
+        assert_frame_equal(df.take([4, 1]), expected.take([4, 1]))
+        assert_frame_equal(df.T, expected.T)
+        assert_frame_equal(df.fillna({'a': 'LSE'}),
+                           expected.fillna({'a': 'LSE'}))
+        assert_frame_equal(df.fillna({'a': 'OTC'}),
+                           expected.fillna({'a': 'OTC'}))
+
+        # comparisons and sorting by the codes
+        assert_frame_equal(df == 'NYSE', expected == 'NYSE')
+        assert_frame_equal(df != 'OTC', expected != 'OTC')
+        df['c'] = [1, 0, 1, 0, 1, 0]
+        expected['c'] = df['c']
+        for by in ['a', ['a', 'b'], ['c', 'a']]:
+            for ascending in [True, False]:
+                assert_frame_equal(df.sort(by, ascending=ascending),
+                                   expected.sort(by, ascending=ascending))
+        nona = df.dropna()
+        assert_frame_equal(nona.sort(['c', 'a'], ascending=[True, False]),
+                           expected.dropna().sort(['c', 'a'],
+                                                  ascending=[True, False]))
+        self.assert_(nona.get_categorical('a') is not None)
+        del df['c'], expected['c']
+        self.assert_(np.array_equal(cat.isin(['LSE', 'TSE']),
+                                    [False, True, False, False, True, True]))
+
+        # items are decoded copies, chained writes to them are lost
+        df['a'][1] = 'OTC'
+        self.assertEqual(df['a'][1], 'LSE')
+
+        # element-wise writes decode the column
+        df.set_value(0, 'a', 'OTC')
+        self.assertEqual(df['a'][0], 'OTC')
+        self.assert_(df.get_categorical('a') is None)
+        df['a'][1] = 'OTC'
+        self.assertEqual(df['a'][1], 'OTC')
+
+        unpickled = pickle.loads(pickle.dumps(df))
+        assert_frame_equal(unpickled, df)
+
+    def test_string_array_column(self):
+        from pandas.core.stringarray import StringArray
+
+        values = np.array(['NYSE', 'LSE', 'NYSE', np.nan, 'TSE', 'LSE'],
+                          dtype=object)
+        expected = DataFrame({'a': values, 'b': np.arange(6.)})
+        df = expected.copy()
+        df['a'] = StringArray.from_array(values)
+
+        arr = df.get_string_array('a')
+        self.assert_(isinstance(arr, StringArray))
+        self.assert_(df.get_string_array('b') is None)
+        self.assert_(df.get_categorical('a') is None)
+        assert_frame_equal(df, expected)
+
+        # rows are taken by their codes, the strings are shared
+        assert_frame_equal(df[2:5], expected[2:5])
+        assert_frame_equal(df.reindex([5, 0, 7]), expected.reindex([5, 0, 7]))
+        taken = df.take([4, 1])
+        self.assert_(taken.get_string_array('a').equals(arr.take([4, 1])))
+        assert_frame_equal(taken, expected.take([4, 1]))
+        assert_frame_equal(df.T, expected.T)
+        assert_frame_equal(df.fillna({'a': 'OTC'}),
+                           expected.fillna({'a': 'OTC'}))
+        assert_frame_equal(df == 'NYSE', expected == 'NYSE')
+        assert_frame_equal(df.sort('a'), expected.sort('a'))
+
+        unpickled = pickle.loads(pickle.dumps(df))
+        assert_frame_equal(unpickled, df)
+        self.assert_(unpickled.get_string_array('a').equals(arr))
+
+        # element-wise writes decode the column
+        df.set_value(0, 'a', 'OTC')
+        self.assertEqual(df['a'][0], 'OTC')
+        self.assert_(df.get_string_array('a') is None)
+
     def test_shift(self):
         # naive shift
         shiftedFrame = self.tsframe.shift(5)
@@ -7261,6 +7672,38 @@ class TestDataFrame(unittest.TestCase, CheckIndexing,
         for letter in range(ord('A'), ord('Z')):
             self.frame[chr(letter)] = chr(letter)
 
+    def test_consolidate_lazy(self):
+        df = DataFrame({'A': ['foo'] * 10})
+
+        # adding many columns merges the blocks now and then, but doesn't
+        # fail or lose data
+        for i in range(250):
+            df[i] = np.arange(10.) + i
+        self.assert_(len(df._data.blocks) < 250)
+        for i in range(250):
+            assert_almost_equal(df[i].values, np.arange(10.) + i)
+
+        # telling mixed-type data apart doesn't merge blocks
+        df = DataFrame({'A': ['foo'] * 10})
+        df['B'] = 1.
+        df['C'] = 2.
+        self.assert_(df._is_mixed_type)
+        self.assertEqual(len(df._data.blocks), 3)
+
+        # column access and pop don't either
+        col = df['B']
+        df.pop('C')
+        self.assertEqual(len(df._data.blocks), 2)
+        self.assert_(df['B'] is col)
+
+        # homogeneous data is merged so .values is a view
+        df = DataFrame({'A': np.zeros(10)})
+        df['B'] = 1.
+        self.assert_(not df._is_mixed_type)
+        self.assertEqual(len(df._data.blocks), 1)
+        df.values[0] = 5
+        self.assert_((df.ix[0] == 5).all())
+
     def test_as_matrix_consolidate(self):
         self.frame['E'] = 7.
         self.assert_(not self.frame._data.is_consolidated())
@@ -7,8 +7,10 @@ from numpy import nan
 from pandas import bdate_range
 from pandas.core.index import Index, MultiIndex
 from pandas.core.common import rands
+from pandas.core.config import set_option, reset_option
 from pandas.core.api import Categorical, DataFrame
-from pandas.core.groupby import GroupByError, SpecificationError, DataError
+from pandas.core.groupby import (GroupByError, SpecificationError, DataError,
+                                 ChunkedGroupBy)
 from pandas.core.series import Series
 from pandas.util.testing import (assert_panel_equal, assert_frame_equal,
                                  assert_series_equal, assert_almost_equal)
@@ -1095,6 +1097,35 @@ class TestGroupBy(unittest.TestCase):
         result = df.groupby(level=0, axis='columns').mean()
         _ = df.groupby(level=0, axis='columns').mean()
 
+    def test_cython_agg_threaded(self):
+        df = DataFrame(np.random.randn(1000, 7))
+        df[3][::3] = nan
+        df['ints'] = np.arange(len(df))
+        df['strs'] = 'foo'
+        key = np.random.randint(0, 20, len(df))
+
+        ts = DataFrame(np.random.randn(1000, 5),
+                       index=bdate_range('1/1/2000', periods=1000))
+
+        def _check(f):
+            expected = f()
+            set_option('compute.threads', 3)
+            try:
+                result = f()
+            finally:
+                reset_option('compute.threads')
+            assert_frame_equal(result, expected)
+
+        for how in ['sum', 'mean', 'prod', 'min', 'max', 'var', 'std',
+                    'first', 'last', 'median']:
+            _check(lambda: getattr(df.groupby(key), how)())
+            _check(lambda: getattr(df.groupby([key, key % 3]), how)())
+            _check(lambda: getattr(df.groupby(key, sort=False), how)())
+            _check(lambda: ts.resample('M', how=how))
+
+        _check(lambda: df[range(7)].T.groupby(key, axis=1).mean())
+        _check(lambda: df[[0, 1]].groupby(key).mean())
+
     def test_wrap_aggregated_output_multindex(self):
         df = self.mframe.T
         df['baz', 'two'] = 'peekaboo'
@@ -1714,6 +1745,95 @@ class TestGroupBy(unittest.TestCase):
         result = grouped.sum()
         _check_groupby(df, result, ['a', 'b'], 'd')
 
+    def test_groupby_nosort_multi(self):
+        df = DataFrame({'a' : ['foo', 'bar', 'foo', 'baz', 'bar', nan],
+                        'b' : [3, 2, 1, 3, 2, 1],
+                        'c' : [0, 1, 2, 0, 1, 2],
+                        'd' : np.random.randn(6)})
+
+        # groups come out in order of first appearance
+        result = df.groupby(['a', 'b', 'c'], sort=False).sum()
+        tups = com._asarray_tuplesafe(map(tuple,
+                                          df[['a', 'b', 'c']].values[:5]))
+        self.assert_(np.array_equal(result.index.values, tups[[0, 1, 2, 3]]))
+        self.assert_(np.array_equal(result['d'], df['d'][[0, 1, 2, 3]]
+                                    + [0, df['d'][4], 0, 0]))
+
+        expected = df.groupby(['a', 'b', 'c']).sum()
+        assert_frame_equal(result.sortlevel(0), expected)
+
+        grouped = df[:5].groupby(['a', 'b'], sort=False)
+        self.assertEqual(len(grouped), 4)
+        self.assertEqual(grouped.indices[('bar', 2)].tolist(), [1, 4])
+        keys = [k for k, _ in grouped]
+        self.assertEqual(keys, [('foo', 3), ('bar', 2), ('foo', 1),
+                                ('baz', 3)])
+
+    def test_groupby_nosort_int64_overflow(self):
+        B = np.concatenate((np.arange(1000), np.arange(1000),
+                            np.arange(500)))
+        A = np.arange(2500)[::-1]
+        df = DataFrame({'A' : A, 'B' : B,
+                        'C' : A, 'D' : B,
+                        'E' : A, 'F' : B,
+                        'G' : A, 'H' : B,
+                        'values' : np.random.randn(2500)})
+
+        keys = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
+        result = df.groupby(keys, sort=False).sum()
+        expected = df.groupby(keys).sum()
+
+        self.assert_(np.array_equal(result.index.get_level_values(0), A))
+        assert_frame_equal(result.sortlevel(0), expected)
+
+    def test_chunked_groupby(self):
+        df = DataFrame({'A' : np.random.randint(0, 10, 200),
+                        'B' : np.random.randint(0, 3, 200),
+                        'C' : np.random.randn(200),
+                        'D' : np.random.randint(0, 100, 200),
+                        'E' : ['foo', 'bar', 'baz', nan] * 50})
+        df['C'][::9] = nan
+        df['C'][df['A'] == 4] = nan
+        chunks = [df[:50], df[50:50], df[50:130], df[130:]]
+
+        for how in ['sum', 'mean', 'var', 'std', 'min', 'max', 'first',
+                    'last']:
+            for keys in ['A', ['A', 'B'], lambda x: x % 7]:
+                grouped = ChunkedGroupBy(chunks, keys)
+                result = getattr(grouped, how)()
+                expected = getattr(df.groupby(keys), how)()
+                assert_frame_equal(result, expected)
+
+        result = ChunkedGroupBy(chunks, 'A').count()
+        expected = df.groupby('A').agg(lambda x: x.count())
+        assert_frame_equal(result, expected)
+
+        # groups in the order they are first seen in
+        result = ChunkedGroupBy(chunks, ['A', 'B'], sort=False)['C'].mean()
+        expected = df.groupby(['A', 'B'], sort=False)['C'].mean()
+        assert_series_equal(result, expected)
+
+        result = ChunkedGroupBy(chunks, 'A', sort=False).agg(['sum', 'max'])
+        expected = df.groupby('A', sort=False).agg(['sum', 'max'])
+        assert_frame_equal(result, expected)
+
+        result = ChunkedGroupBy(chunks, 'A')[['C', 'D']].agg(['sum', 'min'])
+        expected = df.groupby('A')[['C', 'D']].agg(['sum', 'min'])
+        assert_frame_equal(result, expected)
+
+        result = ChunkedGroupBy(chunks, 'A')['C'].agg(['sum', 'min'])
+        expected = df.groupby('A')['C'].agg(['sum', 'min'])
+        assert_frame_equal(result, expected)
+
+        self.assertRaises(ValueError, ChunkedGroupBy(chunks, 'A').agg,
+                          'median')
+
+        # the chunks can only be read once
+        grouped = ChunkedGroupBy(iter(chunks), 'A')
+        assert_frame_equal(grouped.sum(), df.groupby('A').sum())
+        self.assertRaises(Exception, grouped.sum)
+        self.assertRaises(Exception, grouped['C'].mean)
+
     def test_intercept_builtin_sum(self):
         import __builtin__
         s = Series([1., 2., np.nan, 3.])
@@ -1994,6 +2114,21 @@ class TestGroupBy(unittest.TestCase):
         expected = ord_data.groupby(ord_labels, sort=False).describe()
         assert_frame_equal(desc_result, expected)
 
+    def test_groupby_categorical_column(self):
+        values = np.array(['foo', 'bar', 'baz', 'qux'],
+                          dtype=object).take(np.random.randint(0, 4, 100))
+        values[::7] = np.nan
+        df = DataFrame({'A': values, 'B': np.random.randn(100)})
+        expected = df.groupby('A').sum()
+
+        df['A'] = Categorical.from_array(values)
+        assert_frame_equal(df.groupby('A').sum(), expected)
+
+        # levels that are not observed make no groups
+        subset = df[df['A'] != 'qux']
+        self.assert_(subset.get_categorical('A') is not None)
+        assert_frame_equal(subset.groupby('A').sum(), expected[:3])
+
     def test_groupby_groups_datetimeindex(self):
         # #1430
         from pandas.tseries.api import DatetimeIndex
@@ -232,6 +232,155 @@ class TestBlockManager(unittest.TestCase):
         mgr = BlockManager(blocks, [items,  np.arange(N)])
         self.assert_(not mgr.is_mixed_dtype())
 
+    def test_share(self):
+        block = get_float_ex()
+        values = block.values
+        shared = block.share()
+
+        self.assert_(shared.values is values)
+        self.assert_(values.flags.writeable)
+
+        shared.set('a', np.ones(N) * 5)
+        self.assert_(shared.values is not values)
+        self.assert_((shared.get('a') == 5).all())
+        self.assert_(not (block.get('a') == 5).any())
+
+        # nothing is shared anymore
+        self.assert_(not block.materialize())
+        self.assert_(block.values is values)
+        self.assert_(not shared.materialize())
+
+        # the block that shared its values copies those of the others
+        block = get_float_ex()
+        values = block.values
+        shared = block.share()
+        view = shared.copy(deep=False)
+        block.set('a', np.ones(N) * 5)
+        self.assert_(block.values is values)
+        self.assert_(not np.may_share_memory(shared.values, values))
+        self.assert_(not (shared.get('a') == 5).any())
+        self.assert_(not (view.get('a') == 5).any())
+
+        # views on the values are only handed out once the values are copied
+        block = get_float_ex()
+        shared = block.share()
+        self.assert_(not block.prepare_views())
+        self.assert_(shared.prepare_views())
+        self.assert_(shared._refs is None)
+
+        # read-only values stay read-only
+        block = get_float_ex()
+        block.values.flags.writeable = False
+        self.assert_(not block.materialize())
+        self.assert_(not block.values.flags.writeable)
+
+    def test_masked_blocks(self):
+        values = np.arange(12, dtype=np.int64).reshape(3, 4) + 2**60
+        valid = np.ones(values.shape, dtype=bool)
+        valid[1, 2] = False
+        block = make_block(values, ['a', 'b', 'c'], TEST_COLS, valid=valid)
+        self.assert_(isinstance(block, MaskedIntBlock))
+        self.assert_(block._can_hold_na)
+
+        # only items with missing values are upcast
+        self.assert_(block.get('a').dtype == np.int64)
+        self.assertEqual(block.get('a')[0], 2**60)
+        self.assert_(np.isnan(block.get('b')[2]))
+        self.assert_(np.isnan(block._gi((1, 2))))
+
+        taken = block.reindex_axis(np.array([2, -1, 0]), None, True, axis=1)
+        self.assert_(isinstance(taken, MaskedIntBlock))
+        self.assert_(np.array_equal(taken.valid, [[True, False, True],
+                                                  [False, False, True],
+                                                  [True, False, True]]))
+
+        filled = block.fillna(-1)
+        self.assert_(type(filled) == IntBlock)
+        self.assertEqual(filled.get('b')[2], -1)
+        self.assert_(type(block.fillna(0.5)) == FloatBlock)
+
+        decoded = block.decode()
+        self.assert_(type(decoded) == FloatBlock)
+        self.assert_(np.isnan(decoded.values[1, 2]))
+
+        # merging with plain blocks keeps the mask
+        other = make_block(np.zeros((1, 4), dtype=np.int64), ['d'], TEST_COLS)
+        merged = block.merge(other)
+        self.assert_(isinstance(merged, MaskedIntBlock))
+        self.assert_(not merged.valid[1, 2] and merged.valid[3].all())
+
+        # all valid, no mask
+        self.assert_(type(make_block(values, ['a', 'b', 'c'], TEST_COLS,
+                                     valid=np.ones(values.shape,
+                                                   dtype=bool))) == IntBlock)
+
+        bools = make_block(values % 2 == 0, ['a', 'b', 'c'], TEST_COLS,
+                           valid=valid)
+        self.assert_(isinstance(bools, MaskedBoolBlock))
+        self.assert_(bools.get('b').dtype == np.object_)
+
+        items = Index(['a', 'b', 'c'])
+        block = make_block(values, items, items, valid=valid)
+        mgr = BlockManager([block], [items, np.arange(4)])
+        self.assert_(mgr.is_masked)
+        self.assert_(mgr.as_matrix().dtype == np.float64)
+        self.assert_(np.isnan(mgr.get_scalar(('b', 2))))
+        self.assert_(not mgr.decode().is_masked)
+
+        import pickle
+        mgr2 = pickle.loads(pickle.dumps(mgr))
+        self.assert_(isinstance(mgr2.blocks[0], MaskedIntBlock))
+        self.assert_(np.array_equal(mgr2.blocks[0].valid, valid))
+
+    def test_categorical_blocks(self):
+        from pandas.core.categorical import Categorical
+
+        levels = Index(['bar', 'foo'])
+        codes = np.array([[1, 0, -1, 1]], dtype=np.int8)
+        block = make_block(codes, ['a'], TEST_COLS, levels=levels)
+        self.assert_(isinstance(block, CategoricalBlock))
+        self.assert_(block.get('a').dtype == np.object_)
+        self.assert_(np.isnan(block._gi((0, 2))))
+        self.assertEqual(block._gi((0, 1)), 'bar')
+
+        taken = block.reindex_axis(np.array([3, -1, 1]), None, True, axis=1)
+        self.assert_(isinstance(taken, CategoricalBlock))
+        self.assert_(np.array_equal(taken.values, [[1, -1, 0]]))
+        self.assert_(taken.values.dtype == np.int8)
+
+        filled = block.fillna('bar')
+        self.assert_(isinstance(filled, CategoricalBlock))
+        self.assert_(np.array_equal(filled.values, [[1, 0, 0, 1]]))
+        filled = block.fillna('baz')
+        self.assert_(type(filled) == ObjectBlock)
+        self.assertEqual(filled.values[0, 2], 'baz')
+
+        items = Index(['b', 'c'])
+        floats = make_block(np.ones((2, N)), items, items)
+        mgr = BlockManager([floats], [items, np.arange(N)])
+        mgr.set('a', Categorical.from_array(['x', 'y'] * (N // 2)))
+        self.assert_(mgr.is_categorical)
+        self.assert_(mgr.get_categorical('b') is None)
+        cat = mgr.get_categorical('a')
+        self.assert_(cat.labels.dtype == np.int8)
+        self.assert_(cat.levels.equals(Index(['x', 'y'])))
+        self.assertEqual(mgr.get_scalar(('a', 1)), 'y')
+        self.assert_(mgr.as_matrix().dtype == np.object_)
+
+        # not merged with other blocks, and kept by slicing and taking
+        self.assertEqual(len(mgr.consolidate().blocks), 2)
+        sliced = mgr.get_slice(slice(2, 5), axis=1)
+        self.assert_(sliced.get_categorical('a') is not None)
+        taken = mgr.take([4, 0])
+        self.assert_(np.array_equal(taken.get('a'), ['x', 'x']))
+
+        self.assert_(not mgr.decode().is_categorical)
+
+        import pickle
+        mgr2 = pickle.loads(pickle.dumps(mgr))
+        self.assert_(mgr2.get_categorical('a').levels.equals(cat.levels))
+        self.assert_(np.array_equal(mgr2.get('a'), mgr.get('a')))
+
     def test_is_indexed_like(self):
         self.assert_(self.mgr._is_indexed_like(self.mgr))
         mgr2 = self.mgr.reindex_axis(np.arange(N - 1), axis=1)
@@ -357,6 +506,18 @@ class TestBlockManager(unittest.TestCase):
         self.assertEquals(cons.nblocks, 1)
         self.assert_(cons.blocks[0].items.equals(cons.items))
 
+    def test_consolidate_on_insert(self):
+        mgr = self.mgr.copy()
+        for i in range(300):
+            mgr.insert(len(mgr.items), 'x%d' % i, randn(1, N))
+            # merged once the blocks outnumber half of the items
+            self.assert_(len(mgr.blocks) <= max(100, len(mgr.items) // 2))
+
+        mgr._consolidate_inplace()
+        self.assert_(mgr.is_consolidated())
+        for i in [0, 150, 299]:
+            self.assertEqual(mgr.get('x%d' % i).shape, (N,))
+
     def test_reindex_index(self):
         pass
 
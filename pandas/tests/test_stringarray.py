@@ -0,0 +1,80 @@
+# pylint: disable=E1101,E1103,W0232
+
+import cPickle as pickle
+import unittest
+import nose
+
+import numpy as np
+
+from pandas.core.stringarray import StringArray
+from pandas.util.testing import assert_almost_equal
+
+import pandas.util.testing as tm
+
+
+class TestStringArray(unittest.TestCase):
+    _multiprocess_can_split_ = True
+
+    def setUp(self):
+        self.values = np.array(['foo', np.nan, 'barbaz', '', 'q'],
+                               dtype=object)
+        self.arr = StringArray.from_array(self.values)
+
+    def test_from_array(self):
+        self.assertEqual(len(self.arr), 5)
+        self.assertEqual(self.arr.data.tostring(), 'foobarbazq')
+        assert_almost_equal(self.arr.offsets, [0, 3, 3, 9, 9, 10])
+        assert_almost_equal(self.arr.isnull(), [False, True, False, False,
+                                                False])
+        assert_almost_equal(self.arr.values, self.values)
+        assert_almost_equal(np.asarray(self.arr), self.values)
+        self.assert_(not self.arr.is_unicode)
+
+        arr = StringArray.from_array([u'\xe9t\xe9', None])
+        self.assert_(arr.is_unicode)
+        self.assert_(not arr.is_ascii)
+        self.assertEqual(arr[0], u'\xe9t\xe9')
+        self.assertEqual(len(arr.data), 5)
+
+        self.assertRaises(TypeError, StringArray.from_array, ['a', 1])
+
+    def test_getitem(self):
+        self.assertEqual(self.arr[0], 'foo')
+        self.assertEqual(self.arr[-1], 'q')
+        self.assertEqual(self.arr[3], '')
+        self.assert_(np.isnan(self.arr[1]))
+        self.assertRaises(IndexError, self.arr.__getitem__, 5)
+
+        assert_almost_equal(self.arr[1:3].values, self.values[1:3])
+        assert_almost_equal(self.arr[[4, 0]].values, self.values[[4, 0]])
+
+    def test_take(self):
+        result = self.arr.take([2, -1, 0, 2])
+        assert_almost_equal(result.values, ['barbaz', np.nan, 'foo',
+                                            'barbaz'])
+        self.assertEqual(result.data.tostring(), 'barbazfoobarbaz')
+
+        self.assertRaises(IndexError, self.arr.take, [5])
+
+    def test_concat(self):
+        result = StringArray.concat([self.arr, self.arr[2:]])
+        expected = np.concatenate([self.values, self.values[2:]])
+        assert_almost_equal(result.values, expected)
+        self.assert_(result.equals(StringArray.from_array(expected)))
+
+    def test_equals(self):
+        self.assert_(self.arr.equals(StringArray.from_array(self.values)))
+        self.assert_(not self.arr.equals(self.arr[::-1]))
+        self.assert_(not self.arr.equals(self.values))
+
+    def test_pickle(self):
+        result = pickle.loads(pickle.dumps(self.arr))
+        self.assert_(result.equals(self.arr))
+
+    def test_nbytes(self):
+        self.assertEqual(self.arr.nbytes, 10 + 6 * 8 + 5)
+
+
+if __name__ == '__main__':
+    nose.runmodule(argv=[__file__, '-vvs', '-x', '--pdb', '--pdb-failure'],
+                   exit=False)
@@ -18,6 +18,7 @@ import pandas.core.common as com
 from pandas.util.testing import assert_series_equal, assert_almost_equal
 import pandas.util.testing as tm
 
+from pandas.core.stringarray import StringArray
 import pandas.core.strings as strings
 
 class TestStringMethods(unittest.TestCase):
@@ -127,6 +128,23 @@ class TestStringMethods(unittest.TestCase):
         self.assert_(result.dtype == np.bool_)
         tm.assert_almost_equal(result, expected)
 
+    def test_contains_literal(self):
+        # no regex special characters, searched without the regex
+        mixed = ['a', NA, 'bo', u'fo\xe9', True, ['o'], None, u'x']
+        xp = [False, NA, True, True, NA, NA, NA, False]
+        tm.assert_almost_equal(strings.str_contains(mixed, 'o'), xp)
+        tm.assert_almost_equal(strings.str_contains(mixed, u'o'), xp)
+        tm.assert_almost_equal(strings.str_contains(mixed, u'\xe9'),
+                               [False, NA, False, True, NA, NA, NA, False])
+
+        result = strings.str_contains(mixed, 'o', na=False)
+        self.assert_(result.dtype == np.bool_)
+
+        # case-insensitive goes through the regex
+        tm.assert_almost_equal(strings.str_contains(['FOO', 'bar'], 'o',
+                                                    case=False),
+                               [True, False])
+
     def test_startswith(self):
         values = Series(['om', NA, 'foo_nom', 'nom', 'bar_foo', NA, 'foo'])
 
@@ -691,6 +709,65 @@ class TestStringMethods(unittest.TestCase):
         result = data.str.contains(pat, flags=re.IGNORECASE)
         self.assertEquals(result[0], True)
 
+    def test_compact(self):
+        values = np.array(['  foo ', NA, 'barbaz', 'BAR', '', 'a.b'],
+                          dtype=object)
+        arr = StringArray.from_array(values)
+
+        def check(name, *args):
+            f = getattr(strings, 'str_%s' % name)
+            result = f(arr, *args)
+            expected = f(values, *args)
+            if isinstance(result, StringArray):
+                result = result.values
+            self.assertEqual(result.dtype, expected.dtype)
+            tm.assert_almost_equal(result, expected)
+
+        for name in ['len', 'lower', 'upper', 'strip', 'lstrip', 'rstrip']:
+            check(name)
+        check('startswith', 'ba')
+        check('endswith', 'z')
+        check('contains', 'ar')
+        check('contains', 'a.')
+        check('contains', '')
+        check('slice', 1, -1)
+        check('slice', None, 2)
+        check('slice', -2, None)
+
+        # string results stay compact
+        self.assert_(isinstance(strings.str_lower(arr), StringArray))
+        self.assert_(isinstance(arr.str.len(), np.ndarray))
+
+        # NA filled
+        result = strings.str_startswith(arr, 'ba', na=False)
+        self.assertEqual(result.dtype, np.bool_)
+        self.assert_(not result[1])
+
+        # no missing values
+        arr = StringArray.from_array(['foo', 'bar'])
+        result = strings.str_len(arr)
+        self.assertEqual(result.dtype, np.int64)
+        tm.assert_almost_equal(result, [3, 3])
+
+    def test_compact_unicode(self):
+        values = np.array([u'\xe9t\xe9', NA, u'ab\u2019c', u' x\x1c'],
+                          dtype=object)
+        arr = StringArray.from_array(values)
+
+        for name in ['len', 'lower', 'upper', 'strip']:
+            f = getattr(strings, 'str_%s' % name)
+            result = f(arr)
+            if isinstance(result, StringArray):
+                result = result.values
+            tm.assert_almost_equal(result, f(values))
+
+        tm.assert_almost_equal(strings.str_slice(arr, 1).values,
+                               strings.str_slice(values, 1))
+        tm.assert_almost_equal(strings.str_contains(arr, u'\u2019'),
+                               [False, NA, True, False])
+        tm.assert_almost_equal(strings.str_startswith(arr, u'\xe9'),
+                               [True, NA, False, False])
+
     def test_encode_decode(self):
         base = Series([u'a', u'b', u'a\xe4'])
         series = base.str.encode('utf-8')
@@ -13,7 +13,8 @@ from pandas.core.index import (Index, MultiIndex, _get_combined_index,
                                _ensure_index, _get_consensus_names,
                                _all_indexes_same)
 from pandas.core.internals import (IntBlock, BoolBlock, BlockManager,
-                                   make_block, _consolidate)
+                                   make_block, _consolidate, _block_valid,
+                                   _nullable_int_bool)
 from pandas.util.decorators import cache_readonly, Appender, Substitution
 
 from pandas.sparse.frame import SparseDataFrame
@@ -21,6 +22,7 @@ import pandas.core.common as com
 
 import pandas.lib as lib
 import pandas.algos as algos
+import pandas.tslib as tslib
 import pandas.hashtable as _hash
 
 
@@ -226,6 +228,12 @@ class _MergeOperation(object):
                     left_na_indexer = left_indexer.take(na_indexer)
                     key_col.put(na_indexer, com.take_1d(self.left_join_keys[i],
                                                         left_na_indexer))
+
+                if result._data.is_encoded:
+                    # key_col is an upcast or decoded copy, not a view on the
+                    # values
+                    result[name] = key_col
+                    result._consolidate_inplace()
             elif left_indexer is not None:
                 if name is None:
                     name = 'key_%d' % i
@@ -254,9 +262,9 @@ class _MergeOperation(object):
                 _left_join_on_index(right_ax, left_ax, self.right_join_keys,
                                     sort=self.sort)
         else:
+            left_keys, right_keys = self._get_categorical_join_keys()
             (left_indexer,
-             right_indexer) = _get_join_indexers(self.left_join_keys,
-                                                 self.right_join_keys,
+             right_indexer) = _get_join_indexers(left_keys, right_keys,
                                                  sort=self.sort, how=self.how)
 
             if self.right_index:
@@ -268,6 +276,24 @@ class _MergeOperation(object):
 
         return join_index, left_indexer, right_indexer
 
+    def _get_categorical_join_keys(self):
+        """
+        Join keys with the key columns that are categorical on both sides as
+        Categorical, which are factorized by their levels
+        """
+        left_keys = list(self.left_join_keys)
+        right_keys = list(self.right_join_keys)
+        if len(self.left_on) != len(left_keys):
+            return left_keys, right_keys
+
+        for i, (lk, rk) in enumerate(zip(self.left_on, self.right_on)):
+            lcat = _get_categorical(self.orig_left, lk)
+            rcat = _get_categorical(self.orig_right, rk)
+            if lcat is not None and rcat is not None:
+                left_keys[i] = lcat
+                right_keys[i] = rcat
+        return left_keys, right_keys
+
     def _get_merge_data(self):
         """
         Handles overlapping column names etc.
@@ -414,6 +440,13 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner'):
     """
     assert(len(left_keys) == len(right_keys))
 
+    # sorted keys are joined by a linear scan, without hashing them
+    if len(left_keys) == 1:
+        indexers = _get_monotonic_join_indexers(left_keys[0], right_keys[0],
+                                                sort=sort, how=how)
+        if indexers is not None:
+            return indexers
+
     left_labels = []
     right_labels = []
     group_sizes = []
@@ -442,6 +475,54 @@ def _get_join_indexers(left_keys, right_keys, sort=False, how='inner'):
     return join_func(left_group_key, right_group_key, max_groups)
 
 
+def _get_monotonic_join_indexers(lk, rk, sort=False, how='inner'):
+    """
+    Join indexers for integer or datetime64 keys that are both monotonic
+    increasing, from the sorted join kernels. The kernels handle many-to-one
+    joins only, so None is returned (and the keys are factorized instead)
+    unless the keys on one side are unique. The rows come out in the same
+    order as from the hash join
+    """
+    if not (isinstance(lk, np.ndarray) and isinstance(rk, np.ndarray)):
+        return None
+    if not (com._is_int_or_datetime_dtype(lk) and
+            com._is_int_or_datetime_dtype(rk)):
+        return None
+    if len(lk) == 0 or len(rk) == 0:
+        return None
+
+    # without sort, outer and right joins put the keys only on the right last
+    if how in ('outer', 'right') and not sort:
+        return None
+
+    lk = com._ensure_int64(lk)
+    rk = com._ensure_int64(rk)
+
+    # NaT is factorized to the NA group, which is sorted last
+    if lk[0] == tslib.iNaT or rk[0] == tslib.iNaT:
+        return None
+
+    lmono, lunique = algos.is_monotonic_int64(lk)
+    if not lmono:
+        return None
+    rmono, runique = algos.is_monotonic_int64(rk)
+    if not rmono or not (lunique or runique):
+        return None
+
+    if how == 'right':
+        _, right_indexer, left_indexer = algos.left_join_indexer_int64(rk, lk)
+    else:
+        join_func = _monotonic_join_functions[how]
+        _, left_indexer, right_indexer = join_func(lk, rk)
+    return left_indexer, right_indexer
+
+_monotonic_join_functions = {
+    'inner': algos.inner_join_indexer_int64,
+    'left': algos.left_join_indexer_int64,
+    'outer': algos.outer_join_indexer_int64,
+}
+
+
 class _OrderedMerge(_MergeOperation):
 
     def __init__(self, left, right, on=None, by=None, left_on=None,
@@ -539,11 +620,36 @@ def _left_join_on_index(left_ax, right_ax, join_keys, sort=False):
                 _get_single_indexer(jkey, right_ax, sort=sort)
             join_index = left_ax.take(left_indexer)
         else:
-            right_indexer = right_ax.get_indexer(jkey)
+            right_indexer = _get_monotonic_indexer(jkey, right_ax)
+            if right_indexer is None:
+                right_indexer = right_ax.get_indexer(jkey)
 
     return join_index, left_indexer, right_indexer
 
 
+def _get_monotonic_indexer(join_key, index):
+    """
+    The locations of the values of join_key in a unique index, found by a
+    linear scan of both when they are sorted integer or datetime64 values.
+    None otherwise
+    """
+    if not isinstance(join_key, np.ndarray) or isinstance(index, MultiIndex):
+        return None
+    if join_key.dtype != index.dtype or not len(join_key) or not len(index):
+        return None
+    if not com._is_int_or_datetime_dtype(join_key):
+        return None
+    if not (index.is_monotonic and index.is_unique):
+        return None
+
+    join_key = com._ensure_int64(join_key)
+    if join_key[0] == tslib.iNaT or not algos.is_monotonic_int64(join_key)[0]:
+        return None
+
+    values = com._ensure_int64(index.values)
+    return algos.left_join_indexer_unique_int64(join_key, values)
+
+
 def _right_outer_join(x, y, max_groups):
     right_indexer, left_indexer = algos.left_outer_join(y, x, max_groups)
     return left_indexer, right_indexer
@@ -556,7 +662,19 @@ _join_functions = {
 }
 
 
+def _get_categorical(frame, key):
+    if key is None or isinstance(key, np.ndarray):
+        return None
+    try:
+        return frame._data.get_categorical(key)
+    except (KeyError, TypeError):
+        return None
+
+
 def _factorize_keys(lk, rk, sort=True):
+    if isinstance(lk, Factor) and isinstance(rk, Factor):
+        return _factorize_categorical_keys(lk, rk, sort=sort)
+
     if com._is_int_or_datetime_dtype(lk) and com._is_int_or_datetime_dtype(rk):
         klass = _hash.Int64Factorizer
         lk = com._ensure_int64(lk)
@@ -591,6 +709,31 @@ def _factorize_keys(lk, rk, sort=True):
     return llab, rlab, count
 
 
+def _factorize_categorical_keys(lk, rk, sort=True):
+    # only the levels are hashed, the codes are relabeled to match. Without
+    # sort the group keys are numbered in order of appearance afterwards, see
+    # _get_join_indexers
+    llev, rlev, count = _factorize_keys(lk.levels.values, rk.levels.values,
+                                        sort=sort)
+
+    # -1 stays -1
+    llab = np.append(llev, -1).take(com._ensure_platform_int(lk.labels))
+    rlab = np.append(rlev, -1).take(com._ensure_platform_int(rk.labels))
+
+    # NA group
+    lmask = llab == -1; lany = lmask.any()
+    rmask = rlab == -1; rany = rmask.any()
+
+    if lany or rany:
+        if lany:
+            np.putmask(llab, lmask, count)
+        if rany:
+            np.putmask(rlab, rmask, count)
+        count += 1
+
+    return llab, rlab, count
+
+
 def _sort_labels(uniques, left, right):
     if not isinstance(uniques, np.ndarray):
         # tuplesafe
@@ -646,7 +789,7 @@ class _BlockJoinOperation(object):
             join_blocks = unit.get_upcasted_blocks()
             type_map = {}
             for blk in join_blocks:
-                type_map.setdefault(type(blk), []).append(blk)
+                type_map.setdefault(_block_kind(blk), []).append(blk)
             blockmaps.append((unit, type_map))
 
         return blockmaps
@@ -699,11 +842,25 @@ class _BlockJoinOperation(object):
         block_dtype = _get_block_dtype([x[1] for x in merge_chunks])
         out = np.empty(out_shape, dtype=block_dtype)
 
+        # integer and boolean blocks with missing values, see _upcast_blocks
+        masked = any(blk.valid is not None or
+                     (blk._nullable and unit.need_masking)
+                     for unit, blk in merge_chunks)
+        out_valid = np.empty(out_shape, dtype=bool) if masked else None
+
         sofar = 0
         for unit, blk in merge_chunks:
             out_chunk = out[sofar : sofar + len(blk)]
 
-            if unit.indexer is None:
+            if masked:
+                indexer = unit.indexer
+                if indexer is None:
+                    indexer = np.arange(n, dtype=np.int64)
+                values, valid = com.take_nullable(blk.values, blk.valid,
+                                                  indexer, axis=self.axis)
+                out_chunk[:] = values
+                out_valid[sofar : sofar + len(blk)] = valid
+            elif unit.indexer is None:
             # is this really faster than assigning to arr.flat?
                 com.take_fast(blk.values, np.arange(n, dtype=np.int64),
                               None, False,
@@ -718,7 +875,8 @@ class _BlockJoinOperation(object):
 
         # does not sort
         new_block_items = _concat_indexes([b.items for _, b in merge_chunks])
-        return make_block(out, new_block_items, self.result_items)
+        return make_block(out, new_block_items, self.result_items,
+                          valid=out_valid)
 
 
 class _JoinUnit(object):
@@ -779,11 +937,18 @@ def _may_need_upcasting(blocks):
 
 def _upcast_blocks(blocks):
     """
-    Upcast and consolidate if necessary
+    Upcast and consolidate if necessary. If the nullable option is set,
+    integer and boolean blocks are masked when they are reindexed instead
     """
+    nullable = _nullable_int_bool()
+
     new_blocks = []
     for block in blocks:
-        if isinstance(block, IntBlock):
+        if nullable and block._nullable:
+            newb = block
+        elif block.valid is not None:
+            newb = block.decode()
+        elif isinstance(block, IntBlock):
             newb = make_block(block.values.astype(float), block.items,
                               block.ref_items)
         elif isinstance(block, BoolBlock):
@@ -797,6 +962,37 @@ def _upcast_blocks(blocks):
     return _consolidate(new_blocks, newb.ref_items)
 
 
+def _block_kind(block):
+    # masked integer and boolean blocks are merged with the plain ones,
+    # categorical blocks with none, their codes are into levels of their own
+    if block.levels is not None:
+        return block
+    elif isinstance(block, IntBlock):
+        return IntBlock
+    elif isinstance(block, BoolBlock):
+        return BoolBlock
+    return type(block)
+
+
+def _decode_categorical(data):
+    # categorical blocks are concatenated decoded
+    if not data.is_categorical:
+        return data
+    new_blocks = [blk.decode() if blk.levels is not None else blk
+                  for blk in data.blocks]
+    return BlockManager(new_blocks, data.axes).consolidate()
+
+
+def _get_item_valid(data, item):
+    # the values of an item without upcasting them, and their validity mask
+    # (None if they are not masked)
+    _, block = data._find_block(item)
+    if block.valid is None:
+        return block.get(item), None
+    loc = block.items.get_loc(item)
+    return block.values[loc], block.valid[loc]
+
+
 def _get_all_block_kinds(blockmaps):
     kinds = set()
     for mapping in blockmaps:
@@ -972,8 +1168,8 @@ class _Concatenator(object):
 
         blockmaps = []
         for data in reindexed_data:
-            data = data.consolidate()
-            type_map = dict((type(blk), blk) for blk in data.blocks)
+            data = _decode_categorical(data.consolidate())
+            type_map = dict((_block_kind(blk), blk) for blk in data.blocks)
             blockmaps.append(type_map)
         return blockmaps
 
@@ -1003,11 +1199,34 @@ class _Concatenator(object):
                 raise
 
             new_data = {}
+            valids = {}
             for item in self.new_axes[0]:
-                new_data[item] = self._concat_single_item(item)
+                values, valid = self._concat_single_item(item)
+                new_data[item] = values
+                if valid is not None:
+                    valids[item] = valid
+
+            if len(valids):
+                new_data = self._get_item_blocks(new_data, valids)
 
         return new_data
 
+    def _get_item_blocks(self, data, valids):
+        # masked items can't go through the constructor as arrays
+        items = self.new_axes[0]
+        blocks = []
+        for i, item in enumerate(items):
+            valid = valids.get(item)
+            if valid is not None:
+                valid = valid[np.newaxis]
+            blocks.append(make_block(data[item][np.newaxis], items[i:i + 1],
+                                     items, valid=valid))
+
+        axes = list(self.new_axes)
+        if axes[self.axis] is None:
+            axes[self.axis] = self._get_fresh_axis()
+        return BlockManager(blocks, axes).consolidate()
+
     def _get_reindexed_data(self):
         # HACK: ugh
 
@@ -1030,12 +1249,18 @@ class _Concatenator(object):
         values_list = [b.values for b in blocks if b is not None]
         concat_values = com._concat_compat(values_list, axis=self.axis)
 
+        concat_valid = None
+        if any(b is not None and b.valid is not None for b in blocks):
+            concat_valid = np.concatenate([_block_valid(b) for b in blocks
+                                           if b is not None], axis=self.axis)
+
         if self.axis > 0:
             # Not safe to remove this check, need to profile
             if not _all_indexes_same([b.items for b in blocks]):
                 raise Exception('dtypes are not consistent throughout '
                                 'DataFrames')
-            return make_block(concat_values, blocks[0].items, self.new_axes[0])
+            return make_block(concat_values, blocks[0].items, self.new_axes[0],
+                              valid=concat_valid)
         else:
             offsets = np.r_[0, np.cumsum([len(x._data.axes[0]) for
                                             x in self.objs])]
@@ -1049,20 +1274,46 @@ class _Concatenator(object):
 
             if self.ignore_index:
                 ref_items = self._get_fresh_axis()
-                return make_block(concat_values, concat_items, ref_items)
+                return make_block(concat_values, concat_items, ref_items,
+                                  valid=concat_valid)
 
-            return make_block(concat_values, concat_items, self.new_axes[0])
+            return make_block(concat_values, concat_items, self.new_axes[0],
+                              valid=concat_valid)
 
     def _concat_single_item(self, item):
+        """
+        Concatenated values of item, and their validity mask if the
+        nullable option is set and they are integer or boolean values with
+        missing ones (None otherwise)
+        """
+        nullable = _nullable_int_bool()
+
         all_values = []
+        all_valid = []
         dtypes = set()
         for obj in self.objs:
             try:
-                values = obj._data.get(item)
+                if nullable:
+                    values, valid = _get_item_valid(obj._data, item)
+                else:
+                    values, valid = obj._data.get(item), None
                 dtypes.add(values.dtype)
                 all_values.append(values)
+                all_valid.append(valid)
             except KeyError:
                 all_values.append(None)
+                all_valid.append(None)
+
+        # this method only gets called with axis >= 1
+        assert(self.axis >= 1)
+
+        if nullable and len(dtypes):
+            kinds = set(dtype.kind for dtype in dtypes)
+            masked = (None in all_values or
+                      any(v is not None for v in all_valid))
+            if masked and (kinds <= set('iu') or kinds == set('b')):
+                return self._concat_masked_item(all_values, all_valid,
+                                                kinds == set('b'))
 
         # this stinks
         have_object = False
@@ -1084,9 +1335,27 @@ class _Concatenator(object):
             else:
                 to_concat.append(item_values)
 
-        # this method only gets called with axis >= 1
-        assert(self.axis >= 1)
-        return com._concat_compat(to_concat, axis=self.axis - 1)
+        return com._concat_compat(to_concat, axis=self.axis - 1), None
+
+    def _concat_masked_item(self, all_values, all_valid, is_bool):
+        dtype = np.bool_ if is_bool else np.int64
+
+        to_concat = []
+        valid_concat = []
+        for obj, values, valid in zip(self.objs, all_values, all_valid):
+            if values is None:
+                shape = obj._data.shape[1:]
+                to_concat.append(np.zeros(shape, dtype=dtype))
+                valid_concat.append(np.zeros(shape, dtype=bool))
+            else:
+                to_concat.append(values)
+                if valid is None:
+                    valid = np.ones(values.shape, dtype=bool)
+                valid_concat.append(valid)
+
+        values = com._concat_compat(to_concat, axis=self.axis - 1)
+        valid = np.concatenate(valid_concat, axis=self.axis - 1)
+        return values, valid
 
     def _get_result_dim(self):
         if self._is_series and self.axis == 1:
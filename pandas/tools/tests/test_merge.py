@@ -280,6 +280,70 @@ class TestMerge(unittest.TestCase):
                               'b': [2, 2]}, index=df.index)
         tm.assert_frame_equal(result, expected)
 
+    def test_join_nullable_int_bool(self):
+        from pandas.core.config import set_option, reset_option
+
+        df1 = DataFrame({'a': [1, 2, 3], 'b': [True, False, True]},
+                        index=['x', 'y', 'z'])
+        df2 = DataFrame({'c': [4, 5]}, index=['y', 'w'])
+
+        expected = df1.join(df2, how='outer')
+
+        set_option('mode.nullable_int_bool', True)
+        try:
+            joined = df1.join(df2, how='outer')
+            self.assert_(joined._data.is_masked)
+            assert_frame_equal(joined, expected)
+            self.assertEqual(joined['a'].sum(), 6)
+
+            merged = merge(df1, df2, left_index=True, right_index=True,
+                           how='outer')
+            self.assert_(merged._data.is_masked)
+            assert_frame_equal(merged, expected)
+
+            plain = DataFrame({'a': [7], 'b': [False], 'c': [8]},
+                              index=['v'])
+            stacked = concat([joined, plain])
+            self.assert_(stacked._data.is_masked)
+            assert_frame_equal(stacked, concat([expected, plain]))
+
+            # items missing from some of the frames
+            big = 2 ** 60
+            df = DataFrame({'a': np.arange(3) + big, 'b': [True, False, True],
+                            'f': [1.5, 2.5, 3.5]})
+            stacked = concat([df, df[['f']]])
+            self.assert_(stacked._data.is_masked)
+            self.assertEqual(stacked[['a']].sum()['a'], 3 * big + 3)
+            self.assert_(stacked.dropna()['a'].dtype == np.int64)
+            self.assert_(stacked.dropna()['b'].dtype == np.bool_)
+            stacked = concat([df, df[['f']]], ignore_index=True)
+            self.assert_(stacked.index.equals(Index(np.arange(6))))
+        finally:
+            reset_option('mode.nullable_int_bool')
+
+    def test_merge_categorical_keys(self):
+        from pandas.core.categorical import Categorical
+
+        left = DataFrame({'key': ['a', 'b', np.nan, 'c', 'b'],
+                          'lvalue': np.arange(5)})
+        right = DataFrame({'key': ['d', 'b', 'a', np.nan],
+                           'rvalue': np.arange(4)})
+
+        cleft, cright = left.copy(), right.copy()
+        cleft['key'] = Categorical.from_array(left['key'])
+        cright['key'] = Categorical.from_array(right['key'])
+
+        for how in ['inner', 'left', 'right', 'outer']:
+            for sort in [True, False]:
+                result = merge(cleft, cright, on='key', how=how, sort=sort)
+                expected = merge(left, right, on='key', how=how, sort=sort)
+                assert_frame_equal(result, expected)
+
+        # a categorical key joined with a plain one
+        result = merge(cleft, right, on='key', how='outer', sort=True)
+        expected = merge(left, right, on='key', how='outer', sort=True)
+        assert_frame_equal(result, expected)
+
     def test_join_index_mixed(self):
         df1 = DataFrame({'A': 1., 'B': 2, 'C': 'foo', 'D': True},
                         index=np.arange(10),
@@ -705,6 +769,65 @@ class TestMerge(unittest.TestCase):
 
         self.assert_((df.var3.unique() == result.var3.unique()).all())
 
+    def test_merge_monotonic_keys(self):
+        # sorted integer keys are joined by a linear scan, check against the
+        # hash join of the same keys as objects
+        def _objects(df):
+            df = df.copy()
+            df['key'] = df['key'].astype(object)
+            return df
+
+        dups = DataFrame({'key': np.sort(np.random.randint(0, 40, 100)),
+                          'lvalue': np.random.randn(100)})
+        unique = DataFrame({'key': np.arange(-10, 50, 3),
+                            'rvalue': np.random.randn(20)})
+        unique2 = DataFrame({'key': np.arange(0, 60, 2),
+                             'value2': np.random.randn(30)})
+
+        for x, y in [(dups, unique), (unique, dups), (unique, unique2)]:
+            for how in JOIN_TYPES:
+                for sort in [True, False]:
+                    result = merge(x, y, on='key', how=how, sort=sort)
+                    expected = merge(_objects(x), _objects(y), on='key',
+                                     how=how, sort=sort)
+                    expected['key'] = \
+                        expected['key'].astype(result['key'].dtype)
+                    assert_frame_equal(result, expected)
+
+        # the kernels only handle many-to-one joins
+        from pandas.tools.merge import _get_monotonic_join_indexers
+        key = dups['key'].values
+        self.assert_(_get_monotonic_join_indexers(key, key) is None)
+        self.assert_(_get_monotonic_join_indexers(key[::-1],
+                                                  unique['key'].values)
+                     is None)
+        self.assert_(_get_monotonic_join_indexers(key, unique['key'].values)
+                     is not None)
+
+        # join on a sorted unique index
+        from pandas.tools.merge import _get_monotonic_indexer
+        index = Index(unique['key'].values)
+        assert_almost_equal(_get_monotonic_indexer(key, index),
+                            index.get_indexer(key))
+        self.assert_(_get_monotonic_indexer(key, Index(key)) is None)
+        result = dups.join(unique.set_index('key'), on='key')
+        self.assert_(result['key'].index.equals(dups.index))
+        expected = Series(unique['rvalue'].values, index=index).reindex(key)
+        assert_almost_equal(result['rvalue'].values, expected.values)
+
+        # datetime keys
+        left = DataFrame({'key': date_range('1/1/2000', periods=10),
+                          'a': np.arange(10)})
+        right = DataFrame({'key': date_range('1/5/2000', periods=10),
+                           'b': np.arange(10)})
+        result = merge(left, right, on='key', how='outer', sort=True)
+        self.assertEqual(len(result), 14)
+        self.assert_(result['key'].index.equals(Index(np.arange(14))))
+        self.assert_((result['key'].values ==
+                      date_range('1/1/2000', periods=14).values).all())
+        assert_almost_equal(result['b'].values[4:], np.arange(10))
+
+
 def _check_merge(x, y):
     for how in ['inner', 'left', 'outer']:
         result = x.join(y, how=how)
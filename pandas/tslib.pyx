@@ -8,6 +8,7 @@ import numpy as np
 from cpython cimport *
 
 from libc.stdlib cimport free
+from libc.stdio cimport snprintf
 
 from util cimport is_integer_object, is_datetime64_object
 cimport util
@@ -16,9 +17,12 @@ from datetime cimport *
 from khash cimport *
 cimport cython
 
+import sys
 from datetime import timedelta, datetime
 from dateutil.parser import parse as parse_date
 
+cdef bint PY3 = (sys.version_info[0] >= 3)
+
 cdef extern from "Python.h":
     int PySlice_Check(object)
 
@@ -823,6 +827,91 @@ def array_to_datetime(ndarray[object] values, raise_=False, dayfirst=False,
 
         return oresult
 
+def array_strptime(ndarray[object] values, object fmt=None):
+    """
+    Parse an array of strings with a fixed strptime-style format (see
+    parse_datetime_format for the supported directives) into M8[ns]. If no
+    format is given, each value may be in any of the common ISO 8601 layouts.
+    Raises ValueError if any value does not match.
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        object val
+        bint infer = fmt is None
+        char *cfmt = NULL
+        ndarray[int64_t] iresult
+        pandas_datetimestruct dts
+
+    if fmt is not None:
+        if PyUnicode_Check(fmt):
+            fmt = PyUnicode_AsASCIIString(fmt)
+        cfmt = fmt
+        if not is_supported_datetime_format(cfmt):
+            raise ValueError('Unsupported date format: %s' % fmt)
+
+    result = np.empty(n, dtype='M8[ns]')
+    iresult = result.view('i8')
+    for i in range(n):
+        val = values[i]
+        if util._checknull(val) or val is NaT:
+            iresult[i] = iNaT
+            continue
+
+        if PyUnicode_Check(val):
+            val = PyUnicode_AsASCIIString(val)
+        elif not PyString_Check(val):
+            raise ValueError('Unable to parse %s' % str(val))
+
+        if cfmt == NULL or parse_datetime_format(val, cfmt, &dts) < 0:
+            if infer:
+                cfmt = infer_iso_datetime_format(val)
+            if cfmt == NULL or parse_datetime_format(val, cfmt, &dts) < 0:
+                raise ValueError('Unable to parse %s' % val)
+        iresult[i] = pandas_datetimestruct_to_datetime(PANDAS_FR_ns, &dts)
+        _check_dts_bounds(iresult[i], &dts)
+
+    return result
+
+
+def format_datetime64(ndarray[int64_t] values, object na_rep='NaT'):
+    """
+    Format datetime64[ns] values (as int64) like Timestamp._repr_base, with
+    NaT as na_rep
+    """
+    cdef:
+        Py_ssize_t i, n = len(values)
+        int64_t val
+        pandas_datetimestruct dts
+        char buf[64]
+        ndarray[object] result = np.empty(n, dtype=object)
+
+    for i in range(n):
+        val = values[i]
+        if val == NPY_NAT:
+            result[i] = na_rep
+            continue
+
+        pandas_datetime_to_datetimestruct(val, PANDAS_FR_ns, &dts)
+        if dts.ps != 0:
+            snprintf(buf, sizeof(buf), '%d-%.2d-%.2d %.2d:%.2d:%.2d.%.9d',
+                     <int> dts.year, dts.month, dts.day, dts.hour, dts.min,
+                     dts.sec, dts.us * 1000 + dts.ps / 1000)
+        elif dts.us != 0:
+            snprintf(buf, sizeof(buf), '%d-%.2d-%.2d %.2d:%.2d:%.2d.%.6d',
+                     <int> dts.year, dts.month, dts.day, dts.hour, dts.min,
+                     dts.sec, dts.us)
+        else:
+            snprintf(buf, sizeof(buf), '%d-%.2d-%.2d %.2d:%.2d:%.2d',
+                     <int> dts.year, dts.month, dts.day, dts.hour, dts.min,
+                     dts.sec)
+        if PY3:
+            result[i] = (<object> buf).decode('ascii')
+        else:
+            result[i] = <object> buf
+
+    return result
+
+
 cdef inline _get_datetime64_nanos(object val):
     cdef:
         pandas_datetimestruct dts
@@ -624,13 +624,21 @@ sparse_ext = Extension('pandas._sparse',
 parser_ext = Extension('pandas._parser',
                        depends=['pandas/src/parser/tokenizer.h',
                                 'pandas/src/parser/io.h',
-                                'pandas/src/numpy_helper.h'],
+                                'pandas/src/numpy_helper.h',
+                                'pandas/src/datetime/np_datetime.h',
+                                'pandas/src/datetime/np_datetime_strings.h'],
                        sources=[srcpath('parser', suffix=suffix),
                                 'pandas/src/parser/tokenizer.c',
                                 'pandas/src/parser/io.c',
+                                'pandas/src/datetime/np_datetime.c',
+                                'pandas/src/datetime/np_datetime_strings.c',
                                 ],
                        include_dirs=common_include)
 
+strings_ext = Extension('pandas._strings',
+                        sources=[srcpath('strings', suffix=suffix)],
+                        include_dirs=common_include)
+
 sandbox_ext = Extension('pandas._sandbox',
                         sources=[srcpath('sandbox', suffix=suffix)],
                         include_dirs=common_include)
@@ -641,7 +649,7 @@ cppsandbox_ext = Extension('pandas._cppsandbox',
                            sources=[srcpath('cppsandbox', suffix=suffix)],
                            include_dirs=[np.get_include()])
 
-extensions.extend([sparse_ext, parser_ext])
+extensions.extend([sparse_ext, parser_ext, strings_ext])
 
 # if not ISRELEASED:
 #     extensions.extend([sandbox_ext])
@@ -2,4 +2,45 @@ from vbench.benchmark import Benchmark
 from datetime import datetime
 
 common_setup = """from pandas_vb_common import *
+
+N = 1000000
+df = DataFrame(np.random.randn(N, 4))
+df2 = DataFrame(np.random.randn(N, 4))
+"""
+
+#----------------------------------------------------------------------
+# large frames, evaluated in chunks above the size threshold
+
+frame_add = Benchmark("df + df2", common_setup,
+                      start_date=datetime(2012, 12, 1))
+
+frame_mult = Benchmark("df * 2", common_setup,
+                       start_date=datetime(2012, 12, 1))
+
+frame_comparison = Benchmark("df > df2", common_setup,
+                             start_date=datetime(2012, 12, 1))
+
+setup = common_setup + """
+set_option('compute.threads', 4)
+set_option('compute.use_numexpr', False)
 """
+
+frame_add_threaded = Benchmark("df + df2", setup,
+                               start_date=datetime(2012, 12, 1))
+
+frame_mult_threaded = Benchmark("df * 2", setup,
+                                start_date=datetime(2012, 12, 1))
+
+setup = common_setup + """
+set_option('compute.use_numexpr', True)
+np.seterr(all='ignore')
+"""
+
+frame_add_numexpr = Benchmark("df + df2", setup,
+                              start_date=datetime(2012, 12, 1))
+
+frame_mult_numexpr = Benchmark("df * 2", setup,
+                               start_date=datetime(2012, 12, 1))
+
+series_add = Benchmark("df[0] + df2[0]", common_setup,
+                       start_date=datetime(2012, 12, 1))
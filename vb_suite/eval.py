@@ -0,0 +1,38 @@
+from vbench.benchmark import Benchmark
+from datetime import datetime
+
+common_setup = """from pandas_vb_common import *
+import pandas
+
+N = 1000000
+df = DataFrame({'a': np.random.randn(N), 'b': np.random.randn(N),
+                'c': np.random.randint(0, 5, N)})
+"""
+
+#----------------------------------------------------------------------
+# boolean filters
+
+frame_filter_ops = \
+    Benchmark("df[((df.a > 1) & (df.b < 2)) | (df.c == 3)]", common_setup,
+              start_date=datetime(2012, 12, 1))
+
+frame_filter_eval = \
+    Benchmark("df[df.eval('a > 1 & b < 2 | c == 3')]", common_setup,
+              start_date=datetime(2012, 12, 1))
+
+frame_filter_eval_numpy = \
+    Benchmark("df[df.eval('a > 1 & b < 2 | c == 3', engine='numpy')]",
+              common_setup, start_date=datetime(2012, 12, 1))
+
+#----------------------------------------------------------------------
+# arithmetic
+
+frame_arith_ops = Benchmark("df.a * df.b + df.a / 3", common_setup,
+                            start_date=datetime(2012, 12, 1))
+
+frame_arith_eval = Benchmark("df.eval('a * b + a / 3')", common_setup,
+                             start_date=datetime(2012, 12, 1))
+
+frame_arith_eval_numpy = \
+    Benchmark("df.eval('a * b + a / 3', engine='numpy')", common_setup,
+              start_date=datetime(2012, 12, 1))
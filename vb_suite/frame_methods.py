@@ -98,3 +98,40 @@ df = DataFrame(randn(100, 10))
 
 frame_to_string_floats = Benchmark('df.to_string()', setup,
                                    start_date=datetime(2010, 6, 1))
+
+#----------------------------------------------------------------------
+# adding columns one at a time
+
+setup = common_setup + """
+N = 10000
+values = randn(N)
+def f(K=500):
+    df = DataFrame({'key': ['foo'] * N})
+    for i in range(K):
+        df[i] = values
+        df._is_mixed_type
+"""
+
+frame_insert_columns = Benchmark('f()', setup,
+                                 start_date=datetime(2012, 12, 1))
+
+#----------------------------------------------------------------------
+# copies and slices, with and without copy-on-write
+
+setup = common_setup + """
+df = DataFrame(randn(100000, 20))
+cols = df.columns[:10]
+"""
+
+frame_copy = Benchmark('df.copy()', setup,
+                       start_date=datetime(2012, 12, 1))
+
+frame_copy_cow = Benchmark('df.copy()',
+                           setup + "set_option('mode.copy_on_write', True)",
+                           cleanup="reset_option('mode.copy_on_write')",
+                           start_date=datetime(2012, 12, 1))
+
+frame_subset_cow = Benchmark('df[cols]; df[:50000]',
+                             setup + "set_option('mode.copy_on_write', True)",
+                             cleanup="reset_option('mode.copy_on_write')",
+                             start_date=datetime(2012, 12, 1))
@@ -59,6 +59,37 @@ groupby_frame_cython_many_columns = Benchmark('df.groupby(labels).sum()', setup,
                                               start_date=datetime(2011, 8, 1),
                                               logy=True)
 
+#----------------------------------------------------------------------
+# multi-key groupby without sorting, many groups
+
+setup = common_setup + """
+N = 1000000
+df = DataFrame(dict((k, np.random.randint(0, 100000, N)) for k in 'abcd'))
+df['values'] = np.random.randn(N)
+"""
+
+groupby_multi_nosort = \
+    Benchmark("df.groupby(['a', 'b'], sort=False).sum()", setup,
+              start_date=datetime(2012, 12, 1))
+
+groupby_multi_nosort_overflow = \
+    Benchmark("df.groupby(['a', 'b', 'c', 'd'], sort=False).sum()", setup,
+              start_date=datetime(2012, 12, 1))
+
+#----------------------------------------------------------------------
+# aggregate many columns on a thread pool
+
+setup = common_setup + """
+labels = np.random.randint(0, 1000, size=100000)
+df = DataFrame(randn(100000, 100))
+set_option('compute.threads', 4)
+"""
+
+groupby_frame_cython_threaded = \
+    Benchmark('df.groupby(labels).mean()', setup,
+              cleanup="reset_option('compute.threads')",
+              start_date=datetime(2012, 12, 1))
+
 #----------------------------------------------------------------------
 # single key, long, integer key
 
@@ -241,3 +272,21 @@ groupby_frame_apply_overhead = Benchmark("df.groupby('key').apply(f)", setup,
 
 groupbym_frame_apply = Benchmark("df.groupby(['key', 'key2']).apply(f)", setup,
                                  start_date=datetime(2011, 10, 1))
+
+#----------------------------------------------------------------------
+# Categorical key columns
+
+setup = common_setup + """
+N = 1000000
+symbols = np.array([rands(4) for _ in xrange(1000)], dtype='O')
+df = DataFrame({'symbol': symbols.take(np.random.randint(0, 1000, N)),
+                'value': np.random.randn(N)})
+df_cat = df.copy()
+df_cat['symbol'] = Categorical.from_array(df['symbol'])
+"""
+
+groupby_object_key = Benchmark("df.groupby('symbol').sum()", setup,
+                               start_date=datetime(2012, 12, 1))
+
+groupby_categorical_key = Benchmark("df_cat.groupby('symbol').sum()", setup,
+                                    start_date=datetime(2012, 12, 1))
@@ -44,3 +44,51 @@ df = DataFrame(np.random.randn(3000, 30))
 """
 frame_to_csv = Benchmark("df.to_csv('__test__.csv')", setup,
                          start_date=datetime(2011, 1, 1))
+
+frame_to_csv_float_format = Benchmark("df.to_csv('__test__.csv', "
+                                      "float_format='%.4f')", setup,
+                                      start_date=datetime(2012, 12, 1))
+
+#----------------------------------
+setup = common_setup + """
+from datetime import datetime
+df = DataFrame(np.random.randn(100000, 10))
+df['obj'] = 'foo'
+df['int'] = np.arange(100000)
+df['date'] = datetime(2012, 1, 1)
+df.index = date_range('1/1/2000', periods=100000, freq='T')
+"""
+frame_to_csv_mixed = Benchmark("df.to_csv('__test__.csv')", setup,
+                               start_date=datetime(2012, 12, 1))
+
+frame_to_csv_mixed_chunked = Benchmark("df.to_csv('__test__.csv', "
+                                       "chunksize=1000)", setup,
+                                       start_date=datetime(2012, 12, 1))
+
+frame_to_csv_mixed_gzip = Benchmark("df.to_csv('__test__.csv', "
+                                    "compression='gzip')", setup,
+                                    start_date=datetime(2012, 12, 1))
+
+#----------------------------------------------------------------------
+# binary format
+
+setup = common_setup + """
+import os
+df = DataFrame(np.random.randn(100000, 30))
+df['int'] = np.arange(len(df))
+df['string'] = 'foo'
+"""
+write_binary = Benchmark("df.to_binary('__test__.pdbin')", setup,
+                         cleanup="os.remove('__test__.pdbin')",
+                         start_date=datetime(2012, 12, 1))
+
+setup = setup + """
+df.to_binary('__test__.pdbin')
+"""
+read_binary_mmap = Benchmark("read_binary('__test__.pdbin')", setup,
+                             cleanup="os.remove('__test__.pdbin')",
+                             start_date=datetime(2012, 12, 1))
+
+read_binary_memory = Benchmark("read_binary('__test__.pdbin', mmap_mode=None)",
+                               setup, cleanup="os.remove('__test__.pdbin')",
+                               start_date=datetime(2012, 12, 1))
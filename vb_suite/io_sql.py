@@ -0,0 +1,46 @@
+from vbench.api import Benchmark
+from datetime import datetime
+
+common_setup = """from pandas_vb_common import *
+import sqlite3
+import pandas.io.sql as sql
+"""
+
+#----------------------------------------------------------------------
+# write_frame
+
+setup = common_setup + """
+index = [rands(10) for _ in xrange(10000)]
+df = DataFrame({'float1' : randn(10000),
+                'float2' : randn(10000),
+                'string1' : ['foo'] * 10000,
+                'bool1' : [True] * 10000,
+                'int1' : np.random.randint(0, 100000, size=10000)},
+               index=index)
+con = sqlite3.connect(':memory:')
+sql.write_frame(df, name='test', con=con)
+"""
+
+sql_write_frame = Benchmark("sql.write_frame(df, name='test', con=con, "
+                            "append=True)", setup,
+                            start_date=datetime(2012, 12, 1))
+
+sql_write_frame_chunked = Benchmark("sql.write_frame(df, name='test', "
+                                    "con=con, append=True, chunksize=1000)",
+                                    setup, start_date=datetime(2012, 12, 1))
+
+#----------------------------------------------------------------------
+# read_frame
+
+read_setup = setup + """
+con = sqlite3.connect(':memory:')
+sql.write_frame(df, name='test', con=con)
+"""
+
+sql_read_frame = Benchmark("sql.read_frame('select * from test', con)",
+                           read_setup, start_date=datetime(2012, 12, 1))
+
+sql_read_frame_chunked = Benchmark("for chunk in sql.read_frame('select * "
+                                   "from test', con, chunksize=1000): pass",
+                                   read_setup,
+                                   start_date=datetime(2012, 12, 1))
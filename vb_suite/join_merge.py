@@ -110,6 +110,28 @@ merge_2intkey_nosort = Benchmark('merge(left, right, sort=False)', setup,
 merge_2intkey_sort = Benchmark('merge(left, right, sort=True)', setup,
                                start_date=datetime(2011, 10, 20))
 
+#----------------------------------------------------------------------
+# Merges on sorted keys
+
+setup = common_setup + """
+N = 1000000
+left = DataFrame({'key': np.arange(N) * 2, 'value': np.random.randn(N)})
+right = DataFrame({'key': np.arange(N) * 3, 'value2': np.random.randn(N)})
+right_indexed = right.set_index('key')
+"""
+
+merge_monotonic_int_key_inner = \
+    Benchmark("merge(left, right, on='key')", setup,
+              start_date=datetime(2012, 12, 1))
+
+merge_monotonic_int_key_left = \
+    Benchmark("merge(left, right, on='key', how='left')", setup,
+              start_date=datetime(2012, 12, 1))
+
+join_dataframe_monotonic_index = \
+    Benchmark("left.join(right_indexed, on='key')", setup,
+              start_date=datetime(2012, 12, 1))
+
 #----------------------------------------------------------------------
 # Appending DataFrames
 
@@ -204,3 +226,24 @@ right = DataFrame({'key' : np.arange(10000),
 """
 
 stmt = "ordered_merge(left, right, on='key', left_by='group')"
+
+#----------------------------------------------------------------------
+# Merges on categorical keys
+
+setup = common_setup + """
+N = 1000000
+symbols = np.array([rands(4) for _ in xrange(1000)], dtype='O')
+left = DataFrame({'symbol': symbols.take(np.random.randint(0, 1000, N)),
+                  'value': np.random.randn(N)})
+right = DataFrame({'symbol': symbols[::2], 'value2': np.random.randn(500)})
+
+left_cat, right_cat = left.copy(), right.copy()
+left_cat['symbol'] = Categorical.from_array(left['symbol'])
+right_cat['symbol'] = Categorical.from_array(right['symbol'])
+"""
+
+merge_object_key = Benchmark("merge(left, right, on='symbol')", setup,
+                             start_date=datetime(2012, 12, 1))
+
+merge_categorical_key = Benchmark("merge(left_cat, right_cat, on='symbol')",
+                                  setup, start_date=datetime(2012, 12, 1))
@@ -79,3 +79,83 @@ data = data * 2000
 cmd = "read_table(StringIO(data), sep=',', header=None, parse_dates=[1])"
 sdate = datetime(2012, 5, 7)
 read_table_multiple_date_baseline = Benchmark(cmd, setup, start_date=sdate)
+
+setup = common_setup + """
+import os
+N = 10000
+K = 100
+df = DataFrame(np.random.randn(N, K))
+df.to_csv('test.csv', sep='|')
+"""
+
+read_csv_usecols = Benchmark("read_csv('test.csv', sep='|', usecols=[1, 50])",
+                             setup,
+                             cleanup="os.remove('test.csv')",
+                             start_date=datetime(2012, 12, 1))
+
+setup = common_setup + """
+from cStringIO import StringIO
+rng = date_range('1/1/2000', periods=20000, freq='T')
+data = '\\n'.join(['date,value'] +
+                  ['%s,%d' % (d, i) for i, d in enumerate(rng)])
+"""
+
+cmd = "read_csv(StringIO(data), parse_dates=['date'])"
+read_csv_parse_dates_iso8601 = Benchmark(cmd, setup,
+                                         start_date=datetime(2012, 12, 1))
+
+setup = common_setup + """
+from cStringIO import StringIO
+rng = date_range('1/1/2000', periods=20000, freq='T')
+data = '\\n'.join(['date,value'] +
+                  ['%s,%d' % (d.strftime('%d/%m/%Y %H:%M'), i)
+                   for i, d in enumerate(rng)])
+"""
+
+cmd = ("read_csv(StringIO(data), parse_dates=['date'], "
+       "date_format='%d/%m/%Y %H:%M')")
+read_csv_date_format = Benchmark(cmd, setup,
+                                 start_date=datetime(2012, 12, 1))
+
+setup = common_setup + """
+import os
+N = 1000000
+df = DataFrame({'key1': np.random.randint(0, 1000, N),
+                'key2': np.random.randint(0, 10, N),
+                'value': np.random.randn(N)})
+df.to_csv('test.csv', index=False)
+"""
+
+cmd = ("read_csv('test.csv', chunksize=100000)"
+       ".groupby(['key1', 'key2']).agg(['sum', 'mean', 'std'])")
+read_csv_chunked_groupby = Benchmark(cmd, setup,
+                                     cleanup="os.remove('test.csv')",
+                                     start_date=datetime(2012, 12, 1))
+
+setup = common_setup + """
+import os
+N = 10000
+K = 100
+df = DataFrame(np.random.randn(N, K))
+df.to_csv('test.csv.gz', sep='|', compression='gzip')
+"""
+
+read_csv_gzip = Benchmark("read_csv('test.csv.gz', sep='|', "
+                          "compression='infer')", setup,
+                          cleanup="os.remove('test.csv.gz')",
+                          start_date=datetime(2012, 12, 1))
+
+setup = common_setup + """
+from cStringIO import StringIO
+N = 100000
+tickers = np.array(['AAPL', 'GOOG', 'MSFT', 'IBM', 'ORCL'] * (N // 5))
+data = '\\n'.join(['ticker,value'] +
+                  ['%s%d,%d' % (t, i % 1000, i) for i, t in enumerate(tickers)])
+"""
+
+read_csv_strings = Benchmark("read_csv(StringIO(data))", setup,
+                             start_date=datetime(2012, 12, 1))
+
+read_csv_compact_strings = Benchmark("read_csv(StringIO(data), "
+                                     "compact_strings=True)", setup,
+                                     start_date=datetime(2012, 12, 1))
@@ -204,3 +204,26 @@ y = Series(np.random.randn(subsample_size),
 
 series_align_irregular_string = Benchmark("x + y", setup,
                                           start_date=datetime(2010, 6, 1))
+
+#----------------------------------------------------------------------
+# reindexing integer columns, upcast to float64 or masked
+
+setup = common_setup + """
+df = DataFrame(np.random.randint(0, 1000, size=(100000, 10)))
+new_index = np.arange(-10, 100000)
+"""
+
+frame_reindex_int_upcast = Benchmark('df.reindex(new_index)', setup,
+                                     start_date=datetime(2012, 12, 1))
+
+frame_reindex_int_nullable = \
+    Benchmark('df.reindex(new_index)',
+              setup + "set_option('mode.nullable_int_bool', True)",
+              cleanup="reset_option('mode.nullable_int_bool')",
+              start_date=datetime(2012, 12, 1))
+
+frame_reindex_int_nullable_sum = \
+    Benchmark('df.reindex(new_index).sum()',
+              setup + "set_option('mode.nullable_int_bool', True)",
+              cleanup="reset_option('mode.nullable_int_bool')",
+              start_date=datetime(2012, 12, 1))
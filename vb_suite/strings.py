@@ -0,0 +1,55 @@
+from vbench.api import Benchmark
+from datetime import datetime
+
+common_setup = """from pandas_vb_common import *
+from pandas.core.stringarray import StringArray
+
+N = 100000
+tickers = ['AAPL', 'GOOG', 'MSFT', 'IBM', 'ORCL']
+s = Series(['%s%d ' % (tickers[i % 5], i) for i in xrange(N)])
+s[::10] = np.nan
+arr = StringArray.from_array(s)
+"""
+
+#----------------------------------------------------------------------
+# object arrays
+
+strings_len = Benchmark('s.str.len()', common_setup,
+                        start_date=datetime(2012, 12, 1))
+
+strings_startswith = Benchmark("s.str.startswith('AA')", common_setup,
+                               start_date=datetime(2012, 12, 1))
+
+strings_contains_literal = Benchmark("s.str.contains('99')", common_setup,
+                                     start_date=datetime(2012, 12, 1))
+
+strings_contains_regex = Benchmark("s.str.contains('A+P')", common_setup,
+                                   start_date=datetime(2012, 12, 1))
+
+strings_lower = Benchmark('s.str.lower()', common_setup,
+                          start_date=datetime(2012, 12, 1))
+
+strings_strip = Benchmark('s.str.strip()', common_setup,
+                          start_date=datetime(2012, 12, 1))
+
+strings_replace = Benchmark("s.str.replace('A', 'a')", common_setup,
+                            start_date=datetime(2012, 12, 1))
+
+strings_count = Benchmark("s.str.count('A')", common_setup,
+                          start_date=datetime(2012, 12, 1))
+
+strings_slice = Benchmark('s.str.slice(0, 3)', common_setup,
+                          start_date=datetime(2012, 12, 1))
+
+#----------------------------------------------------------------------
+# compact strings
+
+strings_compact_len = Benchmark('arr.str.len()', common_setup,
+                                start_date=datetime(2012, 12, 1))
+
+strings_compact_startswith = Benchmark("arr.str.startswith('AA')",
+                                       common_setup,
+                                       start_date=datetime(2012, 12, 1))
+
+strings_compact_lower = Benchmark('arr.str.lower()', common_setup,
+                                  start_date=datetime(2012, 12, 1))
@@ -6,12 +6,14 @@ import os
 modules = ['attrs_caching',
            'binary_ops',
            'ctors',
+           'eval',
            'frame_ctor',
            'frame_methods',
            'groupby',
            'index_object',
            'indexing',
            'io_bench',
+           'io_sql',
            'join_merge',
            'miscellaneous',
            'panel_ctor',
@@ -21,6 +23,7 @@ modules = ['attrs_caching',
            'sparse',
            'reshape',
            'stat_ops',
+           'strings',
            'timeseries']
 
 by_module = {}